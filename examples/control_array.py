@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""An example of changing effects over the local control API while they run.
+
+Try these from another terminal:
+    curl http://127.0.0.1:8281/catalogue
+    curl -d '{"brightness": 0.25}' http://127.0.0.1:8281/settings
+    curl -d '[{"name": "useColorRainbow"}, {"name": "useFunctionCylon"}]' http://127.0.0.1:8281/mode
+"""
+import asyncio
+from lightberries.array_controller import ArrayController
+from lightberries.control_server import ControlServer
+
+# the number of pixels in the light string
+PIXEL_COUNT = 100
+# GPIO pin to use for PWM signal
+GPIO_PWM_PIN = 18
+# DMA channel
+DMA_CHANNEL = 10
+# frequency to run the PWM signal at
+PWM_FREQUENCY = 800000
+# brightness of LEDs in range [0.0, 1.0]
+BRIGHTNESS = 0.75
+
+
+async def main():
+    """Run the lights and the control server in the same event loop."""
+    # create the LightBerries Controller object
+    lightControl = ArrayController(
+        ledCount=PIXEL_COUNT,
+        pwmGPIOpin=GPIO_PWM_PIN,
+        channelDMA=DMA_CHANNEL,
+        frequencyPWM=PWM_FREQUENCY,
+        ledBrightnessFloat=BRIGHTNESS,
+        debug=True,
+    )
+    lightControl.useColorSequence()
+    lightControl.useFunctionMarquee()
+    # keep running the current mode until it is changed over the control API
+    lightControl.secondsPerMode = float("inf")
+    try:
+        async with ControlServer(lightControl):
+            await lightControl.runAsync(framesPerSecond=60)
+    finally:
+        # turn all LEDs off
+        lightControl.off()
+        lightControl.copyVirtualLedsToWS281X()
+        lightControl.refreshLEDs()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -1,6 +1,5 @@
 #!/usr/bin/python3
 from lightberries import MatrixController
-from PIL import Image
 import numpy as np
 import sys
 
@@ -46,21 +45,7 @@ lightControl = MatrixController(
     matrixShape=MATRIX_SHAPE,
 )
 
-img = Image.open(sys.argv[1])
-img.load()
-data = np.asarray(img, dtype="int32")
-temp = data[:, :, 0].copy()
-data[:, :, 0] = data[:, :, 1]
-data[:, :, 1] = temp
-# data[:] = data.astype(np.float32) * 0.5
-data[:, :, 0] = data[:, :, 0] * 0.9
-data[:, :, 2] = data[:, :, 2] * 0.8
-# data[:, :, :] = data * 0.6
-data = np.rot90(data)
-light_data = np.zeros((32, 32, 3), dtype=np.int32)
-light_data[: data.shape[0], : data.shape[1]] = data
-lightControl.virtualLEDBuffer = light_data
-lightControl.copyVirtualLedsToWS281X()
-lightControl.refreshLEDs()
+# scale the image to the matrix, keeping its aspect ratio and padding the edges
+lightControl.showImage(sys.argv[1], method="area", aspect="fit", quarterTurns=1)
 input("hit enter to exit")
 lightControl.off()
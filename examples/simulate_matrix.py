@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+"""Example of running a matrix show without LEDs.
+
+Open http://127.0.0.1:8282/ in a browser to watch. Give a directory on the
+command line to also save every frame there as a PNG file.
+"""
+import sys
+from lightberries.matrix_controller import MatrixController
+from lightberries.ws281x_simulator import PNGSequenceWriter, PreviewServer
+
+# the number of pixels in the simulated matrix
+PIXEL_ROW_COUNT = 16
+PIXEL_COLUMN_COUNT = 16
+# brightness of LEDs in range [0.0, 1.0]
+BRIGHTNESS = 0.75
+# seconds between LED refreshes (0 to run as fast as possible)
+REFRESH_DELAY = 0.0
+# the most frames per second sent to the browser
+PREVIEW_FRAMES_PER_SECOND = 30
+
+if __name__ == "__main__":
+    lightControl = MatrixController(
+        ledXaxisRange=PIXEL_ROW_COUNT,
+        ledYaxisRange=PIXEL_COLUMN_COUNT,
+        ledBrightnessFloat=BRIGHTNESS,
+        simulate=True,
+    )
+    lightControl.refreshDelay = REFRESH_DELAY
+    preview = PreviewServer(framesPerSecond=PREVIEW_FRAMES_PER_SECOND)
+    preview.start()
+    lightControl.simulator.outputs.append(preview)
+    if len(sys.argv) > 1:
+        lightControl.simulator.outputs.append(PNGSequenceWriter(sys.argv[1]))
+    print("watch at http://%s:%d/" % preview.address)
+    lightControl.useFunctionMatrixFireworks(fireworkCount=5, fadeAmount=0.2)
+    try:
+        lightControl.run()
+    except KeyboardInterrupt:
+        pass
+    except SystemExit:
+        pass
+    finally:
+        print(f"{lightControl.simulator.frameCount} frames")
+        preview.stop()
+        lightControl.off()
+        del lightControl
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+"""Example of playing video on a matrix.
+
+Plays a GIF, a directory of images, or a .y4m file given on the command line.
+Other formats can be piped through ffmpeg:
+
+    ffmpeg -i clip.mp4 -f yuv4mpegpipe -pix_fmt yuv420p - | python3 video.py -
+"""
+import sys
+from lightberries import MatrixController
+
+# the number of pixels in the light string
+PIXEL_ROW_COUNT = 16
+PIXEL_COLUMN_COUNT = 16
+# GPIO pin to use for PWM signal
+GPIO_PWM_PIN = 18
+# DMA channel
+DMA_CHANNEL = 10
+# frequency to run the PWM signal at
+PWM_FREQUENCY = 800000
+# brightness of LEDs in range [0.0, 1.0]
+BRIGHTNESS = 0.1
+# the most frames to show per second
+FRAMES_PER_SECOND = 30
+
+lightControl = MatrixController(
+    ledXaxisRange=PIXEL_ROW_COUNT,
+    ledYaxisRange=PIXEL_COLUMN_COUNT,
+    pwmGPIOpin=GPIO_PWM_PIN,
+    channelDMA=DMA_CHANNEL,
+    frequencyPWM=PWM_FREQUENCY,
+    ledBrightnessFloat=BRIGHTNESS,
+)
+try:
+    lightControl.playVideo(sys.argv[1], framesPerSecond=FRAMES_PER_SECOND, loop=sys.argv[1] != "-")
+except KeyboardInterrupt:
+    pass
+except SystemExit:
+    pass
+print("dropped", lightControl.droppedFrameCount, "frames")
+lightControl.off()
@@ -14,6 +14,8 @@ LOGGER = logging.getLogger(__name__)
 
 
 class Snake(Player):
+    # the tail moves a whole pixel at a time
+    interpolated = False
     BASE_SPEED = 0.15
     BASE_GROWTH = 2
 
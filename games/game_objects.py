@@ -3,9 +3,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import IntEnum
 import numpy as np
-from lightberries.pixel import PixelColors
+from lightberries.pixel import Pixel, PixelColors
+import functools
 import time
-from typing import Optional
+from typing import Callable, Optional
 
 
 @dataclass
@@ -23,6 +24,37 @@ class SpriteShape(IntEnum):
     RECTANGLE = 3
 
 
+@functools.lru_cache(maxsize=None)
+def shape_stencil(shape: SpriteShape, size: int, width: int, height: int) -> tuple[np.ndarray, np.ndarray]:
+    """The (x, y) offsets of the pixels of a shape, from its position.
+
+    Offsets only depend on the shape and its dimensions, so each stencil is built once and
+    shared (read only) by every object of that shape.
+    """
+    if shape == SpriteShape.CROSS:
+        line = np.arange(-size, size + 1)
+        xs = np.concatenate((line, np.zeros_like(line)))
+        ys = np.concatenate((np.zeros_like(line), line))
+    elif shape == SpriteShape.CIRCLE:
+        angles = np.linspace(0, 2 * np.pi, 1 + (4 * size))
+        xs = np.round(np.sin(angles) * size)
+        ys = np.round(np.cos(angles) * size)
+    elif shape == SpriteShape.SQUARE:
+        # the outline, top edge first, then both sides one row at a time, then the bottom edge
+        line = np.arange(-size, size + 1)
+        sides = np.arange(-size + 1, size)
+        xs = np.concatenate((line, np.tile([-size, size], len(sides)), line))
+        ys = np.concatenate((np.full_like(line, -size), np.repeat(sides, 2), np.full_like(line, size)))
+    elif shape == SpriteShape.RECTANGLE:
+        xs = np.tile(np.arange(width), height)
+        ys = np.repeat(-np.arange(height), width)
+    xs = xs.astype(np.int32)
+    ys = ys.astype(np.int32)
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return xs, ys
+
+
 class XboxButton(IntEnum):
     A = 0
     B = 1
@@ -61,6 +93,8 @@ class GameObject:
     GRAVITY = 0.75
     MAX_GRAVITY = 2.5
     BUTTON_DEBOUNCE = 0.15
+    # whether render_objects may draw this object part way through its next move
+    interpolated = False
 
     def __init__(
         self,
@@ -89,6 +123,7 @@ class GameObject:
         self._dx = 0.0
         self._dy = 0.0
         self._size = size
+        self._stencil: Optional[tuple[np.ndarray, np.ndarray]] = None
         self._color = color
         self.has_gravity = has_gravity
         self.collided: list["GameObject"] = []
@@ -127,6 +162,7 @@ class GameObject:
     @shape.setter
     def shape(self, val: SpriteShape) -> None:
         self._shape = val
+        self._stencil = None
 
     @property
     def size(self) -> int:
@@ -135,6 +171,7 @@ class GameObject:
     @size.setter
     def size(self, val: int) -> None:
         self._size = val
+        self._stencil = None
 
     @property
     def height(self) -> int:
@@ -143,6 +180,7 @@ class GameObject:
     @height.setter
     def height(self, val: int) -> None:
         self._size = val
+        self._stencil = None
 
     @property
     def width(self) -> int:
@@ -151,6 +189,7 @@ class GameObject:
     @width.setter
     def width(self, val: int) -> None:
         self._size = val
+        self._stencil = None
 
     @property
     def collision_surface(self) -> set[tuple[int, int]]:
@@ -278,63 +317,22 @@ class GameObject:
         return int(self._right_last)
 
     @property
-    def xs(self) -> list[int]:
-        if self.shape == SpriteShape.CROSS:
-            xs = [round(self._x + i) for i in range(-self.size, self.size + 1)]
-            xs.extend([round(self._x) for i in range(-self.size, self.size + 1)])
-        elif self.shape == SpriteShape.CIRCLE:
-            xs = (
-                np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * self.size))) * (self.size)).astype(dtype=np.int32)
-                + self.x
-            )
-        elif self.shape == SpriteShape.SQUARE:
-            xs = []
-            _xs = [round(self._x + i) for i in range(-self.size, 0)]
-            _xs.extend([round(self._x + i) for i in range(self.size + 1)])
-            xs.extend(_xs)
-            for _ in range(self.size - 1):
-                xs.extend([_xs[0], _xs[-1]])
-            xs.extend([_xs[0], _xs[-1]])
-            for _ in range(self.size - 1):
-                xs.extend([_xs[0], _xs[-1]])
-            xs.extend(_xs)
-        elif self.shape == SpriteShape.RECTANGLE:
-            xs = []
-            for _ in range(self.height):
-                xs.extend([round(self._x + i) for i in range(self.width)])
-        return xs
+    def stencil(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._stencil is None:
+            self._stencil = shape_stencil(self.shape, self.size, self.width, self.height)
+        return self._stencil
 
     @property
-    def ys(self) -> list[int]:
-        if self.shape == SpriteShape.CROSS:
-            ys = [round(self._y) for i in range(-self.size, self.size + 1)]
-            ys.extend([round(self._y + i) for i in range(-self.size, self.size + 1)])
-        elif self.shape == SpriteShape.CIRCLE:
-            ys = (
-                np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * self.size))) * (self.size)).astype(dtype=np.int32)
-                + self.y
-            )
-        elif self.shape == SpriteShape.SQUARE:
-            ys = []
-            _ys = [round(self._y + i) for i in range(-self.size, 0)]
-            _ys.extend([round(self._y + i) for i in range(self.size + 1)])
-            counter = 0
-            ys.extend([_ys[counter]] * ((self.size * 2) + 1))
-            counter += 1
-            for _ in range(-self.size + 1, 0):
-                ys.extend([_ys[counter], _ys[counter]])
-                counter += 1
-            ys.extend([_ys[counter], _ys[counter]])
-            counter += 1
-            for _ in range(self.size - 1):
-                ys.extend([_ys[counter], _ys[counter]])
-                counter += 1
-            ys.extend([_ys[counter]] * ((self.size * 2) + 1))
-        elif self.shape == SpriteShape.RECTANGLE:
-            ys = []
-            for i in range(self.height):
-                ys.extend([round(self._y - i) for _ in range(self.width)])
-        return ys
+    def xs(self) -> np.ndarray:
+        if self.shape == SpriteShape.CIRCLE:
+            return self.stencil[0] + self.x
+        return np.round(self.stencil[0] + self._x).astype(np.int32)
+
+    @property
+    def ys(self) -> np.ndarray:
+        if self.shape == SpriteShape.CIRCLE:
+            return self.stencil[1] + self.y
+        return np.round(self.stencil[1] + self._y).astype(np.int32)
 
     @property
     def xys(self) -> list[tuple[int, int]]:
@@ -448,6 +446,8 @@ class Wall(GameObject):
 
 
 class Sprite(GameObject):
+    interpolated = True
+
     def __init__(
         self,
         x: int,
@@ -519,28 +519,18 @@ class Sprite(GameObject):
             return 0
 
     @property
-    def xs(self) -> list[int]:
+    def xs(self) -> np.ndarray:
         xs = super().xs
-        xs = np.array(xs)
-        fix = np.where(xs < 0)
-        if fix:
-            xs[fix] += GameObject.frame_size_x
-        fix = np.where(xs >= GameObject.frame_size_x)
-        if fix:
-            xs[fix] -= GameObject.frame_size_x
-        return [int(x) for x in xs]
+        xs[xs < 0] += GameObject.frame_size_x
+        xs[xs >= GameObject.frame_size_x] -= GameObject.frame_size_x
+        return xs
 
     @property
-    def ys(self) -> list[int]:
+    def ys(self) -> np.ndarray:
         ys = super().ys
-        ys = np.array(ys)
-        fix = np.where(ys < 0)
-        if fix:
-            ys[fix] += GameObject.frame_size_y
-        fix = np.where(ys >= GameObject.frame_size_y)
-        if fix:
-            ys[fix] -= GameObject.frame_size_y
-        return [int(y) for y in ys]
+        ys[ys < 0] += GameObject.frame_size_y
+        ys[ys >= GameObject.frame_size_y] -= GameObject.frame_size_y
+        return ys
 
     @property
     def move_xs(self) -> list[tuple[int, int]]:
@@ -904,6 +894,175 @@ class Projectile(Sprite):
                 GameObject.dead_objects.append(self.id)
 
 
+class GameClock:
+    """Fixed timestep bookkeeping, so games run at the same speed however long a frame takes.
+
+    Real time is added to an accumulator and spent in whole steps of 1 / tick_rate seconds. The
+    fraction of a step left over is the render interpolation factor. When frames fall far behind,
+    at most max_ticks steps are run per frame and the rest of the backlog is dropped, so a slow
+    display slows the game down instead of freezing it while it catches up.
+    """
+
+    def __init__(
+        self,
+        tick_rate: float,
+        poll_rate: float,
+        max_ticks: int = 5,
+        now: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.tick_period = 1.0 / tick_rate
+        self.poll_period = 1.0 / poll_rate
+        self.max_ticks = max_ticks
+        self.now = now
+        self.sleep = sleep
+        self.accumulator = 0.0
+        self.dropped_ticks = 0
+        self._last: Optional[float] = None
+        self._next_poll = 0.0
+
+    @property
+    def alpha(self) -> float:
+        return min(self.accumulator / self.tick_period, 1.0)
+
+    def ticks(self) -> int:
+        """Spend the time since the last call, and return how many fixed steps are due."""
+        t = self.now()
+        if self._last is None:
+            # the first frame always gets a step, so there is something to draw
+            self._last = t
+            return 1
+        self.accumulator += t - self._last
+        self._last = t
+        count = int(self.accumulator // self.tick_period)
+        if count > self.max_ticks:
+            self.dropped_ticks += count - self.max_ticks
+            count = self.max_ticks
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= count * self.tick_period
+        return count
+
+    def wait(self) -> None:
+        """Sleep until it is time to poll input again, or the next step is due, whichever is first."""
+        t = self.now()
+        self._next_poll = max(self._next_poll + self.poll_period, t)
+        next_tick = self.tick_period - self.accumulator
+        if self._last is not None:
+            next_tick -= t - self._last
+        delay = min(self._next_poll - t, next_tick)
+        if delay > 0:
+            self.sleep(delay)
+
+
+# the width and height of a spatial hash cell, in pixels
+COLLISION_CELL_SIZE = 4
+# box columns
+BOX_TOP, BOX_BOTTOM, BOX_LEFT, BOX_RIGHT = range(4)
+
+
+def collision_boxes(objs: list[GameObject]) -> np.ndarray:
+    """Gather the (inclusive) collision box of each object, as one row of top, bottom, left, right."""
+    boxes = np.empty((len(objs), 4), dtype=np.int32)
+    for i, obj in enumerate(objs):
+        box = obj.box
+        boxes[i] = (box.top, box.bottom, box.left, box.right)
+    return boxes
+
+
+def collision_pairs(boxes: np.ndarray, animate: np.ndarray) -> np.ndarray:
+    """Find every pair of boxes that overlap, where at least one of the pair is animate.
+
+    The boxes are hashed into a grid of COLLISION_CELL_SIZE cells that is rebuilt on
+    every call, so only boxes sharing a cell are compared, then the candidate pairs
+    are checked exactly.
+
+    Returns:
+        (pairs, 2) indices into boxes, each pair with i < j, sorted
+    """
+    count = len(boxes)
+    empty = np.empty((0, 2), dtype=np.intp)
+    if count < 2 or not animate.any():
+        return empty
+    top, bottom, left, right = boxes.T
+    solid = (bottom >= top) & (right >= left)
+    origin_y = top[solid].min(initial=0)
+    origin_x = left[solid].min(initial=0)
+    cell_top = (top - origin_y) // COLLISION_CELL_SIZE
+    cell_left = (left - origin_x) // COLLISION_CELL_SIZE
+    cell_rows = np.where(solid, (bottom - origin_y) // COLLISION_CELL_SIZE - cell_top + 1, 0)
+    cell_columns = np.where(solid, (right - origin_x) // COLLISION_CELL_SIZE - cell_left + 1, 0)
+    cell_counts = cell_rows * cell_columns
+    # one entry for every (box, grid cell) the box touches
+    owners = np.repeat(np.arange(count), cell_counts)
+    steps = np.arange(len(owners)) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+    columns = np.repeat(cell_columns, cell_counts)
+    grid_width = (right[solid] - origin_x).max(initial=0) // COLLISION_CELL_SIZE + 1
+    cells = (np.repeat(cell_top, cell_counts) + steps // columns) * grid_width
+    cells += np.repeat(cell_left, cell_counts) + steps % columns
+    order = np.lexsort((owners, cells))
+    cells = cells[order]
+    owners = owners[order]
+    starts = np.flatnonzero(np.r_[True, cells[1:] != cells[:-1]])
+    sizes = np.diff(np.r_[starts, len(cells)])
+    candidates = []
+    for start, size in zip(starts[sizes > 1], sizes[sizes > 1]):
+        first, second = np.triu_indices(size, 1)
+        candidates.append(owners[start + first] * count + owners[start + second])
+    if not candidates:
+        return empty
+    # boxes that share several cells are only checked once
+    codes = np.unique(np.concatenate(candidates))
+    i = codes // count
+    j = codes % count
+    hits = (animate[i] | animate[j]) & (top[i] <= bottom[j]) & (top[j] <= bottom[i])
+    hits &= (left[i] <= right[j]) & (left[j] <= right[i])
+    return np.stack((i[hits], j[hits]), axis=1)
+
+
+def overlap_surface(box1: np.ndarray, box2: np.ndarray) -> set[tuple[int, int]]:
+    """The (x, y) pixels two overlapping boxes have in common."""
+    top = max(box1[BOX_TOP], box2[BOX_TOP])
+    bottom = min(box1[BOX_BOTTOM], box2[BOX_BOTTOM])
+    left = max(box1[BOX_LEFT], box2[BOX_LEFT])
+    right = min(box1[BOX_RIGHT], box2[BOX_RIGHT])
+    return {(x, y) for y in range(int(top), int(bottom) + 1) for x in range(int(left), int(right) + 1)}
+
+
+def render_objects(buffer: np.ndarray, objs: list[GameObject], alpha: float = 1.0) -> None:
+    """Draw every object into an (x, y, color) LED buffer with one scatter.
+
+    Pixels that fall off the buffer are dropped on their own, the rest of the object is still drawn.
+    Objects later in the list are drawn on top.
+
+    With alpha below 1, moving interpolated objects are drawn that fraction of the way from where
+    they were one step ago to where they are now, so motion looks smooth between fixed steps.
+    """
+    xs = []
+    ys = []
+    colors = []
+    counts = []
+    for obj in objs:
+        if obj.y >= 0:
+            if alpha < 1.0 and obj.interpolated and not (obj.dead or GameObject.pause):
+                # sprites wrap around the frame, so the interpolated position has to wrap too
+                xs.append((obj.xs + round((alpha - 1.0) * obj.dx)) % GameObject.frame_size_x)
+                ys.append((obj.ys + round((alpha - 1.0) * obj.dy)) % GameObject.frame_size_y)
+            else:
+                xs.append(obj.xs)
+                ys.append(obj.ys)
+            colors.append(obj.color)
+            counts.append(len(xs[-1]))
+    if not counts:
+        return
+    xs = np.concatenate(xs).astype(np.intp, copy=False)
+    ys = np.concatenate(ys).astype(np.intp, copy=False)
+    # the LEDs take colors in pixel order, not RGB
+    colors = np.repeat(np.array(colors)[:, Pixel.DEFAULT_PIXEL_ORDER], counts, axis=0)
+    on_frame = (xs >= 0) & (xs < buffer.shape[0]) & (ys >= 0) & (ys < buffer.shape[1])
+    buffer[xs[on_frame], ys[on_frame]] = colors[on_frame]
+
+
 def check_for_collisions():
     t = time.time()
     for key in GameObject.dead_objects:
@@ -925,23 +1084,15 @@ def check_for_collisions():
         for obj1 in objs:
             obj1.go()
             obj1.collided.clear()
-    keys = list(GameObject.objects.keys())
     if len(GameObject.objects) > 1:
-        for i, key1 in enumerate(keys[:-1]):
-            try:
-                obj1 = GameObject.objects[key1]
-                for key2 in keys[i + 1 :]:
-                    try:
-                        obj2 = GameObject.objects[key2]
-                        x = []
-                        if obj1.animate or obj2.animate:
-                            x = obj1.collision_surface.intersection(obj2.collision_surface)
-                        else:
-                            pass
-                        if x:
-                            obj1.collide(obj2, x)
-                            obj2.collide(obj1, x)
-                    except KeyError:
-                        pass
-            except KeyError:
-                pass
+        objs = list(GameObject.objects.values())
+        boxes = collision_boxes(objs)
+        animate = np.array([obj.animate for obj in objs], dtype=np.bool_)
+        for i, j in collision_pairs(boxes, animate):
+            obj1 = objs[i]
+            obj2 = objs[j]
+            if obj1.id not in GameObject.objects or obj2.id not in GameObject.objects:
+                continue
+            x = overlap_surface(boxes[i], boxes[j])
+            obj1.collide(obj2, x)
+            obj2.collide(obj1, x)
@@ -1,3 +1,4 @@
+from __future__ import annotations
 import pygame
 from typing import Callable, Generator, Optional
 import random
@@ -11,7 +12,7 @@ from lightberries.array_functions import ArrayFunction
 from lightberries.array_patterns import ArrayPattern
 from lightberries.pixel import Pixel, PixelColors
 import time
-from game_objects import GameObject, Player, Sprite, check_for_collisions
+from game_objects import GameClock, GameObject, Player, Sprite, check_for_collisions, render_objects
 from lightberries.matrix_patterns import TextMatrix
 
 
@@ -255,6 +256,30 @@ class XboxController(Controller):
         return self.A5
 
 
+class SimulatedDisplay:
+    GRID_COLOR = 127
+
+    def __init__(self, width: int, height: int, cell_size: int) -> None:
+        """A window that shows an (x, y, color) LED buffer, one square cell per LED with a grid between them."""
+        self.cell_size = cell_size
+        self.surface = pygame.display.set_mode((width * cell_size, height * cell_size))
+        self.frame = np.zeros((width * cell_size, height * cell_size, 3), dtype=np.uint8)
+        # the frame viewed as (x, cell x, y, cell y, color), so a whole buffer is scaled up with one broadcast
+        self._cells = self.frame.reshape((width, cell_size, height, cell_size, 3))
+        edge = np.zeros(cell_size, dtype=np.bool_)
+        edge[[0, -1]] = True
+        self._grid = np.tile(edge, width)[:, None] | np.tile(edge, height)[None, :]
+
+    def render(self, buffer: np.ndarray) -> np.ndarray:
+        self._cells[...] = np.clip(buffer, 0, 255)[:, None, :, None, :]
+        self.frame[self._grid] = SimulatedDisplay.GRID_COLOR
+        return self.frame
+
+    def show(self, buffer: np.ndarray) -> None:
+        pygame.surfarray.blit_array(self.surface, self.render(buffer))
+        pygame.display.update()
+
+
 class LightGame:
     PAUSE_DELAY = 0.3
     THRESHOLD = 0.05
@@ -262,41 +287,33 @@ class LightGame:
     RESPAWN_DELAY = 1
     SPECIAL_WEAPON_DELAY = 3
     SIMULATED_SIZE = 16
+    # game steps per second, the speed the games were tuned at in the simulator
+    TICK_RATE = 10.0
+    # input polls (and frames drawn) per second
+    POLL_RATE = 60.0
+    # the most game steps run to catch up after a slow frame
+    MAX_TICKS_PER_FRAME = 5
+    INTERPOLATE = True
 
     def __init__(self, lights: MatrixController) -> None:
         self.lights = lights
         GameObject.frame_size_x = self.lights.realLEDXaxisRange
         GameObject.frame_size_y = self.lights.realLEDYaxisRange
         self.players: dict[int, GameObject] = {}
-        self.rs: list[pygame.Rect] = []
         self.win = False
         self.win_time = time.time()
         self.win_score = int(lights.realLEDYaxisRange // 2)
-        self.display = None
+        self.display: Optional[SimulatedDisplay] = None
         self.exiting = False
         self.pause = True
         self.first_render = True
+        self.clock = GameClock(LightGame.TICK_RATE, LightGame.POLL_RATE, LightGame.MAX_TICKS_PER_FRAME)
+        # what is shown, the LED buffer plus objects part way through their next step
+        self.frame = np.zeros_like(lights.virtualLEDBuffer)
         if lights.simulate:
-            self.display = pygame.display.set_mode(
-                (
-                    lights.realLEDXaxisRange * LightGame.SIMULATED_SIZE,
-                    lights.realLEDYaxisRange * LightGame.SIMULATED_SIZE,
-                )
-            )
-            self.display.fill((127, 127, 127))
-            for i in range(32):
-                for j in range(32):
-                    self.rs.append(
-                        pygame.draw.rect(
-                            self.display,
-                            (0, 0, 0),
-                            (
-                                ((i * LightGame.SIMULATED_SIZE) + 1, (j * LightGame.SIMULATED_SIZE) + 1),
-                                (LightGame.SIMULATED_SIZE - 2, LightGame.SIMULATED_SIZE - 2),
-                            ),
-                        )
-                    )
-            pygame.display.flip()
+            width, height = lights.virtualLEDBuffer.shape[:2]
+            self.display = SimulatedDisplay(width, height, LightGame.SIMULATED_SIZE)
+            self.display.show(self.lights.virtualLEDBuffer)
         else:
             os.environ["SDL_VIDEODRIVER"] = "dummy"
         pygame.init()
@@ -323,6 +340,24 @@ class LightGame:
         self._controller_index_dict: dict[int, XboxController] = {}
         self._instance_to_index_dict: dict[int, int] = {}
         self._callbacks: dict[LightEventId, Callable[[LightEvent], None]] = {}
+        self._event_pool: dict[tuple[int, type[LightEvent], Optional[ButtonState]], LightEvent] = {}
+        self._frame_events: list[LightEvent] = []
+        self._frame_axes: set[int] = set()
+        self._event_handlers: dict[int, Callable[[pygame.event.Event], None]] = {
+            event_type: self._ignore_event for event_type in IGNORED_EVENT_TYPES
+        }
+        self._event_handlers.update(
+            {
+                pygame.QUIT: self._on_quit,
+                pygame.WINDOWCLOSE: self._on_quit,
+                pygame.JOYBUTTONDOWN: self._on_button,
+                pygame.JOYBUTTONUP: self._on_button,
+                pygame.JOYAXISMOTION: self._on_axis,
+                pygame.JOYHATMOTION: self._on_hat,
+                pygame.JOYDEVICEADDED: self._on_controller_added,
+                pygame.JOYDEVICEREMOVED: self._on_controller_removed,
+            }
+        )
 
     def splash_screen(self, message: str, duration: int):
         splash = TextMatrix(self.lights.realLEDYaxisRange, " " + message + "  ", PixelColors.YELLOW.rgb_array)
@@ -366,363 +401,135 @@ class LightGame:
         return self._controller_index_dict
 
     def get_events(self) -> Generator[LightEvent, None, None]:
-        light_events: list[LightEvent] = []
-        left_joysticks: list[LightEvent] = []
-        left_joystick_x_count = 0
-        left_joystick_y_count = 0
-        right_joysticks: list[LightEvent] = []
-        right_joystick_x_count = 0
-        right_joystick_y_count = 0
+        """Translate this frame's pygame events into light events.
+
+        Analog axis motion is coalesced into one stick or trigger event per controller per frame,
+        holding the latest values. Event objects are pooled and reused from frame to frame, so
+        consumers should read them as they are yielded rather than keep them.
+        """
+        self._frame_events.clear()
+        self._frame_axes.clear()
         for pygame_event in pygame.event.get():
             if time.time() - self.timestamp_ready < 1:
                 continue
-            if pygame_event.type == 256 or pygame_event.type == 32787:
-                self.exiting = True
-            elif pygame_event.type == 1024 or pygame_event.type == 1025 or pygame_event.type == 1026:
-                # mouse events
-                pass
-            elif (
-                pygame_event.type == 32768
-                or pygame_event.type == 32784
-                or pygame_event.type == 32774
-                or pygame_event.type == 32785
-                or pygame_event.type == 32770
-                or pygame_event.type == 32776
-                or pygame_event.type == 32780
-                or pygame_event.type == 32782
-                or pygame_event.type == 32783
-                or pygame_event.type == 32786
-            ):
-                # window events
-                pass
-            elif pygame_event.type == 4352:
-                # audio events
-                pass
-            elif pygame_event.type == 770:
-                # text events
-                pass
-            elif "joy" in pygame_event.dict:
-                controller_index = pygame_event.dict["joy"]
-                controller_instance_id = pygame_event.dict["instance_id"]
-                controller = self._controller_instance_dict[controller_instance_id]
-                if "button" in pygame_event.dict:
-                    button_id = pygame_event.dict["button"]
-                    if button_id == XboxButton.A:
-                        light_events.append(
-                            ButtonBottom(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.B:
-                        light_events.append(
-                            ButtonRight(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.X:
-                        light_events.append(
-                            ButtonLeft(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.Y:
-                        light_events.append(
-                            ButtonTop(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.BUMPER_LEFT:
-                        light_events.append(
-                            ButtonBumperLeft(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.BUMPER_RIGHT:
-                        light_events.append(
-                            ButtonBumperRight(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.START:
-                        light_events.append(
-                            ButtonStart(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.OPTIONS:
-                        light_events.append(
-                            ButtonOptions(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.XBOX:
-                        light_events.append(
-                            ButtonPower(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.SHARE:
-                        light_events.append(
-                            ButtonShare(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.UP:
-                        light_events.append(
-                            ButtonHatUp(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.DOWN:
-                        light_events.append(
-                            ButtonHatDown(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.LEFT:
-                        light_events.append(
-                            ButtonHatLeft(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.RIGHT:
-                        light_events.append(
-                            ButtonHatRight(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.JOY_LEFT:
-                        light_events.append(
-                            ButtonStickLeft(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    elif button_id == XboxButton.JOY_RIGHT:
-                        light_events.append(
-                            ButtonStickRight(
-                                id=button_id,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down if pygame_event.type == 1539 else ButtonState.Up,
-                            )
-                        )
-                    else:
-                        print(pygame_event)
-                elif "axis" in pygame_event.dict:
-                    axis = pygame_event.dict["axis"]
-                    if axis == XboxJoystick.JOY_RIGHT_X:
-                        if right_joystick_x_count >= len(right_joysticks):
-                            light_event = StickRight(
-                                id=-3,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                            )
-                            right_joysticks.append(light_event)
-                            light_events.append(light_event)
-                        right_joysticks[right_joystick_x_count].x = pygame_event.dict["value"]
-                        right_joystick_x_count += 1
-                    elif axis == XboxJoystick.JOY_RIGHT_Y:
-                        if right_joystick_y_count >= len(right_joysticks):
-                            light_event = StickRight(
-                                id=-3,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                            )
-                            right_joysticks.append(light_event)
-                            light_events.append(light_event)
-                        right_joysticks[right_joystick_y_count].y = pygame_event.dict["value"]
-                        right_joystick_y_count += 1
-                    elif axis == XboxJoystick.JOY_LEFT_X:
-                        if left_joystick_x_count >= len(left_joysticks):
-                            light_event = StickLeft(
-                                id=-4,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                            )
-                            left_joysticks.append(light_event)
-                            light_events.append(light_event)
-                        left_joysticks[left_joystick_x_count].x = pygame_event.dict["value"]
-                        left_joystick_x_count += 1
-                    elif axis == XboxJoystick.JOY_LEFT_Y:
-                        if left_joystick_y_count >= len(left_joysticks):
-                            light_event = StickLeft(
-                                id=-4,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                            )
-                            left_joysticks.append(light_event)
-                            light_events.append(light_event)
-                        left_joysticks[left_joystick_y_count].y = pygame_event.dict["value"]
-                        left_joystick_y_count += 1
-                    elif axis == XboxJoystick.TRIGGER_RIGHT:
-                        light_events.append(
-                            TriggerRight(
-                                id=-5,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                z=pygame_event.dict["value"],
-                            )
-                        )
-                    elif axis == XboxJoystick.TRIGGER_LEFT:
-                        light_events.append(
-                            TriggerLeft(
-                                id=-6,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                z=pygame_event.dict["value"],
-                            )
-                        )
-                    else:
-                        pass
-                        print(pygame_event)
-                elif "hat" in pygame_event.dict:
-                    hat = pygame_event.dict["hat"]
-                    value = pygame_event.dict["value"]
-                    if hat == 0 and value[1] == 1:
-                        light_events.append(
-                            ButtonHatUp(
-                                id=XboxButton.UP,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down,
-                            )
-                        )
-                    elif hat == 0 and value[1] == -1:
-                        light_events.append(
-                            ButtonHatDown(
-                                id=XboxButton.DOWN,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down,
-                            )
-                        )
-                    elif hat == 0 and value[0] == -1:
-                        light_events.append(
-                            ButtonHatLeft(
-                                id=XboxButton.LEFT,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down,
-                            )
-                        )
-                    elif hat == 0 and value[0] == 1:
-                        light_events.append(
-                            ButtonHatRight(
-                                id=XboxButton.RIGHT,
-                                controller_index=controller_index,
-                                controller=controller,
-                                controller_instance_id=controller_instance_id,
-                                state=ButtonState.Down,
-                            )
-                        )
-                else:
-                    pass
-                    print(pygame_event)
-            elif pygame_event.type == 1541:
-                controller_index = pygame_event.dict["device_index"]
-                if controller_index not in self._controller_index_dict:
-                    self.get_controllers()
-                controller = self._controller_index_dict[controller_index]
-                controller_instance_id = controller.controller.get_instance_id()
-                self._controller_instance_dict[controller_instance_id] = controller
-                self._instance_to_index_dict[controller_instance_id] = controller_index
-                light_events.append(
-                    ControllerAdded(
-                        id=-1,
-                        controller_instance_id=controller_instance_id,
-                        controller_index=controller_index,
-                        controller=controller,
-                    )
-                )
-            elif pygame_event.type == 1542:
-                controller_instance_id = pygame_event.dict["instance_id"]
-                controller = self._controller_instance_dict[controller_instance_id]
-                controller_index = self._instance_to_index_dict[controller_instance_id]
-                light_events.append(
-                    ControllerRemoved(
-                        id=-2,
-                        controller_instance_id=controller_instance_id,
-                        controller_index=controller_index,
-                        controller=controller,
-                    )
-                )
-            else:
+            handler = self._event_handlers.get(pygame_event.type)
+            if handler is None:
                 print(pygame_event)
-        for event in light_events:
+            else:
+                handler(pygame_event)
+        for event in self._frame_events:
             if event.event_id in self._callbacks:
                 self._callbacks[event.event_id](event)
             yield event
 
+    def _pooled_event(
+        self,
+        event_class: type[LightEvent],
+        id: int,
+        controller_instance_id: int,
+        controller_index: int,
+        state: Optional[ButtonState] = None,
+    ) -> LightEvent:
+        key = (controller_instance_id, event_class, state)
+        event = self._event_pool.get(key)
+        if event is None:
+            event = event_class(
+                id=id,
+                controller_instance_id=controller_instance_id,
+                controller=self._controller_instance_dict[controller_instance_id],
+                controller_index=controller_index,
+            )
+            if state is not None:
+                event.state = state
+            self._event_pool[key] = event
+        return event
+
+    def _ignore_event(self, pygame_event: pygame.event.Event) -> None:
+        pass
+
+    def _on_quit(self, pygame_event: pygame.event.Event) -> None:
+        self.exiting = True
+
+    def _on_button(self, pygame_event: pygame.event.Event) -> None:
+        event_class = BUTTON_EVENTS.get(pygame_event.dict["button"])
+        if event_class is None:
+            print(pygame_event)
+            return
+        state = ButtonState.Down if pygame_event.type == pygame.JOYBUTTONDOWN else ButtonState.Up
+        self._frame_events.append(
+            self._pooled_event(
+                event_class,
+                pygame_event.dict["button"],
+                pygame_event.dict["instance_id"],
+                pygame_event.dict["joy"],
+                state,
+            )
+        )
+
+    def _on_axis(self, pygame_event: pygame.event.Event) -> None:
+        axis = AXIS_EVENTS.get(pygame_event.dict["axis"])
+        if axis is None:
+            print(pygame_event)
+            return
+        event_class, event_number, field = axis
+        event = self._pooled_event(
+            event_class, event_number, pygame_event.dict["instance_id"], pygame_event.dict["joy"]
+        )
+        setattr(event, field, pygame_event.dict["value"])
+        # the x and y axes of a stick arrive as separate events, only the first one queues the stick
+        if id(event) not in self._frame_axes:
+            self._frame_axes.add(id(event))
+            self._frame_events.append(event)
+
+    def _on_hat(self, pygame_event: pygame.event.Event) -> None:
+        if pygame_event.dict["hat"] != 0:
+            return
+        value = pygame_event.dict["value"]
+        for index, direction, event_class, button in HAT_EVENTS:
+            if value[index] == direction:
+                self._frame_events.append(
+                    self._pooled_event(
+                        event_class,
+                        button,
+                        pygame_event.dict["instance_id"],
+                        pygame_event.dict["joy"],
+                        ButtonState.Down,
+                    )
+                )
+                return
+
+    def _on_controller_added(self, pygame_event: pygame.event.Event) -> None:
+        controller_index = pygame_event.dict["device_index"]
+        if controller_index not in self._controller_index_dict:
+            self.get_controllers()
+        controller = self._controller_index_dict[controller_index]
+        controller_instance_id = controller.controller.get_instance_id()
+        self._controller_instance_dict[controller_instance_id] = controller
+        self._instance_to_index_dict[controller_instance_id] = controller_index
+        self._frame_events.append(
+            ControllerAdded(
+                id=-1,
+                controller_instance_id=controller_instance_id,
+                controller_index=controller_index,
+                controller=controller,
+            )
+        )
+
+    def _on_controller_removed(self, pygame_event: pygame.event.Event) -> None:
+        controller_instance_id = pygame_event.dict["instance_id"]
+        controller = self._controller_instance_dict[controller_instance_id]
+        controller_index = self._instance_to_index_dict[controller_instance_id]
+        for key in [key for key in self._event_pool if key[0] == controller_instance_id]:
+            self._event_pool.pop(key)
+        self._frame_events.append(
+            ControllerRemoved(
+                id=-2,
+                controller_instance_id=controller_instance_id,
+                controller_index=controller_index,
+                controller=controller,
+            )
+        )
+
     def check_for_winner(self):
         t = time.time()
         if any([player.score >= self.win_score for player in self.players.values()]):
@@ -781,30 +588,41 @@ class LightGame:
                             int(player.score), not_ready
                         )
 
+    def step_game(self):
+        """Advance the game by one fixed step."""
+        self.fade.run()
+        if not self.win:
+            # objects leave their trail where they were, the step moves them on from there
+            render_objects(self.lights.virtualLEDBuffer, list(GameObject.objects.values()))
+            check_for_collisions()
+
+    def render_game(self, alpha: float = 1.0):
+        """Show the LED buffer with every object drawn alpha of the way through its latest step."""
+        trails = self.lights.virtualLEDBuffer
+        if self.frame.shape != trails.shape:
+            self.frame = np.zeros_like(trails)
+        np.copyto(self.frame, trails)
+        if not self.win:
+            render_objects(self.frame, list(GameObject.objects.values()), alpha)
+        if not self.lights.simulate:
+            self.lights.virtualLEDBuffer = self.frame
+            try:
+                self.lights.copyVirtualLedsToWS281X()
+                self.lights.refreshLEDs()
+            finally:
+                self.lights.virtualLEDBuffer = trails
+        else:
+            self.display.show(self.frame)
+
     def update_game(self):
+        ticks = self.clock.ticks()
         if self.first_render or not (self.pause or self.exiting):
-            self.fade.run()
-            if not self.win:
-                check_for_collisions()
-                for obj in GameObject.objects.values():
-                    try:
-                        if obj.y >= 0:
-                            self.lights.virtualLEDBuffer[obj.xs, obj.ys] = Pixel(obj.color).array
-                    except:  # noqa
-                        pass
+            for _ in range(ticks):
+                self.step_game()
             if len(GameObject.objects) > 0:
                 self.first_render = False
-            if not self.lights.simulate:
-                self.lights.copyVirtualLedsToWS281X()
-                self.lights.refreshLEDs()
-            else:
-                counter = 0
-                for row in self.lights.virtualLEDBuffer:
-                    for column in row:
-                        pygame.draw.rect(self.display, [int(x) for x in column], self.rs[counter])
-                        counter += 1
-                pygame.display.update()
-                time.sleep(0.10)
+            self.render_game(self.clock.alpha if LightGame.INTERPOLATE else 1.0)
+        self.clock.wait()
 
     def check_end_game(self):
         if self.exiting:
@@ -1005,3 +823,44 @@ class TriggerRight(Trigger):
 @dataclass
 class TriggerLeft(Trigger):
     event_id: LightEventId = LightEventId.TriggerLeft
+
+
+# the event each controller button produces
+BUTTON_EVENTS: dict[int, type[ButtonEvent]] = {
+    XboxButton.A: ButtonBottom,
+    XboxButton.B: ButtonRight,
+    XboxButton.X: ButtonLeft,
+    XboxButton.Y: ButtonTop,
+    XboxButton.BUMPER_LEFT: ButtonBumperLeft,
+    XboxButton.BUMPER_RIGHT: ButtonBumperRight,
+    XboxButton.START: ButtonStart,
+    XboxButton.OPTIONS: ButtonOptions,
+    XboxButton.XBOX: ButtonPower,
+    XboxButton.SHARE: ButtonShare,
+    XboxButton.UP: ButtonHatUp,
+    XboxButton.DOWN: ButtonHatDown,
+    XboxButton.LEFT: ButtonHatLeft,
+    XboxButton.RIGHT: ButtonHatRight,
+    XboxButton.JOY_LEFT: ButtonStickLeft,
+    XboxButton.JOY_RIGHT: ButtonStickRight,
+}
+# the event each analog axis updates, with the event id and the field the axis value goes in
+AXIS_EVENTS: dict[int, tuple[type[LightEvent], int, str]] = {
+    XboxJoystick.JOY_LEFT_X: (StickLeft, -4, "x"),
+    XboxJoystick.JOY_LEFT_Y: (StickLeft, -4, "y"),
+    XboxJoystick.JOY_RIGHT_X: (StickRight, -3, "x"),
+    XboxJoystick.JOY_RIGHT_Y: (StickRight, -3, "y"),
+    XboxJoystick.TRIGGER_LEFT: (TriggerLeft, -6, "z"),
+    XboxJoystick.TRIGGER_RIGHT: (TriggerRight, -5, "z"),
+}
+# hat directions in priority order, as (value index, value, event, button id)
+HAT_EVENTS: tuple[tuple[int, int, type[ButtonHat], int], ...] = (
+    (1, 1, ButtonHatUp, XboxButton.UP),
+    (1, -1, ButtonHatDown, XboxButton.DOWN),
+    (0, -1, ButtonHatLeft, XboxButton.LEFT),
+    (0, 1, ButtonHatRight, XboxButton.RIGHT),
+)
+# pygame event types the games do not use: text, mouse, audio and window events
+IGNORED_EVENT_TYPES = frozenset(
+    {770, 1024, 1025, 1026, 4352, 32768, 32770, 32774, 32776, 32780, 32782, 32783, 32784, 32785, 32786}
+)
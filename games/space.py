@@ -6,7 +6,7 @@ from typing import Optional
 from light_game import LightEvent, LightEventId, LightGame
 from lightberries.matrix_controller import MatrixController
 from lightberries.pixel import PixelColors
-from game_objects import GameObject, Player, Projectile, Enemy
+from game_objects import GameObject, Player, Projectile, Enemy, SpriteShape, shape_stencil
 import numpy as np
 import logging
 
@@ -111,6 +111,9 @@ class ShieldEnemy(SpaceEnemy):
 
 
 class Shield(Projectile):
+    # drawn around its owner, not moved by dx and dy
+    interpolated = False
+
     def __init__(
         self,
         owner: GameObject,
@@ -141,10 +144,7 @@ class Shield(Projectile):
 
     @property
     def xs(self) -> list[int]:
-        xs = (
-            np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * self.size))) * (self.size)).astype(dtype=np.int32)
-            + self.x
-        )
+        xs = shape_stencil(SpriteShape.CIRCLE, self.size, self.size, self.size)[0] + self.x
         xs = np.array(xs)
         fix = np.where(xs < 0)
         if fix:
@@ -161,10 +161,7 @@ class Shield(Projectile):
 
     @property
     def ys(self) -> list[int]:
-        ys = (
-            np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * self.size))) * (self.size)).astype(dtype=np.int32)
-            + self.y
-        )
+        ys = shape_stencil(SpriteShape.CIRCLE, self.size, self.size, self.size)[1] + self.y
         ys = np.array(ys)
         fix = np.where(ys < 0)
         if fix:
@@ -194,6 +191,8 @@ class Shield(Projectile):
 
 
 class DeathRay(Projectile):
+    # drawn from its owner along its aim, not moved by dx and dy
+    interpolated = False
     death_rays: dict[int, DeathRay] = {}
 
     def __init__(
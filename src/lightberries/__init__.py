@@ -4,9 +4,31 @@ See https://github.com/rpi-ws281x/rpi-ws281x-python for referenced module.
 """
 from __future__ import annotations
 import logging
+from typing import Any, TYPE_CHECKING
 from lightberries.array_controller import ArrayController as ArrayController  # noqa
-from lightberries.matrix_controller import MatrixController as MatrixController  # noqa
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.matrix_controller import MatrixController as MatrixController  # noqa
 
 # setup logging
 LOGGER = logging.getLogger("lightBerries")
 logging.addLevelName(5, "VERBOSE")
+
+
+def __getattr__(name: str) -> Any:
+    """Import the matrix subsystem the first time it is used, to keep startup fast.
+
+    Args:
+        name: the attribute being looked up
+
+    Returns:
+        the attribute
+
+    Raises:
+        AttributeError: if the attribute does not exist
+    """
+    if name == "MatrixController":
+        from lightberries.matrix_controller import MatrixController as _MatrixController
+
+        return _MatrixController
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
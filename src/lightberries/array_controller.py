@@ -3,20 +3,33 @@ from __future__ import annotations
 from math import ceil
 import sys
 import time
-import random
 import logging
 from typing import (
+    AsyncIterable,
     Callable,
+    Iterable,
+    Iterator,
     Optional,
     Any,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
 )
 import numpy as np
-from lightberries.array_patterns import ArrayPattern, ConvertPixelArrayToNumpyArray
+from lightberries.array_patterns import (
+    ArrayPattern,
+    ConvertPixelArrayToNumpyArray,
+    PIXEL_BUFFER_DTYPE,
+    QuantizePixelArray,
+)
+from lightberries.array_layers import LayerStack
+from lightberries.array_random import ArrayRandom
+from lightberries.metrics import ControllerMetrics
 from lightberries.exceptions import (
     LightBerryException,
     ControllerException,
 )
-from lightberries.pixel import Pixel, PixelColors
+from lightberries.pixel import Pixel, PixelColors, PseudoRandomPalette
 from lightberries.ws281x_strings import WS281xString
 from lightberries.array_functions import (
     ArrayFunction,
@@ -26,9 +39,18 @@ from lightberries.array_functions import (
     ThingMoves,
 )
 
+# asyncio, the show thread, and the profiler are only imported when they are used, to keep startup fast
+if TYPE_CHECKING:  # pragma: no cover
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from lightberries.array_profiler import ArrayProfiler
+    from lightberries.audio_analysis import AudioAnalyzer, SharedFeatures
+    from lightberries.ws281x_simulator import SimulatedPixelStrip
 
 LOGGER = logging.getLogger("lightBerries")
 DEFAULT_REFRESH_DELAY = 50
+# a full frame, or a delta given as (indices, colors)
+FrameType = Union[np.ndarray, Tuple[Any, Any]]
 
 
 class ArrayController:
@@ -70,6 +92,7 @@ class ArrayController:
         refreshCallback: Callable = None,
         simulate: bool = False,
         testing: bool = False,
+        seed: Optional[int] = None,
     ) -> None:
         """Create a LightArrayController object for running patterns across a rpi_ws281x LED string.
 
@@ -89,6 +112,8 @@ class ArrayController:
             verbose: set true for even more information
             refreshCallback: callback method is called whenever new LED values are sent to LED string
             simulate: only call refreshCallback, don't use GPIO
+            testing: use the fake rpi_ws281x module
+            seed: seed the random source for a reproducible show
 
         Raises:
             SystemExit: if exiting
@@ -135,9 +160,22 @@ class ArrayController:
                 color=PixelColors.OFF.array,
             )
             self.virtualLEDIndexBuffer: np.ndarray[(Any,), np.int32] = np.array(range(len(self.ws281xString)))
-            self.privateOverlayDict: dict[int, np.ndarray[(3,), np.int32]] = {}
+            self.privateLayerStack: LayerStack = LayerStack(self.privateLEDCount)
+            self.privateRandomSource: ArrayRandom = ArrayRandom(seed)
+            self.privateMetrics: ControllerMetrics = ControllerMetrics(ledBrightnessFloat)
+            self.privateProfiler: Optional[ArrayProfiler] = None
             self.privateVirtualLEDCount: int = len(self.virtualLEDBuffer)
             self.privateVirtualLEDIndexCount: int = len(self.virtualLEDIndexBuffer)
+            self.privateVirtualClock: Optional[float] = None
+            self.privateDroppedFrameCount: int = 0
+            # work on the frame being built, and on the frame waiting to be sent
+            self.privateFrameWork: float = 0.0
+            self.privateReadyFrameWork: float = 0.0
+            self.privateShowExecutor: Optional[ThreadPoolExecutor] = None
+            # shared feature vectors the audio effects attached to by name
+            self.privateAttachedFeatures: list[SharedFeatures] = []
+            self.privateModeSwitches: list[tuple[Callable[[], None], asyncio.Future]] = []
+            self.privateRunningAsync: bool = False
             self.privateLastModeChange: float = time.time() - 1000
             self.privateNextModeChange: float = time.time()
             self.privateRefreshDelay: float = 0.001
@@ -205,6 +243,8 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
+            self._shutdownShowExecutor()
+            self._closeAttachedFeatures()
             if self.ws281xString is not None:
                 self.off()
                 self.copyVirtualLedsToWS281X()
@@ -307,6 +347,82 @@ class ArrayController:
         """
         self.privateSecondsPerMode = float(seconds)
 
+    @property
+    def brightness(
+        self,
+    ) -> float:
+        """The brightness of the LED string.
+
+        Returns:
+            the brightness between 0.0 (OFF) and 1.0 (ON)
+        """
+        return self.ws281xString.brightness
+
+    @brightness.setter
+    def brightness(
+        self,
+        brightness: float,
+    ) -> None:
+        """Set the brightness of the LED string.
+
+        Args:
+            brightness: a value between 0.0 (OFF) and 1.0 (ON)
+        """
+        self.ws281xString.brightness = brightness
+        self.privateMetrics.brightness = float(brightness)
+
+    @property
+    def profiler(
+        self,
+    ) -> Optional[ArrayProfiler]:
+        """The function profiler, if profiling is enabled.
+
+        Returns:
+            the profiler or None
+        """
+        return self.privateProfiler
+
+    def enableProfiling(
+        self,
+        historyFrames: int = 600,
+        outputDirectory: str = ".",
+    ) -> ArrayProfiler:
+        """Time every light function instance every frame, without stopping the show.
+
+        Use profiler.summary() to find the slow function instance and
+        profiler.requestProfile() (or profiler.installSignalHandler()) to capture
+        cProfile stacks for a few frames.
+
+        Args:
+            historyFrames: the number of recent frames to keep timings for
+            outputDirectory: where cProfile captures are written
+
+        Returns:
+            the profiler
+        """
+        from lightberries.array_profiler import ArrayProfiler
+
+        if self.privateProfiler is None:
+            self.privateProfiler = ArrayProfiler(historyFrames=historyFrames, outputDirectory=outputDirectory)
+        return self.privateProfiler
+
+    def disableProfiling(
+        self,
+    ) -> None:
+        """Stop timing light functions."""
+        self.privateProfiler = None
+
+    @property
+    def metrics(
+        self,
+    ) -> ControllerMetrics:
+        """The render loop metrics (frame rate, frame times, current draw, ...).
+
+        Returns:
+            the metrics registry
+        """
+        return self.privateMetrics
+
     @property
     def colorSequence(
         self,
@@ -328,7 +444,7 @@ class ArrayController:
         Args:
             colorSequence: the sequence of RGB values
         """
-        self.privateColorSequence = np.copy(ConvertPixelArrayToNumpyArray(colorSequence))
+        self.privateColorSequence = np.array(ConvertPixelArrayToNumpyArray(colorSequence), dtype=PIXEL_BUFFER_DTYPE)
         self.colorSequenceCount = len(self.privateColorSequence)
         self.colorSequenceIndex = 0
 
@@ -404,13 +520,22 @@ class ArrayController:
         return self.privateLightFunctions
 
     @property
-    def overlayDictionary(self) -> dict[int, Any]:
-        """The list of indices and associated colors to temporarily assign LEDs.
+    def randomSource(self) -> ArrayRandom:
+        """The batched random number source used by this controller and its functions.
+
+        Returns:
+            the random source
+        """
+        return self.privateRandomSource
+
+    @property
+    def layers(self) -> LayerStack:
+        """The stack of layers composited over the virtual LED buffer before output.
 
         Returns:
-            the dictionary of LEDs and values
+            the layer stack
         """
-        return self.privateOverlayDict
+        return self.privateLayerStack
 
     def getColorMethodsList(self) -> list[str]:
         """Get the list of methods in this class (by name) that set the color sequence.
@@ -448,6 +573,10 @@ class ArrayController:
         try:
             LOGGER.debug("%s.%s:", self.__class__.__name__, self.reset.__name__)
             self.privateLightFunctions = []
+            self._closeAttachedFeatures()
+            # switchMode resets between frames of runAsync, which still needs its worker thread
+            if self.privateRunningAsync is not True:
+                self._shutdownShowExecutor()
             if self.virtualLEDCount >= self.realLEDCount:
                 self.setvirtualLEDBuffer(self.virtualLEDBuffer[: self.realLEDCount])
             elif self.virtualLEDCount < self.realLEDCount:
@@ -479,7 +608,7 @@ class ArrayController:
         """
         try:
             # make sure the passed LED array is the correct type
-            _ledBuffer = ledBuffer
+            _ledBuffer = np.ascontiguousarray(ledBuffer, dtype=PIXEL_BUFFER_DTYPE)
             _ledBufferLen = int(_ledBuffer.size / 3)
 
             # check assignment length
@@ -501,7 +630,7 @@ class ArrayController:
                 self.virtualLEDBuffer = np.concatenate(
                     (
                         self.virtualLEDBuffer,
-                        np.array([PixelColors.OFF.tuple for i in range(self.realLEDCount - self.virtualLEDCount)]),
+                        np.zeros((self.realLEDCount - self.virtualLEDCount, 3), dtype=PIXEL_BUFFER_DTYPE),
                     )
                 )
         except SystemExit:  # pragma: no cover
@@ -513,10 +642,13 @@ class ArrayController:
         except Exception as ex:  # pragma: no cover
             raise ControllerException from ex
 
-    def copyVirtualLedsToWS281X(
+    def compositeFrame(
         self,
-    ) -> None:
-        """Sets each Pixel in the rpi_ws281x object to the buffered array value.
+    ) -> np.ndarray[(3, Any), np.float32]:
+        """Map the virtual LED buffer onto the base layer and flatten the layer stack on top of it.
+
+        Returns:
+            the composited frame in LED string order (before quantization)
 
         Raises:
             SystemExit: if exiting
@@ -524,27 +656,30 @@ class ArrayController:
             LightBerryException: if propagating an exception
             LightControlException: if something bad happens
         """
-        # callback function to do work
-
-        def SetPixel(i_rgb):
-            self.ws281xString[i_rgb[0]] = i_rgb[1]
-
-        # fast method of calling the callback method on each index of LED array
-        list(
-            map(
-                SetPixel,
-                enumerate(
-                    self.virtualLEDBuffer[self.virtualLEDIndexBuffer][
-                        np.where(self.virtualLEDIndexBuffer < self.realLEDCount)
-                    ]
-                ),
-            )
-        )
+        try:
+            _base = self.privateLayerStack.base
+            _visibleLEDs = self.virtualLEDBuffer[self.virtualLEDIndexBuffer][
+                self.virtualLEDIndexBuffer < self.realLEDCount
+            ]
+            _base[: len(_visibleLEDs)] = _visibleLEDs
+            # LEDs past the visible ones are off, not left over from an earlier frame
+            _base[len(_visibleLEDs) :] = 0
+            return self.privateLayerStack.composite()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
 
-    def refreshLEDs(
+    def copyVirtualLedsToWS281X(
         self,
     ) -> None:
-        """Display current LED buffer.
+        """Sets each Pixel in the rpi_ws281x object to the buffered array value.
+
+        The composited frame is quantized to 8-bit values here, and only here.
 
         Raises:
             SystemExit: if exiting
@@ -553,10 +688,12 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            # call light string's refresh method to send the communications out to the addressable LEDs
-            if isinstance(self.refreshCallback, Callable):
-                self.refreshCallback()
-            self.ws281xString.refresh()
+            _start = time.perf_counter()
+            _frame = self.compositeFrame()
+            self.ws281xString.setPixelArray(_frame)
+            self.privateMetrics.recordLevels(float(_frame.sum()), len(_frame))
+            self.privateReadyFrameWork = self.privateFrameWork + (time.perf_counter() - _start)
+            self.privateFrameWork = 0.0
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -566,10 +703,10 @@ class ArrayController:
         except Exception as ex:  # pragma: no cover
             raise ControllerException from ex
 
-    def off(
+    def refreshLEDs(
         self,
     ) -> None:
-        """Set all Pixels to RGD background color.
+        """Display current LED buffer.
 
         Raises:
             SystemExit: if exiting
@@ -578,10 +715,13 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            # clear all current values
-            self.virtualLEDBuffer *= 0
-            # set to background color
-            self.virtualLEDBuffer[:] += self.backgroundColor
+            _start = time.perf_counter()
+            # call light string's refresh method to send the communications out to the addressable LEDs
+            if isinstance(self.refreshCallback, Callable):
+                self.refreshCallback()
+            self.ws281xString.refresh()
+            self.privateMetrics.recordFrame(_start, time.perf_counter(), self.privateReadyFrameWork)
+            self.privateReadyFrameWork = 0.0
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -591,10 +731,10 @@ class ArrayController:
         except Exception as ex:  # pragma: no cover
             raise ControllerException from ex
 
-    def _runFunctions(
+    def off(
         self,
     ) -> None:
-        """Run each function in the configured function list.
+        """Set all Pixels to RGD background color.
 
         Raises:
             SystemExit: if exiting
@@ -603,9 +743,10 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            # invoke the function pointer saved in the light data object
-            for function in self.privateLightFunctions:
-                function.runFunction(function)
+            # overwrite all current values with the background color
+            self.virtualLEDBuffer[:] = self.backgroundColor
+            # remove anything drawn on top of the buffer
+            self.privateLayerStack.clear()
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -615,10 +756,10 @@ class ArrayController:
         except Exception as ex:  # pragma: no cover
             raise ControllerException from ex
 
-    def _copyOverlays(
+    def _runFunctions(
         self,
-    ):
-        """Copy overlays directly to output array, bypassing the buffer.
+    ) -> None:
+        """Run each function in the configured function list.
 
         Raises:
             SystemExit: if exiting
@@ -627,13 +768,24 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            # iterate over the dictionary key-value pairs, assign LED values
-            # directly to output buffer skipping the virtual LED copies.
-            # This ensures that overlays are temporary and get overwritten
-            # next refresh.
-            for index, ledValue in self.privateOverlayDict.items():
-                self.ws281xString[index] = ledValue
-            self.privateOverlayDict = {}
+            _start = time.perf_counter()
+            _profiler = self.privateProfiler
+            if _profiler is not None:
+                _profiler.beginFrame()
+            try:
+                # invoke the function pointer saved in the light data object
+                for position, function in enumerate(self.privateLightFunctions):
+                    _cpuStart = time.thread_time()
+                    if _profiler is None:
+                        function.runFunction(function)
+                    else:
+                        _profiler.runFunction(position, function)
+                    self.privateMetrics.functionSeconds.labels(function.funcName).inc(time.thread_time() - _cpuStart)
+            finally:
+                # a function that raises must not leave cProfile running
+                if _profiler is not None:
+                    _profiler.endFrame()
+            self.privateFrameWork += time.perf_counter() - _start
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -658,7 +810,7 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            return random.randint(0, (self.virtualLEDCount - 1))
+            return self.privateRandomSource.randint(0, (self.virtualLEDCount - 1))
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -687,10 +839,7 @@ class ArrayController:
             LightControlException: if something bad happens
         """
         try:
-            temp = []
-            for _ in range(count):
-                temp.append(self.getRandomIndex())
-            return np.array(temp, dtype=np.int32)
+            return self.privateRandomSource.integers(0, (self.virtualLEDCount - 1), count)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -706,7 +855,7 @@ class ArrayController:
         Returns:
             one or negative one, randomly
         """
-        return [-1, 1][random.randint(0, 1)]
+        return self.privateRandomSource.direction()
 
     def getRandomBoolean(self) -> bool:
         """Get a random true or false value.
@@ -714,7 +863,7 @@ class ArrayController:
         Returns:
             True or False, randomly
         """
-        return [True, False][random.randint(0, 1)]
+        return self.privateRandomSource.boolean()
 
     def fadeColor(
         self,
@@ -752,6 +901,21 @@ class ArrayController:
                     _color[rgbIndex] = colorNext[rgbIndex]
         return _color
 
+    def clock(
+        self,
+    ) -> float:
+        """The time used by the frame loop.
+
+        This is wall clock time, except while rendering offline, when it is a virtual
+        clock that advances by exactly one frame period per frame.
+
+        Returns:
+            the current time in seconds
+        """
+        if self.privateVirtualClock is None:
+            return time.time()
+        return self.privateVirtualClock
+
     def run(self):
         """Run the configured color pattern and function either forever or for self.secondsPerMode.
 
@@ -763,23 +927,16 @@ class ArrayController:
         """
         try:
             LOGGER.debug("%s.%s:", self.__class__.__name__, self.run.__name__)
-            # set start time
-            self.privateLastModeChange = time.time()
-            # set a target time to change
-            if self.secondsPerMode is None:
-                self.privateNextModeChange = self.privateLastModeChange + (random.uniform(30, 120))
-            else:
-                self.privateNextModeChange = self.privateLastModeChange + (self.secondsPerMode)
+            # set start time and a target time to change
+            self._scheduleModeChange()
             # loop
             self.running = True
-            while (time.time() < self.privateNextModeChange and self.running is True) or self.privateLoopForever:
+            while (self.clock() < self.privateNextModeChange and self.running is True) or self.privateLoopForever:
                 try:
                     # run the selected functions using LightFunction object callbacks
                     self._runFunctions()
-                    # copy the resulting RGB values to the ws28xx LED buffer
+                    # composite the resulting RGB values and overlays into the ws28xx LED buffer
                     self.copyVirtualLedsToWS281X()
-                    # copy temporary changes (not buffered in this class) to the ws28xx LED buffer
-                    self._copyOverlays()
                     # tell the ws28xx controller to transmit the new data
                     self.refreshLEDs()
                 except KeyboardInterrupt:  # pragma: no cover
@@ -790,11 +947,7 @@ class ArrayController:
                     raise
                 except Exception as ex:  # pragma: no cover
                     raise ControllerException from ex
-            self.privateLastModeChange = time.time()
-            if self.secondsPerMode is None:
-                self.privateNextModeChange = self.privateLastModeChange + (random.random(30, 120))
-            else:
-                self.privateNextModeChange = self.privateLastModeChange + (self.secondsPerMode)
+            self._scheduleModeChange()
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -810,6 +963,542 @@ class ArrayController:
             )
             raise ControllerException from ex
 
+    def render(
+        self,
+        frames: Optional[int],
+        seed: Optional[int] = None,
+        framesPerSecond: float = 60.0,
+        lazy: bool = False,
+    ) -> Union[np.ndarray[(Any, Any, 3), np.uint8], Iterator[np.ndarray[(Any, 3), np.uint8]]]:
+        """Render the configured color pattern and functions offline.
+
+        Frames are composited and quantized exactly as they would be for the LED string,
+        but the string is never touched and the clock is a virtual clock advancing one
+        frame period per frame. Create the controller with testing=True to render
+        without GPIO or root. Pass the same seed to the constructor as well when the
+        useColor/useFunction configuration itself draws random values.
+
+        Args:
+            frames: the number of frames to render (None renders forever, lazy only)
+            seed: reseed the random source before the first frame for reproducible output
+            framesPerSecond: the rate of the virtual clock
+            lazy: set true to get a generator yielding one frame at a time instead of one big array
+
+        Returns:
+            a uint8 array of shape (frames, LEDs, 3), or a generator of (LEDs, 3) frames
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            if seed is not None:
+                self.privateRandomSource.seed(seed)
+            if frames is None and not lazy:
+                raise ControllerException("Rendering forever requires lazy=True")
+            _frames = self._renderFrames(frames, framesPerSecond)
+            if lazy:
+                return _frames
+            _rendered = np.empty((int(frames), self.realLEDCount, 3), dtype=np.uint8)
+            for index, frame in enumerate(_frames):
+                _rendered[index] = frame
+            return _rendered
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+
+    def _renderFrames(
+        self,
+        frames: Optional[int],
+        framesPerSecond: float,
+    ) -> Iterator[np.ndarray[(Any, 3), np.uint8]]:
+        """Generate rendered frames on a virtual clock.
+
+        Args:
+            frames: the number of frames to render, None for no limit
+            framesPerSecond: the rate of the virtual clock
+
+        Yields:
+            one quantized (LEDs, 3) frame at a time
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        _framePeriod = 1.0 / float(framesPerSecond)
+        _frameIndex = 0
+        try:
+            while frames is None or _frameIndex < frames:
+                self.privateVirtualClock = _frameIndex * _framePeriod
+                self._runFunctions()
+                yield QuantizePixelArray(self.compositeFrame())
+                _frameIndex += 1
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+        finally:
+            self.privateVirtualClock = None
+
+    @property
+    def droppedFrameCount(
+        self,
+    ) -> int:
+        """The number of streamed frames replaced by a newer frame before they were shown.
+
+        Returns:
+            the number of frames dropped by the last call to play
+        """
+        return self.privateDroppedFrameCount
+
+    @property
+    def simulator(
+        self,
+    ) -> Optional[SimulatedPixelStrip]:
+        """The simulated LED strip of a controller created with simulate=True.
+
+        Add outputs to it (ws281x_simulator.PNGSequenceWriter or PreviewServer) to see the show.
+
+        Returns:
+            the simulated strip, or None when driving real LEDs
+        """
+        return getattr(self.ws281xString, "simulator", None)
+
+    def _applyFrame(
+        self,
+        frame: FrameType,
+    ) -> None:
+        """Write one streamed frame or frame delta into the virtual LED buffer.
+
+        Args:
+            frame: a full frame shaped like the virtual LED buffer, or an (indices, colors) delta
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            if isinstance(frame, tuple):
+                _indices, _colors = frame
+                self.virtualLEDBuffer[_indices] = _colors
+            else:
+                np.copyto(self.virtualLEDBuffer, frame, casting="same_kind")
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
+    def _showFrame(
+        self,
+    ) -> None:
+        """Composite the virtual LED buffer and send it out to the LED string.
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            self.copyVirtualLedsToWS281X()
+            self.refreshLEDs()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+
+    def play(
+        self,
+        source: Union[Iterable[FrameType], AsyncIterable[FrameType]],
+        framesPerSecond: Optional[float] = None,
+        dropFrames: bool = True,
+    ) -> None:
+        """Show frames from an external source until it is exhausted or running is set false.
+
+        Each item from the source is either a full frame shaped like the virtual LED
+        buffer, or a delta tuple (indices, colors) applied on top of the previous frame.
+        Frames are copied straight into the virtual LED buffer and go through the same
+        index mapping and layer stack as the built in functions.
+
+        A plain iterator is pulled only when the next frame is due, so a slow display
+        applies back-pressure to the source. An async iterator runs independently of the
+        display; when it produces frames faster than they can be shown, only the newest
+        full frame is kept (see droppedFrameCount).
+
+        Args:
+            source: an iterator or async iterator of frames and frame deltas
+            framesPerSecond: the maximum display rate, None to show frames as fast as they come
+            dropFrames: set false to make an async source wait for every frame to be shown
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            LOGGER.debug("%s.%s:", self.__class__.__name__, self.play.__name__)
+            if hasattr(source, "__aiter__"):
+                import asyncio
+
+                asyncio.run(self.playAsync(source, framesPerSecond=framesPerSecond, dropFrames=dropFrames))
+                return
+            self.privateDroppedFrameCount = 0
+            _framePeriod = 0.0 if not framesPerSecond else 1.0 / float(framesPerSecond)
+            _deadline = self.clock()
+            self.running = True
+            for frame in source:
+                self._applyFrame(frame)
+                if _framePeriod:
+                    _now = self.clock()
+                    if _now < _deadline:
+                        time.sleep(_deadline - _now)
+                    # don't try to catch up after a slow frame, just start pacing again from now
+                    _deadline = max(_deadline, _now) + _framePeriod
+                self._showFrame()
+                if self.running is not True:
+                    break
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            LOGGER.exception(
+                "%s.%s Exception: %s",
+                self.__class__.__name__,
+                self.play.__name__,
+                ex,
+            )
+            raise ControllerException from ex
+
+    async def playAsync(
+        self,
+        source: Union[Iterable[FrameType], AsyncIterable[FrameType]],
+        framesPerSecond: Optional[float] = None,
+        dropFrames: bool = True,
+    ) -> None:
+        """Show frames from an external source inside a running event loop.
+
+        The source is consumed by its own task. Full frames land in a single slot that
+        the display side empties once per frame, so a newer frame replaces one that has
+        not been shown yet (latest frame wins). Deltas are never dropped; they are
+        queued behind the pending full frame and applied in order.
+
+        Args:
+            source: an iterator or async iterator of frames and frame deltas
+            framesPerSecond: the maximum display rate, None to show frames as fast as they come
+            dropFrames: set false to make the source wait for every frame to be shown
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        import asyncio
+
+        _pendingFrame: list[Optional[FrameType]] = [None]
+        _pendingDeltas: list[FrameType] = []
+        _available = asyncio.Event()
+        _consumed = asyncio.Event()
+        _consumed.set()
+
+        async def _iterate():
+            if hasattr(source, "__aiter__"):
+                async for frame in source:
+                    yield frame
+            else:
+                for frame in source:
+                    yield frame
+
+        async def _receive():
+            async for frame in _iterate():
+                if not dropFrames:
+                    await _consumed.wait()
+                _consumed.clear()
+                if isinstance(frame, tuple):
+                    _pendingDeltas.append(frame)
+                else:
+                    if _pendingFrame[0] is not None:
+                        self.privateDroppedFrameCount += 1
+                        self.privateMetrics.droppedFramesTotal.inc()
+                    _pendingFrame[0] = frame
+                    # the new frame overwrites everything the queued deltas would have changed
+                    _pendingDeltas.clear()
+                _available.set()
+                # let the display side run between frames from a source that never awaits
+                await asyncio.sleep(0)
+
+        try:
+            LOGGER.debug("%s.%s:", self.__class__.__name__, self.playAsync.__name__)
+            self.privateDroppedFrameCount = 0
+            _framePeriod = 0.0 if not framesPerSecond else 1.0 / float(framesPerSecond)
+            _deadline = self.clock()
+            self.running = True
+            _receiver = asyncio.ensure_future(_receive())
+            try:
+                while self.running is True:
+                    _waitAvailable = asyncio.ensure_future(_available.wait())
+                    await asyncio.wait([_waitAvailable, _receiver], return_when=asyncio.FIRST_COMPLETED)
+                    _waitAvailable.cancel()
+                    if not _available.is_set():
+                        # the source is exhausted (or failed) and everything has been shown
+                        break
+                    if _framePeriod:
+                        _now = self.clock()
+                        if _now < _deadline:
+                            await asyncio.sleep(_deadline - _now)
+                        _deadline = max(_deadline, _now) + _framePeriod
+                    _available.clear()
+                    if _pendingFrame[0] is not None:
+                        self._applyFrame(_pendingFrame[0])
+                        _pendingFrame[0] = None
+                    for delta in _pendingDeltas:
+                        self._applyFrame(delta)
+                    _pendingDeltas.clear()
+                    _consumed.set()
+                    self._showFrame()
+                if _receiver.done():
+                    # propagate any exception raised by the source
+                    _receiver.result()
+            finally:
+                if not _receiver.done():
+                    _receiver.cancel()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except asyncio.CancelledError:  # pragma: no cover
+            raise
+        except Exception as ex:
+            LOGGER.exception(
+                "%s.%s Exception: %s",
+                self.__class__.__name__,
+                self.playAsync.__name__,
+                ex,
+            )
+            raise ControllerException from ex
+
+    def _scheduleModeChange(
+        self,
+    ) -> None:
+        """Start timing a new mode from now."""
+        self.privateLastModeChange = self.clock()
+        if self.secondsPerMode is None:
+            self.privateNextModeChange = self.privateLastModeChange + (self.privateRandomSource.uniform(30, 120))
+        else:
+            self.privateNextModeChange = self.privateLastModeChange + (self.secondsPerMode)
+
+    def _shutdownShowExecutor(
+        self,
+    ) -> None:
+        """Stop the runAsync worker thread, after it finishes sending the frame it is on."""
+        if self.privateShowExecutor is not None:
+            self.privateShowExecutor.shutdown(wait=True)
+            self.privateShowExecutor = None
+
+    def _closeAttachedFeatures(
+        self,
+    ) -> None:
+        """Detach from the shared feature vectors the audio effects in the function list attached to."""
+        for features in self.privateAttachedFeatures:
+            features.close()
+        self.privateAttachedFeatures = []
+
+    def _applyModeSwitches(
+        self,
+    ) -> None:
+        """Apply changes queued by applyBetweenFrames, in the order they were requested."""
+        _switches, self.privateModeSwitches = self.privateModeSwitches, []
+        for change, future in _switches:
+            # the caller stopped waiting, so it no longer wants the change
+            if future.cancelled():
+                continue
+            try:
+                change()
+                future.set_result(None)
+            except Exception as ex:
+                future.set_exception(ex)
+
+    async def applyBetweenFrames(
+        self,
+        change: Callable[[], None],
+    ) -> None:
+        """Call change between two frames of runAsync, or right away if runAsync is not running.
+
+        If this coroutine is cancelled before the change is applied, the change is abandoned.
+
+        Args:
+            change: called with no arguments to modify the controller
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        import asyncio
+
+        try:
+            if self.privateRunningAsync is not True:
+                change()
+                return
+            _future = asyncio.get_running_loop().create_future()
+            self.privateModeSwitches.append((change, _future))
+            await _future
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
+    async def switchMode(
+        self,
+        configure: Callable[[], None],
+    ) -> None:
+        """Change the color pattern and functions between two frames of runAsync.
+
+        The controller is reset, then configure is called to pick the new colors and
+        functions (e.g. lambda: (lights.useColorRainbow(), lights.useFunctionCylon())).
+        The frame loop keeps showing the old mode until the switch is applied at the next
+        frame boundary, so no frame is ever built from a half configured mode. If this
+        coroutine is cancelled before then, the switch is abandoned.
+
+        Args:
+            configure: called with no arguments to configure the new mode
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+
+        def _switch():
+            self.reset()
+            configure()
+            self._scheduleModeChange()
+
+        await self.applyBetweenFrames(_switch)
+
+    async def runAsync(
+        self,
+        framesPerSecond: Optional[float] = None,
+    ) -> None:
+        """Run the configured color pattern and function as a coroutine.
+
+        This is the same frame loop as run, except that it awaits frame deadlines instead
+        of blocking and sends each frame out on a dedicated worker thread, so it can share
+        an event loop with servers, schedulers, and control APIs. The next frame is
+        computed while the previous one is being sent. Use switchMode to change modes
+        while it runs. Note that refreshCallback is called from the worker thread.
+
+        Cancelling the task waits for the frame being sent to finish before the
+        cancellation propagates.
+
+        Args:
+            framesPerSecond: the maximum frame rate, None to run as fast as the LEDs update
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        _showing: Optional[asyncio.Future] = None
+        try:
+            LOGGER.debug("%s.%s:", self.__class__.__name__, self.runAsync.__name__)
+            _loop = asyncio.get_running_loop()
+            if self.privateShowExecutor is None:
+                self.privateShowExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lightberries")
+            _framePeriod = 0.0 if not framesPerSecond else 1.0 / float(framesPerSecond)
+            self._scheduleModeChange()
+            _deadline = self.clock()
+            self.running = True
+            self.privateRunningAsync = True
+            try:
+                while (self.clock() < self.privateNextModeChange and self.running is True) or self.privateLoopForever:
+                    # mode switches only ever happen here, between two complete frames
+                    self._applyModeSwitches()
+                    # compute the next frame while the previous one is still being sent
+                    self._runFunctions()
+                    if _showing is not None:
+                        # cancelling the task must not cancel the frame being sent
+                        await asyncio.shield(_showing)
+                        _showing = None
+                    _now = self.clock()
+                    if _now < _deadline:
+                        await asyncio.sleep(_deadline - _now)
+                    else:
+                        # give other tasks a chance to run even when we are behind
+                        await asyncio.sleep(0)
+                    _deadline = max(_deadline, _now) + _framePeriod
+                    self.copyVirtualLedsToWS281X()
+                    _showing = _loop.run_in_executor(self.privateShowExecutor, self.refreshLEDs)
+                if _showing is not None:
+                    await asyncio.shield(_showing)
+                    _showing = None
+            finally:
+                if _showing is not None:
+                    # never abandon a frame half way out the door
+                    await asyncio.wait([_showing])
+                self.privateRunningAsync = False
+                for _, future in self.privateModeSwitches:
+                    future.cancel()
+                self.privateModeSwitches = []
+            self._scheduleModeChange()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:  # pragma: no cover
+            LOGGER.exception(
+                "%s.%s Exception: %s",
+                self.__class__.__name__,
+                self.runAsync.__name__,
+                ex,
+            )
+            raise ControllerException from ex
+
     def useColorSingle(
         self,
         foregroundColor: Pixel = None,
@@ -832,7 +1521,7 @@ class ArrayController:
 
             # defaults
             _sequence: np.ndarray[(Any, 3), np.int32] = ArrayPattern.DefaultColorSequenceByMonth()
-            _foregroundColor: np.ndarray[(3,), np.int32] = _sequence[random.randint(0, len(_sequence) - 1)]
+            _foregroundColor: np.ndarray[(3,), np.int32] = self.privateRandomSource.choice(_sequence)
             _backgroundColor = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
 
             # use the passed in color
@@ -879,7 +1568,8 @@ class ArrayController:
 
             self.backgroundColor = _backgroundColor
             # set the color sequence
-            self.colorSequence = ConvertPixelArrayToNumpyArray([PixelColors.PSEUDO_RANDOM])
+            # pick the color with the controller's random source so seeded renders repeat
+            self.colorSequence = [self.privateRandomSource.choice(PseudoRandomPalette())]
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -913,7 +1603,7 @@ class ArrayController:
 
             self.backgroundColor = _backgroundColor
             # set the color sequence to a single random value
-            self.colorSequence = ConvertPixelArrayToNumpyArray([PixelColors.RANDOM])
+            self.colorSequence = ArrayPattern.RandomArray(1, generator=self.privateRandomSource.generator)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -982,7 +1672,7 @@ class ArrayController:
         LOGGER.debug("\n%s.%s:", self.__class__.__name__, self.useColorSequencePseudoRandom.__name__)
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
-            _sequenceLength: int = random.randint(self.realLEDCount // 20, self.realLEDCount // 10)
+            _sequenceLength: int = self.privateRandomSource.randint(self.realLEDCount // 20, self.realLEDCount // 10)
             # either calculate a sequence length or use the passed value
             if sequenceLength is not None:
                 _sequenceLength = int(sequenceLength)
@@ -991,9 +1681,9 @@ class ArrayController:
                 _backgroundColor = Pixel(backgroundColor).array
             # assign the color sequence
             self.backgroundColor = _backgroundColor
-            self.colorSequence = ConvertPixelArrayToNumpyArray(
-                [PixelColors.PSEUDO_RANDOM for i in range(_sequenceLength)]
-            )
+            # pick the colors with the controller's random source so seeded renders repeat
+            _palette = np.array([color.array for color in PseudoRandomPalette()])
+            self.colorSequence = _palette[self.privateRandomSource.integers(0, len(_palette) - 1, _sequenceLength)]
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -1023,7 +1713,7 @@ class ArrayController:
         LOGGER.debug("\n%s.%s:", self.__class__.__name__, self.useColorSequenceRandom.__name__)
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
-            _sequenceLength: int = random.randint(self.realLEDCount // 20, self.realLEDCount // 10)
+            _sequenceLength: int = self.privateRandomSource.randint(self.realLEDCount // 20, self.realLEDCount // 10)
             # set background color
             if backgroundColor is not None:
                 self.backgroundColor = Pixel(backgroundColor).array
@@ -1032,7 +1722,7 @@ class ArrayController:
                 _sequenceLength = int(sequenceLength)
             # create color sequence
             self.backgroundColor = _backgroundColor
-            self.colorSequence = ConvertPixelArrayToNumpyArray([PixelColors.RANDOM for i in range(_sequenceLength)])
+            self.colorSequence = ArrayPattern.RandomArray(_sequenceLength, generator=self.privateRandomSource.generator)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -1116,7 +1806,7 @@ class ArrayController:
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
             _colorSequence: np.ndarray[(Any, 3), np.int32] = ArrayPattern.DefaultColorSequenceByMonth()
-            _stepsPerTransition: int = random.randint(3, 7)
+            _stepsPerTransition: int = self.privateRandomSource.randint(3, 7)
             _wrap: bool = self.getRandomBoolean()
             # set color sequence
             if colorSequence is not None:
@@ -1170,7 +1860,7 @@ class ArrayController:
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
             _colorSequence: np.ndarray[(3, Any), np.int32] = ArrayPattern.DefaultColorSequenceByMonth()
-            _stepsPerTransition: int = random.randint(3, 7)
+            _stepsPerTransition: int = self.privateRandomSource.randint(3, 7)
             _wrap: bool = self.getRandomBoolean()
             if colorSequence is not None:
                 _colorSequence = [Pixel(p) for p in colorSequence]
@@ -1220,7 +1910,7 @@ class ArrayController:
         LOGGER.debug("\n%s.%s:", self.__class__.__name__, self.useColorRainbow.__name__)
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
-            _rainbowPixelCount: int = random.randint(10, self.realLEDCount // 2)
+            _rainbowPixelCount: int = self.privateRandomSource.randint(10, self.realLEDCount // 2)
             if backgroundColor is not None:
                 _backgroundColor = Pixel(backgroundColor).array
             if rainbowPixelCount is not None:
@@ -1257,7 +1947,7 @@ class ArrayController:
         LOGGER.debug("\n%s.%s:", self.__class__.__name__, self.useColorRainbowRepeating.__name__)
         try:
             _backgroundColor: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_BACKGROUND_COLOR.array
-            _rainbowPixelCount: int = random.randint(10, self.realLEDCount // 2)
+            _rainbowPixelCount: int = self.privateRandomSource.randint(10, self.realLEDCount // 2)
             if backgroundColor is not None:
                 _backgroundColor = Pixel(backgroundColor).array
             if rainbowPixelCount is not None:
@@ -1318,7 +2008,7 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionSolidColorCycle.__name__)
         try:
-            _delayCount: int = random.randint(50, 100)
+            _delayCount: int = self.privateRandomSource.randint(50, 100)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             # create the tracking object
@@ -1330,8 +2020,7 @@ class ArrayController:
             # add this function to our function list
             self.privateLightFunctions.append(cycle)
             # clear LEDs, assign first color in sequence to all LEDs
-            self.virtualLEDBuffer *= 0
-            self.virtualLEDBuffer += self.colorSequence[0, :]
+            self.virtualLEDBuffer[:] = self.colorSequence[0, :]
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -1362,8 +2051,8 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMarquee.__name__)
         try:
-            _shiftAmount: int = random.randint(1, 2)
-            _delayCount: int = random.randint(0, 6)
+            _shiftAmount: int = self.privateRandomSource.randint(1, 2)
+            _delayCount: int = self.privateRandomSource.randint(0, 6)
             _initialDirection: int = self.getRandomDirection()
             if shiftAmount is not None:
                 _shiftAmount = int(shiftAmount)
@@ -1426,8 +2115,8 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionCylon.__name__)
         try:
-            _fadeAmount: float = random.randint(5, 75) / 255.0
-            _delayCount: int = random.randint(1, 6)
+            _fadeAmount: float = self.privateRandomSource.randint(5, 75) / 255.0
+            _delayCount: int = self.privateRandomSource.randint(1, 6)
             if fadeAmount is not None:
                 _fadeAmount = int(fadeAmount)
             # make sure fade is valid
@@ -1491,7 +2180,7 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMerge.__name__)
         try:
-            _delayCount: int = random.randint(6, 12)
+            _delayCount: int = self.privateRandomSource.randint(6, 12)
             _shiftAmount: int = 1
             if delayCount is not None:
                 _delayCount = int(delayCount)
@@ -1559,9 +2248,9 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionAccelerate.__name__)
         try:
-            _delayCountMax: int = random.randint(5, 10)
-            _stepCountMax: int = random.randint(4, 10)
-            _fadeAmount: float = random.randint(15, 35) / 255.0
+            _delayCountMax: int = self.privateRandomSource.randint(5, 10)
+            _stepCountMax: int = self.privateRandomSource.randint(4, 10)
+            _fadeAmount: float = self.privateRandomSource.randint(15, 35) / 255.0
             _cycleColors: bool = self.getRandomBoolean()
             if delayCountMax is not None:
                 _delayCountMax = int(delayCountMax)
@@ -1631,11 +2320,11 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionRandomChange.__name__)
         try:
-            _changeCount: int = random.randint(self.virtualLEDCount // 5, self.virtualLEDCount)
-            _fadeStepCount: int = random.randint(5, 20)
-            _delayCountMax: int = random.randint(30, 50)
+            _changeCount: int = self.privateRandomSource.randint(self.virtualLEDCount // 5, self.virtualLEDCount)
+            _fadeStepCount: int = self.privateRandomSource.randint(5, 20)
+            _delayCountMax: int = self.privateRandomSource.randint(30, 50)
             fadeTypes: list[LEDFadeType] = list(LEDFadeType)
-            _fadeType: LEDFadeType = fadeTypes[random.randint(0, len(fadeTypes) - 1)]
+            _fadeType: LEDFadeType = fadeTypes[self.privateRandomSource.randint(0, len(fadeTypes) - 1)]
             if changeCount is not None:
                 _changeCount = int(changeCount)
             if fadeStepCount is not None:
@@ -1684,14 +2373,14 @@ class ArrayController:
                             np.where(ArrayFunction.Controller.virtualLEDIndexBuffer == change.index)
                         ]
                     # randomly set the color we are fading toward
-                    if random.randint(0, 1) == 1:
+                    if self.privateRandomSource.randint(0, 1) == 1:
                         change.colorNext = self.colorSequenceNext
                     else:
                         change.colorNext = change.color
                     # set the refresh delay
                     change.delayCountMax = _delayCountMax
                     # we want all the delays random, so don't start them all at zero
-                    change.delayCounter = random.randint(0, change.delayCountMax)
+                    change.delayCounter = self.privateRandomSource.randint(0, change.delayCountMax)
                     # set true to fade, false to "instant on/off"
                     change.fadeType = _fadeType
                     # add function to list
@@ -1736,15 +2425,15 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMeteors.__name__)
         try:
-            _fadeAmount: float = random.randint(20, 40) / 100.0
+            _fadeAmount: float = self.privateRandomSource.randint(20, 40) / 100.0
             _explode: bool = self.getRandomBoolean()
-            _maxSpeed: int = random.randint(1, 3)
-            _delayCount: int = random.randint(1, 3)
-            _meteorCount: int = random.randint(2, 6)
+            _maxSpeed: int = self.privateRandomSource.randint(1, 3)
+            _delayCount: int = self.privateRandomSource.randint(1, 3)
+            _meteorCount: int = self.privateRandomSource.randint(2, 6)
             _collide: bool = self.getRandomBoolean()
             _cycleColors: bool = self.getRandomBoolean()
             fadeTypes: list[LEDFadeType] = list(LEDFadeType)
-            _fadeType: LEDFadeType = fadeTypes[random.randint(0, len(fadeTypes) - 1)]
+            _fadeType: LEDFadeType = fadeTypes[self.privateRandomSource.randint(0, len(fadeTypes) - 1)]
             if self.colorSequenceCount >= 2 and self.colorSequenceCount <= 6:
                 _meteorCount = self.colorSequenceCount
             if fadeAmount is not None:
@@ -1786,11 +2475,11 @@ class ArrayController:
                 # assign meteor color
                 meteor.color = self.colorSequenceNext
                 # initialize "previous" index, for math's sake later
-                meteor.indexPrevious = random.randint(0, self.virtualLEDCount - 1)
+                meteor.indexPrevious = self.privateRandomSource.randint(0, self.virtualLEDCount - 1)
                 # set the number of LEDs it will move in one step
                 meteor.stepSizeMax = _maxSpeed
                 # set the maximum number of LEDs it could move in one step
-                meteor.step = random.randint(1, max(2, meteor.stepSizeMax))
+                meteor.step = self.privateRandomSource.randint(1, max(2, meteor.stepSizeMax))
                 # randomly initialize the direction
                 meteor.direction = self.getRandomDirection()
                 # set the refresh delay
@@ -1837,7 +2526,7 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionSprites.__name__)
         try:
-            _fadeSteps: int = random.randint(1, 6)
+            _fadeSteps: int = self.privateRandomSource.randint(1, 6)
             if fadeSteps is not None:
                 _fadeSteps = int(fadeSteps)
             _fadeAmount = np.ceil(255 / _fadeSteps)
@@ -1852,7 +2541,7 @@ class ArrayController:
             for _ in range(max(min(self.colorSequenceCount, 10), 2)):
                 sprite: ArrayFunction = ArrayFunction(self, ArrayFunction.functionSprites, self.colorSequence)
                 # randomize index
-                sprite.index = random.randint(0, self.virtualLEDCount - 1)
+                sprite.index = self.privateRandomSource.randint(0, self.virtualLEDCount - 1)
                 # initialize previous index
                 sprite.indexPrevious = sprite.index
                 # randomize direction
@@ -1910,10 +2599,10 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionRaindrops.__name__)
         try:
-            _maxSize: int = random.randint(2, int(self.virtualLEDCount // 8))
-            _raindropChance: float = random.uniform(0.005, 0.1)
-            _stepSize: int = random.randint(2, 5)
-            _fadeAmount: float = random.uniform(0.25, 0.65)
+            _maxSize: int = self.privateRandomSource.randint(2, int(self.virtualLEDCount // 8))
+            _raindropChance: float = self.privateRandomSource.uniform(0.005, 0.1)
+            _stepSize: int = self.privateRandomSource.randint(2, 5)
+            _fadeAmount: float = self.privateRandomSource.uniform(0.25, 0.65)
             _maxRaindrops: int = max(min(self.colorSequenceCount, 10), 2)
             if maxSize is not None:
                 _maxSize = int(maxSize)
@@ -1939,13 +2628,13 @@ class ArrayController:
             for _ in range(_maxRaindrops):
                 raindrop: ArrayFunction = ArrayFunction(self, ArrayFunction.functionRaindrops, self.colorSequence)
                 # randomize start index
-                raindrop.index = random.randint(0, self.virtualLEDCount - 1)
+                raindrop.index = self.privateRandomSource.randint(0, self.virtualLEDCount - 1)
                 # assign raindrop growth speed
                 raindrop.step = _stepSize
                 # max raindrop "splash"
                 raindrop.sizeMax = _maxSize
                 # max size
-                raindrop.stepCountMax = random.randint(2, raindrop.sizeMax)
+                raindrop.stepCountMax = self.privateRandomSource.randint(2, raindrop.sizeMax)
                 # chance of raindrop
                 raindrop.activeChance = _raindropChance
                 # assign color
@@ -1993,10 +2682,10 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionAlive.__name__)
         try:
-            _fadeAmount: float = random.uniform(0.20, 0.75)
-            _sizeMax: int = random.randint(self.virtualLEDCount // 6, self.virtualLEDCount // 3)
-            _stepCountMax: int = random.randint(self.virtualLEDCount // 10, self.virtualLEDCount)
-            _stepSizeMax: int = random.randint(6, 10)
+            _fadeAmount: float = self.privateRandomSource.uniform(0.20, 0.75)
+            _sizeMax: int = self.privateRandomSource.randint(self.virtualLEDCount // 6, self.virtualLEDCount // 3)
+            _stepCountMax: int = self.privateRandomSource.randint(self.virtualLEDCount // 10, self.virtualLEDCount)
+            _stepSizeMax: int = self.privateRandomSource.randint(6, 10)
             if fadeAmount is not None:
                 _fadeAmount = float(fadeAmount)
             # make sure fade amount is valid
@@ -2013,7 +2702,7 @@ class ArrayController:
                 _stepCountMax = int(stepCountMax)
             if stepSizeMax is not None:
                 _stepSizeMax = int(stepSizeMax)
-            for _ in range(random.randint(2, 5)):
+            for _ in range(self.privateRandomSource.randint(2, 5)):
                 thing: ArrayFunction = ArrayFunction(self, ArrayFunction.functionAlive, self.colorSequence)
                 # randomize start index
                 thing.index = self.getRandomIndex()
@@ -2028,11 +2717,11 @@ class ArrayController:
                 # set max step size in normal condition
                 thing.stepSizeMax = _stepSizeMax
                 # randomize speed
-                thing.step = random.randint(1, thing.stepSizeMax)
+                thing.step = self.privateRandomSource.randint(1, thing.stepSizeMax)
                 # set refresh speed
-                thing.delayCountMax = random.randint(6, 15)
+                thing.delayCountMax = self.privateRandomSource.randint(6, 15)
                 # set initial size
-                thing.size = random.randint(1, int(_sizeMax // 2))
+                thing.size = self.privateRandomSource.randint(1, int(_sizeMax // 2))
                 # set max size
                 thing.sizeMax = _sizeMax
                 # start the state at 1
@@ -2055,6 +2744,201 @@ class ArrayController:
         except Exception as ex:  # pragma: no cover
             raise ControllerException from ex
 
+    def _newAudioFunction(
+        self,
+        funcPointer: Callable,
+        features: Union[str, SharedFeatures, AudioAnalyzer, None],
+        attack: Optional[float],
+        decay: Optional[float],
+    ) -> ArrayFunction:
+        """Create the tracking object of an audio effect.
+
+        Args:
+            funcPointer: the audio function
+            features: where to read audio features, see audio_analysis.openFeatures
+            attack: the fraction of a rise in level applied per refresh
+            decay: the fraction of a fall in level applied per refresh
+
+        Returns:
+            the tracking object, with its feature source, feature buffer, attack, and decay set
+        """
+        from lightberries.audio_analysis import openFeatures
+
+        audio: ArrayFunction = ArrayFunction(self, funcPointer, self.colorSequence)
+        audio.featureSource = openFeatures(features)
+        if audio.featureSource is not features:
+            # attached by name here, so detached here when the function list is reset
+            self.privateAttachedFeatures.append(audio.featureSource)
+        audio.features = np.zeros(audio.featureSource.featureCount, dtype=np.float64)
+        audio.featureSource.read(audio.features)
+        audio.attack = self.privateRandomSource.uniform(0.5, 0.9)
+        audio.decay = self.privateRandomSource.uniform(0.05, 0.2)
+        if attack is not None:
+            audio.attack = float(attack)
+        if decay is not None:
+            audio.decay = float(decay)
+        audio.brightness = np.zeros(self.virtualLEDCount, dtype=np.float32)
+        return audio
+
+    def useFunctionAudioSpectrum(
+        self,
+        features: Union[str, SharedFeatures, AudioAnalyzer, None] = None,
+        attack: float = None,
+        decay: float = None,
+    ) -> None:
+        """Show the audio spectrum as one bar per band, each band in its own segment of the LEDs.
+
+        Args:
+            features: where to read audio features: an AudioAnalyzer, SharedFeatures, or the name of
+                shared features published by another process (audio_analysis.DEFAULT_SHARED_NAME if None)
+            attack: the fraction of a rise in level applied per refresh (0.0 to 1.0)
+            decay: the fraction of a fall in level applied per refresh (0.0 to 1.0)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionAudioSpectrum.__name__)
+        try:
+            from lightberries.audio_analysis import FEATURE_BANDS, bandLEDMap
+
+            spectrum = self._newAudioFunction(ArrayFunction.functionAudioSpectrum, features, attack, decay)
+            _bandCount = len(spectrum.features) - FEATURE_BANDS
+            spectrum.levels = np.zeros(_bandCount, dtype=np.float32)
+            spectrum.ledBands, spectrum.ledStarts, spectrum.ledScales = bandLEDMap(_bandCount, self.virtualLEDCount)
+            # one color per band, cycling through the color sequence
+            spectrum.ledColors = self.colorSequence[spectrum.ledBands % self.colorSequenceCount].astype(np.float32)
+            self.privateLightFunctions.append(spectrum)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+
+    def useFunctionAudioBeatPulse(
+        self,
+        features: Union[str, SharedFeatures, AudioAnalyzer, None] = None,
+        attack: float = None,
+        decay: float = None,
+    ) -> None:
+        """Flash the LEDs in the next color of the sequence on every beat.
+
+        Args:
+            features: where to read audio features (see useFunctionAudioSpectrum)
+            attack: the fraction of the flash applied on the refresh after a beat (0.0 to 1.0)
+            decay: the fraction of the flash that fades per refresh (0.0 to 1.0)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionAudioBeatPulse.__name__)
+        try:
+            from lightberries.audio_analysis import FEATURE_BEAT_COUNT
+
+            pulse = self._newAudioFunction(ArrayFunction.functionAudioBeatPulse, features, attack, decay)
+            # beats from before the effect started do not flash
+            pulse.beatCount = pulse.features[FEATURE_BEAT_COUNT]
+            pulse.levels = np.zeros(1, dtype=np.float32)
+            # the flash covers the LEDs within its level of the middle, with a one LED soft edge
+            _halfCount = max(self.virtualLEDCount / 2, 1.0)
+            pulse.ledStarts = np.abs(np.arange(self.virtualLEDCount) + 0.5 - _halfCount).astype(np.float32)
+            pulse.ledStarts /= _halfCount
+            pulse.ledScales = np.float32(_halfCount)
+            self.privateLightFunctions.append(pulse)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+
+    def useFunctionAudioMeteors(
+        self,
+        features: Union[str, SharedFeatures, AudioAnalyzer, None] = None,
+        meteorCount: int = None,
+        maxSpeed: int = None,
+        fadeAmount: float = None,
+        attack: float = None,
+        decay: float = None,
+    ) -> None:
+        """Creates meteors that speed up and brighten with the energy of their share of the audio bands.
+
+        Args:
+            features: where to read audio features (see useFunctionAudioSpectrum)
+            meteorCount: number of meteors (at most one per band)
+            maxSpeed: the LEDs per refresh a meteor moves at full energy, on top of one
+            fadeAmount: the amount by which meteor trails are faded
+            attack: the fraction of a rise in energy applied per refresh (0.0 to 1.0)
+            decay: the fraction of a fall in energy applied per refresh (0.0 to 1.0)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionAudioMeteors.__name__)
+        try:
+            from lightberries.audio_analysis import FEATURE_BANDS, FEATURE_BEAT_COUNT, FEATURE_ONSET_COUNT
+
+            _meteorCount: int = self.privateRandomSource.randint(3, 8)
+            _maxSpeed: int = self.privateRandomSource.randint(3, 8)
+            _fadeAmount: float = self.privateRandomSource.uniform(0.2, 0.4)
+            if meteorCount is not None:
+                _meteorCount = int(meteorCount)
+            if maxSpeed is not None:
+                _maxSpeed = int(maxSpeed)
+            if fadeAmount is not None:
+                _fadeAmount = float(fadeAmount)
+            # make sure fade amount is valid
+            if _fadeAmount > 0 and _fadeAmount < 1:
+                pass
+            elif _fadeAmount > 0 and _fadeAmount < 256:
+                _fadeAmount /= 255
+            if _fadeAmount < 0 or _fadeAmount > 1:
+                _fadeAmount = 0.1
+            # make comet trails
+            fade: ArrayFunction = ArrayFunction(self, ArrayFunction.functionFadeOff, self.colorSequence)
+            fade.fadeAmount = _fadeAmount
+            self.privateLightFunctions.append(fade)
+            meteors = self._newAudioFunction(ArrayFunction.functionAudioMeteors, features, attack, decay)
+            _bandCount = len(meteors.features) - FEATURE_BANDS
+            _meteorCount = max(1, min(_meteorCount, _bandCount))
+            # each meteor follows a contiguous group of bands
+            _groups = (np.arange(_bandCount) * _meteorCount) // _bandCount
+            meteors.bandStarts = np.searchsorted(_groups, np.arange(_meteorCount))
+            meteors.bandWidths = np.bincount(_groups, minlength=_meteorCount)
+            meteors.levels = np.zeros(_meteorCount, dtype=np.float64)
+            meteors.onsetCount = meteors.features[FEATURE_ONSET_COUNT]
+            meteors.beatCount = meteors.features[FEATURE_BEAT_COUNT]
+            meteors.stepSizeMax = _maxSpeed
+            meteors.stepOffsets = np.arange(_maxSpeed + 2)
+            meteors.positions = self.privateRandomSource.integers(0, self.virtualLEDCount - 1, _meteorCount)
+            meteors.positions = meteors.positions.astype(np.float64)
+            meteors.directions = self.privateRandomSource.directions(_meteorCount)
+            meteors.colorIndices = np.arange(_meteorCount) % self.colorSequenceCount
+            meteors.colors = self.colorSequence[meteors.colorIndices]
+            meteors.colorSequence = np.copy(self.colorSequence)
+            self.privateLightFunctions.append(meteors)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControllerException from ex
+
     def useOverlayTwinkle(
         self,
         twinkleChance: float = None,
@@ -2074,7 +2958,7 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useOverlayTwinkle.__name__)
         try:
-            _twinkleChance: float = random.uniform(0.991, 0.995)
+            _twinkleChance: float = self.privateRandomSource.uniform(0.991, 0.995)
             _colorSequence = self.colorSequence.copy()
             if twinkleChance is not None:
                 _twinkleChance = float(twinkleChance)
@@ -2109,7 +2993,7 @@ class ArrayController:
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useOverlayBlink.__name__)
         try:
-            _blinkChance: float = random.uniform(0.991, 0.995)
+            _blinkChance: float = self.privateRandomSource.uniform(0.991, 0.995)
             if blinkChance is not None:
                 _blinkChance = float(blinkChance)
             blink: ArrayFunction = ArrayFunction(self, ArrayFunction.overlayBlink, self.colorSequence)
@@ -2213,11 +3097,11 @@ class ArrayController:
                         while (len(functionsCopy) * len(colorsCopy)) > 0:
                             # get a new function if there is one
                             if len(functionsCopy) > 0:
-                                function = functionsCopy[random.randint(0, len(functionsCopy) - 1)]
+                                function = functionsCopy[self.privateRandomSource.randint(0, len(functionsCopy) - 1)]
                                 functionsCopy.remove(function)
                             # get a new color pattern if there is one
                             if len(colorsCopy) > 0:
-                                color = colorsCopy[random.randint(0, len(colorsCopy) - 1)]
+                                color = colorsCopy[self.privateRandomSource.randint(0, len(colorsCopy) - 1)]
                                 colorsCopy.remove(color)
                             # reset
                             self.reset()
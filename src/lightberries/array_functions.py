@@ -3,7 +3,6 @@ from __future__ import annotations
 from math import ceil
 from typing import Callable, Any, Optional
 import logging
-import random
 from enum import IntEnum
 import numpy as np
 import lightberries.array_controller  # noqa : used in typing
@@ -378,7 +377,8 @@ class ArrayFunction:
                                         # movements across LEDs
                                         intersection = np.intersect1d(object1.indexRange, object2.indexRange)
                                         if len(intersection) > 0 and (
-                                            object1.collisionRandomizer is False or random.randint(0, 4) != 0
+                                            object1.collisionRandomizer is False
+                                            or ArrayFunction.Controller.randomSource.randint(0, 4) != 0
                                         ):
                                             object1.collision = True
                                             object1.privateCollision = True
@@ -480,7 +480,7 @@ class ArrayFunction:
             LightFunctionException: if something bad happens
         """
         try:
-            ArrayFunction.Controller.virtualLEDBuffer[:] *= 0
+            ArrayFunction.Controller.virtualLEDBuffer[:] = 0
         except KeyboardInterrupt:  # pragma: no cover
             raise
         except SystemExit:  # pragma: no cover
@@ -601,10 +601,8 @@ class ArrayFunction:
             if cycle.delayCounter >= cycle.delayCountMax:
                 # reset delay counter
                 cycle.delayCounter = 0
-                # remove any current color
-                ArrayFunction.Controller.virtualLEDBuffer *= 0
-                # add new color
-                ArrayFunction.Controller.virtualLEDBuffer += cycle.colorSequenceNext
+                # replace any current color with the new color
+                ArrayFunction.Controller.virtualLEDBuffer[:] = cycle.colorSequenceNext
             # increment delay counter
             cycle.delayCounter += 1
         except SystemExit:  # pragma: no cover
@@ -867,7 +865,7 @@ class ArrayFunction:
                 if (accelerate.state % 2) == 0:
                     accelerate.step += 1
                 # set step counter to a random number of steps based on LED count
-                accelerate.stepCountMax = random.randint(
+                accelerate.stepCountMax = ArrayFunction.Controller.randomSource.randint(
                     int(ArrayFunction.Controller.realLEDCount / 20),
                     int(ArrayFunction.Controller.realLEDCount / 4),
                 )
@@ -896,7 +894,7 @@ class ArrayFunction:
                 # reset delay
                 accelerate.delayCounter = 0
                 # set new delay max
-                accelerate.delayCountMax = random.randint(5, 10)
+                accelerate.delayCountMax = ArrayFunction.Controller.randomSource.randint(5, 10)
                 # reset state max
                 accelerate.stateMax = accelerate.delayCountMax
                 # randomize direction
@@ -960,9 +958,9 @@ class ArrayFunction:
                     # if we are done delaying
                     if change.delayCounter >= change.delayCountMax:
                         # reset delay counter
-                        change.delayCounter = random.randint(0, change.delayCountMax)
+                        change.delayCounter = ArrayFunction.Controller.randomSource.randint(0, change.delayCountMax)
                         # randomly fading some LEDs to background color
-                        if random.randint(0, 3) == 3:
+                        if ArrayFunction.Controller.randomSource.randint(0, 3) == 3:
                             # set next color to background color
                             change.colorNext = ArrayFunction.Controller.backgroundColor
                             # set state to "fading off"
@@ -980,7 +978,7 @@ class ArrayFunction:
                         # set state to "waiting"
                         change.state = ChangeStates.WAIT.value
                         # reset delay counter
-                        change.delayCounter = random.randint(0, change.delayCountMax)
+                        change.delayCounter = ArrayFunction.Controller.randomSource.randint(0, change.delayCountMax)
                 # if state is "waiting"
                 elif change.state == ChangeStates.WAIT.value:
                     # increment delay counter
@@ -998,12 +996,12 @@ class ArrayFunction:
                                 np.where(ArrayFunction.Controller.virtualLEDIndexBuffer == change.index)
                             ]
                         # get next color
-                        for _ in range(random.randint(1, 5)):
+                        for _ in range(ArrayFunction.Controller.randomSource.randint(1, 5)):
                             change.colorNext = change.colorSequenceNext
                         # set state to "fading on"
                         change.state = ChangeStates.FADING_ON.value
                         # randomize delay counter so they aren't synchronized
-                        change.delayCounter = random.randint(0, change.delayCountMax)
+                        change.delayCounter = ArrayFunction.Controller.randomSource.randint(0, change.delayCountMax)
             # if fading LEDs
             if change.fadeType == LEDFadeType.FADE_OFF:
                 # fade the color
@@ -1091,10 +1089,10 @@ class ArrayFunction:
                 # semi-randomly die
                 _min = min(int(sprite.stepCounter // 3), 5)
                 _max = max(int(sprite.stepCounter // 3), 6)
-                if random.randint(_min, _max) < sprite.stepCounter:
+                if ArrayFunction.Controller.randomSource.randint(_min, _max) < sprite.stepCounter:
                     sprite.state = SpriteState.FADING_OFF.value
                 # randomize step sizes
-                sprite.step = random.randint(1, 3)
+                sprite.step = ArrayFunction.Controller.randomSource.randint(1, 3)
                 # only update LED string when we change the index
                 sprite.indexUpdated = False
                 # if we are done delaying
@@ -1123,7 +1121,7 @@ class ArrayFunction:
             # when sprite is in "off" state
             else:
                 # randomly start fading on
-                if random.randint(0, 999) > 800:
+                if ArrayFunction.Controller.randomSource.randint(0, 999) > 800:
                     # set state to fade on
                     sprite.state = SpriteState.FADING_ON.value
                     # reset step counter
@@ -1179,11 +1177,11 @@ class ArrayFunction:
             # if raindrop is off
             if raindrop.state == RaindropStates.OFF.value:
                 # randomly turn on
-                if random.randint(0, 1000) / 1000 < raindrop.activeChance:
+                if ArrayFunction.Controller.randomSource.randint(0, 1000) / 1000 < raindrop.activeChance:
                     # set state on
                     raindrop.state = RaindropStates.SPLASH.value
                     # set max width of this raindrop
-                    raindrop.stepCountMax = random.randint(1, max(raindrop.sizeMax, 2))
+                    raindrop.stepCountMax = ArrayFunction.Controller.randomSource.randint(1, max(raindrop.sizeMax, 2))
                     # set fade amount
                     raindrop.fadeAmount = ((255 / raindrop.stepCountMax) / 255) * 2
                     raindrop.colorScaler = (raindrop.stepCountMax - raindrop.stepCounter) / raindrop.stepCountMax
@@ -1233,11 +1231,13 @@ class ArrayFunction:
                 # splash is done growing
                 else:
                     # randomize next splash start index
-                    raindrop.index = random.randint(0, ArrayFunction.Controller.virtualLEDCount - 1)
+                    raindrop.index = ArrayFunction.Controller.randomSource.randint(
+                        0, ArrayFunction.Controller.virtualLEDCount - 1
+                    )
                     # reset growth counter
                     raindrop.stepCounter = 0
                     # semi-randomize next color
-                    for _ in range(1, random.randint(2, 4)):
+                    for _ in range(1, ArrayFunction.Controller.randomSource.randint(2, 4)):
                         raindrop.color = raindrop.colorSequenceNext
                     # set state to off
                     raindrop.state = RaindropStates.OFF.value
@@ -1284,7 +1284,7 @@ class ArrayFunction:
                         #     thing.index + (thing.step * thing.direction)
                         # ) % ArrayFunction.Controller.virtualLEDCount
                         # randomly change direction
-                        if random.randint(0, 99) > 95:
+                        if ArrayFunction.Controller.randomSource.randint(0, 99) > 95:
                             thing.direction *= -1  # pragma: no cover
                     # if in fast meteor mode
                     elif thing.state & ThingMoves.LIGHTSPEED.value:
@@ -1292,21 +1292,21 @@ class ArrayFunction:
                         if thing.stepCountMax >= shortPeriod:
                             thing.stepCountMax = shortPeriod
                         # randomize step size
-                        thing.step = random.randint(7, 12)
+                        thing.step = ArrayFunction.Controller.randomSource.randint(7, 12)
                         # set next index
                         thing.updateArrayIndex()
                         # thing.index = (
                         #     thing.index + (thing.step * thing.direction)
                         # ) % ArrayFunction.Controller.virtualLEDCount
                         # randomly change direction
-                        if random.randint(0, 99) > 95:
+                        if ArrayFunction.Controller.randomSource.randint(0, 99) > 95:
                             thing.direction *= -1  # pragma: no cover
                     # if slow meteor
                     elif thing.state & ThingMoves.TURTLE.value:
                         # set step to 1
                         thing.step = 1
                         # randomly change direction
-                        if random.randint(0, 99) > 80:
+                        if ArrayFunction.Controller.randomSource.randint(0, 99) > 80:
                             thing.direction *= -1  # pragma: no cover
                         # set next index
                         thing.updateArrayIndex()
@@ -1321,11 +1321,11 @@ class ArrayFunction:
                         # if we can still grow
                         if thing.size < thing.sizeMax:
                             # randomly grow
-                            if random.randint(0, 99) > 80:
-                                thing.size += random.randint(1, 5)  # pragma: no cover
+                            if ArrayFunction.Controller.randomSource.randint(0, 99) > 80:
+                                thing.size += ArrayFunction.Controller.randomSource.randint(1, 5)  # pragma: no cover
                             # also randomly shrink a bit
                             if thing.size > 2:
-                                if random.randint(0, 99) > 90:
+                                if ArrayFunction.Controller.randomSource.randint(0, 99) > 90:
                                     thing.size -= 1  # pragma: no cover
                         # make sure we aren't overgrown
                         if thing.size > thing.sizeMax:
@@ -1341,11 +1341,11 @@ class ArrayFunction:
                         # if we can shrink
                         if thing.size > 0:
                             # randomly shrink
-                            if random.randint(0, 99) > 80:
-                                thing.size -= random.randint(1, 5)
+                            if ArrayFunction.Controller.randomSource.randint(0, 99) > 80:
+                                thing.size -= ArrayFunction.Controller.randomSource.randint(1, 5)
                             # also randomly grow a bit
                             if thing.size < thing.sizeMax:
-                                if random.randint(0, 99) > 90:
+                                if ArrayFunction.Controller.randomSource.randint(0, 99) > 90:
                                     thing.size += 1  # pragma: no cover
                         # make sure we aren't overgrown
                         if thing.size >= thing.sizeMax:
@@ -1359,8 +1359,8 @@ class ArrayFunction:
                         if thing.stepCountMax >= shortPeriod:
                             thing.stepCountMax = shortPeriod
                         # randomly cycle through assign colors
-                        if random.randint(0, 99) > 90:
-                            for _ in range(0, random.randint(1, 3)):
+                        if ArrayFunction.Controller.randomSource.randint(0, 99) > 90:
+                            for _ in range(0, ArrayFunction.Controller.randomSource.randint(1, 3)):
                                 thing.color = thing.colorSequenceNext
                     # calculate range of affected indices
                     # index1 = thing.indexPrevious - (thing.size * thing.direction)
@@ -1374,34 +1374,40 @@ class ArrayFunction:
                 # we hit our step goal, randomize next state
                 else:
                     # states are mutually exclusive bits, can just add one of each
-                    for _ in range(random.randint(1, 3)):
+                    for _ in range(ArrayFunction.Controller.randomSource.randint(1, 3)):
                         thing.state = (
-                            list(ThingMoves)[random.randint(0, len(ThingMoves) - 1)].value
-                            + list(ThingSizes)[random.randint(0, len(ThingSizes) - 1)].value
-                            + list(ThingColors)[random.randint(0, len(ThingColors) - 1)].value
+                            list(ThingMoves)[
+                                ArrayFunction.Controller.randomSource.randint(0, len(ThingMoves) - 1)
+                            ].value
+                            + list(ThingSizes)[
+                                ArrayFunction.Controller.randomSource.randint(0, len(ThingSizes) - 1)
+                            ].value
+                            + list(ThingColors)[
+                                ArrayFunction.Controller.randomSource.randint(0, len(ThingColors) - 1)
+                            ].value
                         )
                     # reset step counter
                     thing.stepCounter = 0
                     # set step count to random value
-                    thing.stepCountMax = random.randint(
+                    thing.stepCountMax = ArrayFunction.Controller.randomSource.randint(
                         ArrayFunction.Controller.virtualLEDCount // 10,
                         ArrayFunction.Controller.virtualLEDCount,
                     )
                     # set delay count randomly
-                    thing.delayCountMax = random.randint(6, 15)
+                    thing.delayCountMax = ArrayFunction.Controller.randomSource.randint(6, 15)
                     # randomize step size
-                    thing.step = random.randint(1, 3)
+                    thing.step = ArrayFunction.Controller.randomSource.randint(1, 3)
                     # randomize fade amount
-                    thing.fadeAmount = random.randint(80, 192)
+                    thing.fadeAmount = ArrayFunction.Controller.randomSource.randint(80, 192)
                     # randomize delays
                     if thing.state & ThingMoves.METEOR.value:
-                        thing.delayCountMax = random.randint(1, 3)
+                        thing.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 3)
                     elif thing.state & ThingMoves.TURTLE.value:
-                        thing.delayCountMax = random.randint(10, 15)
+                        thing.delayCountMax = ArrayFunction.Controller.randomSource.randint(10, 15)
                     elif thing.state & ThingMoves.LIGHTSPEED.value:
-                        thing.delayCountMax = random.randint(0, 3)
+                        thing.delayCountMax = ArrayFunction.Controller.randomSource.randint(0, 3)
                     else:
-                        thing.delayCountMax = random.randint(1, 7)
+                        thing.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 7)
                     # calculate affected range
                     # index1 = thing.indexPrevious - (thing.size * thing.direction)
                     # index2 = thing.indexPrevious + ((thing.step + thing.size) * thing.direction)
@@ -1428,6 +1434,131 @@ class ArrayFunction:
         except Exception as ex:  # pragma: no cover
             raise FunctionException from ex
 
+    @staticmethod
+    def functionAudioSpectrum(
+        spectrum: "ArrayFunction",
+    ) -> None:
+        """Draw each audio band as a bar filling its own segment of the LEDs.
+
+        Args:
+            spectrum: tracking object
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            from lightberries.audio_analysis import FEATURE_BANDS, attackDecay
+
+            spectrum.featureSource.read(spectrum.features)
+            attackDecay(spectrum.levels, spectrum.features[FEATURE_BANDS:], spectrum.attack, spectrum.decay)
+            _brightness = np.take(spectrum.levels, spectrum.ledBands, out=spectrum.brightness)
+            _brightness -= spectrum.ledStarts
+            _brightness *= spectrum.ledScales
+            np.clip(_brightness, 0.0, 1.0, out=_brightness)
+            np.multiply(spectrum.ledColors, _brightness[:, None], out=ArrayFunction.Controller.virtualLEDBuffer)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise FunctionException from ex
+
+    @staticmethod
+    def functionAudioBeatPulse(
+        pulse: "ArrayFunction",
+    ) -> None:
+        """Flash the LEDs on each beat, then shrink the flash toward the middle as it decays.
+
+        Args:
+            pulse: tracking object
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            from lightberries.audio_analysis import FEATURE_BEAT_COUNT, attackDecay
+
+            pulse.featureSource.read(pulse.features)
+            _target = 0.0
+            # compare totals rather than the beat flag, so beats between two frames still count
+            if pulse.features[FEATURE_BEAT_COUNT] > pulse.beatCount:
+                pulse.beatCount = pulse.features[FEATURE_BEAT_COUNT]
+                pulse.color = pulse.colorSequenceNext
+                _target = 1.0
+            attackDecay(pulse.levels, _target, pulse.attack, pulse.decay)
+            _brightness = np.subtract(pulse.levels, pulse.ledStarts, out=pulse.brightness)
+            _brightness *= pulse.ledScales
+            np.clip(_brightness, 0.0, 1.0, out=_brightness)
+            _brightness *= pulse.levels
+            np.multiply(pulse.color, _brightness[:, None], out=ArrayFunction.Controller.virtualLEDBuffer)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise FunctionException from ex
+
+    @staticmethod
+    def functionAudioMeteors(
+        meteors: "ArrayFunction",
+    ) -> None:
+        """Move many meteors at once, each one as fast and as bright as its share of the audio bands.
+
+        Onsets move every meteor to its next color and beats turn them all around.
+
+        Args:
+            meteors: tracking object
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            from lightberries.audio_analysis import FEATURE_BANDS, FEATURE_BEAT_COUNT, FEATURE_ONSET_COUNT, attackDecay
+
+            meteors.featureSource.read(meteors.features)
+            # the mean level of the bands each meteor follows
+            _energies = np.add.reduceat(meteors.features[FEATURE_BANDS:], meteors.bandStarts)
+            _energies /= meteors.bandWidths
+            attackDecay(meteors.levels, _energies, meteors.attack, meteors.decay)
+            if meteors.features[FEATURE_ONSET_COUNT] > meteors.onsetCount:
+                meteors.onsetCount = meteors.features[FEATURE_ONSET_COUNT]
+                meteors.colorIndices = (meteors.colorIndices + 1) % meteors.colorSequenceCount
+                meteors.colors = meteors.colorSequence[meteors.colorIndices]
+            if meteors.features[FEATURE_BEAT_COUNT] > meteors.beatCount:
+                meteors.beatCount = meteors.features[FEATURE_BEAT_COUNT]
+                meteors.directions *= -1
+            _ledCount = ArrayFunction.Controller.virtualLEDCount
+            _speeds = meteors.levels * meteors.stepSizeMax
+            _speeds += 1
+            # light every LED a meteor passes this frame, so fast meteors leave unbroken trails
+            _passed = meteors.stepOffsets[None, :] <= _speeds[:, None]
+            _indices = np.floor(meteors.positions).astype(np.int32)[:, None]
+            _indices = (_indices + meteors.directions[:, None] * meteors.stepOffsets[None, :]) % _ledCount
+            _colors = meteors.colors * (0.2 + 0.8 * meteors.levels)[:, None]
+            ArrayFunction.Controller.virtualLEDBuffer[_indices[_passed]] = np.broadcast_to(
+                _colors[:, None, :], _passed.shape + (3,)
+            )[_passed]
+            meteors.positions += meteors.directions * _speeds
+            meteors.positions %= _ledCount
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise FunctionException from ex
+
     @staticmethod
     def overlayTwinkle(
         twinkle: "ArrayFunction",
@@ -1443,9 +1574,15 @@ class ArrayFunction:
             LightFunctionException: if something bad happens
         """
         try:
-            for index in range(ArrayFunction.Controller.realLEDCount):
-                if random.random() > twinkle.random:
-                    ArrayFunction.Controller.overlayDictionary[index] = twinkle.colorSequenceNext
+            _twinkles = (
+                ArrayFunction.Controller.randomSource.uniforms(ArrayFunction.Controller.realLEDCount) > twinkle.random
+            )
+            _twinkleCount = int(np.count_nonzero(_twinkles))
+            if _twinkleCount > 0:
+                # step through the color sequence once per twinkling LED
+                _colorIndices = (twinkle.colorSequenceIndex + 1 + np.arange(_twinkleCount)) % twinkle.colorSequenceCount
+                twinkle.colorSequenceIndex = int(_colorIndices[-1])
+                ArrayFunction.Controller.layers["overlay"].set(_twinkles, twinkle.colorSequence[_colorIndices])
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -1471,9 +1608,8 @@ class ArrayFunction:
         """
         try:
             color = blink.colorSequenceNext
-            if random.random() > blink.random:
-                for index in range(ArrayFunction.Controller.realLEDCount):
-                    ArrayFunction.Controller.overlayDictionary[index] = color
+            if ArrayFunction.Controller.randomSource.random() > blink.random:
+                ArrayFunction.Controller.layers["overlay"].set(np.s_[:], color)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -0,0 +1,354 @@
+"""Defines the layer stack that is composited into the LED output each frame."""
+from __future__ import annotations
+import logging
+from enum import IntEnum
+from typing import Any, Optional
+import numpy as np
+from lightberries.array_patterns import PIXEL_BUFFER_DTYPE
+from lightberries.exceptions import LayerException, LightBerryException
+
+LOGGER = logging.getLogger("lightBerries")
+
+
+class BlendMode(IntEnum):
+    """Enumeration of the ways a layer can be combined with the layers below it."""
+
+    REPLACE = 0
+    ADD = 1
+    MULTIPLY = 2
+    MAX = 3
+    SCREEN = 4
+
+
+class ArrayLayer:
+    """A preallocated render buffer plus a per-LED mask, opacity, and blend mode."""
+
+    def __init__(
+        self,
+        name: str,
+        ledCount: int,
+        blendMode: BlendMode = BlendMode.REPLACE,
+        alpha: float = 1.0,
+        temporary: bool = False,
+    ) -> None:
+        """Create a layer.
+
+        Args:
+            name: the name used to look the layer up in a LayerStack
+            ledCount: the number of LEDs in the layer
+            blendMode: how this layer gets combined with the layers below it
+            alpha: layer opacity between 0.0 (invisible) and 1.0 (opaque)
+            temporary: set true to clear the layer after every composite (for overlays)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            self.name: str = name
+            self.blendMode: BlendMode = BlendMode(blendMode)
+            self.alpha: float = float(alpha)
+            self.temporary: bool = temporary
+            self.buffer: np.ndarray[(3, Any), np.float32] = np.zeros((ledCount, 3), dtype=PIXEL_BUFFER_DTYPE)
+            self.mask: np.ndarray[(Any,), np.bool_] = np.zeros((ledCount,), dtype=np.bool_)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return the number of LEDs in the layer.
+
+        Returns:
+            the number of LEDs in the layer
+        """
+        return len(self.mask)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Represent the layer as a string.
+
+        Returns:
+            a string representation of the layer
+        """
+        return f"<{self.__class__.__name__}> {self.name} ({self.blendMode.name}, alpha={self.alpha})"
+
+    def clear(
+        self,
+    ) -> None:
+        """Remove everything drawn on this layer."""
+        self.mask[:] = False
+
+    def set(
+        self,
+        mask: np.ndarray[(Any,), np.bool_],
+        color: np.ndarray[(3,), np.int32] | np.ndarray[(3, Any), np.int32],
+    ) -> None:
+        """Draw one color (or one color per masked LED) on this layer.
+
+        Args:
+            mask: boolean mask, index array, or slice selecting the LEDs to draw
+            color: a single RGB value, or one RGB value per selected LED
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            self.buffer[mask] = color
+            self.mask[mask] = True
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
+
+    def blend(
+        self,
+        destination: np.ndarray[(3, Any), np.float32],
+        scratch: np.ndarray[(3, Any), np.float32],
+    ) -> None:
+        """Blend this layer onto destination in place.
+
+        Args:
+            destination: the composited result of all layers below this one
+            scratch: a preallocated buffer the same shape as destination
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            if self.alpha <= 0.0 or not self.mask.any():
+                return
+            if self.blendMode == BlendMode.REPLACE:
+                np.copyto(scratch, self.buffer)
+            elif self.blendMode == BlendMode.ADD:
+                np.add(destination, self.buffer, out=scratch)
+            elif self.blendMode == BlendMode.MULTIPLY:
+                np.multiply(destination, self.buffer, out=scratch)
+                scratch *= 1.0 / 255.0
+            elif self.blendMode == BlendMode.MAX:
+                np.maximum(destination, self.buffer, out=scratch)
+            elif self.blendMode == BlendMode.SCREEN:
+                # 255 - (255 - a) * (255 - b) / 255
+                np.subtract(255.0, destination, out=scratch)
+                scratch *= 255.0 - self.buffer
+                scratch *= -1.0 / 255.0
+                scratch += 255.0
+            if self.alpha < 1.0:
+                # destination + (blended - destination) * alpha
+                scratch -= destination
+                scratch *= self.alpha
+                scratch += destination
+            np.copyto(destination, scratch, where=self.mask[:, None])
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
+
+
+class LayerStack:
+    """An ordered stack of layers flattened into a single output buffer once per frame.
+
+    The base layer always holds the (index mapped) virtual LED buffer. By default
+    a temporary "overlay" layer (REPLACE) sits above it, and more layers can be
+    added with addLayer.
+    """
+
+    DEFAULT_LAYERS: list[tuple[str, BlendMode, bool]] = [
+        ("overlay", BlendMode.REPLACE, True),
+    ]
+
+    def __init__(
+        self,
+        ledCount: int,
+    ) -> None:
+        """Create a layer stack.
+
+        Args:
+            ledCount: the number of LEDs in every layer
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            self.ledCount: int = int(ledCount)
+            self.base: np.ndarray[(3, Any), np.float32] = np.zeros((self.ledCount, 3), dtype=PIXEL_BUFFER_DTYPE)
+            self.output: np.ndarray[(3, Any), np.float32] = np.zeros((self.ledCount, 3), dtype=PIXEL_BUFFER_DTYPE)
+            self.privateScratch: np.ndarray[(3, Any), np.float32] = np.zeros_like(self.output)
+            self.layers: list[ArrayLayer] = []
+            for name, blendMode, temporary in LayerStack.DEFAULT_LAYERS:
+                self.addLayer(name, blendMode=blendMode, temporary=temporary)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
+
+    def __getitem__(
+        self,
+        name: str,
+    ) -> ArrayLayer:
+        """Look up a layer by name.
+
+        Args:
+            name: the layer name
+
+        Returns:
+            the layer
+
+        Raises:
+            LayerException: if there is no layer with that name
+        """
+        layer = self.getLayer(name)
+        if layer is None:
+            raise LayerException(f"No layer named {name}")
+        return layer
+
+    def __len__(
+        self,
+    ) -> int:
+        """Return the number of layers above the base layer.
+
+        Returns:
+            the number of layers
+        """
+        return len(self.layers)
+
+    def getLayer(
+        self,
+        name: str,
+    ) -> Optional[ArrayLayer]:
+        """Look up a layer by name.
+
+        Args:
+            name: the layer name
+
+        Returns:
+            the layer, or None if it doesn't exist
+        """
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        return None
+
+    def addLayer(
+        self,
+        name: str,
+        blendMode: BlendMode = BlendMode.REPLACE,
+        alpha: float = 1.0,
+        temporary: bool = False,
+        position: Optional[int] = None,
+    ) -> ArrayLayer:
+        """Add a new layer to the stack, or return the existing layer with that name.
+
+        Args:
+            name: the layer name
+            blendMode: how the layer gets combined with the layers below it
+            alpha: layer opacity
+            temporary: set true to clear the layer after every composite
+            position: where to insert the layer, defaults to the top of the stack
+
+        Returns:
+            the layer
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            layer = self.getLayer(name)
+            if layer is None:
+                layer = ArrayLayer(name, self.ledCount, blendMode=blendMode, alpha=alpha, temporary=temporary)
+                if position is None:
+                    self.layers.append(layer)
+                else:
+                    self.layers.insert(position, layer)
+            return layer
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
+
+    def removeLayer(
+        self,
+        name: str,
+    ) -> None:
+        """Remove a layer from the stack.
+
+        Args:
+            name: the layer name
+        """
+        self.layers = [layer for layer in self.layers if layer.name != name]
+
+    def clear(
+        self,
+    ) -> None:
+        """Clear every layer above the base layer."""
+        for layer in self.layers:
+            layer.clear()
+
+    def composite(
+        self,
+    ) -> np.ndarray[(3, Any), np.float32]:
+        """Flatten the base layer and every layer above it into the output buffer.
+
+        Temporary layers are cleared afterwards.
+
+        Returns:
+            the preallocated output buffer
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LayerException: if something bad happens
+        """
+        try:
+            np.copyto(self.output, self.base)
+            for layer in self.layers:
+                layer.blend(self.output, self.privateScratch)
+                if layer.temporary:
+                    layer.clear()
+            return self.output
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise LayerException from ex
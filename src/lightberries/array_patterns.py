@@ -1,9 +1,8 @@
 """Defines a bunch of color patterns and color sequence methods."""
 from __future__ import annotations
-import random
 import logging
 import datetime
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 import numpy as np
 from lightberries.exceptions import (
     LightBerryException,
@@ -13,6 +12,9 @@ from lightberries.pixel import Pixel, PixelColors
 
 LOGGER = logging.getLogger("lightBerries")
 
+# every render buffer is kept in this dtype, quantization to 8-bit only happens at output
+PIXEL_BUFFER_DTYPE = np.float32
+
 
 def ConvertPixelArrayToNumpyArray(
     colorSequence: Sequence[Pixel],
@@ -46,25 +48,113 @@ def ConvertPixelArrayToNumpyArray(
         raise PatternException from ex
 
 
+def QuantizePixelArray(
+    ledBuffer: np.ndarray[(3, Any), np.float32],
+) -> np.ndarray[(3, Any), np.uint8]:
+    """Convert a render buffer into 8-bit RGB values.
+
+    Values are rounded and clipped to 0-255 in a single pass so that effects
+    can work in float without worrying about overflow.
+
+    Args:
+        ledBuffer: an array of rgb values in any numeric dtype
+
+    Returns:
+        a uint8 array with the same shape as the input
+
+    Raises:
+        SystemExit: if exiting
+        KeyboardInterrupt: if user quits
+        LightBerryException: if propagating an exception
+        LightPatternException: if something bad happens
+    """
+    try:
+        if ledBuffer.dtype == np.uint8:
+            return ledBuffer
+        _quantized = np.rint(ledBuffer)
+        np.clip(_quantized, 0, 255, out=_quantized)
+        return _quantized.astype(np.uint8)
+    except SystemExit:  # pragma: no cover
+        raise
+    except KeyboardInterrupt:  # pragma: no cover
+        raise
+    except LightBerryException:  # pragma: no cover
+        raise
+    except Exception as ex:  # pragma: no cover
+        raise PatternException from ex
+
+
+def PackPixelArray(
+    ledBuffer: np.ndarray[(3, Any), np.float32],
+    order: list[int] | None = None,
+) -> np.ndarray[(Any,), np.uint32]:
+    """Quantize a render buffer and pack each rgb value into a 24-bit int.
+
+    Args:
+        ledBuffer: an array of rgb values in any numeric dtype
+        order: the color order of the physical pixels, defaults to Pixel.DEFAULT_PIXEL_ORDER
+
+    Returns:
+        an array of packed pixel values ready for the ws281x library
+
+    Raises:
+        SystemExit: if exiting
+        KeyboardInterrupt: if user quits
+        LightBerryException: if propagating an exception
+        LightPatternException: if something bad happens
+    """
+    try:
+        if order is None:
+            order = Pixel.DEFAULT_PIXEL_ORDER
+        _quantized = QuantizePixelArray(ledBuffer).reshape((-1, 3)).astype(np.uint32)
+        return (_quantized[:, order[0]] << 16) | (_quantized[:, order[1]] << 8) | _quantized[:, order[2]]
+    except SystemExit:  # pragma: no cover
+        raise
+    except KeyboardInterrupt:  # pragma: no cover
+        raise
+    except LightBerryException:  # pragma: no cover
+        raise
+    except Exception as ex:  # pragma: no cover
+        raise PatternException from ex
+
+
+class _MonthlyColorSequence:
+    """Picks the default color sequence for the current month the first time it is read."""
+
+    def __get__(
+        self,
+        instance: Any,
+        owner: type,
+    ) -> np.ndarray[(3, Any), np.int32]:
+        """Replace this descriptor with this month's color sequence and return it.
+
+        Args:
+            instance: ignored
+            owner: the class the sequence belongs to
+
+        Returns:
+            the default sequence of colors for this month
+        """
+        return owner.DefaultColorSequenceByMonth()
+
+
 class ArrayPattern:
     # set some constants
     DEFAULT_TWINKLE_COLOR = PixelColors.GRAY
     DEFAULT_BACKGROUND_COLOR = PixelColors.OFF
-    DEFAULT_COLOR_SEQUENCE = ConvertPixelArrayToNumpyArray(
-        [
-            PixelColors.RED,
-            PixelColors.GREEN,
-            PixelColors.BLUE,
-        ]
-    )
+    # computed on first use rather than at import time
+    DEFAULT_COLOR_SEQUENCE = _MonthlyColorSequence()
 
     @classmethod
     def DefaultColorSequenceByMonth(
         cls,
-        date: datetime.datetime = datetime.datetime.now(),
+        date: Optional[datetime.datetime] = None,
     ) -> np.ndarray[(3, Any), np.int32]:
         """Get the default sequence of colors defined for this month.
 
+        Args:
+            date: the date to pick colors for, defaults to today
+
         Returns:
             the default sequence of colors as determined by the current month
 
@@ -75,6 +165,8 @@ class ArrayPattern:
             LightPatternException: if something bad happens
         """
         try:
+            if date is None:
+                date = datetime.datetime.now()
             month = date.month
             if month == 1:
                 cls.DEFAULT_COLOR_SEQUENCE = ConvertPixelArrayToNumpyArray(
@@ -215,9 +307,9 @@ class ArrayPattern:
         """
         try:
             if arrayLength > 0:
-                return np.array([PixelColors.OFF.array for i in range(int(arrayLength))])
+                return np.zeros((int(arrayLength), 3), dtype=PIXEL_BUFFER_DTYPE)
             else:
-                return np.zeros((0, 3))
+                return np.zeros((0, 3), dtype=PIXEL_BUFFER_DTYPE)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -252,9 +344,9 @@ class ArrayPattern:
             if color is None:
                 color = cls.DEFAULT_COLOR_SEQUENCE[0]
             if arrayLength > 0:
-                return np.array([color for i in range(int(arrayLength))])
+                return np.tile(np.asarray(color, dtype=PIXEL_BUFFER_DTYPE), (int(arrayLength), 1))
             else:
-                return np.zeros((0, 3))
+                return np.zeros((0, 3), dtype=PIXEL_BUFFER_DTYPE)
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -299,7 +391,7 @@ class ArrayPattern:
             if len(inputSequence.shape):
                 sequenceLength = inputSequence.shape[0]
             if sequenceLength == 0 or arrayLength == 0:
-                return np.zeros((0, 3))
+                return np.zeros((0, 3), dtype=PIXEL_BUFFER_DTYPE)
             count = 0
             stepCount = None
             prevStepCount = 0
@@ -332,7 +424,7 @@ class ArrayPattern:
                         thisColor[rgbIndex], nextColor[rgbIndex], stepCount
                     )
                 count += stepCount
-            return temp_array.astype(int)
+            return temp_array
         except SystemExit:  # pragma: no cover
             raise
         except KeyboardInterrupt:  # pragma: no cover
@@ -411,7 +503,7 @@ class ArrayPattern:
             if len(inputSequence):
                 sequenceLength = len(inputSequence)
             else:
-                return np.zeros((0, 3))
+                return np.zeros((0, 3), dtype=PIXEL_BUFFER_DTYPE)
             temp_array = ArrayPattern.PixelArrayOff(arrayLength=arrayLength)
             if arrayLength > sequenceLength:
                 temp_array[0:sequenceLength] = inputSequence
@@ -499,7 +591,7 @@ class ArrayPattern:
             if foldLength is None:
                 foldLength = arrayLength // 2
             if colorSequenceLen == 0 or arrayLength == 0:
-                return np.zeros((0, 3))
+                return np.zeros((0, 3), dtype=PIXEL_BUFFER_DTYPE)
             if foldLength > colorSequenceLen:
                 temp = ArrayPattern.PixelArrayOff(foldLength)
                 temp[foldLength - colorSequenceLen :] = inputSequence
@@ -538,11 +630,13 @@ class ArrayPattern:
 
     def RandomArray(
         arrayLength: int,
+        generator: np.random.Generator | None = None,
     ) -> np.ndarray[(3, Any), np.int32]:
         """Creates an array of random colors.
 
         Args:
             arrayLength: the number of random colors to generate for the array
+            generator: optional numpy Generator (e.g. a controller's randomSource.generator) for reproducible colors
 
         Returns:
             a list of Pixel objects in the pattern you requested
@@ -554,23 +648,12 @@ class ArrayPattern:
             LightPatternException: if something bad happens
         """
         try:
-            temp_array = ArrayPattern.PixelArrayOff(arrayLength)
-            for i in range(arrayLength):
-                # prevent 255, 255, 255
-                exclusion = random.randint(0, 2)
-                if exclusion != 0:
-                    redLED = random.randint(0, 255)
-                else:
-                    redLED = 0
-                if exclusion != 1:
-                    greenLED = random.randint(0, 255)
-                else:
-                    greenLED = 0
-                if exclusion != 2:
-                    blueLED = random.randint(0, 255)
-                else:
-                    blueLED = 0
-                temp_array[i] = [redLED, greenLED, blueLED]
+            if generator is None:
+                generator = np.random.default_rng()
+            arrayLength = int(arrayLength)
+            temp_array = generator.integers(0, 255, (arrayLength, 3), endpoint=True).astype(PIXEL_BUFFER_DTYPE)
+            # prevent 255, 255, 255
+            temp_array[np.arange(arrayLength), generator.integers(0, 2, arrayLength, endpoint=True)] = 0
             return temp_array
         except SystemExit:  # pragma: no cover
             raise
@@ -584,12 +667,14 @@ class ArrayPattern:
     def PseudoRandomArray(
         arrayLength: int,
         colorSequence: np.ndarray[(3, Any), np.int32] = None,
+        generator: np.random.Generator | None = None,
     ) -> np.ndarray[(3, Any), np.int32]:
         """Creates an array of random colors.
 
         Args:
             arrayLength: the number of random colors to generate for the array
             colorSequence: optional parameter from which to draw the pseudo random colors from
+            generator: optional numpy Generator (e.g. a controller's randomSource.generator) for reproducible colors
 
         Returns:
             a list of Pixel objects in the pattern you requested
@@ -612,8 +697,9 @@ class ArrayPattern:
             if inputSequenceLen == 0:
                 inputSequence = ArrayPattern.DEFAULT_COLOR_SEQUENCE
                 inputSequenceLen = inputSequence.shape[0]
-            for i in range(arrayLength):
-                temp_array[i] = inputSequence[random.randint(0, inputSequenceLen - 1)]
+            if generator is None:
+                generator = np.random.default_rng()
+            temp_array[:] = inputSequence[generator.integers(0, inputSequenceLen, int(arrayLength))]
             return temp_array
         except SystemExit:  # pragma: no cover
             raise
@@ -646,6 +732,8 @@ class ArrayPattern:
                 inputSequence = ArrayPattern.DEFAULT_COLOR_SEQUENCE
             else:
                 inputSequence = colorSequence.copy()
+            if inputSequence.dtype == object:
+                inputSequence = ConvertPixelArrayToNumpyArray(inputSequence)
             colorSequenceLength = inputSequence.shape[0]
             repeats = int(arrayLength / colorSequenceLength)
             if arrayLength % colorSequenceLength > 0:
@@ -662,6 +750,3 @@ class ArrayPattern:
             raise
         except Exception as ex:  # pragma: no cover
             raise PatternException from ex
-
-
-ArrayPattern.DefaultColorSequenceByMonth()
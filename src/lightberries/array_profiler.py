@@ -0,0 +1,275 @@
+"""Defines an opt-in profiler for the light functions run by a controller."""
+from __future__ import annotations
+import cProfile
+import logging
+import os
+import pstats
+import signal
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import numpy as np
+from lightberries.exceptions import LightBerryException, ProfilerException
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.array_functions import ArrayFunction
+
+LOGGER = logging.getLogger("lightBerries")
+DEFAULT_HISTORY_FRAMES = 600
+DEFAULT_PROFILE_FRAMES = 120
+# deeper call chains are folded into their caller
+MAX_FOLDED_DEPTH = 64
+
+
+class ArrayProfiler:
+    """Times every light function every frame, and captures cProfile stacks on request.
+
+    Function instances are named by function name and position in the function list,
+    e.g. "functionAlive[3]", so two instances of the same function can be told apart.
+    """
+
+    def __init__(
+        self,
+        historyFrames: int = DEFAULT_HISTORY_FRAMES,
+        outputDirectory: str = ".",
+    ) -> None:
+        """Create a profiler.
+
+        Args:
+            historyFrames: the number of recent frames to keep timings for
+            outputDirectory: where cProfile captures are written
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            ProfilerException: if something bad happens
+        """
+        try:
+            self.outputDirectory: str = outputDirectory
+            self.frames: deque[list[tuple[str, float]]] = deque(maxlen=int(historyFrames))
+            self.privateFrame: list[tuple[str, float]] = []
+            self.privateProfile: Optional[cProfile.Profile] = None
+            self.privateProfileFramesRemaining: int = 0
+            self.privateRequestedFrames: int = 0
+            self.privateRequestedPath: Optional[str] = None
+            self.privateCaptureCallback: Optional[Callable[[str], None]] = None
+            self.privateCaptureThread: Optional[threading.Thread] = None
+            self.captures: list[str] = []
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ProfilerException from ex
+
+    @property
+    def capturing(
+        self,
+    ) -> bool:
+        """Whether a cProfile capture is requested or in progress.
+
+        Returns:
+            true while capturing
+        """
+        return self.privateProfile is not None or self.privateRequestedFrames > 0
+
+    def requestProfile(
+        self,
+        frames: int = DEFAULT_PROFILE_FRAMES,
+        path: Optional[str] = None,
+        callback: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        """Capture full cProfile stacks for the next few frames.
+
+        The capture starts at the next frame and is written when it finishes, as a
+        .pstats file (for pstats, snakeviz, gprof2dot, ...) plus a .folded file of
+        collapsed stacks in microseconds (for flamegraph.pl, speedscope, ...). The
+        folded stacks are rebuilt from the cProfile call graph, so time is split
+        between callers in proportion to how much each one called.
+
+        This only sets a flag, so it is safe to call from a signal handler or another thread.
+
+        Args:
+            frames: the number of frames to capture
+            path: the file name without extension, defaults to a time stamped name in outputDirectory
+            callback: called with the path (without extension) once the capture is written
+        """
+        self.privateRequestedPath = path
+        self.privateCaptureCallback = callback
+        self.privateRequestedFrames = max(1, int(frames))
+
+    def installSignalHandler(
+        self,
+        signalNumber: Optional[int] = None,
+        frames: int = DEFAULT_PROFILE_FRAMES,
+    ) -> None:
+        """Start a capture whenever the process receives a signal (e.g. kill -USR1 <pid>).
+
+        Args:
+            signalNumber: the signal to listen for, defaults to SIGUSR1
+            frames: the number of frames to capture
+
+        Raises:
+            ProfilerException: if no signal is given and the platform has no SIGUSR1
+        """
+        if signalNumber is None:
+            # never fall back to a signal the user already has a use for, like SIGINT
+            if not hasattr(signal, "SIGUSR1"):
+                raise ProfilerException("SIGUSR1 is not available on this platform, pass a signal number")
+            signalNumber = signal.SIGUSR1
+        signal.signal(signalNumber, lambda *_: self.requestProfile(frames))
+
+    def beginFrame(
+        self,
+    ) -> None:
+        """Start timing a frame (and start a requested capture)."""
+        self.privateFrame = []
+        if self.privateRequestedFrames > 0 and self.privateProfile is None:
+            self.privateProfileFramesRemaining = self.privateRequestedFrames
+            self.privateRequestedFrames = 0
+            self.privateProfile = cProfile.Profile()
+        if self.privateProfile is not None:
+            self.privateProfile.enable()
+
+    def runFunction(
+        self,
+        position: int,
+        function: ArrayFunction,
+    ) -> None:
+        """Run and time one light function.
+
+        Args:
+            position: the position of the function in the function list
+            function: the function to run
+        """
+        _start = time.perf_counter()
+        function.runFunction(function)
+        self.privateFrame.append((f"{function.funcName}[{position}]", time.perf_counter() - _start))
+
+    def endFrame(
+        self,
+    ) -> None:
+        """Finish timing a frame (and finish a capture once it has enough frames)."""
+        if self.privateProfile is not None:
+            self.privateProfile.disable()
+            self.privateProfileFramesRemaining -= 1
+            if self.privateProfileFramesRemaining <= 0:
+                _profile, self.privateProfile = self.privateProfile, None
+                _path = self.privateRequestedPath
+                if _path is None:
+                    _path = os.path.join(self.outputDirectory, time.strftime("lightberries-%Y%m%d-%H%M%S"))
+                # folding and writing take a while, so keep them out of the frame loop
+                self.privateCaptureThread = threading.Thread(
+                    target=self._writeCapture,
+                    args=(_profile, _path, self.privateCaptureCallback),
+                    daemon=True,
+                )
+                self.privateCaptureThread.start()
+        self.frames.append(self.privateFrame)
+
+    def summary(
+        self,
+    ) -> dict[str, dict[str, float]]:
+        """Summarize the recorded frames per function instance, slowest first.
+
+        Returns:
+            for each function instance: frames, mean, p95, max, and total seconds
+        """
+        _times: dict[str, list[float]] = defaultdict(list)
+        for frame in list(self.frames):
+            for name, seconds in frame:
+                _times[name].append(seconds)
+        _summary = {}
+        for name, seconds in _times.items():
+            _seconds = np.array(seconds)
+            _summary[name] = {
+                "frames": len(_seconds),
+                "mean": float(_seconds.mean()),
+                "p95": float(np.percentile(_seconds, 95)),
+                "max": float(_seconds.max()),
+                "total": float(_seconds.sum()),
+            }
+        return dict(sorted(_summary.items(), key=lambda item: item[1]["total"], reverse=True))
+
+    def waitForCapture(
+        self,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Wait for the last finished capture to be written.
+
+        Args:
+            timeout: the maximum number of seconds to wait
+        """
+        if self.privateCaptureThread is not None:
+            self.privateCaptureThread.join(timeout)
+
+    def _writeCapture(
+        self,
+        profile: cProfile.Profile,
+        path: str,
+        callback: Optional[Callable[[str], None]],
+    ) -> None:
+        """Write a finished capture to disk.
+
+        Args:
+            profile: the finished profile
+            path: the file name without extension
+            callback: called with the path once the capture is written
+        """
+        try:
+            profile.dump_stats(path + ".pstats")
+            with open(path + ".folded", "w") as foldedFile:
+                foldedFile.writelines(f"{stack} {count}\n" for stack, count in foldStacks(profile).items())
+            self.captures.append(path)
+            LOGGER.info("%s wrote %s", self.__class__.__name__, path)
+            if callback is not None:
+                callback(path)
+        except Exception as ex:  # pragma: no cover
+            # a failed capture must never stop the show
+            LOGGER.exception("%s failed to write %s: %s", self.__class__.__name__, path, ex)
+
+
+def foldStacks(
+    profile: cProfile.Profile,
+) -> dict[str, int]:
+    """Convert a cProfile capture into collapsed stacks.
+
+    Args:
+        profile: the finished profile
+
+    Returns:
+        a map from "outer;inner;innermost" stacks to self time in microseconds
+    """
+    _stats: dict[Any, tuple] = pstats.Stats(profile).stats  # type: ignore
+    _children: dict[Any, list[tuple[Any, float]]] = defaultdict(list)
+    for callee, (_, _, _, _, callers) in _stats.items():
+        for caller, (_, _, _, callerCumulative) in callers.items():
+            _children[caller].append((callee, callerCumulative))
+    _folded: dict[str, float] = defaultdict(float)
+
+    def _name(function: Any) -> str:
+        fileName, line, functionName = function
+        return f"{functionName} ({os.path.basename(fileName)}:{line})".replace(";", ":")
+
+    def _walk(function: Any, stack: list[str], visited: frozenset, share: float) -> None:
+        _, _, selfTime, cumulativeTime, _ = _stats[function]
+        _folded[";".join(stack)] += selfTime * share
+        for callee, edgeCumulative in _children.get(function, []):
+            _calleeCumulative = _stats[callee][3]
+            if callee in visited or _calleeCumulative <= 0 or len(stack) >= MAX_FOLDED_DEPTH:
+                continue
+            _walk(
+                callee,
+                stack + [_name(callee)],
+                visited | {callee},
+                share * edgeCumulative / _calleeCumulative,
+            )
+
+    for function, (_, _, _, _, callers) in _stats.items():
+        if not callers:
+            _walk(function, [_name(function)], frozenset({function}), 1.0)
+    return {stack: int(round(seconds * 1e6)) for stack, seconds in _folded.items() if seconds * 1e6 >= 0.5}
@@ -0,0 +1,240 @@
+"""Defines the batched random number source shared by a controller and its functions."""
+from __future__ import annotations
+import logging
+from typing import Any, Optional
+import numpy as np
+from lightberries.exceptions import LightBerryException, RandomException
+
+LOGGER = logging.getLogger("lightBerries")
+
+
+class ArrayRandom:
+    """Hands out random values from batches drawn in bulk from a numpy Generator.
+
+    Every controller owns one of these so that shows (and tests) can be reproduced
+    by passing the same seed. Scalar draws come from a pre-drawn pool of uniforms
+    that gets refilled with a single call once it runs out, so per-LED or per-entity
+    dice rolls don't pay the python random module overhead each time.
+    """
+
+    DEFAULT_BATCH_SIZE: int = 1024
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        batchSize: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Create a random number source.
+
+        Args:
+            seed: seed for reproducible random values, None for a fresh random seed
+            batchSize: the number of values to pre-draw at a time
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            RandomException: if something bad happens
+        """
+        try:
+            self.batchSize: int = max(1, int(batchSize))
+            self.seed(seed)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise RandomException from ex
+
+    @property
+    def generator(
+        self,
+    ) -> np.random.Generator:
+        """The underlying numpy Generator, for drawing whole arrays directly.
+
+        Returns:
+            the generator
+        """
+        return self.privateGenerator
+
+    def seed(
+        self,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Reseed the generator and throw away any pre-drawn values.
+
+        Args:
+            seed: seed for reproducible random values, None for a fresh random seed
+        """
+        self.privateGenerator: np.random.Generator = np.random.default_rng(seed)
+        self.privateUniforms: list[float] = []
+        self.privateUniformIndex: int = 0
+
+    def _refill(
+        self,
+    ) -> None:
+        """Draw the next batch of uniform values."""
+        self.privateUniforms = self.privateGenerator.random(self.batchSize).tolist()
+        self.privateUniformIndex = 0
+
+    def random(
+        self,
+    ) -> float:
+        """Get a random float in [0.0, 1.0).
+
+        Returns:
+            a random float
+        """
+        if self.privateUniformIndex >= len(self.privateUniforms):
+            self._refill()
+        value = self.privateUniforms[self.privateUniformIndex]
+        self.privateUniformIndex += 1
+        return value
+
+    def uniform(
+        self,
+        low: float = 0.0,
+        high: float = 1.0,
+    ) -> float:
+        """Get a random float in [low, high).
+
+        Args:
+            low: lowest value
+            high: highest value
+
+        Returns:
+            a random float
+        """
+        return low + ((high - low) * self.random())
+
+    def randint(
+        self,
+        low: int,
+        high: int,
+    ) -> int:
+        """Get a random int in [low, high], including both end points (like random.randint).
+
+        Args:
+            low: lowest value
+            high: highest value
+
+        Returns:
+            a random int
+
+        Raises:
+            RandomException: if high is less than low
+        """
+        if int(high) < int(low):
+            raise RandomException(f"Empty range for randint({low}, {high})")
+        return int(low) + int(self.random() * (int(high) - int(low) + 1))
+
+    def boolean(
+        self,
+        chance: float = 0.5,
+    ) -> bool:
+        """Get a random True or False value.
+
+        Args:
+            chance: the probability of getting True
+
+        Returns:
+            True or False, randomly
+        """
+        return self.random() < chance
+
+    def direction(
+        self,
+    ) -> int:
+        """Get a random one or negative one.
+
+        Returns:
+            one or negative one, randomly
+        """
+        return 1 if self.random() < 0.5 else -1
+
+    def uniforms(
+        self,
+        count: int,
+        low: float = 0.0,
+        high: float = 1.0,
+    ) -> np.ndarray[(Any,), np.float64]:
+        """Get an array of random floats in [low, high).
+
+        Args:
+            count: the number of values
+            low: lowest value
+            high: highest value
+
+        Returns:
+            array of random floats
+        """
+        return self.privateGenerator.uniform(low, high, int(count))
+
+    def integers(
+        self,
+        low: int,
+        high: int,
+        count: int,
+    ) -> np.ndarray[(Any,), np.int32]:
+        """Get an array of random ints in [low, high], including both end points.
+
+        Args:
+            low: lowest value
+            high: highest value
+            count: the number of values
+
+        Returns:
+            array of random ints
+
+        Raises:
+            RandomException: if high is less than low
+        """
+        if int(high) < int(low):
+            raise RandomException(f"Empty range for integers({low}, {high})")
+        return self.privateGenerator.integers(low, high, int(count), dtype=np.int32, endpoint=True)
+
+    def booleans(
+        self,
+        count: int,
+        chance: float = 0.5,
+    ) -> np.ndarray[(Any,), np.bool_]:
+        """Get an array of random True/False values.
+
+        Args:
+            count: the number of values
+            chance: the probability of each value being True
+
+        Returns:
+            array of random booleans
+        """
+        return self.privateGenerator.random(int(count)) < chance
+
+    def directions(
+        self,
+        count: int,
+    ) -> np.ndarray[(Any,), np.int32]:
+        """Get an array of random ones and negative ones.
+
+        Args:
+            count: the number of values
+
+        Returns:
+            array of random directions
+        """
+        return (self.privateGenerator.integers(0, 2, int(count), dtype=np.int32) * 2) - 1
+
+    def choice(
+        self,
+        sequence: Any,
+    ) -> Any:
+        """Pick a random element of a sequence.
+
+        Args:
+            sequence: anything with a length that can be indexed
+
+        Returns:
+            one element of the sequence
+        """
+        return sequence[self.randint(0, len(sequence) - 1)]
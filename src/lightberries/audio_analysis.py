@@ -0,0 +1,901 @@
+"""Defines a real-time audio analysis engine for audio-reactive effects.
+
+Samples go into a preallocated ring buffer. Each analysis windows the newest frame of
+samples with a cached window and runs a real FFT, the power spectrum is summed into
+log-spaced bands through a precomputed bin map, and spectral flux and bass energy drive
+onset and beat detection. The resulting feature vector is published through shared
+memory, so effects in this or any other process read the latest one without blocking.
+"""
+from __future__ import annotations
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import wave
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterable, Iterator, Optional, Union
+import numpy as np
+from lightberries.exceptions import AudioException, LightBerryException
+
+LOGGER = logging.getLogger("lightBerries")
+DEFAULT_SAMPLE_RATE = 44100
+DEFAULT_FRAME_SIZE = 2048
+DEFAULT_CHUNK_SIZE = 512
+DEFAULT_BAND_COUNT = 16
+DEFAULT_MIN_FREQUENCY = 40.0
+DEFAULT_MAX_FREQUENCY = 16000.0
+# band levels are scaled over this many decibels below the recent peak
+DEFAULT_DYNAMIC_RANGE = 60.0
+# decibels per second the recent peak falls when the audio gets quieter
+PEAK_DECAY = 6.0
+# seconds of history the onset and beat thresholds adapt to
+DETECTION_HISTORY = 1.0
+# onsets need spectral flux this many standard deviations above its recent mean
+ONSET_THRESHOLD = 2.0
+# beats need bass energy this many times its recent mean, and as many standard deviations above it as onsets
+BEAT_THRESHOLD = 1.5
+MIN_ONSET_INTERVAL = 0.1
+# chunks quieter than this (RMS of full scale, about -50 dBFS) never trigger onsets or beats
+SILENCE_LEVEL = 10 ** (-50 / 20)
+MIN_BEAT_INTERVAL = 0.25
+# bands starting at or below this frequency count as bass for beat detection
+BEAT_MAX_FREQUENCY = 200.0
+# positions in the feature vector
+FEATURE_TIME = 0
+FEATURE_LEVEL = 1
+FEATURE_FLUX = 2
+FEATURE_ONSET = 3
+FEATURE_BEAT = 4
+# running totals, so readers that poll slower than the analyzer still see every onset and beat
+FEATURE_ONSET_COUNT = 5
+FEATURE_BEAT_COUNT = 6
+FEATURE_BANDS = 7
+# the shared memory name effects attach to when they are not given features
+DEFAULT_SHARED_NAME = "lightberries-audio"
+# shared memory header: the update sequence number and the feature count
+_SHARED_HEADER = 2
+# attempts to read a consistent copy before falling back to the last one
+_SHARED_READ_TRIES = 8
+
+
+@functools.lru_cache(maxsize=None)
+def analysisWindow(
+    name: str,
+    size: int,
+) -> np.ndarray:
+    """A read only analysis window, built once per name and size.
+
+    Args:
+        name: "hann", "hamming", "blackman", or "rectangular"
+        size: the number of samples
+
+    Returns:
+        the float32 window
+
+    Raises:
+        AudioException: if the window name is unknown
+    """
+    if name == "hann":
+        _window = np.hanning(size)
+    elif name == "hamming":
+        _window = np.hamming(size)
+    elif name == "blackman":
+        _window = np.blackman(size)
+    elif name == "rectangular":
+        _window = np.ones(size)
+    else:
+        raise AudioException(f"Unknown analysis window: {name}")
+    _window = _window.astype(np.float32)
+    _window.flags.writeable = False
+    return _window
+
+
+@functools.lru_cache(maxsize=None)
+def bandBinMap(
+    sampleRate: int,
+    frameSize: int,
+    bandCount: int,
+    minFrequency: float,
+    maxFrequency: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map real FFT bins onto log-spaced bands.
+
+    Bands are contiguous; low bands narrower than one bin are widened to one bin and the
+    bands above them pushed up, so every band gets at least one bin of its own.
+
+    Args:
+        sampleRate: samples per second
+        frameSize: the number of samples per FFT
+        bandCount: the number of bands
+        minFrequency: the bottom edge of the first band
+        maxFrequency: the top edge of the last band (limited to half the sample rate)
+
+    Returns:
+        the first bin and the number of bins of each band
+
+    Raises:
+        AudioException: if the bands do not fit in the FFT bins
+    """
+    _binCount = frameSize // 2 + 1
+    _edges = np.geomspace(minFrequency, min(maxFrequency, sampleRate / 2), bandCount + 1)
+    _edgeBins = np.clip(np.round(_edges * frameSize / sampleRate).astype(np.int64), 1, _binCount)
+    _steps = np.arange(bandCount + 1)
+    # each edge at least one bin past the one before it
+    _edgeBins = np.maximum.accumulate(_edgeBins - _steps) + _steps
+    if _edgeBins[-1] > _binCount:
+        raise AudioException(f"{bandCount} bands from {minFrequency} Hz do not fit in {_binCount} FFT bins")
+    _starts = _edgeBins[:-1].copy()
+    _widths = np.diff(_edgeBins)
+    _starts.flags.writeable = False
+    _widths.flags.writeable = False
+    return _starts, _widths
+
+
+@functools.lru_cache(maxsize=None)
+def bandLEDMap(
+    bandCount: int,
+    ledCount: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split a string of LEDs into one segment per band.
+
+    A band level is drawn as a bar filling its segment from the bottom, so each LED
+    also gets the level its bar starts at and the scale that turns the part of the
+    level above that into the LED's brightness (0.0 to 1.0, fractional at the top
+    of the bar). With fewer LEDs than bands each LED shows one band.
+
+    Args:
+        bandCount: the number of bands
+        ledCount: the number of LEDs
+
+    Returns:
+        the band, bar start, and bar scale of each LED
+    """
+    _bands = (np.arange(ledCount) * bandCount) // ledCount
+    _segmentStarts = np.searchsorted(_bands, np.arange(bandCount))
+    _segmentWidths = np.bincount(_bands, minlength=bandCount)
+    _scales = _segmentWidths[_bands].astype(np.float32)
+    _starts = (np.arange(ledCount) - _segmentStarts[_bands]) / _scales
+    _bands = _bands.astype(np.int32)
+    _starts = _starts.astype(np.float32)
+    for array in (_bands, _starts, _scales):
+        array.flags.writeable = False
+    return _bands, _starts, _scales
+
+
+def attackDecay(
+    levels: np.ndarray,
+    targets: np.ndarray,
+    attack: float,
+    decay: float,
+) -> np.ndarray:
+    """Move smoothed levels toward new values, quickly when they rise and slowly when they fall.
+
+    Args:
+        levels: the smoothed levels, updated in place
+        targets: the new values
+        attack: the fraction of a rise applied per update, 0.0 to 1.0
+        decay: the fraction of a fall applied per update, 0.0 to 1.0
+
+    Returns:
+        the smoothed levels
+    """
+    _change = targets - levels
+    _change *= np.where(_change > 0, attack, decay)
+    levels += _change
+    return levels
+
+
+def _movingStatistics(
+    value: float,
+    mean: float,
+    variance: float,
+    rate: float,
+) -> tuple[float, float]:
+    """Update an exponentially weighted mean and variance.
+
+    Args:
+        value: the new value
+        mean: the current mean
+        variance: the current variance
+        rate: the weight of the new value, 0.0 to 1.0
+
+    Returns:
+        the new mean and variance
+    """
+    _difference = value - mean
+    return mean + rate * _difference, (1.0 - rate) * (variance + rate * _difference**2)
+
+
+class AudioRingBuffer:
+    """A fixed size sample history that is written in place instead of rolled."""
+
+    def __init__(
+        self,
+        capacity: int,
+    ) -> None:
+        """Create a ring buffer.
+
+        Args:
+            capacity: the number of samples kept
+        """
+        self.buffer: np.ndarray = np.zeros(int(capacity), dtype=np.float32)
+        self.written: int = 0
+        self.privateWrite: int = 0
+
+    def write(
+        self,
+        samples: np.ndarray,
+    ) -> None:
+        """Add samples, overwriting the oldest ones.
+
+        Args:
+            samples: the new samples, oldest first
+        """
+        _capacity = len(self.buffer)
+        _count = len(samples)
+        self.written += _count
+        if _count >= _capacity:
+            self.buffer[:] = samples[-_capacity:]
+            self.privateWrite = 0
+            return
+        _first = min(_count, _capacity - self.privateWrite)
+        self.buffer[self.privateWrite : self.privateWrite + _first] = samples[:_first]
+        self.buffer[: _count - _first] = samples[_first:]
+        self.privateWrite = (self.privateWrite + _count) % _capacity
+
+    def latest(
+        self,
+        count: int,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Copy out the newest samples in order.
+
+        Args:
+            count: the number of samples (at most the capacity)
+            out: where to copy them, allocated if not given
+
+        Returns:
+            the samples, oldest first
+        """
+        if out is None:
+            out = np.empty(count, dtype=np.float32)
+        _start = (self.privateWrite - count) % len(self.buffer)
+        _first = min(count, len(self.buffer) - _start)
+        out[:_first] = self.buffer[_start : _start + _first]
+        out[_first:count] = self.buffer[: count - _first]
+        return out
+
+
+class SharedFeatures:
+    """A feature vector in shared memory, written by one analyzer and read by any number of effects.
+
+    Updates are guarded by a sequence number that is odd while a write is in progress, so
+    readers never take a lock: they copy the vector and retry if the sequence changed.
+    There are no memory barriers, so on weakly ordered CPUs (ARM, as on a Raspberry Pi)
+    a reader can now and then get a vector mixing values from two consecutive updates.
+    That is harmless for effects, which only ever want recent values.
+    """
+
+    # names of the blocks created by this process, which its resource tracker has to keep
+    privateCreatedNames: set[str] = set()
+
+    def __init__(
+        self,
+        memory: shared_memory.SharedMemory,
+        owner: bool,
+    ) -> None:
+        """Wrap a shared memory block, use create() or attach() instead.
+
+        Args:
+            memory: the shared memory block
+            owner: whether this object created the block (and unlinks it)
+        """
+        self.memory: shared_memory.SharedMemory = memory
+        self.owner: bool = owner
+        self.privateHeader: np.ndarray = np.ndarray((_SHARED_HEADER,), dtype=np.int64, buffer=memory.buf)
+        self.privateValues: np.ndarray = np.ndarray(
+            (int(self.privateHeader[1]),), dtype=np.float64, buffer=memory.buf, offset=_SHARED_HEADER * 8
+        )
+        self.privateLast: np.ndarray = np.zeros_like(self.privateValues)
+        self.privateLastSequence: int = 0
+
+    @classmethod
+    def create(
+        cls,
+        featureCount: int,
+        name: Optional[str] = None,
+    ) -> SharedFeatures:
+        """Allocate a new shared feature vector.
+
+        Args:
+            featureCount: the length of the feature vector
+            name: the shared memory name, chosen by the system if not given
+
+        Returns:
+            the writable feature vector
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            _memory = shared_memory.SharedMemory(name=name, create=True, size=(_SHARED_HEADER + featureCount) * 8)
+            _header = np.ndarray((_SHARED_HEADER,), dtype=np.int64, buffer=_memory.buf)
+            _header[:] = (0, featureCount)
+            del _header
+            cls.privateCreatedNames.add(_memory.name)
+            return cls(_memory, owner=True)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise AudioException from ex
+
+    @classmethod
+    def attach(
+        cls,
+        name: str,
+    ) -> SharedFeatures:
+        """Open a feature vector created by another process.
+
+        Args:
+            name: the shared memory name
+
+        Returns:
+            the feature vector
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            if sys.version_info >= (3, 13):
+                return cls(shared_memory.SharedMemory(name=name, track=False), owner=False)
+            _memory = shared_memory.SharedMemory(name=name)
+            # before Python 3.13 attaching registers the block with this process's resource
+            # tracker, which would unlink it out from under the writer when this process exits
+            if os.name == "posix" and _memory.name not in cls.privateCreatedNames:
+                resource_tracker.unregister(_memory._name, "shared_memory")
+            return cls(_memory, owner=False)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:
+            raise AudioException from ex
+
+    @property
+    def name(
+        self,
+    ) -> str:
+        """The shared memory name, for attach().
+
+        Returns:
+            the name
+        """
+        return self.memory.name
+
+    @property
+    def featureCount(
+        self,
+    ) -> int:
+        """The length of the feature vector.
+
+        Returns:
+            the number of features
+        """
+        return len(self.privateValues)
+
+    def publish(
+        self,
+        features: np.ndarray,
+    ) -> None:
+        """Replace the feature vector.
+
+        Args:
+            features: the new features
+        """
+        self.privateHeader[0] += 1
+        self.privateValues[:] = features
+        self.privateHeader[0] += 1
+
+    def read(
+        self,
+        out: np.ndarray,
+    ) -> int:
+        """Copy the latest feature vector without waiting for the writer.
+
+        Args:
+            out: where to copy the features
+
+        Returns:
+            the number of updates published so far, so callers can tell new data from old
+        """
+        for _ in range(_SHARED_READ_TRIES):
+            _sequence = int(self.privateHeader[0])
+            if _sequence % 2 == 0:
+                self.privateLast[:] = self.privateValues
+                if int(self.privateHeader[0]) == _sequence:
+                    self.privateLastSequence = _sequence // 2
+                    break
+        # a write that is still in progress leaves the previous copy in place
+        out[:] = self.privateLast
+        return self.privateLastSequence
+
+    def close(
+        self,
+    ) -> None:
+        """Detach from the shared memory, and free it if this object created it."""
+        # numpy views into the buffer have to go before the memory can be closed
+        self.privateHeader = np.zeros(_SHARED_HEADER, dtype=np.int64)
+        self.privateValues = np.zeros_like(self.privateLast)
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            self.owner = False
+            self.privateCreatedNames.discard(self.memory.name)
+
+
+class WavSource:
+    """Reads a PCM WAV file as mono float chunks, standing in for a microphone."""
+
+    def __init__(
+        self,
+        path: str,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        loop: bool = False,
+    ) -> None:
+        """Load a WAV file.
+
+        Args:
+            path: the file to read
+            chunkSize: the number of samples per chunk
+            loop: start over at the end instead of stopping
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            with wave.open(path, "rb") as _wav:
+                self.sampleRate: int = _wav.getframerate()
+                _channels = _wav.getnchannels()
+                _width = _wav.getsampwidth()
+                _data = _wav.readframes(_wav.getnframes())
+            if _width == 1:
+                _samples = (np.frombuffer(_data, dtype=np.uint8).astype(np.float32) - 128) / 128
+            elif _width == 2:
+                _samples = np.frombuffer(_data, dtype="<i2").astype(np.float32) / 2**15
+            elif _width == 3:
+                _bytes = np.frombuffer(_data, dtype=np.uint8).reshape((-1, 3)).astype(np.int32)
+                _values = _bytes[:, 0] | (_bytes[:, 1] << 8) | (_bytes[:, 2] << 16)
+                _samples = (np.where(_values >= 2**23, _values - 2**24, _values)).astype(np.float32) / 2**23
+            elif _width == 4:
+                _samples = np.frombuffer(_data, dtype="<i4").astype(np.float32) / 2**31
+            else:
+                raise AudioException(f"Unsupported WAV sample width: {_width} bytes")
+            self.samples: np.ndarray = _samples.reshape((-1, _channels)).mean(axis=1, dtype=np.float32)
+            self.samples.flags.writeable = False
+            self.chunkSize: int = int(chunkSize)
+            self.loop: bool = loop
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise AudioException from ex
+
+    @property
+    def duration(
+        self,
+    ) -> float:
+        """The length of the file.
+
+        Returns:
+            the length in seconds
+        """
+        return len(self.samples) / self.sampleRate
+
+    def __iter__(
+        self,
+    ) -> Iterator[np.ndarray]:
+        """Yield the file in chunks (the last one may be short).
+
+        Returns:
+            read only views of the samples
+        """
+        while True:
+            for _start in range(0, len(self.samples), self.chunkSize):
+                yield self.samples[_start : _start + self.chunkSize]
+            if not self.loop or len(self.samples) == 0:
+                return
+
+
+class MicrophoneSource:
+    """Reads 16 bit mono chunks from an input device through pyaudio."""
+
+    def __init__(
+        self,
+        sampleRate: int = DEFAULT_SAMPLE_RATE,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        deviceIndex: Optional[int] = None,
+    ) -> None:
+        """Open an input device.
+
+        Args:
+            sampleRate: samples per second
+            chunkSize: the number of samples per chunk
+            deviceIndex: the pyaudio device, the default input if not given
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if pyaudio is not installed or the device cannot be opened
+        """
+        try:
+            try:
+                import pyaudio
+            except ImportError as ex:
+                raise AudioException("Microphone input needs pyaudio (pip install lightberries[examples])") from ex
+            self.sampleRate: int = sampleRate
+            self.chunkSize: int = chunkSize
+            self.privateAudio = pyaudio.PyAudio()
+            self.privateStream = self.privateAudio.open(
+                format=pyaudio.paInt16,
+                rate=sampleRate,
+                channels=1,
+                input=True,
+                input_device_index=deviceIndex,
+                frames_per_buffer=chunkSize,
+            )
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise AudioException from ex
+
+    def __iter__(
+        self,
+    ) -> Iterator[np.ndarray]:  # pragma: no cover
+        """Yield chunks as they are recorded.
+
+        Returns:
+            the samples scaled to -1.0 to 1.0
+        """
+        while self.privateStream is not None:
+            _data = self.privateStream.read(self.chunkSize, exception_on_overflow=False)
+            yield np.frombuffer(_data, dtype=np.int16).astype(np.float32) / 2**15
+
+    def close(
+        self,
+    ) -> None:  # pragma: no cover
+        """Close the input device."""
+        if self.privateStream is not None:
+            self.privateStream.stop_stream()
+            self.privateStream.close()
+            self.privateStream = None
+            self.privateAudio.terminate()
+
+
+class AudioAnalyzer:
+    """Turns chunks of samples into band levels, loudness, and onset and beat flags."""
+
+    def __init__(
+        self,
+        sampleRate: int = DEFAULT_SAMPLE_RATE,
+        frameSize: int = DEFAULT_FRAME_SIZE,
+        bandCount: int = DEFAULT_BAND_COUNT,
+        minFrequency: float = DEFAULT_MIN_FREQUENCY,
+        maxFrequency: float = DEFAULT_MAX_FREQUENCY,
+        window: str = "hann",
+        dynamicRange: float = DEFAULT_DYNAMIC_RANGE,
+    ) -> None:
+        """Create an analyzer.
+
+        Args:
+            sampleRate: samples per second
+            frameSize: the number of samples per FFT
+            bandCount: the number of log-spaced bands
+            minFrequency: the bottom edge of the first band
+            maxFrequency: the top edge of the last band
+            window: the analysis window name
+            dynamicRange: the decibels below the recent peak that band levels are scaled over
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            self.sampleRate: int = int(sampleRate)
+            self.frameSize: int = int(frameSize)
+            self.bandCount: int = int(bandCount)
+            self.dynamicRange: float = float(dynamicRange)
+            self.ring: AudioRingBuffer = AudioRingBuffer(self.frameSize)
+            self.features: np.ndarray = np.zeros(FEATURE_BANDS + self.bandCount, dtype=np.float64)
+            self.privateWindow: np.ndarray = analysisWindow(window, self.frameSize)
+            self.privateFrame: np.ndarray = np.zeros(self.frameSize, dtype=np.float32)
+            self.privateBandStarts, self.privateBandWidths = bandBinMap(
+                self.sampleRate, self.frameSize, self.bandCount, float(minFrequency), float(maxFrequency)
+            )
+            self.privateBandEnd: int = int(self.privateBandStarts[-1] + self.privateBandWidths[-1])
+            _bandFrequencies = self.privateBandStarts * self.sampleRate / self.frameSize
+            self.privateBassBands: int = max(1, int(np.count_nonzero(_bandFrequencies <= BEAT_MAX_FREQUENCY)))
+            self.privateLogBands: np.ndarray = np.zeros(self.bandCount, dtype=np.float64)
+            self.privatePreviousLogBands: np.ndarray = np.zeros(self.bandCount, dtype=np.float64)
+            self.privatePeak: float = -np.inf
+            self.privateFluxMean: float = 0.0
+            self.privateFluxVariance: float = 0.0
+            self.privateBassMean: float = 0.0
+            self.privateBassVariance: float = 0.0
+            self.privateStatisticsCount: int = 1
+            # detection waits for a full frame and some history to compare against
+            self.privateDetectFrom: float = self.frameSize / self.sampleRate + DETECTION_HISTORY / 4
+            self.privateLastOnset: float = -np.inf
+            self.privateLastBeat: float = -np.inf
+            self.privateStarted: bool = False
+            self.privateSequence: int = 0
+            self.privateStop: threading.Event = threading.Event()
+            self.privateThread: Optional[threading.Thread] = None
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise AudioException from ex
+
+    @property
+    def bands(
+        self,
+    ) -> np.ndarray:
+        """The latest band levels, 0.0 (at the bottom of the dynamic range) to 1.0 (at the peak).
+
+        Returns:
+            a view into the feature vector
+        """
+        return self.features[FEATURE_BANDS:]
+
+    @property
+    def featureCount(
+        self,
+    ) -> int:
+        """The length of the feature vector.
+
+        Returns:
+            the number of features
+        """
+        return len(self.features)
+
+    @property
+    def bandFrequencies(
+        self,
+    ) -> np.ndarray:
+        """The lower edge of each band.
+
+        Returns:
+            the frequencies in Hz
+        """
+        return self.privateBandStarts * self.sampleRate / self.frameSize
+
+    def process(
+        self,
+        samples: np.ndarray,
+    ) -> np.ndarray:
+        """Add a chunk of samples and analyze the newest frame.
+
+        Args:
+            samples: mono samples between -1.0 and 1.0, oldest first
+
+        Returns:
+            the updated feature vector (reused from call to call)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            _samples = np.asarray(samples, dtype=np.float32)
+            self.ring.write(_samples)
+            _now = self.ring.written / self.sampleRate
+            _elapsed = len(_samples) / self.sampleRate
+            _frame = self.ring.latest(self.frameSize, out=self.privateFrame)
+            np.multiply(_frame, self.privateWindow, out=_frame)
+            _spectrum = np.fft.rfft(_frame)
+            _power = np.square(_spectrum.real) + np.square(_spectrum.imag)
+            _bandPower = np.add.reduceat(_power[: self.privateBandEnd], self.privateBandStarts)
+            _bandPower /= self.privateBandWidths
+            self.privatePreviousLogBands, self.privateLogBands = self.privateLogBands, self.privatePreviousLogBands
+            np.log10(_bandPower + 1e-12, out=self.privateLogBands)
+            self.privateLogBands *= 10
+            # spectral flux: how much the bands got louder since the last frame
+            _flux = float(np.maximum(self.privateLogBands - self.privatePreviousLogBands, 0).mean())
+            _bass = float(_bandPower[: self.privateBassBands].mean())
+            self.privatePeak = max(float(self.privateLogBands.max()), self.privatePeak - PEAK_DECAY * _elapsed)
+            _level = float(np.sqrt(np.mean(np.square(_samples)))) if len(_samples) else 0.0
+            _onset = False
+            _beat = False
+            if self.privateStarted:
+                if _now >= self.privateDetectFrom and _level >= SILENCE_LEVEL:
+                    _fluxLimit = self.privateFluxMean + ONSET_THRESHOLD * np.sqrt(self.privateFluxVariance)
+                    if _flux > _fluxLimit and _now - self.privateLastOnset >= MIN_ONSET_INTERVAL:
+                        _onset = True
+                        self.privateLastOnset = _now
+                    _bassLimit = max(
+                        BEAT_THRESHOLD * self.privateBassMean,
+                        self.privateBassMean + ONSET_THRESHOLD * np.sqrt(self.privateBassVariance),
+                    )
+                    if _bass > _bassLimit and _now - self.privateLastBeat >= MIN_BEAT_INTERVAL:
+                        _beat = True
+                        self.privateLastBeat = _now
+                # exponential moving statistics over about DETECTION_HISTORY seconds, plain
+                # averages until there are enough frames for that, so early thresholds are sound
+                self.privateStatisticsCount += 1
+                _rate = max(1.0 - np.exp(-_elapsed / DETECTION_HISTORY), 1.0 / self.privateStatisticsCount)
+                self.privateFluxMean, self.privateFluxVariance = _movingStatistics(
+                    _flux, self.privateFluxMean, self.privateFluxVariance, _rate
+                )
+                self.privateBassMean, self.privateBassVariance = _movingStatistics(
+                    _bass, self.privateBassMean, self.privateBassVariance, _rate
+                )
+            elif self.ring.written >= self.frameSize:
+                self.privateFluxMean = _flux
+                self.privateBassMean = _bass
+                self.privateStarted = True
+            self.features[FEATURE_TIME] = _now
+            self.features[FEATURE_LEVEL] = _level
+            self.features[FEATURE_FLUX] = _flux
+            self.features[FEATURE_ONSET] = _onset
+            self.features[FEATURE_BEAT] = _beat
+            self.features[FEATURE_ONSET_COUNT] += _onset
+            self.features[FEATURE_BEAT_COUNT] += _beat
+            _floor = self.privatePeak - self.dynamicRange
+            np.clip((self.privateLogBands - _floor) / self.dynamicRange, 0.0, 1.0, out=self.bands)
+            self.privateSequence += 1
+            return self.features
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise AudioException from ex
+
+    def read(
+        self,
+        out: np.ndarray,
+    ) -> int:
+        """Copy the latest feature vector, like SharedFeatures.read, for effects in the analyzing process.
+
+        Args:
+            out: where to copy the features
+
+        Returns:
+            the number of chunks processed so far
+        """
+        out[:] = self.features
+        return self.privateSequence
+
+    def run(
+        self,
+        source: Iterable[np.ndarray],
+        shared: Optional[SharedFeatures] = None,
+        realtime: bool = False,
+    ) -> None:
+        """Analyze every chunk from a source until it ends or stop() is called.
+
+        Args:
+            source: chunks of mono samples, e.g. a WavSource or MicrophoneSource
+            shared: where to publish the features after each chunk
+            realtime: pace the source to the sample rate, for sources that are faster than real time
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            AudioException: if something bad happens
+        """
+        try:
+            self.privateStop.clear()
+            _start = time.perf_counter()
+            _startTime = self.ring.written / self.sampleRate
+            for _chunk in source:
+                if self.privateStop.is_set():
+                    break
+                _features = self.process(_chunk)
+                if shared is not None:
+                    shared.publish(_features)
+                if realtime:
+                    _ahead = (_features[FEATURE_TIME] - _startTime) - (time.perf_counter() - _start)
+                    if _ahead > 0:
+                        time.sleep(_ahead)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise AudioException from ex
+
+    def start(
+        self,
+        source: Iterable[np.ndarray],
+        shared: SharedFeatures,
+        realtime: bool = True,
+    ) -> threading.Thread:
+        """Run the analyzer on a background thread.
+
+        Args:
+            source: chunks of mono samples
+            shared: where to publish the features
+            realtime: pace the source to the sample rate
+
+        Returns:
+            the analysis thread
+        """
+        self.privateThread = threading.Thread(
+            target=self.run, args=(source, shared, realtime), name="lightberries-audio", daemon=True
+        )
+        self.privateThread.start()
+        return self.privateThread
+
+    def stop(
+        self,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Stop a background analysis thread.
+
+        Args:
+            timeout: seconds to wait for the thread to finish
+        """
+        self.privateStop.set()
+        if self.privateThread is not None:
+            self.privateThread.join(timeout)
+            self.privateThread = None
+
+
+def openFeatures(
+    features: Union[str, SharedFeatures, AudioAnalyzer, None] = None,
+) -> Union[SharedFeatures, AudioAnalyzer]:
+    """Find the feature vector an effect should read.
+
+    Args:
+        features: an analyzer or shared feature vector (used as is), the name of a
+            shared feature vector to attach to, or None for DEFAULT_SHARED_NAME
+
+    Returns:
+        something with a non-blocking read(out) method
+
+    Raises:
+        AudioException: if there is no shared feature vector with that name
+    """
+    if features is None:
+        features = DEFAULT_SHARED_NAME
+    if isinstance(features, str):
+        return SharedFeatures.attach(features)
+    return features
@@ -0,0 +1,456 @@
+"""A small asyncio control server for changing a running controller from another process.
+
+The server only speaks enough HTTP/1.1 and WebSocket (RFC 6455) to be driven by curl,
+a browser, or a few lines of script, and it binds to the loopback interface (or a UNIX
+socket) by default. Run it in the same event loop as ArrayController.runAsync so that
+every change is applied between two frames.
+
+    GET  /catalogue  the useColor*/useFunction*/useOverlay* methods and their parameters
+    GET  /settings   secondsPerMode, brightness, and colorSequence
+    POST /settings   change any of the above, e.g. {"brightness": 0.5}
+    POST /mode       reset, then call methods from the catalogue in order, e.g.
+                     [{"name": "useColorRainbow"}, {"name": "useFunctionCylon", "arguments": {"fadeAmount": 0.2}}]
+    GET  /frames     WebSocket stream of the displayed LEDs as raw RGB bytes (3 bytes per LED)
+    GET  /metrics    the controller metrics in Prometheus text format
+"""
+from __future__ import annotations
+import asyncio
+import base64
+import hashlib
+import inspect
+import json
+import logging
+import struct
+from typing import Any, Callable, Optional, TYPE_CHECKING
+import numpy as np
+from lightberries.array_patterns import PIXEL_BUFFER_DTYPE, QuantizePixelArray
+from lightberries.exceptions import ControlServerException, LightBerryException
+from lightberries.metrics import PROMETHEUS_CONTENT_TYPE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.array_controller import ArrayController
+
+LOGGER = logging.getLogger("lightBerries")
+DEFAULT_CONTROL_HOST = "127.0.0.1"
+DEFAULT_CONTROL_PORT = 8281
+CATALOGUE_PREFIXES = ("useColor", "useFunction", "useOverlay")
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class ControlServer:
+    """Serves the control API for one controller."""
+
+    def __init__(
+        self,
+        controller: ArrayController,
+        host: str = DEFAULT_CONTROL_HOST,
+        port: int = DEFAULT_CONTROL_PORT,
+        unixSocketPath: Optional[str] = None,
+        previewFramesPerSecond: float = 10.0,
+    ) -> None:
+        """Create a control server (call start to begin serving).
+
+        Args:
+            controller: the controller to control
+            host: the address to bind, loopback by default
+            port: the TCP port to bind, 0 picks a free port
+            unixSocketPath: bind this UNIX socket instead of a TCP port
+            previewFramesPerSecond: the maximum rate of the /frames stream
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            ControlServerException: if something bad happens
+        """
+        try:
+            self.controller: ArrayController = controller
+            self.host: str = host
+            self.port: int = int(port)
+            self.unixSocketPath: Optional[str] = unixSocketPath
+            self.previewFramesPerSecond: float = float(previewFramesPerSecond)
+            self.privateServer: Optional[asyncio.AbstractServer] = None
+            self.privateRoutes: dict[tuple[str, str], Callable[[Any], Any]] = {
+                ("GET", "/catalogue"): self._getCatalogue,
+                ("GET", "/settings"): self._getSettings,
+                ("POST", "/settings"): self._postSettings,
+                ("POST", "/mode"): self._postMode,
+                ("GET", "/metrics"): self._getMetrics,
+            }
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControlServerException from ex
+
+    @property
+    def address(
+        self,
+    ) -> Any:
+        """The address the server is listening on.
+
+        Returns:
+            the (host, port) tuple, or the UNIX socket path
+        """
+        if self.privateServer is None or not self.privateServer.sockets:
+            return None
+        return self.privateServer.sockets[0].getsockname()
+
+    async def start(
+        self,
+    ) -> None:
+        """Start listening for connections.
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            ControlServerException: if something bad happens
+        """
+        try:
+            if self.unixSocketPath is not None:
+                self.privateServer = await asyncio.start_unix_server(self._handleConnection, path=self.unixSocketPath)
+            else:
+                self.privateServer = await asyncio.start_server(self._handleConnection, self.host, self.port)
+            LOGGER.info("%s listening on %s", self.__class__.__name__, self.address)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControlServerException from ex
+
+    async def stop(
+        self,
+    ) -> None:
+        """Stop listening and close the server."""
+        if self.privateServer is not None:
+            self.privateServer.close()
+            await self.privateServer.wait_closed()
+            self.privateServer = None
+
+    async def __aenter__(
+        self,
+    ) -> ControlServer:
+        """Start the server.
+
+        Returns:
+            this server
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        *args,
+    ) -> None:
+        """Stop the server.
+
+        Args:
+            args: ignored
+        """
+        await self.stop()
+
+    def catalogue(
+        self,
+    ) -> dict[str, dict[str, dict[str, Any]]]:
+        """Describe every color pattern, function, and overlay the controller offers.
+
+        Returns:
+            method names grouped by prefix, each mapped to its parameters and their defaults
+        """
+        _catalogue: dict[str, dict[str, dict[str, Any]]] = {prefix: {} for prefix in CATALOGUE_PREFIXES}
+        for name, method in inspect.getmembers(self.controller, inspect.ismethod):
+            for prefix in CATALOGUE_PREFIXES:
+                if name.startswith(prefix):
+                    _catalogue[prefix][name] = {
+                        parameter.name: _toJson(parameter.default)
+                        if parameter.default is not inspect.Parameter.empty
+                        else None
+                        for parameter in inspect.signature(method).parameters.values()
+                    }
+        return _catalogue
+
+    def settings(
+        self,
+    ) -> dict[str, Any]:
+        """Report the settings that can be changed through the server.
+
+        Returns:
+            the current settings
+        """
+        return {
+            "secondsPerMode": self.controller.secondsPerMode,
+            "brightness": self.controller.brightness,
+            "colorSequence": _toJson(self.controller.colorSequence),
+        }
+
+    async def applySettings(
+        self,
+        settings: dict[str, Any],
+    ) -> None:
+        """Change controller settings between two frames.
+
+        Args:
+            settings: any of secondsPerMode, brightness, and colorSequence
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            ControlServerException: if something bad happens
+        """
+        try:
+            _unknown = set(settings) - {"secondsPerMode", "brightness", "colorSequence"}
+            if _unknown:
+                raise ControlServerException(f"Unknown settings: {sorted(_unknown)}")
+
+            def _apply():
+                if "secondsPerMode" in settings:
+                    self.controller.secondsPerMode = float(settings["secondsPerMode"])
+                if "brightness" in settings:
+                    self.controller.brightness = float(settings["brightness"])
+                if "colorSequence" in settings:
+                    self.controller.colorSequence = np.array(settings["colorSequence"], dtype=PIXEL_BUFFER_DTYPE)
+
+            await self.controller.applyBetweenFrames(_apply)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise ControlServerException from ex
+
+    async def applyMode(
+        self,
+        calls: list[dict[str, Any]],
+    ) -> None:
+        """Reset the controller and call catalogue methods between two frames.
+
+        Args:
+            calls: a list of {"name": method name, "arguments": {keyword: value}}
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            ControlServerException: if something bad happens
+        """
+        try:
+            if isinstance(calls, dict):
+                calls = [calls]
+            _methods = []
+            for call in calls:
+                _name = call.get("name", "")
+                if not _name.startswith(CATALOGUE_PREFIXES) or not hasattr(self.controller, _name):
+                    raise ControlServerException(f"{_name} is not in the catalogue")
+                _method, _arguments = getattr(self.controller, _name), call.get("arguments", {})
+                # check the arguments now, the controller is reset before the methods are called
+                try:
+                    inspect.signature(_method).bind(**_arguments)
+                except TypeError as ex:
+                    raise ControlServerException(f"Bad arguments for {_name}: {ex}") from ex
+                _methods.append((_method, _arguments))
+
+            def _configure():
+                for method, arguments in _methods:
+                    method(**arguments)
+
+            await self.controller.switchMode(_configure)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise ControlServerException from ex
+
+    async def _getCatalogue(
+        self,
+        _: Any,
+    ) -> Any:
+        return self.catalogue()
+
+    async def _getSettings(
+        self,
+        _: Any,
+    ) -> Any:
+        return self.settings()
+
+    async def _postSettings(
+        self,
+        body: Any,
+    ) -> Any:
+        await self.applySettings(body)
+        return self.settings()
+
+    async def _getMetrics(
+        self,
+        _: Any,
+    ) -> Any:
+        return self.controller.metrics.expose()
+
+    async def _postMode(
+        self,
+        body: Any,
+    ) -> Any:
+        await self.applyMode(body)
+        return {"functions": [function.runFunction.__name__ for function in self.controller.functionList]}
+
+    async def _handleConnection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer one HTTP request, or stream frames if the request is a WebSocket upgrade.
+
+        Args:
+            reader: the connection input
+            writer: the connection output
+        """
+        try:
+            _requestLine = (await reader.readline()).decode("latin-1").split()
+            if len(_requestLine) < 2:
+                return
+            _method, _path = _requestLine[0].upper(), _requestLine[1].split("?")[0]
+            _headers: dict[str, str] = {}
+            while True:
+                _line = (await reader.readline()).decode("latin-1").strip()
+                if not _line:
+                    break
+                _key, _, _value = _line.partition(":")
+                _headers[_key.strip().lower()] = _value.strip()
+            _body = await reader.readexactly(int(_headers.get("content-length", 0)))
+
+            if _path == "/frames" and _headers.get("upgrade", "").lower() == "websocket":
+                await self._streamFrames(reader, writer, _headers)
+                return
+
+            _route = self.privateRoutes.get((_method, _path))
+            if _route is None:
+                _status = 405 if any(path == _path for _, path in self.privateRoutes) else 404
+                _response: Any = {"error": HTTP_REASONS[_status]}
+            else:
+                try:
+                    _response = await _route(json.loads(_body) if _body else {})
+                    _status = 200
+                except (ValueError, LightBerryException) as ex:
+                    _status = 400
+                    _response = {"error": str(ex.__cause__ or ex)}
+            if isinstance(_response, str):
+                _payload, _contentType = _response.encode(), PROMETHEUS_CONTENT_TYPE
+            else:
+                _payload, _contentType = json.dumps(_response).encode(), "application/json"
+            writer.write(
+                (
+                    f"HTTP/1.1 {_status} {HTTP_REASONS[_status]}\r\n"
+                    f"Content-Type: {_contentType}\r\n"
+                    f"Content-Length: {len(_payload)}\r\n"
+                    "Connection: close\r\n\r\n"
+                ).encode()
+                + _payload
+            )
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as ex:  # pragma: no cover
+            LOGGER.exception("%s: %s", self.__class__.__name__, ex)
+        finally:
+            writer.close()
+
+    async def _streamFrames(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        headers: dict[str, str],
+    ) -> None:
+        """Send the displayed LED values over a WebSocket until the client goes away.
+
+        Frames are sampled from the controller at most previewFramesPerSecond times a
+        second, so a slow client only ever slows down its own stream.
+
+        Args:
+            reader: the connection input
+            writer: the connection output
+            headers: the upgrade request headers
+        """
+        _accept = base64.b64encode(
+            hashlib.sha1((headers.get("sec-websocket-key", "") + WEBSOCKET_GUID).encode()).digest()
+        ).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\n"
+                "Upgrade: websocket\r\n"
+                "Connection: Upgrade\r\n"
+                f"Sec-WebSocket-Accept: {_accept}\r\n\r\n"
+            ).encode()
+        )
+        await writer.drain()
+        # anything the client sends (including a close frame) ends the stream
+        _closed = asyncio.ensure_future(reader.read(1))
+        _period = 1.0 / self.previewFramesPerSecond
+        try:
+            while not _closed.done():
+                _frame = QuantizePixelArray(self.controller.layers.output).tobytes()
+                writer.write(_websocketHeader(0x2, len(_frame)) + _frame)
+                await writer.drain()
+                await asyncio.wait([_closed], timeout=_period)
+            writer.write(_websocketHeader(0x8, 0))
+            await writer.drain()
+        finally:
+            _closed.cancel()
+
+
+def _websocketHeader(
+    opcode: int,
+    length: int,
+) -> bytes:
+    """Build an unmasked, unfragmented WebSocket frame header.
+
+    Args:
+        opcode: the frame type (0x2 binary, 0x8 close)
+        length: the payload length
+
+    Returns:
+        the header bytes
+    """
+    if length < 126:
+        return struct.pack("!BB", 0x80 | opcode, length)
+    if length < 1 << 16:
+        return struct.pack("!BBH", 0x80 | opcode, 126, length)
+    return struct.pack("!BBQ", 0x80 | opcode, 127, length)
+
+
+def _toJson(
+    value: Any,
+) -> Any:
+    """Convert numpy values (and anything else json can't handle) to something it can.
+
+    Args:
+        value: the value to convert
+
+    Returns:
+        a json friendly value
+    """
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is None or isinstance(value, (bool, int, float, str, list, dict)):
+        return value
+    return str(value)
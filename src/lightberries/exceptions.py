@@ -25,3 +25,39 @@ class PatternException(LightBerryException):
 
 class PixelException(LightBerryException):
     """Exception for LightPixel to raise."""
+
+
+class LayerException(LightBerryException):
+    """Exception for LightLayers to raise."""
+
+
+class RandomException(LightBerryException):
+    """Exception for LightRandom to raise."""
+
+
+class ControlServerException(LightBerryException):
+    """Exception for ControlServer to raise."""
+
+
+class MetricsException(LightBerryException):
+    """Exception for Metrics to raise."""
+
+
+class ProfilerException(LightBerryException):
+    """Exception for ArrayProfiler to raise."""
+
+
+class MatrixFontException(LightBerryException):
+    """Exception for FontAtlas to raise."""
+
+
+class AudioException(LightBerryException):
+    """Exception for AudioAnalyzer to raise."""
+
+
+class MatrixVideoException(LightBerryException):
+    """Exception for matrix video decoding and resampling to raise."""
+
+
+class SimulatorException(LightBerryException):
+    """Exception for SimulatedPixelStrip and its outputs to raise."""
@@ -1,6 +1,5 @@
 from __future__ import annotations
-import random
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Optional, Union
 
 from numpy.typing import NDArray
 import numpy as np
@@ -8,18 +7,23 @@ from lightberries.array_controller import ArrayController
 import logging
 from lightberries.array_functions import ArrayFunction
 from lightberries.exceptions import LightBerryException, ControllerException
+from lightberries.matrix_font import FontAtlas, TextScroller, defaultFont, loadFont
 from lightberries.matrix_functions import MatrixFunction
+from lightberries.matrix_stencils import circleStencil, joinStencils, pointsStencil
 from lightberries.matrix_patterns import (
     SolidColorMatrix,
     MatrixOrder,
     DEFAULT_MATRIX_ORDER,
     Spectrum2,
-    TextMatrix,
 )
-from lightberries.array_patterns import ArrayPattern
+from lightberries.array_patterns import ArrayPattern, PIXEL_BUFFER_DTYPE
 from lightberries.pixel import PixelColors
 from lightberries.ws281x_strings import WS281xString
 
+# video decoding is only imported when it is used, to keep startup fast
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.matrix_video import Frame
+
 LOGGER = logging.getLogger("lightBerries")
 
 
@@ -43,6 +47,7 @@ class MatrixController(ArrayController):
         matrixShape: tuple[int, int] = None,
         matrixLayout: NDArray[np.int32] | None = None,
         testing: bool = False,
+        seed: Optional[int] = None,
     ) -> None:
         self.testing = testing
         if not ledXaxisRange:
@@ -76,6 +81,7 @@ class MatrixController(ArrayController):
             refreshCallback=refreshCallback,
             simulate=simulate,
             testing=testing,
+            seed=seed,
         )
         self.realLEDYaxisRange = ledXaxisRange
         self.realLEDXaxisRange = ledYaxisRange
@@ -158,7 +164,7 @@ class MatrixController(ArrayController):
             self.virtualLEDXaxisRange = matrix.shape[0]
             self.virtualLEDYaxisRange = matrix.shape[1]
 
-            self.virtualLEDBuffer = matrix
+            self.virtualLEDBuffer = np.ascontiguousarray(matrix, dtype=PIXEL_BUFFER_DTYPE)
         except KeyboardInterrupt:
             raise
         except SystemExit:
@@ -169,6 +175,7 @@ class MatrixController(ArrayController):
             raise ControllerException from ex
 
     def setvirtualLEDBuffer(self, ledMatrix: np.ndarray[(3, Any, Any), np.int32]) -> None:
+        ledMatrix = np.ascontiguousarray(ledMatrix, dtype=PIXEL_BUFFER_DTYPE)
         self.virtualLEDXaxisRange = ledMatrix.shape[0]
         self.virtualLEDYaxisRange = ledMatrix.shape[1]
         self.virtualLEDBuffer = ledMatrix
@@ -221,6 +228,23 @@ class MatrixController(ArrayController):
                     r = matrix_row * self.matrixShape[1]
                     c = matrix_column * self.matrixShape[0]
                     self.virtualLEDIndexBuffer[c : c + self.matrixShape[1], r : r + self.matrixShape[0]] = temp
+        self._layoutSimulator()
+
+    def _layoutSimulator(
+        self,
+    ) -> None:
+        """Draw the simulated LEDs (if any) in the same places as the virtual LED matrix."""
+        _simulator = self.simulator
+        if _simulator is None or self.virtualLEDIndexBuffer.ndim != 2:
+            return
+        if DEFAULT_MATRIX_ORDER is MatrixOrder.TraverseColumnThenRow.value:
+            # each matrix cell holds the index of the LED it is shown on
+            _simulator.setLayout(self.virtualLEDIndexBuffer)
+        else:
+            # each LED holds the index of the matrix cell it shows
+            _layout = np.full(self.virtualLEDIndexBuffer.size, -1, dtype=np.intp)
+            _layout[self.virtualLEDIndexBuffer.reshape(-1)] = np.arange(self.virtualLEDIndexBuffer.size)
+            _simulator.setLayout(_layout.reshape(self.virtualLEDIndexBuffer.shape))
 
     def reset(
         self,
@@ -234,6 +258,10 @@ class MatrixController(ArrayController):
         """
         try:
             self.privateLightFunctions = []
+            self._closeAttachedFeatures()
+            # switchMode resets between frames of runAsync, which still needs its worker thread
+            if self.privateRunningAsync is not True:
+                self._shutdownShowExecutor()
             if self.virtualLEDCount > self.realLEDCount:
                 self.setvirtualLEDBuffer(self.virtualLEDBuffer[: self.realLEDXaxisRange, : self.realLEDYaxisRange])
             elif self.virtualLEDCount < self.realLEDCount:
@@ -256,10 +284,13 @@ class MatrixController(ArrayController):
         except Exception as ex:
             raise ControllerException from ex
 
-    def copyVirtualLedsToWS281X(
+    def compositeFrame(
         self,
-    ) -> None:
-        """Sets each Pixel in the rpi_ws281x object to the buffered array value.
+    ) -> np.ndarray[(3, Any), np.float32]:
+        """Map the virtual LED matrix onto the base layer and flatten the layer stack on top of it.
+
+        Returns:
+            the composited frame in LED string order (before quantization)
 
         Raises:
             SystemExit: if exiting
@@ -267,51 +298,133 @@ class MatrixController(ArrayController):
             LightControlException: if something bad happens
         """
         try:
-            # callback function to do work
-
-            def SetPixel(i_rgb):
-                i = i_rgb[0]
-                rgb = i_rgb[1]
-                if i < self.realLEDCount:
-                    self.ws281xString[i] = rgb
-
-            # fast method of calling the callback method on each index of LED array
+            # map the matrix onto the base layer
+            _base = self.layers.base
+            _visible = self.virtualLEDIndexBuffer < self.realLEDCount
             if len(self.virtualLEDBuffer.shape) > 2:
                 if DEFAULT_MATRIX_ORDER is MatrixOrder.TraverseColumnThenRow.value:
-                    list(
-                        map(
-                            SetPixel,
-                            zip(
-                                self.virtualLEDIndexBuffer[np.where(self.virtualLEDIndexBuffer < self.realLEDCount)],
-                                self.virtualLEDBuffer[np.where(self.virtualLEDIndexBuffer < self.realLEDCount)],
-                            ),
-                        )
-                    )
+                    # LEDs that no visible cell maps to are off, not left over from an earlier frame
+                    _base[:] = 0
+                    _base[self.virtualLEDIndexBuffer[_visible]] = self.virtualLEDBuffer[_visible]
                 else:
-                    list(
-                        map(
-                            SetPixel,
-                            enumerate(
-                                self.virtualLEDBuffer.reshape(
-                                    (
-                                        self.virtualLEDXaxisRange * self.virtualLEDYaxisRange,
-                                        3,
-                                    )
-                                )[self.virtualLEDIndexBuffer][np.where(self.virtualLEDIndexBuffer < self.realLEDCount)]
-                            ),
+                    _flatBuffer = self.virtualLEDBuffer.reshape(
+                        (
+                            self.virtualLEDXaxisRange * self.virtualLEDYaxisRange,
+                            3,
                         )
                     )
+                    _visibleLEDs = _flatBuffer[self.virtualLEDIndexBuffer][_visible]
+                    _base[: len(_visibleLEDs)] = _visibleLEDs
+                    _base[len(_visibleLEDs) :] = 0
             else:
-                list(
-                    map(
-                        SetPixel,
-                        enumerate(
-                            self.virtualLEDBuffer[self.virtualLEDIndexBuffer][
-                                np.where(self.virtualLEDIndexBuffer < self.realLEDCount)
-                            ]
-                        ),
-                    )
-                )
+                _visibleLEDs = self.virtualLEDBuffer[self.virtualLEDIndexBuffer][_visible]
+                _base[: len(_visibleLEDs)] = _visibleLEDs
+                _base[len(_visibleLEDs) :] = 0
+            return self.layers.composite()
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
+    def playVideo(
+        self,
+        source: Union[str, BinaryIO, Iterable[str], Iterable[Frame]],
+        method: str = "area",
+        quarterTurns: int = 0,
+        framesPerSecond: Optional[float] = None,
+        prefetch: int = 4,
+        loop: bool = False,
+        aspect: str = "stretch",
+    ) -> None:
+        """Play a video, animation, or image sequence on the matrix until it ends or running is set false.
+
+        Frames are decoded and resampled to the virtual LED buffer on a background thread,
+        and late frames are dropped to keep up (see droppedFrameCount).
+
+        Args:
+            source: a file or directory name, "-" or a binary stream of YUV4MPEG2, a list of
+                image files, or a decoder (see matrix_video.openVideo)
+            method: the resampling method, "area", "bilinear", or "nearest"
+            quarterTurns: counterclockwise quarter turns applied to every frame
+            framesPerSecond: the most frames to show per second, None for the video's own rate
+            prefetch: the most frames decoded ahead of the display
+            loop: set true to start the video over when it ends
+            aspect: "stretch" to fill the matrix, "fit" to pad, or "fill" to crop to the matrix's aspect ratio
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            from lightberries.matrix_video import VideoPipeline, openVideo
+
+            LOGGER.debug("%s.%s:", self.__class__.__name__, self.playVideo.__name__)
+            _decoder = source
+            if isinstance(source, str) or hasattr(source, "read"):
+                _decoder = openVideo(source)
+            elif isinstance(source, (list, tuple)) and all(isinstance(path, str) for path in source):
+                _decoder = openVideo(source)
+            _pipeline = VideoPipeline(
+                _decoder,
+                self.virtualLEDBuffer.shape[:2],
+                method=method,
+                quarterTurns=quarterTurns,
+                framesPerSecond=framesPerSecond,
+                prefetch=prefetch,
+                aspect=aspect,
+                loop=loop,
+                clock=self.clock,
+            )
+            try:
+                self.play(_pipeline)
+            finally:
+                self.privateDroppedFrameCount = _pipeline.droppedFrameCount
+                self.privateMetrics.droppedFramesTotal.inc(_pipeline.droppedFrameCount)
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
+    def showImage(
+        self,
+        image: Union[str, NDArray[np.uint8]],
+        method: str = "area",
+        aspect: str = "fit",
+        quarterTurns: int = 0,
+    ) -> None:
+        """Resample an image of any size onto the matrix and show it.
+
+        Args:
+            image: an image file name (see matrix_video.loadImage) or a grayscale, RGB, or RGBA array
+            method: the resampling method, "area", "bilinear", or "nearest"
+            aspect: "fit" to pad, "fill" to crop, or "stretch" to ignore the image's aspect ratio
+            quarterTurns: counterclockwise quarter turns applied to the image
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightControlException: if something bad happens
+        """
+        try:
+            from lightberries.matrix_resample import resampleMap
+            from lightberries.matrix_video import loadImage
+
+            LOGGER.debug("%s.%s:", self.__class__.__name__, self.showImage.__name__)
+            _image = loadImage(image) if isinstance(image, str) else np.asarray(image)
+            _map = resampleMap(_image.shape[:2], self.virtualLEDBuffer.shape[:2], method, quarterTurns, aspect=aspect)
+            _map.apply(_image, out=self.virtualLEDBuffer)
+            self._showFrame()
         except SystemExit:
             raise
         except KeyboardInterrupt:
@@ -337,7 +450,7 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixColorFlux.__name__)
         try:
-            _delayCount: int = random.randint(0, 5)
+            _delayCount: int = self.randomSource.randint(0, 5)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             # create the tracking object
@@ -376,7 +489,7 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixMarquee.__name__)
         try:
-            _delayCount: int = random.randint(0, 5)
+            _delayCount: int = self.randomSource.randint(0, 5)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             # create the tracking object
@@ -400,12 +513,15 @@ class MatrixController(ArrayController):
     def useFunctionMatrixMarqueeText(
         self,
         delayCount: int = None,
-        text: str = None,
+        text: str | Iterable[str] = None,
+        font: FontAtlas | str = None,
     ) -> None:
-        """
+        """Scroll text across the matrix.
 
         Args:
             delayCount: number of led updates between color updates
+            text: text to repeat, or an iterable of messages (e.g. a feed) to show once each as they are reached
+            font: a font atlas, or a font file to load (see loadFont), defaults to BigLetters
 
         Raises:
             SystemExit: if exiting
@@ -414,29 +530,42 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixMarquee.__name__)
         try:
-            _delayCount: int = random.randint(0, 5)
+            _delayCount: int = self.randomSource.randint(0, 5)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             options = ["hello world", "hi guys", "lol             "]
+            _messages: Optional[Iterable[str]] = None
             if text is None:
-                _text = options[random.randint(0, len(options) - 1)]
+                _text = options[self.randomSource.randint(0, len(options) - 1)]
+            elif isinstance(text, str):
+                _text = text
             else:
-                _text = str(text)
+                _text, _messages = None, text
+            _font = defaultFont()
+            if isinstance(font, FontAtlas):
+                _font = font
+            elif font is not None:
+                _font = loadFont(str(font))
             # create the tracking object
-            marquee: MatrixFunction = MatrixFunction(self, MatrixFunction.functionMatrixMarquee, self.colorSequence)
+            marquee: MatrixFunction = MatrixFunction(self, MatrixFunction.functionMatrixScrollText, self.colorSequence)
             # set refresh counter
             marquee.delayCounter = _delayCount
             # set refresh limit (after which this function will execute)
             marquee.delayCountMax = _delayCount
-            # add this function to our function list
-            self.privateLightFunctions.append(marquee)
+            # only the visible window is ever rendered, so the buffer stays the size of the matrix
             self.setvirtualLEDBuffer(
-                TextMatrix(
-                    yRange=self.realLEDYaxisRange,
-                    text=_text,
-                    color=self.colorSequence[0],
-                )
+                np.zeros((self.realLEDXaxisRange, self.realLEDYaxisRange, 3), dtype=PIXEL_BUFFER_DTYPE)
+            )
+            columnFirst = DEFAULT_MATRIX_ORDER == MatrixOrder.TraverseColumnThenRow
+            marquee.textScroller = TextScroller(
+                font=_font,
+                window=self.virtualLEDBuffer.shape[0 if columnFirst else 1],
+                text=_text,
+                messages=_messages,
             )
+            marquee.textScroller.renderColor(marquee.color, out=self.virtualLEDBuffer, transpose=columnFirst)
+            # add this function to our function list
+            self.privateLightFunctions.append(marquee)
         except SystemExit:
             raise
         except KeyboardInterrupt:
@@ -462,13 +591,19 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixEye.__name__)
         try:
-            _delayCount: int = random.randint(0, 5)
+            _delayCount: int = self.randomSource.randint(0, 5)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             # create the tracking object
             eye: MatrixFunction = MatrixFunction(self, MatrixFunction.functionMatrixEye, self.colorSequence)
             eye.rowIndex = int(self.realLEDXaxisRange / 2)
             eye.columnIndex = int(self.realLEDYaxisRange / 2)
+            eye.size = 4
+            eye.stencil = joinStencils(
+                circleStencil(3),
+                circleStencil(eye.size),
+                pointsStencil(((-2, -2), (-2, 2), (2, -2), (2, 2))),
+            )
             # set refresh counter
             eye.delayCounter = _delayCount
             # set refresh limit (after which this function will execute)
@@ -506,9 +641,9 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixBounce.__name__)
         try:
-            _fadeAmount: float = random.randint(50, 100) / 255.0
-            _delayCount: int = random.randint(1, 6)
-            _ballCount: int = random.randint(1, 6)
+            _fadeAmount: float = self.randomSource.randint(50, 100) / 255.0
+            _delayCount: int = self.randomSource.randint(1, 6)
+            _ballCount: int = self.randomSource.randint(1, 6)
             if fadeAmount is not None:
                 _fadeAmount = int(fadeAmount)
             # make sure fade is valid
@@ -536,12 +671,12 @@ class MatrixController(ArrayController):
             # create the tracking object
             for _ in range(_ballCount):
                 bounce: MatrixFunction = MatrixFunction(self, MatrixFunction.functionMatrixBounce, self.colorSequence)
-                bounce.rowIndex = random.randint(0, self.realLEDXaxisRange - 1)
-                bounce.columnIndex = random.randint(0, self.realLEDYaxisRange - 1)
-                bounce.rowDirection = [-1, 1][random.randint(0, 1)]
-                bounce.columnDirection = [-1, 1][random.randint(0, 1)]
-                bounce.rowStep = random.randint(1, 2)
-                bounce.columnStep = random.randint(1, 2)
+                bounce.rowIndex = self.randomSource.randint(0, self.realLEDXaxisRange - 1)
+                bounce.columnIndex = self.randomSource.randint(0, self.realLEDYaxisRange - 1)
+                bounce.rowDirection = [-1, 1][self.randomSource.randint(0, 1)]
+                bounce.columnDirection = [-1, 1][self.randomSource.randint(0, 1)]
+                bounce.rowStep = self.randomSource.randint(1, 2)
+                bounce.columnStep = self.randomSource.randint(1, 2)
                 # set refresh counter
                 bounce.delayCounter = _delayCount
                 # set refresh limit (after which this function will execute)
@@ -582,11 +717,11 @@ class MatrixController(ArrayController):
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixFireworks.__name__)
         try:
             if fadeAmount is None:
-                fadeAmount: float = random.randint(10, 50) / 100.0
+                fadeAmount: float = self.randomSource.randint(10, 50) / 100.0
             # _fadeAmount: float = 0.0
-            _delayCount: int = random.randint(0, 3)
+            _delayCount: int = self.randomSource.randint(0, 3)
             # _delayCount: int = 1
-            _zoomyCount: int = random.randint(1, 6)
+            _zoomyCount: int = self.randomSource.randint(1, 6)
             # _zoomyCount: int = 1
             if fadeAmount is not None:
                 _fadeAmount = int(fadeAmount)
@@ -617,8 +752,8 @@ class MatrixController(ArrayController):
                 firework: MatrixFunction = MatrixFunction(
                     self, MatrixFunction.functionMatrixFireworks, self.colorSequence
                 )
-                firework.rowIndex = random.randint(0, self.realLEDXaxisRange - 1)
-                firework.columnIndex = random.randint(0, self.realLEDYaxisRange - 1)
+                firework.rowIndex = self.randomSource.randint(0, self.realLEDXaxisRange - 1)
+                firework.columnIndex = self.randomSource.randint(0, self.realLEDYaxisRange - 1)
                 firework.size = 1
                 firework.step = 1
                 firework.sizeMax = min(self.realLEDXaxisRange, self.realLEDYaxisRange)
@@ -638,6 +773,79 @@ class MatrixController(ArrayController):
         except Exception as ex:
             raise ControllerException from ex
 
+    def useFunctionMatrixFireworksBatch(
+        self,
+        delayCount: int = None,
+        fireworkCount: int = None,
+        fadeAmount: float = None,
+        colorChange: bool = True,
+    ) -> None:
+        """Like useFunctionMatrixFireworks, but every firework is stepped and drawn in one vectorized pass.
+
+        Use this for dozens of fireworks on large matrices.
+
+        Args:
+            delayCount: number of led updates between firework updates
+            fireworkCount: number of fireworks
+            fadeAmount: fade amount
+            colorChange: change colors
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightControlException: if something bad happens
+        """
+        LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixFireworksBatch.__name__)
+        try:
+            _fadeAmount: float = self.randomSource.randint(10, 50) / 100.0
+            _delayCount: int = self.randomSource.randint(0, 3)
+            _fireworkCount: int = self.randomSource.randint(10, 40)
+            if fadeAmount is not None:
+                _fadeAmount = float(fadeAmount)
+            if _fadeAmount > 1 and _fadeAmount < 256:
+                _fadeAmount /= 255
+            if _fadeAmount < 0 or _fadeAmount > 1:
+                _fadeAmount = 0.1
+            if delayCount is not None:
+                _delayCount = int(delayCount)
+            if fireworkCount is not None:
+                _fireworkCount = max(1, int(fireworkCount))
+            if _fadeAmount == 1.0:
+                off: ArrayFunction = ArrayFunction(self, MatrixFunction.functionOff, self.colorSequence)
+                self.privateLightFunctions.append(off)
+            else:
+                # fade the whole LED strand
+                fade: ArrayFunction = ArrayFunction(self, ArrayFunction.functionFadeOff, self.colorSequence)
+                # by this amount
+                fade.fadeAmount = _fadeAmount
+                # add function to list
+                self.privateLightFunctions.append(fade)
+            # create one tracking object for all of the fireworks
+            fireworks: MatrixFunction = MatrixFunction(
+                self, MatrixFunction.functionMatrixFireworksBatch, self.colorSequence
+            )
+            rows, columns = self.virtualLEDBuffer.shape[0], self.virtualLEDBuffer.shape[1]
+            fireworks.sizeMax = min(rows, columns)
+            fireworks.step = 1
+            fireworks.rowIndices = self.randomSource.integers(0, rows - 1, _fireworkCount)
+            fireworks.columnIndices = self.randomSource.integers(0, columns - 1, _fireworkCount)
+            fireworks.sizes = np.ones((_fireworkCount,), dtype=np.int32)
+            fireworks.sizeMaxes = np.full((_fireworkCount,), fireworks.sizeMax, dtype=np.int32)
+            fireworks.delayCounters = np.zeros((_fireworkCount,), dtype=np.int32)
+            fireworks.delayCountMaxes = np.full((_fireworkCount,), _delayCount, dtype=np.int32)
+            fireworks.colors = MatrixFunction.colorSequenceBatch(fireworks, _fireworkCount).astype(PIXEL_BUFFER_DTYPE)
+            fireworks.colorCycle = bool(colorChange)
+            # add this function to our function list
+            self.privateLightFunctions.append(fireworks)
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
     def useFunctionMatrixRadar(
         self,
         delayCount: int = None,
@@ -658,8 +866,8 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixRadar.__name__)
         try:
-            _fadeAmount: float = random.randint(5, 10) / 100.0
-            _delayCount: int = random.randint(1, 3)
+            _fadeAmount: float = self.randomSource.randint(5, 10) / 100.0
+            _delayCount: int = self.randomSource.randint(1, 3)
             if fadeAmount is not None:
                 _fadeAmount = float(fadeAmount)
             # make sure fade is valid
@@ -683,18 +891,12 @@ class MatrixController(ArrayController):
             # create the tracking object
             radar: MatrixFunction = MatrixFunction(self, MatrixFunction.functionsMatrixRadar, self.colorSequence)
             max_radius = max(int(self.realLEDXaxisRange / 2), int(self.realLEDYaxisRange / 2))
-            radar.rowIndex = random.randint(0, self.realLEDXaxisRange - 1)
-            radar.columnIndex = random.randint(0, self.realLEDYaxisRange - 1)
+            radar.rowIndex = self.randomSource.randint(0, self.realLEDXaxisRange - 1)
+            radar.columnIndex = self.randomSource.randint(0, self.realLEDYaxisRange - 1)
             radar.delayCounter = 0
             radar.radius = max_radius
             radar.stepCountMax = 200
-            radar.t = np.linspace(-np.pi, np.pi, radar.stepCountMax)
-            radar.x = np.linspace(-max_radius, max_radius - 1, radar.stepCountMax)
-            # radar.sinx = np.sin(radar.t)
-            # radar.cosx = np.cos(radar.t)
-            # radar.thetas = np.arctan2(radar.sinx, radar.cosx)
-            radar.thetas = np.tan(radar.t)
-            radar.x = radar.x.astype(np.int32)
+            # the sweep lines for every step are computed once and cached
             # set refresh limit (after which this function will execute)
             radar.delayCountMax = _delayCount
             # add this function to our function list
@@ -732,9 +934,9 @@ class MatrixController(ArrayController):
         """
         LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixSnake.__name__)
         try:
-            _delayCount: int = random.randint(1, 3)
-            _snakeLength: int = random.randint(3, 30)
-            _snakeCount: int = random.randint(1, 4)
+            _delayCount: int = self.randomSource.randint(1, 3)
+            _snakeLength: int = self.randomSource.randint(3, 30)
+            _snakeCount: int = self.randomSource.randint(1, 4)
             if delayCount is not None:
                 _delayCount = int(delayCount)
             if snakeLength is not None:
@@ -751,16 +953,18 @@ class MatrixController(ArrayController):
             for _ in range(_snakeCount):
                 snake = MatrixFunction(self, MatrixFunction.functionsMatrixSnake, self.colorSequence)
                 snake.sizeMax = _snakeLength
-                snake.size = random.randint(int(snake.sizeMax / 2), snake.sizeMax)
-                snake.rowIndex = np.ones((snake.size), dtype=np.int32) * random.randint(0, self.realLEDXaxisRange - 1)
-                snake.columnIndex = np.ones((snake.size), dtype=np.int32) * random.randint(
+                snake.size = self.randomSource.randint(int(snake.sizeMax / 2), snake.sizeMax)
+                snake.rowIndex = np.ones((snake.size), dtype=np.int32) * self.randomSource.randint(
+                    0, self.realLEDXaxisRange - 1
+                )
+                snake.columnIndex = np.ones((snake.size), dtype=np.int32) * self.randomSource.randint(
                     0, self.realLEDYaxisRange - 1
                 )
                 snake.stepCountMax = snake.size
                 snake.delayCounter = 0
-                snake.rowDirection = [-1, 0, 1][random.randint(0, 2)]
+                snake.rowDirection = [-1, 0, 1][self.randomSource.randint(0, 2)]
                 if snake.rowDirection == 0:
-                    snake.columnDirection = [-1, 1][random.randint(0, 1)]
+                    snake.columnDirection = [-1, 1][self.randomSource.randint(0, 1)]
                 else:
                     snake.columnDirection = 0
                 # set refresh limit (after which this function will execute)
@@ -778,6 +982,71 @@ class MatrixController(ArrayController):
         except Exception as ex:
             raise ControllerException from ex
 
+    def useFunctionMatrixSnakeBatch(
+        self,
+        delayCount: int = None,
+        snakeLength: int = None,
+        snakeCount: int = None,
+        collision: bool = True,
+    ) -> None:
+        """Like useFunctionMatrixSnake, but every snake is moved and drawn in one vectorized pass.
+
+        Use this for dozens of snakes on large matrices. With collision on, snakes
+        avoid each other as well as themselves.
+
+        Args:
+            delayCount: number of led updates between snake moves
+            snakeLength: the longest a snake gets
+            snakeCount: number of snakes
+            collision: true to keep snakes from running into snakes
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightControlException: if something bad happens
+        """
+        LOGGER.debug("%s.%s:", self.__class__.__name__, self.useFunctionMatrixSnakeBatch.__name__)
+        try:
+            _delayCount: int = self.randomSource.randint(1, 3)
+            _snakeLength: int = self.randomSource.randint(3, 30)
+            _snakeCount: int = self.randomSource.randint(10, 40)
+            if delayCount is not None:
+                _delayCount = int(delayCount)
+            if snakeLength is not None:
+                _snakeLength = max(1, int(snakeLength))
+            if snakeCount is not None:
+                _snakeCount = max(1, int(snakeCount))
+            if self.colorSequence is None or len(self.colorSequence) == 0:
+                self.colorSequence = ArrayPattern.DefaultColorSequenceByMonth()
+            # turn off the whole LED strand each time
+            off: ArrayFunction = ArrayFunction(self, ArrayFunction.functionOff, self.colorSequence)
+            # add function to list
+            self.privateLightFunctions.append(off)
+            # create one tracking object for all of the snakes
+            snakes = MatrixFunction(self, MatrixFunction.functionMatrixSnakeBatch, self.colorSequence)
+            snakes.bodyRows = np.zeros((_snakeCount, _snakeLength), dtype=np.int32)
+            snakes.bodyColumns = np.zeros((_snakeCount, _snakeLength), dtype=np.int32)
+            snakes.sizes = np.zeros((_snakeCount,), dtype=np.int32)
+            snakes.lengths = np.zeros((_snakeCount,), dtype=np.int32)
+            snakes.rowDirections = np.zeros((_snakeCount,), dtype=np.int32)
+            snakes.columnDirections = np.zeros((_snakeCount,), dtype=np.int32)
+            snakes.colors = np.zeros((_snakeCount, 3), dtype=PIXEL_BUFFER_DTYPE)
+            MatrixFunction.restartSnakes(snakes, np.arange(_snakeCount))
+            snakes.delayCounter = 0
+            # set refresh limit (after which this function will execute)
+            snakes.delayCountMax = _delayCount
+            snakes.collision = bool(collision)
+            # add this function to our function list
+            self.privateLightFunctions.append(snakes)
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise ControllerException from ex
+
     def getFunctionMatrixMethodsList(self) -> list[str]:
         """Get the list of methods in this class (by name) that set the color functions.
 
@@ -882,11 +1151,11 @@ class MatrixController(ArrayController):
                         while (len(functionsCopy) * len(colorsCopy)) > 0:
                             # get a new function if there is one
                             if len(functionsCopy) > 0:
-                                function = functionsCopy[random.randint(0, len(functionsCopy) - 1)]
+                                function = functionsCopy[self.randomSource.randint(0, len(functionsCopy) - 1)]
                                 functionsCopy.remove(function)
                             # get a new color pattern if there is one
                             if len(colorsCopy) > 0:
-                                color = colorsCopy[random.randint(0, len(colorsCopy) - 1)]
+                                color = colorsCopy[self.randomSource.randint(0, len(colorsCopy) - 1)]
                                 colorsCopy.remove(color)
                             # reset
                             self.reset()
@@ -0,0 +1,790 @@
+"""Defines a packed glyph atlas for rendering text onto matrices."""
+from __future__ import annotations
+import hashlib
+import itertools
+import json
+import logging
+import os
+from collections import OrderedDict, deque
+from typing import Iterable, Iterator, Optional
+import numpy as np
+import numpy.typing
+from lightberries.exceptions import LightBerryException, MatrixFontException
+
+LOGGER = logging.getLogger("lightBerries")
+# the number of rendered strings each atlas keeps
+DEFAULT_CACHE_SIZE = 256
+# bump whenever the layout of saved atlases changes
+FONT_CACHE_VERSION = 1
+
+
+class FontAtlas:
+    """All the glyphs of a font packed side by side into one boolean array.
+
+    The atlas is laid out as rows (y) by columns (x), whatever the matrix order.
+    Each character maps to a glyph index, and each glyph has an offset (its first
+    column in the atlas) and a width (its advance, so glyphs can be any width).
+    One blank column is kept at the end of the atlas for spacing. Rendering a
+    string is a single gather of atlas columns, and the results are kept in a
+    least recently used cache so text that repeats (clocks, scores, tickers) does
+    not have to be rendered again.
+
+    Kerning adjusts the advance of a glyph when it is followed by a particular
+    character: a negative amount drops columns from the right edge of the glyph
+    (usually its spacing) and a positive amount adds blank columns.
+    """
+
+    def __init__(
+        self,
+        bitmap: numpy.typing.NDArray[np.bool_],
+        offsets: numpy.typing.NDArray[np.int32],
+        widths: numpy.typing.NDArray[np.int32],
+        glyphIndex: dict[str, int],
+        kerning: Optional[dict[str, int]] = None,
+        cacheSize: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Create an atlas from already packed glyphs.
+
+        Args:
+            bitmap: the packed glyphs, rows by columns
+            offsets: the first atlas column of each glyph
+            widths: the number of atlas columns of each glyph
+            glyphIndex: the glyph used for each character
+            kerning: the advance adjustment for pairs of characters, e.g. {"AV": -1}
+            cacheSize: the number of rendered strings to keep
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            bitmap = np.asarray(bitmap, dtype=np.bool_)
+            if bitmap.ndim != 2:
+                raise MatrixFontException("an atlas needs a 2d bitmap")
+            self.bitmap: numpy.typing.NDArray[np.bool_] = np.hstack(
+                [bitmap, np.zeros((bitmap.shape[0], 1), dtype=np.bool_)]
+            )
+            self.blankColumn: int = bitmap.shape[1]
+            self.offsets: numpy.typing.NDArray[np.int32] = np.asarray(offsets, dtype=np.int32)
+            self.widths: numpy.typing.NDArray[np.int32] = np.asarray(widths, dtype=np.int32)
+            if self.offsets.shape != self.widths.shape:
+                raise MatrixFontException("an atlas needs one offset and width per glyph")
+            if np.any(self.offsets < 0) or np.any(self.offsets + self.widths > self.blankColumn):
+                raise MatrixFontException("glyphs must lie inside the atlas bitmap")
+            if any(not 0 <= index < len(self.offsets) for index in glyphIndex.values()):
+                raise MatrixFontException("every character must map to a glyph in the atlas")
+            self.glyphIndex: dict[str, int] = dict(glyphIndex)
+            self.kerning: dict[str, int] = {}
+            for pair, amount in (kerning or {}).items():
+                if len(pair) != 2:
+                    raise MatrixFontException(f"kerning is for pairs of characters, not {pair!r}")
+                if amount:
+                    self.kerning[pair] = int(amount)
+            self.cacheSize: int = int(cacheSize)
+            self.privateCache: OrderedDict[str, numpy.typing.NDArray[np.bool_]] = OrderedDict()
+            self.bitmap.flags.writeable = False
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixFontException from ex
+
+    @classmethod
+    def fromGlyphs(
+        cls,
+        glyphs: dict[str, numpy.typing.NDArray[np.bool_]],
+        kerning: Optional[dict[str, int]] = None,
+        cacheSize: int = DEFAULT_CACHE_SIZE,
+    ) -> FontAtlas:
+        """Pack separate glyphs into an atlas.
+
+        Glyphs that are identical (e.g. upper and lower case letters sharing one
+        drawing) are only packed once.
+
+        Args:
+            glyphs: the rows of on/off pixels for each character, all the same height
+            kerning: the advance adjustment for pairs of characters, e.g. {"AV": -1}
+            cacheSize: the number of rendered strings to keep
+
+        Returns:
+            the packed atlas
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            if not glyphs:
+                raise MatrixFontException("an atlas needs at least one glyph")
+            _heights = {np.shape(glyph)[0] for glyph in glyphs.values()}
+            if len(_heights) != 1:
+                raise MatrixFontException(f"all glyphs must be the same height, not {sorted(_heights)}")
+            _packed: list[numpy.typing.NDArray[np.bool_]] = []
+            _indices: dict[bytes, int] = {}
+            _glyphIndex: dict[str, int] = {}
+            for character, glyph in glyphs.items():
+                _glyph = np.asarray(glyph, dtype=np.bool_)
+                _key = _glyph.tobytes() + np.array(_glyph.shape).tobytes()
+                if _key not in _indices:
+                    _indices[_key] = len(_packed)
+                    _packed.append(_glyph)
+                _glyphIndex[character] = _indices[_key]
+            _widths = np.array([glyph.shape[1] for glyph in _packed], dtype=np.int32)
+            _offsets = np.cumsum(_widths, dtype=np.int32) - _widths
+            return cls(np.hstack(_packed), _offsets, _widths, _glyphIndex, kerning, cacheSize)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixFontException from ex
+
+    @classmethod
+    def fromBDF(
+        cls,
+        path: str,
+        cacheSize: int = DEFAULT_CACHE_SIZE,
+    ) -> FontAtlas:
+        """Read a bitmap font in the Glyph Bitmap Distribution Format (.bdf).
+
+        Every glyph is drawn into a cell as tall as the font bounding box and as
+        wide as the glyph's advance (DWIDTH), so proportional fonts keep their widths.
+        Glyphs without a unicode encoding are skipped.
+
+        Args:
+            path: the .bdf file
+            cacheSize: the number of rendered strings to keep
+
+        Returns:
+            the packed atlas
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            with open(path, "r", encoding="latin-1") as bdfFile:
+                _lines = iter(bdfFile.read().splitlines())
+            _fontBox: Optional[list[int]] = None
+            _defaultAdvance = 0
+            _glyphs: dict[str, numpy.typing.NDArray[np.bool_]] = {}
+            for line in _lines:
+                _fields = line.split()
+                if not _fields:
+                    continue
+                if _fields[0] == "FONTBOUNDINGBOX":
+                    _fontBox = [int(field) for field in _fields[1:5]]
+                elif _fields[0] == "DWIDTH":
+                    # a font wide advance (glyphs without their own DWIDTH use it)
+                    _defaultAdvance = int(_fields[1])
+                elif _fields[0] == "STARTCHAR":
+                    if _fontBox is None:
+                        raise MatrixFontException(f"{path} has no FONTBOUNDINGBOX before its glyphs")
+                    _encoding, _advance, _box = -1, _defaultAdvance or _fontBox[0], list(_fontBox)
+                    for line in _lines:
+                        _fields = line.split()
+                        if not _fields:
+                            continue
+                        if _fields[0] == "ENCODING":
+                            _encoding = int(_fields[1])
+                        elif _fields[0] == "DWIDTH":
+                            _advance = int(_fields[1])
+                        elif _fields[0] == "BBX":
+                            _box = [int(field) for field in _fields[1:5]]
+                        elif _fields[0] == "BITMAP":
+                            break
+                    _rows = [
+                        bytes.fromhex(row.strip())
+                        for row in itertools.takewhile(lambda r: r.strip() != "ENDCHAR", _lines)
+                    ]
+                    if _encoding < 0:
+                        continue
+                    _glyphs[chr(_encoding)] = _bdfGlyph(_rows, _box, _fontBox, _advance)
+            if _fontBox is None:
+                raise MatrixFontException(f"{path} is not a BDF font")
+            return cls.fromGlyphs(_glyphs, cacheSize=cacheSize)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise MatrixFontException(f"failed to read {path}") from ex
+
+    @classmethod
+    def fromJSON(
+        cls,
+        path: str,
+        cacheSize: int = DEFAULT_CACHE_SIZE,
+    ) -> FontAtlas:
+        """Read a font drawn as text in a JSON file.
+
+        The file holds the glyphs as rows of text, where "#" is lit and anything
+        else is off, plus optional kerning pairs:
+
+            {"glyphs": {"A": [".#.", "#.#", "###", "#.#"], ...}, "kerning": {"AV": -1}}
+
+        Args:
+            path: the .json file
+            cacheSize: the number of rendered strings to keep
+
+        Returns:
+            the packed atlas
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as jsonFile:
+                _font = json.load(jsonFile)
+            _glyphs = {}
+            for character, rows in _font["glyphs"].items():
+                _width = max((len(row) for row in rows), default=0)
+                _glyphs[character] = np.array(
+                    [[c == "#" for c in row.ljust(_width)] for row in rows], dtype=np.bool_
+                ).reshape((len(rows), _width))
+            return cls.fromGlyphs(_glyphs, kerning=_font.get("kerning"), cacheSize=cacheSize)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise MatrixFontException(f"failed to read {path}") from ex
+
+    def save(
+        self,
+        path: str,
+    ) -> None:
+        """Write the packed atlas to a binary file that load() reads back without any parsing.
+
+        Args:
+            path: the file to write (numpy .npz)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            _characters = list(self.glyphIndex)
+            _pairs = list(self.kerning)
+            with open(path, "wb") as atlasFile:
+                np.savez(
+                    atlasFile,
+                    version=np.array(FONT_CACHE_VERSION),
+                    bitmap=self.bitmap[:, : self.blankColumn],
+                    offsets=self.offsets,
+                    widths=self.widths,
+                    characters=np.array(_characters, dtype=np.str_),
+                    glyphs=np.array([self.glyphIndex[c] for c in _characters], dtype=np.int32),
+                    kerningPairs=np.array(_pairs, dtype=np.str_),
+                    kerning=np.array([self.kerning[pair] for pair in _pairs], dtype=np.int32),
+                )
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:
+            raise MatrixFontException(f"failed to write {path}") from ex
+
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        cacheSize: int = DEFAULT_CACHE_SIZE,
+    ) -> FontAtlas:
+        """Read an atlas written by save().
+
+        Args:
+            path: the file to read
+            cacheSize: the number of rendered strings to keep
+
+        Returns:
+            the packed atlas
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            with np.load(path, allow_pickle=False) as _atlas:
+                if int(_atlas["version"]) != FONT_CACHE_VERSION:
+                    raise MatrixFontException(f"{path} was written by a different version")
+                return cls(
+                    _atlas["bitmap"],
+                    _atlas["offsets"],
+                    _atlas["widths"],
+                    dict(zip(_atlas["characters"].tolist(), _atlas["glyphs"].tolist())),
+                    dict(zip(_atlas["kerningPairs"].tolist(), _atlas["kerning"].tolist())),
+                    cacheSize,
+                )
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise MatrixFontException(f"failed to read {path}") from ex
+
+    @property
+    def height(
+        self,
+    ) -> int:
+        """The number of rows in every glyph.
+
+        Returns:
+            the glyph height
+        """
+        return self.bitmap.shape[0]
+
+    def glyphIndices(
+        self,
+        text: str,
+    ) -> numpy.typing.NDArray[np.intp]:
+        """Find the glyph of each character, skipping characters the font does not have.
+
+        Args:
+            text: the string to look up
+
+        Returns:
+            the glyph indices
+        """
+        _glyphIndex = self.glyphIndex
+        return np.array([_glyphIndex[c] for c in text if c in _glyphIndex], dtype=np.intp)
+
+    def advances(
+        self,
+        text: str,
+        following: str = "",
+    ) -> tuple[numpy.typing.NDArray[np.intp], numpy.typing.NDArray[np.intp]]:
+        """Find the glyph of each character and how many columns it takes, after kerning.
+
+        Args:
+            text: the string to look up
+            following: the character after the string (if the string is part of a longer one), for kerning
+
+        Returns:
+            the glyph indices and the number of columns each one takes
+        """
+        _glyphs = self.glyphIndices(text)
+        _advances = self.widths[_glyphs].astype(np.intp)
+        if self.kerning:
+            _characters = [c for c in text if c in self.glyphIndex] + [following[:1]]
+            for i in range(len(_glyphs)):
+                _advances[i] += self.kerning.get(_characters[i] + _characters[i + 1], 0)
+            np.maximum(_advances, 0, out=_advances)
+        return _glyphs, _advances
+
+    def columns(
+        self,
+        text: str,
+        following: str = "",
+    ) -> numpy.typing.NDArray[np.intp]:
+        """Find the atlas columns that make up a string, left to right.
+
+        Args:
+            text: the string to render
+            following: the character after the string (if the string is part of a longer one), for kerning
+
+        Returns:
+            the atlas column of every column of the rendered string
+        """
+        _glyphs, _advances = self.advances(text, following)
+        # each glyph's columns count up from its offset, so repeat each offset
+        # (less the position the glyph starts at) over its advance and add a ramp
+        _starts = np.cumsum(_advances) - _advances
+        _ramp = np.arange(_advances.sum(), dtype=np.intp) - np.repeat(_starts, _advances)
+        _columns = np.repeat(self.offsets[_glyphs], _advances) + _ramp
+        if self.kerning:
+            # columns kerned past the right edge of a glyph are blank
+            _columns[_ramp >= np.repeat(self.widths[_glyphs], _advances)] = self.blankColumn
+        return _columns
+
+    def width(
+        self,
+        text: str,
+    ) -> int:
+        """Measure a string.
+
+        Args:
+            text: the string to measure
+
+        Returns:
+            the number of columns the rendered string takes
+        """
+        return int(self.advances(text)[1].sum())
+
+    def render(
+        self,
+        text: str,
+        out: Optional[numpy.typing.NDArray[np.bool_]] = None,
+    ) -> numpy.typing.NDArray[np.bool_]:
+        """Render a string as rows of on/off pixels.
+
+        Args:
+            text: the string to render
+            out: a preallocated (height, width) buffer to render into
+
+        Returns:
+            the rendered string, a read only cached array unless out was given
+
+        Raises:
+            MatrixFontException: if out is the wrong shape
+        """
+        _rendered = self.privateCache.get(text)
+        if _rendered is not None:
+            self.privateCache.move_to_end(text)
+        elif out is not None:
+            # one gather straight into the caller's buffer
+            _columns = self.columns(text)
+            if out.shape != (self.height, len(_columns)):
+                raise MatrixFontException(f"expected a {(self.height, len(_columns))} buffer, not {out.shape}")
+            np.take(self.bitmap, _columns, axis=1, out=out)
+            return out
+        else:
+            _rendered = self.bitmap[:, self.columns(text)]
+            _rendered.flags.writeable = False
+            self.privateCache[text] = _rendered
+            if len(self.privateCache) > self.cacheSize:
+                self.privateCache.popitem(last=False)
+        if out is None:
+            return _rendered
+        if out.shape != _rendered.shape:
+            raise MatrixFontException(f"expected a {_rendered.shape} buffer, not {out.shape}")
+        np.copyto(out, _rendered)
+        return out
+
+    def renderColor(
+        self,
+        text: str,
+        color: numpy.typing.ArrayLike,
+        out: numpy.typing.NDArray[np.float32],
+        transpose: bool = False,
+    ) -> numpy.typing.NDArray[np.float32]:
+        """Render a string in a color into a preallocated pixel buffer.
+
+        Args:
+            text: the string to render
+            color: the rgb color of lit pixels
+            out: the (height, width, 3) pixel buffer, or (width, height, 3) if transposed
+            transpose: true to write columns first (for column then row matrices)
+
+        Returns:
+            out
+        """
+        _rendered = self.render(text)
+        if transpose:
+            _rendered = _rendered.T
+        np.multiply(_rendered[:, :, None], color, out=out, casting="unsafe")
+        return out
+
+
+# characters to leave between messages, the same gap TextMatrix leaves after its text
+DEFAULT_MESSAGE_GAP = "     "
+# the number of characters laid out at a time as the scroller needs more columns
+SCROLL_CHUNK_CHARACTERS = 16
+
+
+class TextScroller:
+    """Scrolls text through a fixed size window without rendering the whole message.
+
+    The scroller only keeps the atlas columns from the left edge of the window to
+    the end of the last laid out chunk of characters, and gathers just the visible
+    columns each frame, so memory and per frame cost depend on the window size
+    rather than the length of the text. Messages can be repeated forever (like a
+    marquee), queued with feed(), or pulled from an iterator as they are needed.
+    """
+
+    def __init__(
+        self,
+        font: FontAtlas,
+        window: int,
+        text: Optional[str] = None,
+        messages: Optional[Iterable[str]] = None,
+        gap: str = DEFAULT_MESSAGE_GAP,
+    ) -> None:
+        """Create a scroller.
+
+        Args:
+            font: the font to render with
+            window: the number of columns visible at once
+            text: text to repeat whenever there are no other messages
+            messages: messages to show once each, read only when the scroller reaches them
+            gap: characters to add after every message
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixFontException: if something bad happens
+        """
+        try:
+            self.font: FontAtlas = font
+            self.window: int = int(window)
+            if self.window < 1:
+                raise MatrixFontException("the scroll window must be at least one column wide")
+            self.gap: str = gap
+            self.offset: int = 0
+            self.privateRepeatText: Optional[str] = None
+            if text is not None and font.width(text + gap) > 0:
+                self.privateRepeatText = text + gap
+            self.privateMessages: deque[str] = deque()
+            self.privateSource: Optional[Iterator[str]] = None if messages is None else iter(messages)
+            self.privateMessage: str = ""
+            self.privatePosition: int = 0
+            self.privateColumns: numpy.typing.NDArray[np.intp] = np.zeros((0,), dtype=np.intp)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixFontException from ex
+
+    def feed(
+        self,
+        message: str,
+    ) -> None:
+        """Queue a message to be shown once, after the messages already queued.
+
+        Args:
+            message: the text to show
+        """
+        self.privateMessages.append(message + self.gap)
+
+    def step(
+        self,
+        columns: int = 1,
+    ) -> None:
+        """Scroll the text left.
+
+        Args:
+            columns: the number of columns to scroll
+        """
+        self._layOut(columns)
+        self.privateColumns = self.privateColumns[columns:]
+        self.offset += columns
+
+    def render(
+        self,
+        out: Optional[numpy.typing.NDArray[np.bool_]] = None,
+    ) -> numpy.typing.NDArray[np.bool_]:
+        """Render the visible window as rows of on/off pixels.
+
+        Args:
+            out: a preallocated (height, window) buffer to render into
+
+        Returns:
+            the visible window
+        """
+        self._layOut(self.window)
+        return np.take(self.font.bitmap, self.privateColumns[: self.window], axis=1, out=out)
+
+    def renderColor(
+        self,
+        color: numpy.typing.ArrayLike,
+        out: numpy.typing.NDArray[np.float32],
+        transpose: bool = False,
+    ) -> numpy.typing.NDArray[np.float32]:
+        """Render the visible window in a color into a preallocated pixel buffer.
+
+        Rows that do not fit in the buffer are cut off the bottom of the text.
+
+        Args:
+            color: the rgb color of lit pixels
+            out: the (rows, window, 3) pixel buffer, or (window, rows, 3) if transposed
+            transpose: true to write columns first (for column then row matrices)
+
+        Returns:
+            out
+        """
+        _rendered = self.render()
+        if transpose:
+            _rendered = _rendered.T
+            _rendered = _rendered[:, : out.shape[1]]
+            out = out[:, : _rendered.shape[1]]
+        else:
+            _rendered = _rendered[: out.shape[0]]
+            out = out[: _rendered.shape[0]]
+        np.multiply(_rendered[:, :, None], color, out=out, casting="unsafe")
+        return out
+
+    def _nextMessage(
+        self,
+    ) -> Optional[str]:
+        """Get the next message to lay out.
+
+        Returns:
+            queued messages first, then the message source, then the repeating text (if any)
+        """
+        if self.privateMessages:
+            return self.privateMessages.popleft()
+        if self.privateSource is not None:
+            _message = next(self.privateSource, None)
+            if _message is not None:
+                return str(_message) + self.gap
+            self.privateSource = None
+        return self.privateRepeatText
+
+    def _layOut(
+        self,
+        count: int,
+    ) -> None:
+        """Make sure at least count columns past the left edge of the window are laid out.
+
+        Args:
+            count: the number of columns needed
+        """
+        _chunks = [self.privateColumns]
+        _count = len(self.privateColumns)
+        while _count < count:
+            if self.privatePosition >= len(self.privateMessage):
+                _message = self._nextMessage()
+                if _message is None:
+                    # nothing to show, so scroll in blank columns
+                    _chunks.append(np.full((count - _count,), self.font.blankColumn, dtype=np.intp))
+                    break
+                self.privateMessage, self.privatePosition = _message, 0
+            _end = self.privatePosition + SCROLL_CHUNK_CHARACTERS
+            _columns = self.font.columns(
+                self.privateMessage[self.privatePosition : _end],
+                following=self.privateMessage[_end : _end + 1],
+            )
+            self.privatePosition = _end
+            _chunks.append(_columns)
+            _count += len(_columns)
+        if len(_chunks) > 1:
+            self.privateColumns = np.concatenate(_chunks)
+
+
+def _bdfGlyph(
+    rows: list[bytes],
+    box: list[int],
+    fontBox: list[int],
+    advance: int,
+) -> numpy.typing.NDArray[np.bool_]:
+    """Draw one BDF glyph into its cell.
+
+    Args:
+        rows: the glyph's bitmap rows, most significant bit on the left
+        box: the glyph bounding box (width, height, x offset, y offset)
+        fontBox: the font bounding box (width, height, x offset, y offset)
+        advance: the glyph's advance in columns
+
+    Returns:
+        the glyph cell, as tall as the font bounding box
+    """
+    _width, _height, _x, _y = box
+    _fontWidth, _fontHeight, _fontX, _fontY = fontBox
+    # glyphs that hang left of the origin are shifted right rather than cut off
+    _left = max(_x, 0)
+    _cell = np.zeros((_fontHeight, max(advance, _left + _width)), dtype=np.bool_)
+    if _width <= 0 or _height <= 0 or len(rows) < _height:
+        return _cell
+    _bits = np.unpackbits(np.frombuffer(b"".join(rows[:_height]), dtype=np.uint8).reshape((_height, -1)), axis=1)
+    # the top row of the cell is the top of the font bounding box
+    _top = (_fontY + _fontHeight) - (_y + _height)
+    _rows = slice(max(_top, 0), min(_top + _height, _fontHeight))
+    _cell[_rows, _left : _left + _width] = _bits[_rows.start - _top : _rows.stop - _top, :_width]
+    return _cell
+
+
+def loadFont(
+    path: str,
+    cacheDirectory: Optional[str] = None,
+    cacheSize: int = DEFAULT_CACHE_SIZE,
+) -> FontAtlas:
+    """Load a .bdf or .json font, or an atlas written by FontAtlas.save().
+
+    The first time a font file is loaded it is packed and saved to a binary cache
+    file, so later loads of the same (unchanged) file skip parsing altogether.
+
+    Args:
+        path: the font file
+        cacheDirectory: where packed atlases are cached, defaults to ~/.cache/lightberries
+        cacheSize: the number of rendered strings to keep
+
+    Returns:
+        the packed atlas
+
+    Raises:
+        MatrixFontException: if the font cannot be read
+    """
+    _extension = os.path.splitext(path)[1].lower()
+    if _extension == ".npz":
+        return FontAtlas.load(path, cacheSize)
+    if _extension not in (".bdf", ".json"):
+        raise MatrixFontException(f"unknown font format {_extension!r}, expected .bdf, .json, or .npz")
+    if cacheDirectory is None:
+        cacheDirectory = os.path.join(os.path.expanduser("~"), ".cache", "lightberries")
+    # the cache file is named for the font file and changes whenever the font file does
+    _stat = os.stat(path)
+    _source = f"{os.path.abspath(path)}:{_stat.st_size}:{_stat.st_mtime_ns}:{FONT_CACHE_VERSION}"
+    _cachePath = os.path.join(
+        cacheDirectory,
+        f"{os.path.basename(path)}-{hashlib.sha1(_source.encode()).hexdigest()[:16]}.npz",
+    )
+    if os.path.exists(_cachePath):
+        try:
+            return FontAtlas.load(_cachePath, cacheSize)
+        except MatrixFontException as ex:
+            LOGGER.warning("ignoring font cache %s: %s", _cachePath, ex)
+    if _extension == ".bdf":
+        _atlas = FontAtlas.fromBDF(path, cacheSize)
+    else:
+        _atlas = FontAtlas.fromJSON(path, cacheSize)
+    try:
+        os.makedirs(cacheDirectory, exist_ok=True)
+        # write then rename so a half written cache is never read
+        _temporaryPath = f"{_cachePath}.{os.getpid()}.tmp"
+        _atlas.save(_temporaryPath)
+        os.replace(_temporaryPath, _cachePath)
+    except (OSError, MatrixFontException) as ex:
+        # the font still works, it just gets parsed again next time
+        LOGGER.warning("could not cache font %s: %s", path, ex)
+    return _atlas
+
+
+_DEFAULT_FONT: Optional[FontAtlas] = None
+
+
+def defaultFont() -> FontAtlas:
+    """Get the atlas of the BigLetters font, packing it the first time it is needed.
+
+    Lower case letters share the upper case glyphs.
+
+    Returns:
+        the default font atlas
+    """
+    global _DEFAULT_FONT
+    if _DEFAULT_FONT is None:
+        from lightberries.matrix_letters import letter_bitmaps
+
+        _glyphs = letter_bitmaps()
+        _glyphs.update({character.lower(): _glyphs[character] for character in list(_glyphs) if character.isalpha()})
+        _DEFAULT_FONT = FontAtlas.fromGlyphs(_glyphs)
+    return _DEFAULT_FONT
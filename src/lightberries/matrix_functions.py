@@ -1,11 +1,19 @@
 from __future__ import annotations
-import random
-from typing import Any, Callable, ClassVar
+from typing import Any, Callable, ClassVar, Optional
 import numpy as np
 import logging
 from lightberries.array_functions import ArrayFunction
 import lightberries.matrix_controller
+import lightberries.matrix_font  # noqa : used in typing
 from lightberries.exceptions import LightBerryException, FunctionException
+from lightberries.matrix_patterns import DEFAULT_MATRIX_ORDER, MatrixOrder
+from lightberries.matrix_stencils import (
+    Stencil,
+    circleStencil,
+    circleStencilTable,
+    scatterStencil,
+    sweepStencils,
+)
 from lightberries.pixel import PixelColors
 from math import ceil
 from enum import IntEnum
@@ -51,6 +59,8 @@ class MatrixFunction(ArrayFunction):
         self.columnDirection: int = 1
         self.rowStep: int = 1
         self.columnStep: int = 1
+        self.textScroller: Optional["lightberries.matrix_font.TextScroller"] = None
+        self.stencil: Optional[Stencil] = None
 
     @staticmethod
     def functionMatrixFadeOff(
@@ -143,17 +153,17 @@ class MatrixFunction(ArrayFunction):
             if flux.delayCounter >= flux.delayCountMax:
                 MatrixFunction.Controller.virtualLEDBuffer[:, :, 0] = np.roll(
                     MatrixFunction.Controller.virtualLEDBuffer[:, :, 0],
-                    random.randint(-1, 0),
+                    ArrayFunction.Controller.randomSource.randint(-1, 0),
                     roll_index,
                 )
                 MatrixFunction.Controller.virtualLEDBuffer[:, :, 1] = np.roll(
                     MatrixFunction.Controller.virtualLEDBuffer[:, :, 1],
-                    random.randint(-1, 0),
+                    ArrayFunction.Controller.randomSource.randint(-1, 0),
                     roll_index,
                 )
                 MatrixFunction.Controller.virtualLEDBuffer[:, :, 2] = np.roll(
                     MatrixFunction.Controller.virtualLEDBuffer[:, :, 2],
-                    random.randint(-1, 0),
+                    ArrayFunction.Controller.randomSource.randint(-1, 0),
                     roll_index,
                 )
                 flux.delayCounter = 0
@@ -167,6 +177,41 @@ class MatrixFunction(ArrayFunction):
         except Exception as ex:
             raise FunctionException from ex
 
+    @staticmethod
+    def functionMatrixScrollText(
+        scroll: "MatrixFunction",
+    ) -> None:
+        """Scroll text across the matrix one column at a time.
+
+        Only the visible columns are rendered each step, so the cost does not depend on the length of the text.
+
+        Args:
+            scroll: the object used for tracking scroll status
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            if scroll.delayCounter >= scroll.delayCountMax:
+                scroll.textScroller.step()
+                scroll.textScroller.renderColor(
+                    scroll.color,
+                    out=MatrixFunction.Controller.virtualLEDBuffer,
+                    transpose=DEFAULT_MATRIX_ORDER == MatrixOrder.TraverseColumnThenRow,
+                )
+                scroll.delayCounter = 0
+            scroll.delayCounter += 1
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise FunctionException from ex
+
     @staticmethod
     def functionMatrixMarquee(
         marquee: "MatrixFunction",
@@ -220,11 +265,11 @@ class MatrixFunction(ArrayFunction):
             if eye.delayCounter >= eye.delayCountMax:
                 if eye.state == EyeMoveType.MOVE.value:
                     eye.rowIndexLast = eye.rowIndex
-                    eye.rowIndex += random.randint(
+                    eye.rowIndex += ArrayFunction.Controller.randomSource.randint(
                         -int(eye.Controller.realLEDXaxisRange / 2), int(eye.Controller.realLEDXaxisRange / 2)
                     )
                     eye.columnIndexLast = eye.columnIndex
-                    eye.columnIndex += random.randint(
+                    eye.columnIndex += ArrayFunction.Controller.randomSource.randint(
                         -int(eye.Controller.realLEDYaxisRange / 2), int(eye.Controller.realLEDYaxisRange / 2)
                     )
                     if eye.rowIndex < _min:
@@ -236,13 +281,13 @@ class MatrixFunction(ArrayFunction):
                     elif eye.columnIndex >= eye.Controller.realLEDYaxisRange - _max:
                         eye.columnIndex = eye.Controller.realLEDYaxisRange - _max - 1
 
-                    eye.delayCountMax = random.randint(0, 9)
+                    eye.delayCountMax = ArrayFunction.Controller.randomSource.randint(0, 9)
                     if eye.delayCountMax >= 3:
-                        eye.delayCountMax = random.randint(5, 20)
+                        eye.delayCountMax = ArrayFunction.Controller.randomSource.randint(5, 20)
                     elif eye.delayCountMax >= 8:
-                        eye.delayCountMax = random.randint(50, 100)
-                    eye.delayCountMax = random.randint(0, 30)
-                    r = random.randint(0, 4)
+                        eye.delayCountMax = ArrayFunction.Controller.randomSource.randint(50, 100)
+                    eye.delayCountMax = ArrayFunction.Controller.randomSource.randint(0, 30)
+                    r = ArrayFunction.Controller.randomSource.randint(0, 4)
                     if r == 3:
                         eye.state = EyeMoveType.TWITCH.value
                     elif r == 4:
@@ -254,8 +299,8 @@ class MatrixFunction(ArrayFunction):
                     r = eye.columnIndex
                     eye.columnIndex = eye.columnIndexLast
                     eye.columnIndexLast = r
-                    eye.delayCountMax = random.randint(0, 5)
-                    r = random.randint(0, 4)
+                    eye.delayCountMax = ArrayFunction.Controller.randomSource.randint(0, 5)
+                    r = ArrayFunction.Controller.randomSource.randint(0, 4)
                     if r == 3:
                         eye.state = EyeMoveType.MOVE.value
                     elif r == 4:
@@ -263,7 +308,7 @@ class MatrixFunction(ArrayFunction):
                 elif eye.state == EyeMoveType.BLINK.value:
                     eye.delayCountMax = 2
                     if eye.stepCounter > 1:
-                        r = random.randint(0, 1)
+                        r = ArrayFunction.Controller.randomSource.randint(0, 1)
                         if r == 0:
                             eye.state = EyeMoveType.MOVE.value
                             eye.stepCounter = 0
@@ -276,104 +321,19 @@ class MatrixFunction(ArrayFunction):
                 elif eye.state == EyeMoveType.BLINKED.value:
                     eye.state = EyeMoveType.BLINK.value
 
-                eye.Controller.virtualLEDBuffer *= 0
+                eye.Controller.virtualLEDBuffer[:] = 0
 
                 if eye.state == EyeMoveType.BLINK.value:
-                    xy = (tuple(eye.rowRange), tuple(eye.columnRange))
-                    eye.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array
+                    eye.Controller.virtualLEDBuffer[eye.rowRange, eye.columnRange] = PixelColors.RED.array
                 elif eye.state != EyeMoveType.BLINKED.value:
-                    eye.size = 3
-                    x = (
-                        np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * eye.size))) * (eye.size)).astype(
-                            dtype=np.int32
-                        )
-                        + eye.rowIndex
-                    )
-                    xi = np.where((x >= eye.Controller.realLEDYaxisRange) | (x < 0))[0]
-                    y = (
-                        np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * eye.size))) * (eye.size)).astype(
-                            dtype=np.int32
-                        )
-                        + eye.columnIndex
-                    )
-                    yi = np.where((y >= eye.Controller.realLEDXaxisRange) | (y < 0))[0]
-                    if len(xi) > 0 and len(yi) > 0:
-                        i = np.concatenate((xi, yi))
-                    elif len(xi) > 0:
-                        i = xi
-                    else:
-                        i = yi
-                    if len(i) > 0:
-                        x = np.delete(x, i)
-                        y = np.delete(y, i)
-                    # xy = (tuple(x), tuple(y))
-                    # eye.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array
-                    eye.rowRange = list(x)
-                    eye.columnRange = list(y)
-
-                    eye.size = 4
-                    x = (
-                        np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * eye.size))) * (eye.size)).astype(
-                            dtype=np.int32
-                        )
-                        + eye.rowIndex
+                    # the pupil, the iris, and four corners, remembered for blinking
+                    eye.rowRange, eye.columnRange = scatterStencil(
+                        eye.Controller.virtualLEDBuffer,
+                        eye.stencil,
+                        PixelColors.RED.array,
+                        eye.rowIndex,
+                        eye.columnIndex,
                     )
-                    xi = np.where((x >= eye.Controller.realLEDYaxisRange) | (x < 0))[0]
-                    y = (
-                        np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * eye.size))) * (eye.size)).astype(
-                            dtype=np.int32
-                        )
-                        + eye.columnIndex
-                    )
-                    yi = np.where((y >= eye.Controller.realLEDXaxisRange) | (y < 0))[0]
-                    if len(xi) > 0 and len(yi) > 0:
-                        i = np.concatenate((xi, yi))
-                    elif len(xi) > 0:
-                        i = xi
-                    else:
-                        i = yi
-                    if len(i) > 0:
-                        x = np.delete(x, i)
-                        y = np.delete(y, i)
-                    # xy = (tuple(x), tuple(y))
-                    # eye.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array
-                    eye.rowRange.extend(list(x))
-                    eye.columnRange.extend(list(y))
-
-                    x = np.array(
-                        [
-                            eye.rowIndex - 2,
-                            eye.rowIndex - 2,
-                            eye.rowIndex + 2,
-                            eye.rowIndex + 2,
-                        ]
-                    )
-                    xi = np.where((x >= eye.Controller.realLEDYaxisRange) | (x < 0))[0]
-                    y = np.array(
-                        [
-                            eye.columnIndex - 2,
-                            eye.columnIndex + 2,
-                            eye.columnIndex - 2,
-                            eye.columnIndex + 2,
-                        ]
-                    )
-                    yi = np.where((y >= eye.Controller.realLEDXaxisRange) | (y < 0))[0]
-                    if len(xi) > 0 and len(yi) > 0:
-                        i = np.concatenate((xi, yi))
-                    elif len(xi) > 0:
-                        i = xi
-                    else:
-                        i = yi
-                    if len(i) > 0:
-                        x = np.delete(x, i)
-                        y = np.delete(y, i)
-                    # xy = (tuple(x), tuple(y))
-                    # eye.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array
-                    eye.rowRange.extend(list(x))
-                    eye.columnRange.extend(list(y))
-
-                    xy = (tuple(eye.rowRange), tuple(eye.columnRange))
-                    eye.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array
 
                 eye.delayCounter = 0
             eye.delayCounter += 1
@@ -409,30 +369,30 @@ class MatrixFunction(ArrayFunction):
                 if bounce.rowIndex < _min:
                     bounce.rowIndex = _min
                     bounce.rowDirection *= -1
-                    bounce.rowStep = random.randint(1, 2)
-                    bounce.delayCountMax = random.randint(1, 5)
-                    if bounce.colorCycle and random.randint(0, 10) >= 7:
+                    bounce.rowStep = ArrayFunction.Controller.randomSource.randint(1, 2)
+                    bounce.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 5)
+                    if bounce.colorCycle and ArrayFunction.Controller.randomSource.randint(0, 10) >= 7:
                         bounce.color = bounce.colorSequenceNext
                 elif bounce.rowIndex >= bounce.Controller.realLEDXaxisRange - _max:
                     bounce.rowIndex = bounce.Controller.realLEDXaxisRange - _max - 1
                     bounce.rowDirection *= -1
-                    bounce.rowStep = random.randint(1, 2)
-                    bounce.delayCountMax = random.randint(1, 5)
-                    if bounce.colorCycle and random.randint(0, 10) >= 7:
+                    bounce.rowStep = ArrayFunction.Controller.randomSource.randint(1, 2)
+                    bounce.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 5)
+                    if bounce.colorCycle and ArrayFunction.Controller.randomSource.randint(0, 10) >= 7:
                         bounce.color = bounce.colorSequenceNext
                 if bounce.columnIndex < _min:
                     bounce.columnIndex = _min
                     bounce.columnDirection *= -1
-                    bounce.columnStep = random.randint(1, 2)
-                    bounce.delayCountMax = random.randint(1, 5)
-                    if bounce.colorCycle and random.randint(0, 10) >= 7:
+                    bounce.columnStep = ArrayFunction.Controller.randomSource.randint(1, 2)
+                    bounce.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 5)
+                    if bounce.colorCycle and ArrayFunction.Controller.randomSource.randint(0, 10) >= 7:
                         bounce.color = bounce.colorSequenceNext
                 elif bounce.columnIndex >= bounce.Controller.realLEDYaxisRange - _max:
                     bounce.columnIndex = bounce.Controller.realLEDYaxisRange - _max - 1
                     bounce.columnDirection *= -1
-                    bounce.columnStep = random.randint(1, 2)
-                    bounce.delayCountMax = random.randint(1, 5)
-                    if bounce.colorCycle and random.randint(0, 10) >= 7:
+                    bounce.columnStep = ArrayFunction.Controller.randomSource.randint(1, 2)
+                    bounce.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 5)
+                    if bounce.colorCycle and ArrayFunction.Controller.randomSource.randint(0, 10) >= 7:
                         bounce.color = bounce.colorSequenceNext
                 bounce.delayCounter = 0
             bounceRange = ((bounce.columnIndex), (bounce.rowIndex))
@@ -469,42 +429,27 @@ class MatrixFunction(ArrayFunction):
                     firework.size += firework.step
                 else:
                     firework.size = 1
-                    firework.rowIndex = random.randint(0, firework.Controller.realLEDYaxisRange - 1)
-                    firework.columnIndex = random.randint(0, firework.Controller.realLEDXaxisRange - 1)
-                    firework.delayCountMax = random.randint(1, 5)
+                    firework.rowIndex = ArrayFunction.Controller.randomSource.randint(
+                        0, firework.Controller.realLEDYaxisRange - 1
+                    )
+                    firework.columnIndex = ArrayFunction.Controller.randomSource.randint(
+                        0, firework.Controller.realLEDXaxisRange - 1
+                    )
+                    firework.delayCountMax = ArrayFunction.Controller.randomSource.randint(1, 5)
                     _sizeMax = min(
                         MatrixFunction.Controller.realLEDXaxisRange, MatrixFunction.Controller.realLEDYaxisRange
                     )
-                    firework.sizeMax = random.randint(int(_sizeMax // 2), _sizeMax)
+                    firework.sizeMax = ArrayFunction.Controller.randomSource.randint(int(_sizeMax // 2), _sizeMax)
                     if firework.colorCycle:
                         firework.color = firework.colorSequenceNext
                 firework.delayCounter = 0
-            x = (
-                np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * firework.size))) * (firework.size)).astype(
-                    dtype=np.int32
-                )
-                + firework.rowIndex
+            scatterStencil(
+                firework.Controller.virtualLEDBuffer,
+                circleStencil(firework.size),
+                firework.color,
+                firework.rowIndex,
+                firework.columnIndex,
             )
-            i1 = np.where((x >= firework.Controller.realLEDYaxisRange) | (x < 0))[0]
-            y = (
-                np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * firework.size))) * (firework.size)).astype(
-                    dtype=np.int32
-                )
-                + firework.columnIndex
-            )
-            i2 = np.where((y >= firework.Controller.realLEDXaxisRange) | (y < 0))[0]
-            if len(i1) > 0 and len(i2) > 0:
-                i = np.concatenate((i1, i2))
-            elif len(i1) > 0:
-                i = i1
-            else:
-                i = i2
-            if len(i) > 0:
-                x = np.delete(x, i)
-                y = np.delete(y, i)
-            xy = (tuple(x), tuple(y))
-
-            firework.Controller.virtualLEDBuffer[xy] = firework.color
 
             firework.delayCounter += 1
         except SystemExit:
@@ -530,29 +475,15 @@ class MatrixFunction(ArrayFunction):
             LightFunctionException: if something bad happens
         """
         try:
-            x = radar.x + radar.radius
-            y = radar.thetas[radar.stepCounter] * radar.x + radar.radius
-            # y = radar.thetas[radar.stepCounter] * radar.x + radar.stepCounter
-            # y = radar.thetas[radar.stepCounter] * radar.x + (radar.stepCountMax - 1 - radar.stepCounter)
-            y = y.astype(np.int32)
-            i1 = np.where((x >= radar.Controller.realLEDXaxisRange) | (x < 0))[0]
-            i2 = np.where((y >= radar.Controller.realLEDYaxisRange) | (y < 0))[0]
-            if len(i1) > 0 and len(i2) > 0:
-                i = np.concatenate((i1, i2))
-            elif len(i1) > 0:
-                i = i1
-            else:
-                i = i2
-            if len(i) > 0:
-                x = np.delete(x, i)
-                y = np.delete(y, i)
-            xy = (tuple(x), tuple(y))
-
-            radar.Controller.virtualLEDBuffer[xy] = PixelColors.RED.array * 0.5
+            x, y = scatterStencil(
+                radar.Controller.virtualLEDBuffer,
+                sweepStencils(radar.radius, radar.stepCountMax)[radar.stepCounter],
+                PixelColors.RED.array * 0.5,
+            )
 
-            if random.random() < radar.activeChance:
+            if ArrayFunction.Controller.randomSource.random() < radar.activeChance and len(x) > 0:
                 duration = 20
-                i = random.randint(0, len(x) - 1)
+                i = ArrayFunction.Controller.randomSource.randint(0, len(x) - 1)
                 if x[i] != radar.radius and y[i] != radar.radius:
                     # radar.enemy.append([duration, (x[i], y[i])])
                     radar.enemy.append(
@@ -639,7 +570,7 @@ class MatrixFunction(ArrayFunction):
                         if attempts == 0:
                             snake.rowIndex[0] -= 1
                             snake.rowDirection -= 1
-                            snake.columnDirection = [-1, 1][random.randint(0, 1)]
+                            snake.columnDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                             snake.columnIndex[0] = snake.columnIndex[1] + snake.columnDirection
                         else:
                             snake.rowDirection *= -1
@@ -648,7 +579,7 @@ class MatrixFunction(ArrayFunction):
                         if attempts == 0:
                             snake.rowIndex[0] += 1
                             snake.rowDirection += 1
-                            snake.columnDirection = [-1, 1][random.randint(0, 1)]
+                            snake.columnDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                             snake.columnIndex[0] = snake.columnIndex[1] + snake.columnDirection
                         else:
                             snake.rowDirection *= -1
@@ -657,7 +588,7 @@ class MatrixFunction(ArrayFunction):
                         if attempts == 0:
                             snake.columnIndex[0] -= 1
                             snake.columnDirection -= 1
-                            snake.rowDirection = [-1, 1][random.randint(0, 1)]
+                            snake.rowDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                             snake.rowIndex[0] = snake.rowIndex[1] + snake.rowDirection
                         else:
                             snake.columnDirection *= -1
@@ -666,7 +597,7 @@ class MatrixFunction(ArrayFunction):
                         if attempts == 0:
                             snake.columnIndex[0] += 1
                             snake.columnDirection += 1
-                            snake.rowDirection = [-1, 1][random.randint(0, 1)]
+                            snake.rowDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                             snake.rowIndex[0] = snake.rowIndex[1] + snake.rowDirection
                         else:
                             snake.columnDirection *= -1
@@ -693,14 +624,14 @@ class MatrixFunction(ArrayFunction):
                             d[ii] = ii
 
                 if collision or not ready:
-                    snake.size = random.randint(int(snake.sizeMax / 2), snake.sizeMax)
+                    snake.size = ArrayFunction.Controller.randomSource.randint(int(snake.sizeMax / 2), snake.sizeMax)
                     snake.stepCountMax = snake.size
-                    snake.rowIndex = np.ones((snake.size), dtype=np.int32) * random.randint(
-                        0, snake.Controller.realLEDXaxisRange - 1
-                    )
-                    snake.columnIndex = np.ones((snake.size), dtype=np.int32) * random.randint(
-                        0, snake.Controller.realLEDYaxisRange - 1
-                    )
+                    snake.rowIndex = np.ones(
+                        (snake.size), dtype=np.int32
+                    ) * ArrayFunction.Controller.randomSource.randint(0, snake.Controller.realLEDXaxisRange - 1)
+                    snake.columnIndex = np.ones(
+                        (snake.size), dtype=np.int32
+                    ) * ArrayFunction.Controller.randomSource.randint(0, snake.Controller.realLEDYaxisRange - 1)
                     snake.stepCounter = 1
                     snake.delayCounter = 0
                     snake.color = snake.colorSequenceNext
@@ -708,12 +639,12 @@ class MatrixFunction(ArrayFunction):
             for i in range(snake.stepCounter):
                 snake.Controller.virtualLEDBuffer[snake.rowIndex[i], snake.columnIndex[i]] = snake.color
 
-            if random.random() > 0.9:
+            if ArrayFunction.Controller.randomSource.random() > 0.9:
                 if snake.rowDirection != 0:
                     snake.rowDirection = 0
-                    snake.columnDirection = [-1, 1][random.randint(0, 1)]
+                    snake.columnDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                 else:
-                    snake.rowDirection = [-1, 1][random.randint(0, 1)]
+                    snake.rowDirection = [-1, 1][ArrayFunction.Controller.randomSource.randint(0, 1)]
                     snake.columnDirection = 0
 
             snake.delayCounter += 1
@@ -727,3 +658,209 @@ class MatrixFunction(ArrayFunction):
             raise
         except Exception as ex:
             raise FunctionException from ex
+
+    @staticmethod
+    def functionMatrixFireworksBatch(
+        fireworks: "MatrixFunction",
+    ) -> None:
+        """Grow many fireworks at once, with the state of every firework held in arrays.
+
+        Args:
+            fireworks: the object used for tracking the fireworks
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            _buffer = MatrixFunction.Controller.virtualLEDBuffer
+            _random = ArrayFunction.Controller.randomSource
+            _due = fireworks.delayCounters >= fireworks.delayCountMaxes
+            _growing = _due & (fireworks.sizes < fireworks.sizeMaxes)
+            fireworks.sizes[_growing] += fireworks.step
+            _restart = np.flatnonzero(_due & ~_growing)
+            if len(_restart):
+                _count = len(_restart)
+                _sizeMax = min(_buffer.shape[0], _buffer.shape[1])
+                fireworks.sizes[_restart] = 1
+                fireworks.rowIndices[_restart] = _random.integers(0, _buffer.shape[0] - 1, _count)
+                fireworks.columnIndices[_restart] = _random.integers(0, _buffer.shape[1] - 1, _count)
+                fireworks.delayCountMaxes[_restart] = _random.integers(1, 5, _count)
+                fireworks.sizeMaxes[_restart] = _random.integers(_sizeMax // 2, _sizeMax, _count)
+                if fireworks.colorCycle:
+                    fireworks.colors[_restart] = MatrixFunction.colorSequenceBatch(fireworks, _count)
+            fireworks.delayCounters[_due] = 0
+            # one row of the circle table per firework, drawn with a single scatter
+            _table = circleStencilTable(fireworks.sizeMax)
+            np.minimum(fireworks.sizes, fireworks.sizeMax, out=fireworks.sizes)
+            scatterStencil(
+                _buffer,
+                (_table[0][fireworks.sizes], _table[1][fireworks.sizes]),
+                fireworks.colors[:, None, :],
+                fireworks.rowIndices[:, None],
+                fireworks.columnIndices[:, None],
+            )
+            fireworks.delayCounters += 1
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise FunctionException from ex
+
+    @staticmethod
+    def functionMatrixSnakeBatch(
+        snakes: "MatrixFunction",
+    ) -> None:
+        """Move many snakes at once, with the bodies of every snake held in arrays.
+
+        The cells every snake covers are counted in an occupancy grid, so a snake
+        that runs into any snake (itself included) is found with one lookup per head.
+        Snakes that hit a wall or a snake turn once, and start over somewhere new if
+        they are still blocked.
+
+        Args:
+            snakes: the object used for tracking the snakes
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightFunctionException: if something bad happens
+        """
+        try:
+            _buffer = MatrixFunction.Controller.virtualLEDBuffer
+            _random = ArrayFunction.Controller.randomSource
+            _rowCount, _columnCount = _buffer.shape[0], _buffer.shape[1]
+            _snakeCount, _maxLength = snakes.bodyRows.shape
+            _segments = np.arange(_maxLength)
+            if snakes.delayCounter >= snakes.delayCountMax:
+                snakes.delayCounter = 0
+                # the cells that stay covered after this step (tails that are about to move are free)
+                _staying = _segments[None, :] < np.minimum(snakes.lengths, snakes.sizes - 1)[:, None]
+                _occupancy = np.zeros((_rowCount, _columnCount), dtype=np.int32)
+                if snakes.collision:
+                    _rows = snakes.bodyRows[_staying]
+                    _columns = snakes.bodyColumns[_staying]
+                    _onMatrix = (_rows >= 0) & (_rows < _rowCount) & (_columns >= 0) & (_columns < _columnCount)
+                    np.add.at(_occupancy, (_rows[_onMatrix], _columns[_onMatrix]), 1)
+
+                def _blocked(rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+                    _offMatrix = (rows < 0) | (rows >= _rowCount) | (columns < 0) | (columns >= _columnCount)
+                    _hit = np.zeros_like(_offMatrix)
+                    _hit[~_offMatrix] = _occupancy[rows[~_offMatrix], columns[~_offMatrix]] > 0
+                    return _offMatrix | _hit
+
+                _headRows = snakes.bodyRows[:, 0] + snakes.rowDirections
+                _headColumns = snakes.bodyColumns[:, 0] + snakes.columnDirections
+                _turn = _blocked(_headRows, _headColumns)
+                if _turn.any():
+                    # turn a quarter either way, then try the other way
+                    _side = _random.directions(_snakeCount)
+                    for side in (_side, -_side):
+                        _rowDirections = np.where(snakes.rowDirections != 0, 0, side)
+                        _columnDirections = np.where(snakes.rowDirections != 0, side, 0)
+                        _rows = np.where(_turn, snakes.bodyRows[:, 0] + _rowDirections, _headRows)
+                        _columns = np.where(_turn, snakes.bodyColumns[:, 0] + _columnDirections, _headColumns)
+                        _free = _turn & ~_blocked(_rows, _columns)
+                        snakes.rowDirections[_free] = _rowDirections[_free]
+                        snakes.columnDirections[_free] = _columnDirections[_free]
+                        _headRows[_free] = _rows[_free]
+                        _headColumns[_free] = _columns[_free]
+                        _turn &= ~_free
+                if snakes.collision:
+                    # two heads moving into the same cell: the first snake gets it
+                    # (blocked heads may be off the matrix, where the flat cell number aliases a real cell)
+                    _moving = np.flatnonzero(~_turn)
+                    _cells = _headRows[_moving] * _columnCount + _headColumns[_moving]
+                    _first = np.zeros((_snakeCount,), dtype=np.bool_)
+                    _first[_moving[np.unique(_cells, return_index=True)[1]]] = True
+                    _turn |= ~_first
+                # move: every body shifts back one segment and the head goes in front
+                snakes.bodyRows[:, 1:] = snakes.bodyRows[:, :-1].copy()
+                snakes.bodyColumns[:, 1:] = snakes.bodyColumns[:, :-1].copy()
+                snakes.bodyRows[:, 0] = _headRows
+                snakes.bodyColumns[:, 0] = _headColumns
+                np.minimum(snakes.lengths + 1, snakes.sizes, out=snakes.lengths)
+                _restart = np.flatnonzero(_turn)
+                if len(_restart):
+                    _occupied = None
+                    if snakes.collision:
+                        # start over in cells no other snake covers
+                        _covering = (_segments[None, :] < snakes.lengths[:, None]) & ~_turn[:, None]
+                        _occupied = np.zeros((_rowCount, _columnCount), dtype=np.bool_)
+                        _occupied[snakes.bodyRows[_covering], snakes.bodyColumns[_covering]] = True
+                    MatrixFunction.restartSnakes(snakes, _restart, _occupied)
+                # now and then, turn
+                _turning = _random.booleans(_snakeCount, 0.1)
+                _side = _random.directions(_snakeCount)
+                _wasRow = snakes.rowDirections != 0
+                snakes.rowDirections = np.where(_turning, np.where(_wasRow, 0, _side), snakes.rowDirections)
+                snakes.columnDirections = np.where(_turning, np.where(_wasRow, _side, 0), snakes.columnDirections)
+            _visible = _segments[None, :] < snakes.lengths[:, None]
+            _colors = np.broadcast_to(snakes.colors[:, None, :], _visible.shape + (3,))
+            _buffer[snakes.bodyRows[_visible], snakes.bodyColumns[_visible]] = _colors[_visible]
+            snakes.delayCounter += 1
+        except SystemExit:
+            raise
+        except KeyboardInterrupt:
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:
+            raise FunctionException from ex
+
+    @staticmethod
+    def restartSnakes(
+        snakes: "MatrixFunction",
+        restart: np.ndarray[(Any,), np.int32],
+        occupied: Optional[np.ndarray[(Any, Any), np.bool_]] = None,
+    ) -> None:
+        """Start some of a batch of snakes over as one segment somewhere random.
+
+        Args:
+            snakes: the object used for tracking the snakes
+            restart: the indices of the snakes to start over
+            occupied: cells to avoid starting in, if there are enough free ones
+        """
+        _buffer = MatrixFunction.Controller.virtualLEDBuffer
+        _random = ArrayFunction.Controller.randomSource
+        _count = len(restart)
+        _maxLength = snakes.bodyRows.shape[1]
+        _columnCount = _buffer.shape[1]
+        snakes.sizes[restart] = _random.integers(max(1, _maxLength // 2), _maxLength, _count)
+        snakes.lengths[restart] = 1
+        _free = np.arange(_buffer.shape[0] * _columnCount)
+        if occupied is not None:
+            _free = np.flatnonzero(~occupied)
+        _replace = len(_free) < _count
+        if not len(_free):
+            _free = np.arange(_buffer.shape[0] * _columnCount)
+        _cells = _random.generator.choice(_free, _count, replace=_replace)
+        snakes.bodyRows[restart] = (_cells // _columnCount)[:, None]
+        snakes.bodyColumns[restart] = (_cells % _columnCount)[:, None]
+        _side = _random.directions(_count)
+        _alongRows = _random.booleans(_count)
+        snakes.rowDirections[restart] = np.where(_alongRows, _side, 0)
+        snakes.columnDirections[restart] = np.where(_alongRows, 0, _side)
+        snakes.colors[restart] = MatrixFunction.colorSequenceBatch(snakes, _count)
+
+    @staticmethod
+    def colorSequenceBatch(
+        function: "MatrixFunction",
+        count: int,
+    ) -> np.ndarray[(Any, 3), np.float32]:
+        """Get the next few colors in a function's color sequence, like colorSequenceNext does one at a time.
+
+        Args:
+            function: the function whose color sequence to advance
+            count: the number of colors
+
+        Returns:
+            the colors
+        """
+        _indices = (function.colorSequenceIndex + 1 + np.arange(count)) % function.colorSequenceCount
+        function.colorSequenceIndex = int(_indices[-1])
+        return function.colorSequence[_indices]
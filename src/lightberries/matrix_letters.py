@@ -3,7 +3,7 @@ import numpy as np
 import numpy.typing
 
 o = 0
-l = 1  # noqa : dont care
+x = 1
 
 
 def _init_letter(temp_array):
@@ -15,581 +15,602 @@ def _init_letter(temp_array):
     return np.dstack([temp_array, temp_array, temp_array])
 
 
+class _LazyLetter:
+    """Builds a glyph the first time it is read instead of at import time."""
+
+    def __init__(self, builder):
+        self.builder = builder
+        self.name = None
+        self.glyph = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if self.glyph is None:
+            self.glyph = _init_letter(self.builder())
+        return self.glyph
+
+    def bitmap(self) -> numpy.typing.NDArray[np.bool_]:
+        """The glyph as rows of on/off pixels, before any matrix ordering is applied."""
+        return np.array(self.builder(), dtype=np.bool_)
+
+
 class BigLetters:
-    A = _init_letter(
-        np.array(
+    A = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, o, o, o, l, o, o, o, o, o, o, o],
-                [o, o, o, o, o, l, o, l, o, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, l, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, l, l, l, l, l, l, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, l, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
+                [o, o, o, o, o, o, x, o, o, o, o, o, o, o],
+                [o, o, o, o, o, x, o, x, o, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, x, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, x, x, x, x, x, x, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, x, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    B = _init_letter(
-        np.array(
+    B = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, o, o, o, o, o],
-                [o, l, o, o, o, l, o, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, l, l, l, l, o, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, l, l, l, l, o, o, o, o],
+                [o, x, x, x, x, o, o, o, o, o],
+                [o, x, o, o, o, x, o, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, x, x, x, x, o, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, x, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    C = _init_letter(
-        np.array(
+    C = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, l, o, o, o],
-                [o, o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, l, o, o],
-                [o, o, o, l, l, l, l, o, o, o],
+                [o, o, o, x, x, x, x, o, o, o],
+                [o, o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, x, o, o],
+                [o, o, o, x, x, x, x, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    D = _init_letter(
-        np.array(
+    D = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, o, o, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o, o],
-                [o, l, l, l, l, l, o, o, o, o],
+                [o, x, x, x, x, x, o, o, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o, o],
+                [o, x, x, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    E = _init_letter(
-        np.array(
+    E = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, l, l, l, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, o, o],
+                [o, x, x, x, x, x, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, x, x, x, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    F = _init_letter(
-        np.array(
+    F = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, l, l, l, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, x, x, x, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    G = _init_letter(
-        np.array(
+    G = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, l, l, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, l, o, o, o, o],
+                [o, o, o, x, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, x, x, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    H = _init_letter(
-        np.array(
+    H = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, l, l, l, l, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, x, x, x, x, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    I = _init_letter(  # noqa : dont care
-        np.array(
+    I = _LazyLetter(  # noqa : dont care
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, l, l, l, l, l, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
+                [o, o, x, x, x, x, x, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    J = _init_letter(
-        np.array(
+    J = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, l, o, o, l, o, o, o, o, o],
-                [o, l, o, o, l, o, o, o, o, o],
-                [o, l, o, o, l, o, o, o, o, o],
-                [o, o, l, l, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, x, o, o, x, o, o, o, o, o],
+                [o, x, o, o, x, o, o, o, o, o],
+                [o, x, o, o, x, o, o, o, o, o],
+                [o, o, x, x, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    K = _init_letter(
-        np.array(
+    K = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, l, o, o, o, o],
-                [o, l, o, l, o, o, o, o, o],
-                [o, l, l, l, o, o, o, o, o],
-                [o, l, o, o, l, o, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, x, o, o, o, o],
+                [o, x, o, x, o, o, o, o, o],
+                [o, x, x, x, o, o, o, o, o],
+                [o, x, o, o, x, o, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    L = _init_letter(
-        np.array(
+    L = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    M = _init_letter(
-        np.array(
+    M = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, l, o, o, o, l, l, o, o],
-                [o, l, l, o, o, o, l, l, o, o],
-                [o, l, o, l, o, l, o, l, o, o],
-                [o, l, o, l, o, l, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, x, o, o, o, x, x, o, o],
+                [o, x, x, o, o, o, x, x, o, o],
+                [o, x, o, x, o, x, o, x, o, o],
+                [o, x, o, x, o, x, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    N = _init_letter(
-        np.array(
+    N = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, l, o, o, o, o, l, o, o],
-                [o, l, l, o, o, o, o, l, o, o],
-                [o, l, o, l, o, o, o, l, o, o],
-                [o, l, o, l, o, o, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, o, o, l, o, l, o, o],
-                [o, l, o, o, o, l, o, l, o, o],
-                [o, l, o, o, o, o, l, l, o, o],
-                [o, l, o, o, o, o, l, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, x, o, o, o, o, x, o, o],
+                [o, x, x, o, o, o, o, x, o, o],
+                [o, x, o, x, o, o, o, x, o, o],
+                [o, x, o, x, o, o, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, o, o, x, o, x, o, o],
+                [o, x, o, o, o, x, o, x, o, o],
+                [o, x, o, o, o, o, x, x, o, o],
+                [o, x, o, o, o, o, x, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    O = _init_letter(  # noqa : dont care
-        np.array(
+    O = _LazyLetter(  # noqa : dont care
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    P = _init_letter(
-        np.array(
+    P = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, l, l, l, l, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, x, x, x, x, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    Q = _init_letter(
-        np.array(
+    Q = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, o, o, l, o, l, o, o],
-                [o, l, o, o, o, o, l, l, o, o],
-                [o, o, l, o, o, o, l, l, o, o],
-                [o, o, o, l, l, l, o, o, l, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, o, o, x, o, x, o, o],
+                [o, x, o, o, o, o, x, x, o, o],
+                [o, o, x, o, o, o, x, x, o, o],
+                [o, o, o, x, x, x, o, o, x, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    R = _init_letter(
-        np.array(
+    R = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, l, l, l, l, o, o, o],
-                [o, l, o, o, l, o, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
+                [o, x, x, x, x, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, x, x, x, x, o, o, o],
+                [o, x, o, o, x, o, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    S = _init_letter(
-        np.array(
+    S = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, o, l, l, l, l, o, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, l, o, o],
-                [o, o, l, l, l, l, o, o, o],
+                [o, o, x, x, x, x, o, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o],
+                [o, o, o, x, x, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, x, o, o],
+                [o, o, x, x, x, x, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    T = _init_letter(
-        np.array(
+    T = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    U = _init_letter(
-        np.array(
+    U = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    V = _init_letter(
-        np.array(
+    V = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    W = _init_letter(
-        np.array(
+    W = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o, l, o, o, o],
-                [o, o, o, l, o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, l, o, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, l, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, l, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o, x, o, o, o],
+                [o, o, o, x, o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, x, o, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, x, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, x, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    X = _init_letter(
-        np.array(
+    X = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    Y = _init_letter(
-        np.array(
+    Y = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    Z = _init_letter(
-        np.array(
+    Z = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    SPACE = _init_letter(
-        np.array(
+    SPACE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o],
                 [o, o, o, o, o],
@@ -610,13 +631,13 @@ class BigLetters:
             ]
         )
     )
-    APOSTROPHE = _init_letter(
-        np.array(
+    APOSTROPHE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o],
                 [o, o, o],
-                [o, l, o],
-                [l, o, o],
+                [o, x, o],
+                [x, o, o],
                 [o, o, o],
                 [o, o, o],
                 [o, o, o],
@@ -632,8 +653,8 @@ class BigLetters:
             ]
         )
     )
-    COMMA = _init_letter(
-        np.array(
+    COMMA = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o],
                 [o, o, o],
@@ -648,256 +669,256 @@ class BigLetters:
                 [o, o, o],
                 [o, o, o],
                 [o, o, o],
-                [o, l, o],
-                [o, l, o],
-                [l, o, o],
+                [o, x, o],
+                [o, x, o],
+                [x, o, o],
             ]
         )
     )
-    EXCLAMATION = _init_letter(
-        np.array(
+    EXCLAMATION = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
                 [o, o, o, o],
                 [o, o, o, o],
-                [o, l, o, o],
-                [o, l, o, o],
+                [o, x, o, o],
+                [o, x, o, o],
                 [o, o, o, o],
             ]
         )
     )
-    ZERO = _init_letter(
-        np.array(
+    ZERO = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, l, l, o, o],
-                [o, l, o, o, o, o, l, l, o, o],
-                [o, l, o, o, o, l, o, l, o, o],
-                [o, l, o, o, o, l, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, o, l, o, o, l, o, o],
-                [o, l, o, l, o, o, o, l, o, o],
-                [o, l, o, l, o, o, o, l, o, o],
-                [o, l, l, o, o, o, o, l, o, o],
-                [o, l, l, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, x, x, o, o],
+                [o, x, o, o, o, o, x, x, o, o],
+                [o, x, o, o, o, x, o, x, o, o],
+                [o, x, o, o, o, x, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, o, x, o, o, x, o, o],
+                [o, x, o, x, o, o, o, x, o, o],
+                [o, x, o, x, o, o, o, x, o, o],
+                [o, x, x, o, o, o, o, x, o, o],
+                [o, x, x, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    ONE = _init_letter(
-        np.array(
+    ONE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, l, l, o, o, o, o],
-                [o, l, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o],
-                [o, l, l, l, l, l, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, x, x, o, o, o, o],
+                [o, x, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o],
+                [o, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o],
             ]
         )
     )
-    TWO = _init_letter(
-        np.array(
+    TWO = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, o, l, l, l, o, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, l, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, o, o, o],
+                [o, o, x, x, x, o, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, x, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    THREE = _init_letter(
-        np.array(
+    THREE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, o, l, l, l, o, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, l, l, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, o, l, l, l, o, o, o, o],
+                [o, o, x, x, x, o, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, x, x, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    FOUR = _init_letter(
-        np.array(
+    FOUR = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, l, l, o, o, o],
-                [o, o, o, o, l, l, o, o, o],
-                [o, o, o, l, o, l, o, o, o],
-                [o, o, o, l, o, l, o, o, o],
-                [o, o, l, o, o, l, o, o, o],
-                [o, o, l, o, o, l, o, o, o],
-                [o, l, o, o, o, l, o, o, o],
-                [o, l, l, l, l, l, l, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, x, x, o, o, o],
+                [o, o, o, o, x, x, o, o, o],
+                [o, o, o, x, o, x, o, o, o],
+                [o, o, o, x, o, x, o, o, o],
+                [o, o, x, o, o, x, o, o, o],
+                [o, o, x, o, o, x, o, o, o],
+                [o, x, o, o, o, x, o, o, o],
+                [o, x, x, x, x, x, x, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o],
                 [o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    FIVE = _init_letter(
-        np.array(
+    FIVE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, l, l, l, o, o, o, o],
-                [o, l, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, x, x, x, o, o, o, o],
+                [o, x, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    SIX = _init_letter(
-        np.array(
+    SIX = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, o, l, l, l, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, o, o, o, o, o, o, o],
-                [o, l, o, l, l, l, o, o, o, o],
-                [o, l, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, o, o, o, x, x, x, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, o, o, o, o, o, o, o],
+                [o, x, o, x, x, x, o, o, o, o],
+                [o, x, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    SEVEN = _init_letter(
-        np.array(
+    SEVEN = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, o, l, o, o, o],
-                [o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, o, o, l, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, o, l, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, o, l, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
-                [o, o, l, o, o, o, o, o, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, o, x, o, o, o],
+                [o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, o, o, x, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, o, x, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, o, x, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
+                [o, o, x, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    EIGHT = _init_letter(
-        np.array(
+    EIGHT = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    NINE = _init_letter(
-        np.array(
+    NINE = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, o, o, l, l, l, o, o, o, o],
-                [o, o, l, o, o, o, l, o, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, l, o, o, o, o, o, l, o, o],
-                [o, o, l, o, o, o, l, l, o, o],
-                [o, o, o, l, l, l, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
-                [o, o, o, o, o, o, o, l, o, o],
+                [o, o, o, x, x, x, o, o, o, o],
+                [o, o, x, o, o, o, x, o, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, x, o, o, o, o, o, x, o, o],
+                [o, o, x, o, o, o, x, x, o, o],
+                [o, o, o, x, x, x, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
+                [o, o, o, o, o, o, o, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
             ]
         )
     )
-    EQUALS = _init_letter(
-        np.array(
+    EQUALS = _LazyLetter(
+        lambda: np.array(
             [
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
@@ -905,10 +926,10 @@ class BigLetters:
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
-                [o, l, l, l, l, l, l, l, o, o],
+                [o, x, x, x, x, x, x, x, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
                 [o, o, o, o, o, o, o, o, o, o],
@@ -920,39 +941,34 @@ class BigLetters:
     )
 
 
+# the BigLetters glyph used for each character
+CHARACTER_NAMES: dict[str, str] = {
+    **{letter: letter for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ"},
+    " ": "SPACE",
+    "'": "APOSTROPHE",
+    ",": "COMMA",
+    "!": "EXCLAMATION",
+    "0": "ZERO",
+    "1": "ONE",
+    "2": "TWO",
+    "3": "THREE",
+    "4": "FOUR",
+    "5": "FIVE",
+    "6": "SIX",
+    "7": "SEVEN",
+    "8": "EIGHT",
+    "9": "NINE",
+    "=": "EQUALS",
+}
+
+
+def letter_bitmaps() -> dict[str, numpy.typing.NDArray[np.bool_]]:
+    """Get the rows of on/off pixels of every BigLetters character, for building a font atlas."""
+    return {character: vars(BigLetters)[name].bitmap() for character, name in CHARACTER_NAMES.items()}
+
+
 def letters_to_matrices(text: str) -> list[numpy.typing.NDArray]:
-    retval = []
-    for letter in text.upper():
-        if letter in dir(BigLetters):
-            retval.append(getattr(BigLetters, letter))
-        elif letter == " ":
-            retval.append(getattr(BigLetters, "SPACE"))
-        elif letter == "'":
-            retval.append(getattr(BigLetters, "APOSTROPHE"))
-        elif letter == ",":
-            retval.append(getattr(BigLetters, "COMMA"))
-        elif letter == "!":
-            retval.append(getattr(BigLetters, "EXCLAMATION"))
-        elif letter == "0":
-            retval.append(getattr(BigLetters, "ZERO"))
-        elif letter == "1":
-            retval.append(getattr(BigLetters, "ONE"))
-        elif letter == "2":
-            retval.append(getattr(BigLetters, "TWO"))
-        elif letter == "3":
-            retval.append(getattr(BigLetters, "THREE"))
-        elif letter == "4":
-            retval.append(getattr(BigLetters, "FOUR"))
-        elif letter == "5":
-            retval.append(getattr(BigLetters, "FIVE"))
-        elif letter == "6":
-            retval.append(getattr(BigLetters, "SIX"))
-        elif letter == "7":
-            retval.append(getattr(BigLetters, "SEVEN"))
-        elif letter == "8":
-            retval.append(getattr(BigLetters, "EIGHT"))
-        elif letter == "9":
-            retval.append(getattr(BigLetters, "NINE"))
-        elif letter == "=":
-            retval.append(getattr(BigLetters, "EQUALS"))
-    return retval
+    # characters without a glyph are skipped
+    return [
+        getattr(BigLetters, CHARACTER_NAMES[letter]) for letter in text.upper() if letter in CHARACTER_NAMES
+    ]
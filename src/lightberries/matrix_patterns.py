@@ -1,12 +1,15 @@
 from __future__ import annotations
 import logging
-from typing import Any
+from typing import Any, Optional, TYPE_CHECKING
 import numpy as np
 from lightberries.exceptions import LightBerryException, PatternException
 from lightberries.pixel import Pixel
-from lightberries.array_patterns import ArrayPattern
+from lightberries.array_patterns import ArrayPattern, PIXEL_BUFFER_DTYPE
 from enum import IntEnum
 
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.matrix_font import FontAtlas
+
 LOGGER = logging.getLogger("lightBerries")
 
 
@@ -19,13 +22,13 @@ DEFAULT_MATRIX_ORDER: int = MatrixOrder.TraverseColumnThenRow.value
 
 
 def SingleLED(xRange: int, yRange: int) -> np.ndarray[(Any, Any, 3), np.int32]:
-    matrix = np.zeros((yRange, xRange, 3))
+    matrix = np.zeros((yRange, xRange, 3), dtype=PIXEL_BUFFER_DTYPE)
     matrix[0, 0, :] = 255
     return matrix
 
 
 def Spectrum(xRange: int, yRange: int) -> np.ndarray[(Any, Any, 3), np.int32]:
-    matrix = np.zeros((yRange, xRange, 3))
+    matrix = np.zeros((yRange, xRange, 3), dtype=PIXEL_BUFFER_DTYPE)
     row_scalers = np.linspace(0, 127.5, xRange)
     column_scalers = np.linspace(0, 127.5, yRange)
     matrix[:, :, 0] += column_scalers
@@ -38,7 +41,7 @@ def Spectrum(xRange: int, yRange: int) -> np.ndarray[(Any, Any, 3), np.int32]:
 
 
 def Spectrum2(xRange: int, yRange: int) -> np.ndarray[(Any, Any, 3), np.int32]:
-    matrix = np.zeros((yRange, xRange, 3))
+    matrix = np.zeros((yRange, xRange, 3), dtype=PIXEL_BUFFER_DTYPE)
     matrix[:, :, 0] += (np.cos(np.linspace(0, 2 * np.pi, yRange)) * 127.5) + 127.5
     matrix[:, :, 1] += (np.cos(np.linspace(0, 4 * np.pi, yRange)) * 127.5) + 127.5
     matrix[:, :, 2] += (np.cos(np.linspace(0, 6 * np.pi, yRange)) * 127.5) + 127.5
@@ -49,7 +52,7 @@ def Spectrum2(xRange: int, yRange: int) -> np.ndarray[(Any, Any, 3), np.int32]:
 
 
 def SolidColorMatrix(
-    xRange: int, yRange: int, color: np.ndarray[(3,), np.int32] = ArrayPattern.DEFAULT_COLOR_SEQUENCE[0]
+    xRange: int, yRange: int, color: np.ndarray[(3,), np.int32] = None
 ) -> np.ndarray[(3, Any), np.int32]:
     """Creates matrix of RGB tuples that are all one color.
 
@@ -67,14 +70,14 @@ def SolidColorMatrix(
         LightPatternException: if something bad happens
     """
     try:
+        if color is None:
+            color = ArrayPattern.DEFAULT_COLOR_SEQUENCE[0]
         if isinstance(color, np.ndarray):
             _color = Pixel(color)
         else:
             _color = color
-        matrix = np.ones((yRange, xRange, 3))
-        matrix[:, :, 0] *= _color.array[0]
-        matrix[:, :, 1] *= _color.array[1]
-        matrix[:, :, 2] *= _color.array[2]
+        matrix = np.empty((yRange, xRange, 3), dtype=PIXEL_BUFFER_DTYPE)
+        matrix[:, :, :] = _color.array
         return matrix
     except SystemExit:
         raise
@@ -86,28 +89,27 @@ def SolidColorMatrix(
         raise PatternException from ex
 
 
-def TextMatrix(yRange: int, text: str, color: np.ndarray[(Any, 3), np.int32]) -> np.ndarray[(Any, Any, 3), np.int32]:
-    from lightberries.matrix_letters import letters_to_matrices
+def TextMatrix(
+    yRange: int,
+    text: str,
+    color: np.ndarray[(Any, 3), np.int32],
+    font: Optional["FontAtlas"] = None,
+) -> np.ndarray[(Any, Any, 3), np.int32]:
+    from lightberries.matrix_font import defaultFont
 
-    letters = letters_to_matrices(text + "     ")
-    total_length = 0
-    matrix = np.ndarray
+    if font is None:
+        font = defaultFont()
+    textWithGap = text + "     "
     if DEFAULT_MATRIX_ORDER == MatrixOrder.TraverseColumnThenRow:
-        total_length = sum([matrix.shape[0] for matrix in letters])
-        matrix = np.zeros((total_length, letters[0].shape[1], 3))
-        idx = 0
-        for letter in letters:
-            matrix[idx : idx + letter.shape[0], : letter.shape[1], :] = letter
-            idx += letter.shape[0]
-    elif DEFAULT_MATRIX_ORDER == MatrixOrder.TraverseRowThenColumn:
-        total_length = sum([matrix.shape[1] for matrix in letters])
-        matrix = np.zeros((letters[0].shape[0], total_length, 3))
-        idx = 0
-        for letter in letters:
-            matrix[: letter.shape[0], idx : idx + letter.shape[1], :] = letter
-            idx += letter.shape[1]
-    matrix *= color
-    ydelta = yRange - matrix.shape[1]
-    _matrix = np.zeros((matrix.shape[0], ydelta + matrix.shape[1], 3))
-    _matrix[: matrix.shape[0], : matrix.shape[1], :] = matrix
-    return _matrix
+        shape = (font.width(textWithGap), font.height)
+    else:
+        shape = (font.height, font.width(textWithGap))
+    ydelta = yRange - shape[1]
+    matrix = np.zeros((shape[0], ydelta + shape[1], 3), dtype=PIXEL_BUFFER_DTYPE)
+    font.renderColor(
+        textWithGap,
+        color,
+        out=matrix[: shape[0], : shape[1], :],
+        transpose=DEFAULT_MATRIX_ORDER == MatrixOrder.TraverseColumnThenRow,
+    )
+    return matrix
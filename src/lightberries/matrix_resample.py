@@ -0,0 +1,328 @@
+"""Defines cached maps for resampling images and video frames onto a matrix.
+
+A map is computed once per source size, target size, and set of options, then
+every frame through it is a fixed set of vectorized steps: a gather for nearest
+sampling, a gather and weighted sum of four neighbors for bilinear sampling, or
+two reductions and a weighted gather for box (area) averaging. Aspect ratio
+padding or cropping, rotation, and the LED color order are all folded into the
+map, so frames come out ready to copy into the virtual LED buffer.
+"""
+from __future__ import annotations
+import functools
+from typing import Optional
+import numpy as np
+import numpy.typing
+from lightberries.exceptions import LightBerryException, MatrixVideoException
+from lightberries.pixel import Pixel
+
+RESAMPLE_NEAREST = "nearest"
+RESAMPLE_BILINEAR = "bilinear"
+RESAMPLE_AREA = "area"
+# a box filter averages the source pixels under each target cell, which is area sampling
+RESAMPLE_BOX = RESAMPLE_AREA
+RESAMPLE_METHODS = (RESAMPLE_NEAREST, RESAMPLE_BILINEAR, RESAMPLE_AREA)
+# scale each axis separately to cover the matrix
+ASPECT_STRETCH = "stretch"
+# keep the aspect ratio and show the whole frame, padding the edges with black
+ASPECT_FIT = "fit"
+# keep the aspect ratio and cover the whole matrix, cropping the edges of the frame
+ASPECT_FILL = "fill"
+ASPECT_MODES = (ASPECT_STRETCH, ASPECT_FIT, ASPECT_FILL)
+# the number of maps kept, one per combination of sizes and options in use
+MAP_CACHE_SIZE = 32
+
+
+def _rgbFrame(
+    frame: numpy.typing.NDArray[np.uint8],
+) -> numpy.typing.NDArray[np.uint8]:
+    """View a grayscale, RGB, or RGBA frame as RGB.
+
+    Args:
+        frame: a (rows, columns) or (rows, columns, 1, 3, or 4 channels) frame
+
+    Returns:
+        the (rows, columns, 3) frame, alpha dropped and gray repeated in each channel
+
+    Raises:
+        MatrixVideoException: if the frame has some other number of channels
+    """
+    if frame.ndim == 2:
+        frame = frame[:, :, None]
+    if frame.ndim != 3 or frame.shape[2] not in (1, 3, 4):
+        raise MatrixVideoException(f"Expected a grayscale, RGB, or RGBA frame, not shape {frame.shape}")
+    if frame.shape[2] == 1:
+        return np.repeat(frame, 3, axis=2)
+    return frame[:, :, :3]
+
+
+def _sampleEdges(
+    sourceLength: int,
+    targetLength: int,
+    sourceStart: int = 0,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Split a source axis into one run of samples per target cell.
+
+    Args:
+        sourceLength: the number of source samples
+        targetLength: the number of target cells
+        sourceStart: the first source sample used
+
+    Returns:
+        the first source sample and the number of samples of each cell (at least one)
+    """
+    _starts = (np.arange(targetLength) * sourceLength) // targetLength
+    _ends = (np.arange(1, targetLength + 1) * sourceLength) // targetLength
+    return sourceStart + _starts, np.maximum(_ends - _starts, 1)
+
+
+def _bilinearAxis(
+    sourceLength: int,
+    targetLength: int,
+    sourceStart: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the two source samples on either side of each target cell center.
+
+    Args:
+        sourceLength: the number of source samples
+        targetLength: the number of target cells
+        sourceStart: the first source sample used
+
+    Returns:
+        the lower sample, the upper sample, and the weight of the upper sample for each cell
+    """
+    _last = sourceStart + sourceLength - 1
+    _centers = sourceStart + (np.arange(targetLength) + 0.5) * sourceLength / targetLength - 0.5
+    _centers = np.clip(_centers, sourceStart, _last)
+    _lower = np.floor(_centers).astype(np.intp)
+    return _lower, np.minimum(_lower + 1, _last), (_centers - _lower).astype(np.float32)
+
+
+def _aspectWindows(
+    sourceShape: tuple[int, int],
+    targetShape: tuple[int, int],
+    aspect: str,
+) -> tuple[tuple[int, int], tuple[int, int], tuple[int, int], tuple[int, int]]:
+    """Find the part of the source that is shown, and the part of the target it is shown on.
+
+    Args:
+        sourceShape: the rows and columns of the source frames
+        targetShape: the rows and columns of the (unrotated) target
+        aspect: ASPECT_STRETCH, ASPECT_FIT, or ASPECT_FILL
+
+    Returns:
+        the first source row and column, the source rows and columns used,
+        the first target row and column, and the target rows and columns covered
+    """
+    _sourceStart, _sourceSize = (0, 0), sourceShape
+    _targetStart, _targetSize = (0, 0), targetShape
+    if aspect == ASPECT_FIT:
+        _scale = min(targetShape[0] / sourceShape[0], targetShape[1] / sourceShape[1])
+        _targetSize = tuple(min(t, max(1, round(s * _scale))) for s, t in zip(sourceShape, targetShape))
+        _targetStart = tuple((t - c) // 2 for t, c in zip(targetShape, _targetSize))
+    elif aspect == ASPECT_FILL:
+        _scale = max(targetShape[0] / sourceShape[0], targetShape[1] / sourceShape[1])
+        _sourceSize = tuple(min(s, max(1, round(t / _scale))) for s, t in zip(sourceShape, targetShape))
+        _sourceStart = tuple((s - c) // 2 for s, c in zip(sourceShape, _sourceSize))
+    return _sourceStart, _sourceSize, _targetStart, _targetSize
+
+
+class ResampleMap:
+    """Resamples (rows, columns, 3) frames of one size onto a matrix of another.
+
+    Nearest sampling takes the source pixel under the center of each target cell.
+    Bilinear sampling blends the four source pixels around each cell center, which
+    gives smooth gradients when small frames are enlarged. Area (box) sampling
+    averages every source pixel a target cell covers, which keeps fine detail from
+    flickering when large frames are shrunk onto a few LEDs; when a target axis is
+    larger than the source it repeats pixels instead.
+    """
+
+    def __init__(
+        self,
+        sourceShape: tuple[int, int],
+        targetShape: tuple[int, int],
+        method: str = RESAMPLE_AREA,
+        quarterTurns: int = 0,
+        channelOrder: Optional[tuple[int, ...]] = None,
+        aspect: str = ASPECT_STRETCH,
+    ) -> None:
+        """Build the index and weight maps for one source size.
+
+        Args:
+            sourceShape: the rows and columns of the source frames
+            targetShape: the rows and columns of the matrix
+            method: RESAMPLE_NEAREST, RESAMPLE_BILINEAR, or RESAMPLE_AREA (RESAMPLE_BOX)
+            quarterTurns: the number of times to rotate the frame a quarter turn counterclockwise (as np.rot90)
+            channelOrder: the source channel for each LED channel, Pixel.DEFAULT_PIXEL_ORDER if not given
+            aspect: ASPECT_STRETCH, ASPECT_FIT (pad), or ASPECT_FILL (crop)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixVideoException: if something bad happens
+        """
+        try:
+            if method not in RESAMPLE_METHODS:
+                raise MatrixVideoException(f"Unknown resampling method: {method}")
+            if aspect not in ASPECT_MODES:
+                raise MatrixVideoException(f"Unknown aspect mode: {aspect}")
+            self.sourceShape: tuple[int, int] = (int(sourceShape[0]), int(sourceShape[1]))
+            self.targetShape: tuple[int, int] = (int(targetShape[0]), int(targetShape[1]))
+            self.method: str = method
+            self.quarterTurns: int = int(quarterTurns) % 4
+            self.aspect: str = aspect
+            _channelOrder = Pixel.DEFAULT_PIXEL_ORDER if channelOrder is None else channelOrder
+            # the frame is sampled upright, then rotated into the target shape
+            if self.quarterTurns % 2:
+                _uprightShape = (self.targetShape[1], self.targetShape[0])
+            else:
+                _uprightShape = self.targetShape
+            _sourceStart, _sourceSize, _targetStart, _targetSize = _aspectWindows(
+                self.sourceShape, _uprightShape, aspect
+            )
+            self.privateCrop: tuple[slice, slice] = (
+                slice(_sourceStart[0], _sourceStart[0] + _sourceSize[0]),
+                slice(_sourceStart[1], _sourceStart[1] + _sourceSize[1]),
+            )
+            _rowStarts, _rowCounts = _sampleEdges(_sourceSize[0], _targetSize[0])
+            _columnStarts, _columnCounts = _sampleEdges(_sourceSize[1], _targetSize[1])
+            # flat pixel indices and weights of each sample, shaped (samples, rows, columns)
+            _weights: Optional[np.ndarray] = None
+            if method == RESAMPLE_NEAREST:
+                # the middle sample of each run, and the gather reads the source directly
+                _rows = _sourceStart[0] + _rowStarts + (_rowCounts - 1) // 2
+                _columns = _sourceStart[1] + _columnStarts + (_columnCounts - 1) // 2
+                _pixels = (_rows[:, None] * self.sourceShape[1] + _columns[None, :])[None]
+            elif method == RESAMPLE_BILINEAR:
+                # the four neighbors of each cell center, read from the source directly
+                _rowsLower, _rowsUpper, _rowWeights = _bilinearAxis(_sourceSize[0], _targetSize[0], _sourceStart[0])
+                _columnsLower, _columnsUpper, _columnWeights = _bilinearAxis(
+                    _sourceSize[1], _targetSize[1], _sourceStart[1]
+                )
+                _pixels = np.stack(
+                    [
+                        rows[:, None] * self.sourceShape[1] + columns[None, :]
+                        for rows in (_rowsLower, _rowsUpper)
+                        for columns in (_columnsLower, _columnsUpper)
+                    ]
+                )
+                _weights = np.stack(
+                    [
+                        rowWeights[:, None] * columnWeights[None, :]
+                        for rowWeights in (1 - _rowWeights, _rowWeights)
+                        for columnWeights in (1 - _columnWeights, _columnWeights)
+                    ]
+                )
+            else:
+                # the gather reads the summed runs, and the weights divide by the pixels summed
+                _pixels = (np.arange(_targetSize[0])[:, None] * _targetSize[1] + np.arange(_targetSize[1])[None, :])[
+                    None
+                ]
+                _weights = 1 / (_rowCounts[:, None] * _columnCounts[None, :])[None].astype(np.float32)
+            if _targetSize != _uprightShape:
+                # padding reads the first pixel with a weight of zero
+                _window = (
+                    slice(None),
+                    slice(_targetStart[0], _targetStart[0] + _targetSize[0]),
+                    slice(_targetStart[1], _targetStart[1] + _targetSize[1]),
+                )
+                _paddedPixels = np.zeros((len(_pixels),) + _uprightShape, dtype=np.intp)
+                _paddedPixels[_window] = _pixels
+                _paddedWeights = np.zeros((len(_pixels),) + _uprightShape, dtype=np.float32)
+                _paddedWeights[_window] = 1 if _weights is None else _weights
+                _pixels, _weights = _paddedPixels, _paddedWeights
+            _pixels = np.rot90(_pixels, self.quarterTurns, axes=(1, 2))
+            self.privateGather: np.ndarray = np.ascontiguousarray(
+                _pixels[:, :, :, None] * 3 + np.asarray(_channelOrder, dtype=np.intp)[None, None, None, :]
+            ).astype(np.intp)
+            self.privateWeights: Optional[np.ndarray] = None
+            if _weights is not None:
+                self.privateWeights = np.ascontiguousarray(
+                    np.rot90(_weights, self.quarterTurns, axes=(1, 2))[:, :, :, None], dtype=np.float32
+                )
+            self.privateRowStarts: np.ndarray = _rowStarts
+            self.privateColumnStarts: np.ndarray = _columnStarts
+            for array in (self.privateGather, self.privateWeights, self.privateRowStarts, self.privateColumnStarts):
+                if array is not None:
+                    array.flags.writeable = False
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixVideoException from ex
+
+    def apply(
+        self,
+        frame: numpy.typing.NDArray[np.uint8],
+        out: Optional[numpy.typing.NDArray[np.float32]] = None,
+    ) -> numpy.typing.NDArray[np.float32]:
+        """Resample one frame.
+
+        Args:
+            frame: the (rows, columns, 3) source frame, grayscale and RGBA frames are converted
+            out: a (target rows, target columns, 3) float32 array to write into
+
+        Returns:
+            the frame, shaped and ordered like the virtual LED buffer
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixVideoException: if something bad happens
+        """
+        try:
+            if frame.shape[:2] != self.sourceShape:
+                raise MatrixVideoException(f"Frame is {frame.shape[:2]}, this map is for {self.sourceShape}")
+            frame = _rgbFrame(frame)
+            if out is None:
+                out = np.empty(self.targetShape + (3,), dtype=np.float32)
+            if self.method == RESAMPLE_AREA:
+                # sum each run of rows, then each run of columns (the weights divide by the pixels summed)
+                _sums = np.add.reduceat(frame[self.privateCrop], self.privateRowStarts, axis=0, dtype=np.uint32)
+                _sampled = np.add.reduceat(_sums, self.privateColumnStarts, axis=1, dtype=np.uint32)
+            else:
+                _sampled = np.ascontiguousarray(frame)
+            _samples = np.take(_sampled, self.privateGather, mode="clip")
+            if self.privateWeights is None:
+                np.copyto(out, _samples[0])
+            else:
+                np.sum(np.multiply(_samples, self.privateWeights, dtype=np.float32), axis=0, out=out)
+            return out
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixVideoException from ex
+
+
+@functools.lru_cache(maxsize=MAP_CACHE_SIZE)
+def resampleMap(
+    sourceShape: tuple[int, int],
+    targetShape: tuple[int, int],
+    method: str = RESAMPLE_AREA,
+    quarterTurns: int = 0,
+    channelOrder: Optional[tuple[int, ...]] = None,
+    aspect: str = ASPECT_STRETCH,
+) -> ResampleMap:
+    """The map for a source size, built the first time it is needed.
+
+    Args:
+        sourceShape: the rows and columns of the source frames
+        targetShape: the rows and columns of the matrix
+        method: RESAMPLE_NEAREST, RESAMPLE_BILINEAR, or RESAMPLE_AREA (RESAMPLE_BOX)
+        quarterTurns: the number of counterclockwise quarter turns
+        channelOrder: the source channel for each LED channel, Pixel.DEFAULT_PIXEL_ORDER if not given
+        aspect: ASPECT_STRETCH, ASPECT_FIT (pad), or ASPECT_FILL (crop)
+
+    Returns:
+        the shared map
+    """
+    return ResampleMap(sourceShape, targetShape, method, quarterTurns, channelOrder, aspect)
@@ -0,0 +1,217 @@
+"""Defines cached shape stencils and a clip-and-scatter helper for drawing on matrices.
+
+A stencil is a pair of integer offset arrays (rows, columns) describing a shape
+around an origin. Stencils only depend on their size, so each one is computed
+once, cached, and made read only; drawing a shape is then a translate, one
+bounds mask, and one scatter into the LED buffer.
+"""
+from __future__ import annotations
+import functools
+from typing import Any, Optional, Tuple
+import numpy as np
+import numpy.typing
+
+# the offset arrays of one shape, rows then columns
+Stencil = Tuple[numpy.typing.NDArray[np.int32], numpy.typing.NDArray[np.int32]]
+# large enough to stay off any matrix, small enough not to overflow int32
+_OFF_MATRIX = 2**30
+
+
+def _freeze(
+    rows: numpy.typing.ArrayLike,
+    columns: numpy.typing.ArrayLike,
+) -> Stencil:
+    """Make a cached stencil safe to share.
+
+    Args:
+        rows: the row offsets
+        columns: the column offsets
+
+    Returns:
+        read only int32 copies of the offsets
+    """
+    _rows = np.array(rows, dtype=np.int32)
+    _columns = np.array(columns, dtype=np.int32)
+    _rows.flags.writeable = False
+    _columns.flags.writeable = False
+    return _rows, _columns
+
+
+@functools.lru_cache(maxsize=None)
+def circleStencil(
+    radius: int,
+) -> Stencil:
+    """The outline of a circle, sampled at 4 * radius + 1 points (the first and last are the same cell).
+
+    Args:
+        radius: the circle radius
+
+    Returns:
+        the row and column offsets from the center
+    """
+    _angles = np.linspace(0, 2 * np.pi, 1 + (4 * radius))
+    return _freeze(
+        np.round(np.sin(_angles) * radius),
+        np.round(np.cos(_angles) * radius),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def circleStencilTable(
+    maxRadius: int,
+) -> Stencil:
+    """Every circle outline up to a radius, padded to the same length so many circles can be drawn at once.
+
+    Row r holds circleStencil(r); the padding repeats the circle's first point, so it draws nothing new.
+
+    Args:
+        maxRadius: the largest radius
+
+    Returns:
+        (maxRadius + 1, 4 * maxRadius + 1) row and column offsets, indexed by radius
+    """
+    _width = 1 + (4 * maxRadius)
+    _rows = np.zeros((maxRadius + 1, _width), dtype=np.int32)
+    _columns = np.zeros((maxRadius + 1, _width), dtype=np.int32)
+    for radius in range(maxRadius + 1):
+        _circleRows, _circleColumns = circleStencil(radius)
+        _rows[radius] = np.pad(_circleRows, (0, _width - len(_circleRows)), mode="edge")
+        _columns[radius] = np.pad(_circleColumns, (0, _width - len(_circleColumns)), mode="edge")
+    return _freeze(_rows, _columns)
+
+
+@functools.lru_cache(maxsize=None)
+def ringStencil(
+    innerRadius: float,
+    outerRadius: float,
+) -> Stencil:
+    """Every cell whose center lies between two radii (inclusive), i.e. a filled annulus.
+
+    Args:
+        innerRadius: the radius of the hole (0 for a filled disc)
+        outerRadius: the outside radius
+
+    Returns:
+        the row and column offsets from the center
+    """
+    _reach = int(np.ceil(outerRadius))
+    _rows, _columns = np.mgrid[-_reach : _reach + 1, -_reach : _reach + 1]
+    _distances = np.hypot(_rows, _columns)
+    _inside = (_distances >= innerRadius) & (_distances <= outerRadius)
+    return _freeze(_rows[_inside], _columns[_inside])
+
+
+@functools.lru_cache(maxsize=None)
+def lineStencil(
+    rowDelta: int,
+    columnDelta: int,
+) -> Stencil:
+    """A line from the origin to (rowDelta, columnDelta), one cell per step along its longer axis.
+
+    Args:
+        rowDelta: the row offset of the far end
+        columnDelta: the column offset of the far end
+
+    Returns:
+        the row and column offsets from the start of the line
+    """
+    _steps = max(abs(rowDelta), abs(columnDelta)) + 1
+    return _freeze(
+        np.round(np.linspace(0, rowDelta, _steps)),
+        np.round(np.linspace(0, columnDelta, _steps)),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def pointsStencil(
+    points: tuple[tuple[int, int], ...],
+) -> Stencil:
+    """Arbitrary cells.
+
+    Args:
+        points: the (row, column) offset of each cell
+
+    Returns:
+        the row and column offsets
+    """
+    _points = np.array(points, dtype=np.int32).reshape((-1, 2))
+    return _freeze(_points[:, 0], _points[:, 1])
+
+
+def joinStencils(
+    *stencils: Stencil,
+) -> Stencil:
+    """Combine stencils into one, so they are drawn with a single scatter.
+
+    Args:
+        stencils: the stencils to combine
+
+    Returns:
+        all of the offsets, in order
+    """
+    return _freeze(
+        np.concatenate([rows for rows, _ in stencils]),
+        np.concatenate([columns for _, columns in stencils]),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def sweepStencils(
+    radius: int,
+    steps: int,
+) -> tuple[Stencil, ...]:
+    """The lines of a radar sweep: one line through the center for each of steps angles from -pi to pi.
+
+    Each line has steps rows spread from 0 to 2 * radius - 1, with columns from the
+    slope at that angle, and the offsets are from the top left corner of the sweep.
+    Lines that run off the square are kept, the scatter clips them.
+
+    Args:
+        radius: half the width of the sweep
+        steps: the number of angles
+
+    Returns:
+        one stencil per angle
+    """
+    _slopes = np.tan(np.linspace(-np.pi, np.pi, steps))
+    _samples = np.linspace(-radius, radius - 1, steps).astype(np.int32)
+    _rows = _samples + radius
+    _stencils = []
+    for slope in _slopes:
+        # near vertical lines have huge columns, keep them off the matrix without overflowing
+        _columns = np.clip(slope * _samples + radius, -_OFF_MATRIX, _OFF_MATRIX)
+        _stencils.append(_freeze(_rows, _columns.astype(np.int32)))
+    return tuple(_stencils)
+
+
+def scatterStencil(
+    buffer: numpy.typing.NDArray[Any],
+    stencil: Stencil,
+    color: Optional[numpy.typing.ArrayLike],
+    row: int = 0,
+    column: int = 0,
+) -> Stencil:
+    """Draw a stencil into a matrix buffer, dropping the cells that fall off it.
+
+    Args:
+        buffer: the (rows, columns, ...) buffer to draw into
+        stencil: the shape to draw
+        color: the value to write to each cell (or an array of values matching the stencil shape), or None
+        row: the row of the stencil origin (or an array that broadcasts against the stencil)
+        column: the column of the stencil origin (or an array that broadcasts against the stencil)
+
+    Returns:
+        the row and column of every cell that was drawn
+    """
+    _rows = stencil[0] + row
+    _columns = stencil[1] + column
+    _onMatrix = (_rows >= 0) & (_rows < buffer.shape[0]) & (_columns >= 0) & (_columns < buffer.shape[1])
+    _rows = _rows[_onMatrix]
+    _columns = _columns[_onMatrix]
+    if color is not None:
+        _color = np.asarray(color)
+        if _color.ndim > 1:
+            # one color per cell, e.g. one per entity broadcast over the entity's cells
+            _color = np.broadcast_to(_color, _onMatrix.shape + _color.shape[-1:])[_onMatrix]
+        buffer[_rows, _columns] = _color
+    return _rows, _columns
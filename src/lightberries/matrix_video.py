@@ -0,0 +1,562 @@
+"""Defines decoders and a background pipeline for playing video on matrices.
+
+Decoders turn GIFs, image sequences, and raw YUV4MPEG2 video (from a file or a
+pipe, e.g. ffmpeg -f yuv4mpegpipe) into RGB frames with durations. A pipeline
+decodes and resamples on a background thread through a cached ResampleMap,
+keeps at most a few frames ready, and hands them to MatrixController.play on
+time, dropping frames that are already late rather than falling behind.
+"""
+from __future__ import annotations
+import logging
+import os
+import queue
+import sys
+import threading
+import time
+from typing import BinaryIO, Callable, Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
+import numpy.typing
+from lightberries.exceptions import LightBerryException, MatrixVideoException
+from lightberries.matrix_resample import ASPECT_STRETCH, RESAMPLE_AREA, resampleMap
+
+LOGGER = logging.getLogger("lightBerries")
+# decoded frames the pipeline keeps ready ahead of the display
+DEFAULT_PREFETCH = 4
+# the frame rate of image sequences, and of video that does not say
+DEFAULT_FRAMES_PER_SECOND = 30.0
+# image files that are read without Pillow
+NETPBM_EXTENSIONS = (".pbm", ".pgm", ".ppm", ".pnm")
+# seconds the decoding thread waits on a full queue before checking whether it was stopped
+_QUEUE_POLL_SECONDS = 0.1
+# a decoded frame: (rows, columns, 3) RGB, and the seconds it is shown for
+Frame = Tuple[numpy.typing.NDArray[np.uint8], float]
+# marks that the frame after the current one has not been taken from the queue yet
+_NOT_FETCHED = object()
+
+
+def _readNetpbmToken(
+    data: bytes,
+    position: int,
+) -> tuple[bytes, int]:
+    """Read one whitespace separated header token, skipping comments.
+
+    Args:
+        data: the file contents
+        position: where to start reading
+
+    Returns:
+        the token and the position after it
+    """
+    while True:
+        while data[position : position + 1].isspace():
+            position += 1
+        if data[position : position + 1] != b"#":
+            break
+        position = data.index(b"\n", position)
+    _end = position
+    while _end < len(data) and not data[_end : _end + 1].isspace():
+        _end += 1
+    return data[position:_end], _end
+
+
+def readNetpbm(
+    path: str,
+) -> numpy.typing.NDArray[np.uint8]:
+    """Read a binary PGM or PPM image (P5 or P6, 8 bits per sample).
+
+    Args:
+        path: the image file
+
+    Returns:
+        the (rows, columns, 3) RGB image
+
+    Raises:
+        SystemExit: if exiting
+        KeyboardInterrupt: if user quits
+        LightBerryException: if propagating an exception
+        MatrixVideoException: if the file is not a supported netpbm image
+    """
+    try:
+        with open(path, "rb") as file:
+            _data = file.read()
+        _magic, _position = _readNetpbmToken(_data, 0)
+        if _magic not in (b"P5", b"P6"):
+            raise MatrixVideoException(f"{path} is not a binary PGM or PPM image")
+        _width, _position = _readNetpbmToken(_data, _position)
+        _height, _position = _readNetpbmToken(_data, _position)
+        _maxValue, _position = _readNetpbmToken(_data, _position)
+        if int(_maxValue) > 255:
+            raise MatrixVideoException(f"{path} has more than 8 bits per sample")
+        _channels = 3 if _magic == b"P6" else 1
+        _shape = (int(_height), int(_width), _channels)
+        # exactly one whitespace character separates the header from the samples
+        _image = np.frombuffer(_data, dtype=np.uint8, count=int(np.prod(_shape)), offset=_position + 1)
+        return np.broadcast_to(_image.reshape(_shape), _shape[:2] + (3,))
+    except SystemExit:  # pragma: no cover
+        raise
+    except KeyboardInterrupt:  # pragma: no cover
+        raise
+    except LightBerryException:
+        raise
+    except Exception as ex:
+        raise MatrixVideoException from ex
+
+
+def _pillowImage():
+    """Import Pillow's Image module, which is only needed for compressed formats.
+
+    Returns:
+        the PIL.Image module
+
+    Raises:
+        MatrixVideoException: if Pillow is not installed
+    """
+    try:
+        from PIL import Image
+    except ImportError as ex:
+        raise MatrixVideoException("Reading GIF, PNG, and JPEG files needs Pillow (pip install pillow)") from ex
+    return Image
+
+
+def loadImage(
+    path: str,
+) -> numpy.typing.NDArray[np.uint8]:
+    """Read an image file as RGB.
+
+    Args:
+        path: the image file, netpbm images are read directly and anything else through Pillow
+
+    Returns:
+        the (rows, columns, 3) RGB image
+
+    Raises:
+        SystemExit: if exiting
+        KeyboardInterrupt: if user quits
+        LightBerryException: if propagating an exception
+        MatrixVideoException: if something bad happens
+    """
+    try:
+        if path.lower().endswith(NETPBM_EXTENSIONS):
+            return readNetpbm(path)
+        with _pillowImage().open(path) as image:
+            return np.asarray(image.convert("RGB"))
+    except SystemExit:  # pragma: no cover
+        raise
+    except KeyboardInterrupt:  # pragma: no cover
+        raise
+    except LightBerryException:
+        raise
+    except Exception as ex:  # pragma: no cover
+        raise MatrixVideoException from ex
+
+
+class ImageSequenceDecoder:
+    """Shows a list of image files one after another at a fixed rate."""
+
+    def __init__(
+        self,
+        paths: Iterable[str],
+        framesPerSecond: float = DEFAULT_FRAMES_PER_SECOND,
+    ) -> None:
+        """Create a decoder.
+
+        Args:
+            paths: the image files in order
+            framesPerSecond: the rate to show them at
+        """
+        self.paths: list[str] = list(paths)
+        self.framesPerSecond: float = float(framesPerSecond)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Frame]:
+        """Read each image when it is needed.
+
+        Returns:
+            the images and their durations
+        """
+        for path in self.paths:
+            yield loadImage(path), 1.0 / self.framesPerSecond
+
+
+class GIFDecoder:
+    """Reads the frames of an animated GIF (or any format Pillow can animate) with their own durations."""
+
+    def __init__(
+        self,
+        path: str,
+    ) -> None:
+        """Create a decoder.
+
+        Args:
+            path: the image file
+        """
+        self.path: str = path
+
+    def __iter__(
+        self,
+    ) -> Iterator[Frame]:  # pragma: no cover
+        """Read each frame when it is needed.
+
+        Returns:
+            the frames and their durations
+        """
+        with _pillowImage().open(self.path) as image:
+            for index in range(getattr(image, "n_frames", 1)):
+                image.seek(index)
+                _duration = image.info.get("duration") or 1000.0 / DEFAULT_FRAMES_PER_SECOND
+                yield np.asarray(image.convert("RGB")), _duration / 1000.0
+
+
+class Y4MDecoder:
+    """Reads raw 8 bit YUV4MPEG2 video, e.g. from ffmpeg -f yuv4mpegpipe, from a file or a pipe."""
+
+    def __init__(
+        self,
+        source: Union[str, BinaryIO],
+    ) -> None:
+        """Create a decoder.
+
+        Args:
+            source: a file name, "-" for standard input, or a binary stream
+        """
+        self.source: Union[str, BinaryIO] = source
+        self.width: int = 0
+        self.height: int = 0
+        self.framesPerSecond: float = DEFAULT_FRAMES_PER_SECOND
+        self.colorSpace: str = "420jpeg"
+        self.fullRange: bool = False
+
+    def _readHeader(
+        self,
+        stream: BinaryIO,
+    ) -> None:
+        """Read the stream header.
+
+        Args:
+            stream: the video
+
+        Raises:
+            MatrixVideoException: if the stream is not 8 bit YUV4MPEG2
+        """
+        _fields = stream.readline().split()
+        if not _fields or _fields[0] != b"YUV4MPEG2":
+            raise MatrixVideoException("Stream is not YUV4MPEG2")
+        for field in _fields[1:]:
+            _tag, _value = chr(field[0]), field[1:].decode()
+            if _tag == "W":
+                self.width = int(_value)
+            elif _tag == "H":
+                self.height = int(_value)
+            elif _tag == "F":
+                _numerator, _denominator = _value.split(":")
+                self.framesPerSecond = int(_numerator) / int(_denominator)
+            elif _tag == "C":
+                self.colorSpace = _value
+            elif _tag == "X" and _value.upper() == "COLORRANGE=FULL":
+                self.fullRange = True
+        if not self.colorSpace.startswith(("420", "422", "444", "mono")) or "p1" in self.colorSpace:
+            raise MatrixVideoException(f"Unsupported YUV4MPEG2 color space: {self.colorSpace}")
+
+    def _toRGB(
+        self,
+        data: bytes,
+    ) -> numpy.typing.NDArray[np.uint8]:
+        """Convert the planes of one frame to RGB.
+
+        Args:
+            data: the Y, U, and V planes
+
+        Returns:
+            the (rows, columns, 3) RGB frame
+        """
+        _height, _width = self.height, self.width
+        _luma = np.frombuffer(data, dtype=np.uint8, count=_height * _width).reshape((_height, _width))
+        _luma = _luma.astype(np.float32)
+        if self.colorSpace.startswith("mono"):
+            _red = _green = _blue = _luma
+        else:
+            _rowStep = 2 if self.colorSpace.startswith("420") else 1
+            _columnStep = 1 if self.colorSpace.startswith("444") else 2
+            _chromaShape = (-(-_height // _rowStep), -(-_width // _columnStep))
+            _planes = np.frombuffer(data, dtype=np.uint8, offset=_height * _width).reshape((2,) + _chromaShape)
+            # chroma is sampled at lower resolution, repeat it back up to the luma size
+            _chroma = _planes.repeat(_rowStep, axis=1).repeat(_columnStep, axis=2)[:, :_height, :_width]
+            _u, _v = _chroma.astype(np.float32) - 128.0
+            if not self.fullRange:
+                _luma = (_luma - 16.0) * (255.0 / 219.0)
+                _u *= 255.0 / 224.0
+                _v *= 255.0 / 224.0
+            # ITU-R BT.601
+            _red = _luma + 1.402 * _v
+            _green = _luma - 0.344136 * _u - 0.714136 * _v
+            _blue = _luma + 1.772 * _u
+        _rgb = np.stack((_red, _green, _blue), axis=-1)
+        return np.clip(_rgb, 0, 255, out=_rgb).astype(np.uint8)
+
+    def __iter__(
+        self,
+    ) -> Iterator[Frame]:
+        """Read each frame when it is needed.
+
+        Returns:
+            the frames and their durations
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixVideoException: if something bad happens
+        """
+        try:
+            if isinstance(self.source, str):
+                _stream = sys.stdin.buffer if self.source == "-" else open(self.source, "rb")
+            else:
+                _stream = self.source
+            try:
+                self._readHeader(_stream)
+                _lumaSize = self.width * self.height
+                if self.colorSpace.startswith("mono"):
+                    _frameSize = _lumaSize
+                else:
+                    _rowStep = 2 if self.colorSpace.startswith("420") else 1
+                    _columnStep = 1 if self.colorSpace.startswith("444") else 2
+                    _frameSize = _lumaSize + 2 * (-(-self.height // _rowStep)) * (-(-self.width // _columnStep))
+                while True:
+                    _marker = _stream.readline()
+                    if not _marker:
+                        return
+                    if not _marker.startswith(b"FRAME"):
+                        raise MatrixVideoException("Lost sync with the YUV4MPEG2 stream")
+                    _data = _stream.read(_frameSize)
+                    if len(_data) < _frameSize:
+                        return
+                    yield self._toRGB(_data), 1.0 / self.framesPerSecond
+            finally:
+                if isinstance(self.source, str) and self.source != "-":
+                    _stream.close()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixVideoException from ex
+
+
+def openVideo(
+    source: Union[str, BinaryIO, Iterable[str]],
+    framesPerSecond: float = DEFAULT_FRAMES_PER_SECOND,
+) -> Iterable[Frame]:
+    """Pick a decoder for a source.
+
+    Args:
+        source: a .y4m file, "-" or a binary stream of YUV4MPEG2, a directory or list of images,
+            or a single image or animation
+        framesPerSecond: the rate of image sequences
+
+    Returns:
+        the decoder
+    """
+    if not isinstance(source, str):
+        if hasattr(source, "read"):
+            return Y4MDecoder(source)
+        return ImageSequenceDecoder(source, framesPerSecond)
+    if source == "-" or source.lower().endswith(".y4m"):
+        return Y4MDecoder(source)
+    if os.path.isdir(source):
+        return ImageSequenceDecoder(sorted(os.path.join(source, name) for name in os.listdir(source)), framesPerSecond)
+    if source.lower().endswith(NETPBM_EXTENSIONS):
+        return ImageSequenceDecoder([source], framesPerSecond)
+    return GIFDecoder(source)
+
+
+class VideoPipeline:
+    """Decodes and resamples frames on a background thread, and hands them out on time.
+
+    The decoding thread stays at most prefetch frames ahead of the display. When
+    the display falls behind (or the video has more frames per second than the
+    target rate) a frame is dropped if the one after it is decoded and already due.
+    Iterating the pipeline yields frames shaped like the virtual LED buffer, for
+    MatrixController.play.
+    """
+
+    def __init__(
+        self,
+        decoder: Iterable[Frame],
+        targetShape: tuple[int, int],
+        method: str = RESAMPLE_AREA,
+        quarterTurns: int = 0,
+        framesPerSecond: Optional[float] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        aspect: str = ASPECT_STRETCH,
+        loop: bool = False,
+        clock: Callable[[], float] = time.perf_counter,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Create a pipeline (iterating it starts decoding).
+
+        Args:
+            decoder: the source of RGB frames and durations
+            targetShape: the rows and columns of the virtual LED buffer
+            method: the resampling method, see matrix_resample
+            quarterTurns: counterclockwise quarter turns applied to every frame
+            framesPerSecond: the most frames to show per second, None for the video's own rate
+            prefetch: the most frames decoded ahead of the display
+            aspect: how frames of another aspect ratio are fit to the matrix, see matrix_resample
+            loop: set true to start the video over when it ends
+            clock: the time source, in seconds
+            sleep: waits for a number of seconds
+        """
+        self.decoder: Iterable[Frame] = decoder
+        self.targetShape: tuple[int, int] = (int(targetShape[0]), int(targetShape[1]))
+        self.method: str = method
+        self.quarterTurns: int = int(quarterTurns)
+        self.aspect: str = aspect
+        self.framesPerSecond: Optional[float] = framesPerSecond
+        self.loop: bool = loop
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        self.droppedFrameCount: int = 0
+        self.shownFrameCount: int = 0
+        self.privateQueue: queue.Queue = queue.Queue(maxsize=max(1, int(prefetch)))
+        self.privateStop: threading.Event = threading.Event()
+        self.privateThread: Optional[threading.Thread] = None
+
+    def _put(
+        self,
+        item: object,
+    ) -> bool:
+        """Queue an item for the display, waiting while the queue is full.
+
+        Args:
+            item: a (time, frame) pair, an exception, or None at the end
+
+        Returns:
+            False if the pipeline was stopped while waiting
+        """
+        while not self.privateStop.is_set():
+            try:
+                self.privateQueue.put(item, timeout=_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _decode(
+        self,
+    ) -> None:
+        """Decode and resample frames until the video ends or the pipeline is stopped."""
+        try:
+            _time = 0.0
+            while True:
+                _frames = 0
+                for image, duration in self.decoder:
+                    _map = resampleMap(
+                        image.shape[:2], self.targetShape, self.method, self.quarterTurns, aspect=self.aspect
+                    )
+                    if not self._put((_time, _map.apply(image))):
+                        return
+                    _time += duration
+                    _frames += 1
+                if not self.loop or _frames == 0:
+                    break
+            self._put(None)
+        except Exception as ex:
+            # hand the error to the display side, which raises it
+            self._put(ex)
+
+    def start(
+        self,
+    ) -> None:
+        """Start decoding on a background thread."""
+        if self.privateThread is None:
+            self.privateStop.clear()
+            self.privateThread = threading.Thread(target=self._decode, name="lightberries-video", daemon=True)
+            self.privateThread.start()
+
+    def stop(
+        self,
+    ) -> None:
+        """Stop the decoding thread and discard the frames it decoded."""
+        self.privateStop.set()
+        if self.privateThread is not None:
+            # a decoder blocked reading a pipe can't be interrupted, the thread is a daemon so just leave it
+            self.privateThread.join(timeout=1.0)
+            self.privateThread = None
+        while not self.privateQueue.empty():
+            self.privateQueue.get_nowait()
+
+    def _get(
+        self,
+    ) -> Optional[tuple[float, np.ndarray]]:
+        """Wait for the next decoded frame.
+
+        Returns:
+            the (time, frame) pair, or None at the end of the video
+
+        Raises:
+            MatrixVideoException: if decoding failed
+        """
+        _item = self.privateQueue.get()
+        if isinstance(_item, Exception):
+            if isinstance(_item, LightBerryException):
+                raise _item
+            raise MatrixVideoException from _item
+        return _item
+
+    def __iter__(
+        self,
+    ) -> Iterator[numpy.typing.NDArray[np.float32]]:
+        """Yield each frame when it is due.
+
+        Returns:
+            frames shaped like the virtual LED buffer
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MatrixVideoException: if something bad happens
+        """
+        try:
+            self.start()
+            _period = 1.0 / self.framesPerSecond if self.framesPerSecond else 0.0
+            _current = self._get()
+            if _current is None:
+                return
+            # video time zero is now
+            _start = self.clock() - _current[0]
+            _lastShown = -np.inf
+            while _current is not None:
+                # the earliest video time the next frame can be shown at
+                _slot = max(self.clock() - _start, _lastShown + _period)
+                _next = _NOT_FETCHED
+                # skip frames whose successor is already decoded and due, never waiting for one
+                while not self.privateQueue.empty():
+                    _item = self._get()
+                    if _item is None or _item[0] > _slot:
+                        _next = _item
+                        break
+                    self.droppedFrameCount += 1
+                    _current = _item
+                _wait = max(_current[0], _lastShown + _period) - (self.clock() - _start)
+                if _wait > 0:
+                    self.sleep(_wait)
+                _lastShown = self.clock() - _start
+                self.shownFrameCount += 1
+                yield _current[1]
+                if _next is _NOT_FETCHED:
+                    _next = self._get()
+                _current = _next
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MatrixVideoException from ex
+        finally:
+            self.stop()
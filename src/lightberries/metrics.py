@@ -0,0 +1,520 @@
+"""Defines counters, gauges, and histograms that can be exported in Prometheus text format.
+
+Metrics are updated from the render loop with plain attribute arithmetic, no locks and
+no allocation, so recording a frame costs a few microseconds. Exporting reads the same
+attributes from any thread; a scrape may see one frame's update half applied, which is
+fine for monitoring.
+"""
+from __future__ import annotations
+import logging
+import os
+import re
+from bisect import bisect_left
+from typing import Optional, Sequence
+from lightberries.exceptions import LightBerryException, MetricsException
+
+LOGGER = logging.getLogger("lightBerries")
+METRIC_NAME_PATTERN = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+# seconds, chosen around a 60 frames per second budget
+DEFAULT_TIME_BUCKETS = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.033, 0.066, 0.133, 0.25, 0.5, 1.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Metric:
+    """The parts shared by every metric type."""
+
+    TYPE = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+    ) -> None:
+        """Create a metric.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+
+        Raises:
+            MetricsException: if the name is not a valid metric name
+        """
+        if not METRIC_NAME_PATTERN.match(name):
+            raise MetricsException(f"Invalid metric name: {name}")
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelNames: tuple[str, ...] = tuple(labelNames)
+        self.privateChildren: dict[tuple[str, ...], Metric] = {}
+
+    def labels(
+        self,
+        *labelValues: str,
+    ) -> Metric:
+        """Get the child metric for one combination of label values.
+
+        Args:
+            labelValues: one value for each label name
+
+        Returns:
+            the child metric
+
+        Raises:
+            MetricsException: if the wrong number of label values is given
+        """
+        try:
+            return self.privateChildren[labelValues]
+        except KeyError:
+            if len(labelValues) != len(self.labelNames):
+                raise MetricsException(f"{self.name} expects labels {self.labelNames}")
+            child = self._createChild()
+            self.privateChildren[tuple(labelValues)] = child
+            return child
+
+    def _createChild(
+        self,
+    ) -> Metric:
+        return self.__class__(self.name, self.documentation)
+
+    def _samples(
+        self,
+        labelText: str,
+    ) -> list[str]:
+        return []
+
+    def expose(
+        self,
+    ) -> str:
+        """Format the metric in Prometheus text exposition format.
+
+        Returns:
+            the HELP, TYPE, and sample lines
+        """
+        _lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+        if self.labelNames:
+            for labelValues, child in list(self.privateChildren.items()):
+                _labelText = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.labelNames, labelValues))
+                _lines.extend(child._samples(_labelText))
+        else:
+            _lines.extend(self._samples(""))
+        return "\n".join(_lines) + "\n"
+
+
+class Counter(Metric):
+    """A value that only goes up."""
+
+    TYPE = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+    ) -> None:
+        """Create a counter.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+        """
+        super().__init__(name, documentation, labelNames)
+        self.value: float = 0.0
+
+    def inc(
+        self,
+        amount: float = 1.0,
+    ) -> None:
+        """Add to the counter.
+
+        Args:
+            amount: a non-negative amount to add
+        """
+        self.value += amount
+
+    def _samples(
+        self,
+        labelText: str,
+    ) -> list[str]:
+        return [f"{_sampleName(self.name, labelText)} {_format(self.value)}"]
+
+
+class Gauge(Metric):
+    """A value that can go up and down."""
+
+    TYPE = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+    ) -> None:
+        """Create a gauge.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+        """
+        super().__init__(name, documentation, labelNames)
+        self.value: float = 0.0
+
+    def set(
+        self,
+        value: float,
+    ) -> None:
+        """Set the gauge.
+
+        Args:
+            value: the new value
+        """
+        self.value = value
+
+    def _samples(
+        self,
+        labelText: str,
+    ) -> list[str]:
+        return [f"{_sampleName(self.name, labelText)} {_format(self.value)}"]
+
+
+class Histogram(Metric):
+    """Counts observations in buckets so percentiles can be computed by the monitoring system."""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_TIME_BUCKETS,
+    ) -> None:
+        """Create a histogram.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+            buckets: the upper bounds of the buckets, in increasing order (+Inf is implied)
+
+        Raises:
+            MetricsException: if the buckets are not in increasing order
+        """
+        super().__init__(name, documentation, labelNames)
+        if list(buckets) != sorted(buckets):
+            raise MetricsException(f"{name} buckets must be in increasing order")
+        self.buckets: list[float] = list(buckets)
+        # the last count is the +Inf bucket
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.sum: float = 0.0
+
+    def _createChild(
+        self,
+    ) -> Metric:
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(
+        self,
+        value: float,
+    ) -> None:
+        """Record one observation.
+
+        Args:
+            value: the observed value
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @property
+    def count(
+        self,
+    ) -> int:
+        """The number of observations.
+
+        Returns:
+            the number of observations
+        """
+        return sum(self.counts)
+
+    def _samples(
+        self,
+        labelText: str,
+    ) -> list[str]:
+        _separator = "," if labelText else ""
+        _lines = []
+        _cumulative = 0
+        for bound, count in zip(self.buckets + [float("inf")], self.counts):
+            _cumulative += count
+            _lines.append(f'{self.name}_bucket{{{labelText}{_separator}le="{_format(bound)}"}} {_cumulative}')
+        _lines.append(f"{_sampleName(self.name + '_sum', labelText)} {_format(self.sum)}")
+        _lines.append(f"{_sampleName(self.name + '_count', labelText)} {_cumulative}")
+        return _lines
+
+
+class MetricsRegistry:
+    """A collection of metrics exported together."""
+
+    def __init__(
+        self,
+    ) -> None:
+        """Create an empty registry."""
+        self.metrics: dict[str, Metric] = {}
+
+    def register(
+        self,
+        metric: Metric,
+    ) -> Metric:
+        """Add a metric to the registry.
+
+        Args:
+            metric: the metric
+
+        Returns:
+            the same metric
+
+        Raises:
+            MetricsException: if a metric with that name already exists
+        """
+        if metric.name in self.metrics:
+            raise MetricsException(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+    ) -> Counter:
+        """Create and register a counter.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+
+        Returns:
+            the counter
+        """
+        return self.register(Counter(name, documentation, labelNames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+    ) -> Gauge:
+        """Create and register a gauge.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+
+        Returns:
+            the gauge
+        """
+        return self.register(Gauge(name, documentation, labelNames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelNames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_TIME_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram.
+
+        Args:
+            name: the metric name
+            documentation: the HELP text
+            labelNames: names of the labels that divide this metric into children
+            buckets: the upper bounds of the buckets
+
+        Returns:
+            the histogram
+        """
+        return self.register(Histogram(name, documentation, labelNames, buckets))
+
+    def expose(
+        self,
+    ) -> str:
+        """Format every metric in Prometheus text exposition format.
+
+        Returns:
+            the exposition text
+        """
+        return "".join(metric.expose() for metric in list(self.metrics.values()))
+
+    def writeTextfile(
+        self,
+        path: str,
+    ) -> None:
+        """Write the metrics for the node_exporter textfile collector.
+
+        The file is replaced atomically so the collector never reads a partial file.
+
+        Args:
+            path: the .prom file to write
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            MetricsException: if something bad happens
+        """
+        import tempfile
+
+        _temporaryPath: Optional[str] = None
+        try:
+            _descriptor, _temporaryPath = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(path)), prefix=".lightberries", suffix=".prom"
+            )
+            with os.fdopen(_descriptor, "w") as textfile:
+                textfile.write(self.expose())
+            os.replace(_temporaryPath, path)
+            _temporaryPath = None
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise MetricsException from ex
+        finally:
+            if _temporaryPath is not None:  # pragma: no cover
+                os.unlink(_temporaryPath)
+
+
+class ControllerMetrics(MetricsRegistry):
+    """The metrics every controller records about its render loop."""
+
+    # rough WS2812 figures, adjust for other LEDs
+    MILLIAMPS_PER_CHANNEL: float = 20.0
+    MILLIAMPS_IDLE_PER_LED: float = 1.0
+    # smoothing for the frame rate gauge
+    FRAME_RATE_SMOOTHING: float = 0.1
+
+    def __init__(
+        self,
+        brightness: float = 1.0,
+    ) -> None:
+        """Create the controller metrics.
+
+        Args:
+            brightness: the LED string brightness, used to estimate current draw
+        """
+        super().__init__()
+        self.brightness: float = float(brightness)
+        self.framesTotal = self.counter("lightberries_frames_total", "Frames sent to the LEDs.")
+        self.droppedFramesTotal = self.counter(
+            "lightberries_dropped_frames_total", "Streamed or video frames skipped without being shown."
+        )
+        self.frameSeconds = self.histogram("lightberries_frame_seconds", "Time between frames sent to the LEDs.")
+        self.workSeconds = self.histogram(
+            "lightberries_frame_work_seconds", "Time spent computing and compositing each frame."
+        )
+        self.outputSeconds = self.histogram("lightberries_output_seconds", "Time spent sending each frame out.")
+        self.framesPerSecond = self.gauge("lightberries_frames_per_second", "Smoothed frame rate.")
+        self.functionSeconds = self.counter(
+            "lightberries_function_cpu_seconds_total", "CPU time spent in each light function.", ("function",)
+        )
+        self.estimatedAmps = self.gauge(
+            "lightberries_estimated_current_amps", "Estimated current drawn by the LEDs for the last frame."
+        )
+        self.privateLastFrame: Optional[float] = None
+
+    def recordLevels(
+        self,
+        levelSum: float,
+        ledCount: int,
+    ) -> None:
+        """Estimate current draw from the sum of every channel of the frame.
+
+        Args:
+            levelSum: the sum of the R, G, and B values (0-255) of every LED
+            ledCount: the number of LEDs
+        """
+        self.estimatedAmps.value = (
+            levelSum * self.brightness * (self.MILLIAMPS_PER_CHANNEL / 255.0) + ledCount * self.MILLIAMPS_IDLE_PER_LED
+        ) / 1000.0
+
+    def recordFrame(
+        self,
+        start: float,
+        end: float,
+        workSeconds: float,
+    ) -> None:
+        """Record a frame being sent out.
+
+        The work is passed in rather than accumulated here because runAsync sends a frame
+        from its worker thread while the next frame is being built.
+
+        Args:
+            start: perf_counter time before the frame was sent
+            end: perf_counter time after the frame was sent
+            workSeconds: the time spent computing and compositing the frame
+        """
+        self.framesTotal.value += 1
+        self.outputSeconds.observe(end - start)
+        self.workSeconds.observe(workSeconds)
+        if self.privateLastFrame is not None and end > self.privateLastFrame:
+            self.frameSeconds.observe(end - self.privateLastFrame)
+            _rate = 1.0 / (end - self.privateLastFrame)
+            if self.framesPerSecond.value:
+                _rate = self.framesPerSecond.value + self.FRAME_RATE_SMOOTHING * (_rate - self.framesPerSecond.value)
+            self.framesPerSecond.value = _rate
+        self.privateLastFrame = end
+
+
+def _sampleName(
+    name: str,
+    labelText: str,
+) -> str:
+    """Attach labels to a sample name.
+
+    Args:
+        name: the sample name
+        labelText: the formatted labels, possibly empty
+
+    Returns:
+        the sample name with labels
+    """
+    if labelText:
+        return f"{name}{{{labelText}}}"
+    return name
+
+
+def _format(
+    value: float,
+) -> str:
+    """Format a sample value the way Prometheus expects.
+
+    Args:
+        value: the value
+
+    Returns:
+        the formatted value
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if value == float("-inf"):
+        return "-Inf"
+    return repr(float(value))
+
+
+def _escape(
+    value: str,
+) -> str:
+    """Escape a label value.
+
+    Args:
+        value: the label value
+
+    Returns:
+        the escaped label value
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
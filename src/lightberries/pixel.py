@@ -287,13 +287,22 @@ class PixelColors:
 
     @static_pixel_property
     def PSEUDO_RANDOM() -> Pixel:
-        clrs = [
-            getattr(PixelColors, p)
-            for p in dir(PixelColors)
-            if "__" not in p and "random" not in p.lower() and "off" not in p.lower()
-        ]
+        clrs = PseudoRandomPalette()
         return clrs[random.randint(0, len(clrs) - 1)]
 
     @static_pixel_property
     def RANDOM() -> Pixel:
         return Pixel([random.randint(0, 255), random.randint(0, 255), random.randint(0, 255)])
+
+
+def PseudoRandomPalette() -> list[Pixel]:
+    """The named colors PixelColors.PSEUDO_RANDOM picks from (every color except off).
+
+    Returns:
+        the colors
+    """
+    return [
+        getattr(PixelColors, p)
+        for p in dir(PixelColors)
+        if "__" not in p and "random" not in p.lower() and "off" not in p.lower()
+    ]
@@ -22,6 +22,7 @@ class PixelStrip:
             _: ignored
             kwargs: ignored
         """
+        self.brightness = int(kwargs.get("brightness", 255))
         if "num" in kwargs:
             self.count = kwargs["num"]  # pragma: no cover
 
@@ -53,6 +54,22 @@ class PixelStrip:
         """
         return self.fake[index]
 
+    def setBrightness(self, brightness: int):
+        """Fake method.
+
+        Args:
+            brightness: saved
+        """
+        self.brightness = brightness
+
+    def getBrightness(self) -> int:
+        """Fake method.
+
+        Returns:
+            saved brightness
+        """
+        return self.brightness
+
     def show(self):
         """Fake method."""
         pass  # pylint: disable = unnecessary-pass
@@ -0,0 +1,563 @@
+"""Defines a headless stand in for rpi_ws281x.PixelStrip, for developing and benchmarking shows without LEDs.
+
+SimulatedPixelStrip keeps the packed LED colors in a numpy array and, each time show
+is called, renders them into an RGB image with one gather through a cached map of
+LED indices. Every rendered image is handed to the strip's outputs:
+
+    PNGSequenceWriter  saves numbered PNG files
+    PreviewServer      streams the images to a browser on localhost as
+                       multipart/x-mixed-replace (the way MJPEG cameras stream),
+                       so http://127.0.0.1:8282/ can be opened in a browser
+
+PNG files are written with zlib, so no imaging library is needed.
+"""
+from __future__ import annotations
+import http.server
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable, Optional, Sequence
+import numpy as np
+import numpy.typing
+from lightberries.exceptions import LightBerryException, SimulatorException
+
+LOGGER = logging.getLogger("lightBerries")
+# the width and height in image pixels of one LED
+DEFAULT_LED_SCALE = 8
+DEFAULT_PREVIEW_HOST = "127.0.0.1"
+DEFAULT_PREVIEW_PORT = 8282
+# the most images per second sent to preview clients, rendering itself is not limited
+DEFAULT_PREVIEW_FRAMES_PER_SECOND = 30.0
+# zlib level 1 is several times faster than the default and the images are mostly flat color
+DEFAULT_COMPRESSION_LEVEL = 1
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PREVIEW_BOUNDARY = "lightberries-frame"
+# how long a preview client waits for a frame before checking whether the server stopped
+_PREVIEW_POLL_SECONDS = 0.5
+# bit shifts of red, green, and blue in a packed LED color
+_CHANNEL_SHIFTS = np.array([16, 8, 0], dtype=np.uint32)
+
+
+def _pngChunk(
+    kind: bytes,
+    data: bytes,
+) -> bytes:
+    """Frame one PNG chunk with its length and checksum.
+
+    Args:
+        kind: the four letter chunk type
+        data: the chunk contents
+
+    Returns:
+        the chunk bytes
+    """
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(data, zlib.crc32(kind)))
+
+
+def encodePNG(
+    image: numpy.typing.NDArray[np.uint8],
+    compressionLevel: int = DEFAULT_COMPRESSION_LEVEL,
+) -> bytes:
+    """Encode an RGB image as an 8 bit truecolor PNG.
+
+    Args:
+        image: the (rows, columns, 3) uint8 image
+        compressionLevel: the zlib compression level, 0 (none) to 9 (smallest)
+
+    Returns:
+        the PNG file contents
+
+    Raises:
+        SystemExit: if exiting
+        KeyboardInterrupt: if user quits
+        LightBerryException: if propagating an exception
+        SimulatorException: if something bad happens
+    """
+    try:
+        _rows, _columns = image.shape[:2]
+        # every scanline starts with its filter type, 0 for none
+        _scanlines = np.zeros((_rows, 1 + _columns * 3), dtype=np.uint8)
+        _scanlines[:, 1:] = image.reshape((_rows, _columns * 3))
+        _header = struct.pack(">IIBBBBB", _columns, _rows, 8, 2, 0, 0, 0)
+        return (
+            PNG_SIGNATURE
+            + _pngChunk(b"IHDR", _header)
+            + _pngChunk(b"IDAT", zlib.compress(_scanlines.tobytes(), compressionLevel))
+            + _pngChunk(b"IEND", b"")
+        )
+    except SystemExit:  # pragma: no cover
+        raise
+    except KeyboardInterrupt:  # pragma: no cover
+        raise
+    except LightBerryException:  # pragma: no cover
+        raise
+    except Exception as ex:  # pragma: no cover
+        raise SimulatorException from ex
+
+
+class SimulatedPixelStrip:
+    """Implements the rpi_ws281x.PixelStrip interface by rendering the LEDs into an RGB image."""
+
+    def __init__(
+        self,
+        num: int,
+        *_,
+        brightness: int = 255,
+        layout: Optional[numpy.typing.NDArray[np.int_]] = None,
+        scale: int = DEFAULT_LED_SCALE,
+        outputs: Optional[Sequence[Any]] = None,
+        **kwargs,
+    ) -> None:
+        """Create a simulated strip.
+
+        Args:
+            num: the number of LEDs
+            _: ignored, the GPIO settings of rpi_ws281x.PixelStrip
+            brightness: the brightness applied to every LED, 0 to 255
+            layout: the LED index shown at each (row, column) of the image, a single row of LEDs if None
+            scale: the width and height in image pixels of one LED
+            outputs: objects with a write(image) method that receive every rendered image
+            kwargs: ignored, the GPIO settings of rpi_ws281x.PixelStrip
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            self.privateColors: np.ndarray = np.zeros(int(num), dtype=np.uint32)
+            self.brightness: int = int(brightness)
+            self.scale: int = max(1, int(scale))
+            self.outputs: list[Any] = list(outputs or [])
+            self.frameCount: int = 0
+            # the last palette entry is black, for image pixels that show no LED
+            self.privatePalette: np.ndarray = np.zeros((int(num) + 1, 3), dtype=np.uint8)
+            self.privatePixelMap: np.ndarray = np.zeros((0, 0), dtype=np.intp)
+            self.image: np.ndarray = np.zeros((0, 0, 3), dtype=np.uint8)
+            self.setLayout(layout)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+    def setLayout(
+        self,
+        layout: Optional[numpy.typing.NDArray[np.int_]] = None,
+    ) -> None:
+        """Choose where each LED appears in the image.
+
+        Args:
+            layout: the LED index shown at each (row, column) of the image, indices outside
+                the strip are drawn black, a single row of LEDs if None
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            _count = len(self.privateColors)
+            if layout is None:
+                layout = np.arange(_count)[None, :]
+            _layout = np.asarray(layout, dtype=np.intp)
+            if _layout.ndim != 2:
+                raise SimulatorException(f"Layout must be (rows, columns), not {_layout.shape}")
+            _layout = np.where((_layout >= 0) & (_layout < _count), _layout, _count)
+            self.privatePixelMap = np.ascontiguousarray(_layout.repeat(self.scale, axis=0).repeat(self.scale, axis=1))
+            self.image = np.zeros(self.privatePixelMap.shape + (3,), dtype=np.uint8)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+    def begin(self) -> None:
+        """Nothing to initialize."""
+        pass  # pylint: disable = unnecessary-pass
+
+    def numPixels(self) -> int:
+        """The number of LEDs.
+
+        Returns:
+            the number of LEDs
+        """
+        return len(self.privateColors)
+
+    def setPixelColor(
+        self,
+        index: int,
+        color: int,
+    ) -> None:
+        """Set one LED.
+
+        Args:
+            index: the LED index
+            color: the packed 24 bit color
+        """
+        self.privateColors[index] = color
+
+    def setPixelColors(
+        self,
+        indices: numpy.typing.NDArray[np.int_],
+        colors: numpy.typing.NDArray[np.uint32],
+    ) -> None:
+        """Set many LEDs at once (WS281xString.setPixelArray uses this instead of a loop when it exists).
+
+        Args:
+            indices: the LED indices
+            colors: the packed 24 bit colors
+        """
+        self.privateColors[indices] = colors
+
+    def getPixelColor(
+        self,
+        index: int,
+    ) -> int:
+        """Get one LED.
+
+        Args:
+            index: the LED index
+
+        Returns:
+            the packed 24 bit color
+        """
+        return int(self.privateColors[index])
+
+    def setBrightness(
+        self,
+        brightness: int,
+    ) -> None:
+        """Set the brightness applied to every LED.
+
+        Args:
+            brightness: 0 to 255
+        """
+        self.brightness = int(brightness)
+
+    def getBrightness(self) -> int:
+        """Get the brightness applied to every LED.
+
+        Returns:
+            0 to 255
+        """
+        return self.brightness
+
+    def show(self) -> None:
+        """Render the LEDs into the image and hand it to every output.
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            # unpack, then scale by brightness the way the ws281x driver does
+            _channels = (self.privateColors[:, None] >> _CHANNEL_SHIFTS) & 0xFF
+            _channels = (_channels * (self.brightness + 1)) >> 8
+            np.copyto(self.privatePalette[:-1], _channels, casting="unsafe")
+            np.take(self.privatePalette, self.privatePixelMap, axis=0, out=self.image)
+            self.frameCount += 1
+            for output in self.outputs:
+                output.write(self.image)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+    def _cleanup(self) -> None:
+        """Nothing to free."""
+        pass  # pylint: disable = unnecessary-pass
+
+
+class PNGSequenceWriter:
+    """Saves every image it is given as a numbered PNG file."""
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "frame",
+        compressionLevel: int = DEFAULT_COMPRESSION_LEVEL,
+    ) -> None:
+        """Create a writer (the directory is created if needed).
+
+        Args:
+            directory: where to save the files
+            prefix: the start of each file name, followed by a six digit frame number
+            compressionLevel: the zlib compression level, 0 (none) to 9 (smallest)
+        """
+        self.directory: str = directory
+        self.prefix: str = prefix
+        self.compressionLevel: int = int(compressionLevel)
+        self.frameCount: int = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write(
+        self,
+        image: numpy.typing.NDArray[np.uint8],
+    ) -> None:
+        """Save one image.
+
+        Args:
+            image: the (rows, columns, 3) uint8 image
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            _path = os.path.join(self.directory, f"{self.prefix}{self.frameCount:06d}.png")
+            with open(_path, "wb") as pngFile:
+                pngFile.write(encodePNG(image, self.compressionLevel))
+            self.frameCount += 1
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+
+class _PreviewRequestHandler(http.server.BaseHTTPRequestHandler):
+    """Streams the newest image of the PreviewServer that owns the HTTP server."""
+
+    def do_GET(self) -> None:  # noqa N802
+        """Stream images until the client disconnects or the server stops."""
+        preview: PreviewServer = self.server.preview
+        if self.path.split("?")[0] not in ("/", "/stream"):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", f"multipart/x-mixed-replace; boundary={PREVIEW_BOUNDARY}")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        preview._addClient(1)
+        try:
+            _frameNumber = 0
+            while True:
+                _frameNumber, _png = preview._nextFrame(_frameNumber)
+                if _png is None:
+                    break
+                self.wfile.write(
+                    (f"--{PREVIEW_BOUNDARY}\r\nContent-Type: image/png\r\nContent-Length: {len(_png)}\r\n\r\n").encode()
+                    + _png
+                    + b"\r\n"
+                )
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            preview._addClient(-1)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        """Send request logs to the lightberries logger instead of stderr.
+
+        Args:
+            format: the message format
+            args: the message arguments
+        """
+        LOGGER.debug("%s %s", self.address_string(), format % args)
+
+
+class PreviewServer:
+    """Streams rendered images to browsers on localhost, as multipart/x-mixed-replace PNG frames.
+
+    Images are only encoded while a client is connected, and at most
+    framesPerSecond times per second, so a fast simulation is not slowed down
+    by its preview.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_PREVIEW_HOST,
+        port: int = DEFAULT_PREVIEW_PORT,
+        framesPerSecond: float = DEFAULT_PREVIEW_FRAMES_PER_SECOND,
+        compressionLevel: int = DEFAULT_COMPRESSION_LEVEL,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Create a preview server (call start to begin serving).
+
+        Args:
+            host: the address to bind, loopback by default
+            port: the TCP port to bind, 0 picks a free port
+            framesPerSecond: the most images per second sent to clients
+            compressionLevel: the zlib compression level, 0 (none) to 9 (smallest)
+            clock: the time source, in seconds
+        """
+        self.host: str = host
+        self.port: int = int(port)
+        self.framesPerSecond: float = float(framesPerSecond)
+        self.compressionLevel: int = int(compressionLevel)
+        self.clock: Callable[[], float] = clock
+        self.privateCondition: threading.Condition = threading.Condition()
+        self.privateFrame: Optional[bytes] = None
+        self.privateFrameNumber: int = 0
+        self.privateFrameTime: float = -np.inf
+        self.privateClientCount: int = 0
+        self.privateStopped: bool = False
+        self.privateServer: Optional[http.server.ThreadingHTTPServer] = None
+        self.privateThread: Optional[threading.Thread] = None
+
+    @property
+    def address(
+        self,
+    ) -> tuple[str, int]:
+        """The bound host and port.
+
+        Returns:
+            the (host, port) clients connect to
+        """
+        if self.privateServer is not None:
+            return self.privateServer.server_address[:2]
+        return self.host, self.port
+
+    def start(
+        self,
+    ) -> None:
+        """Start serving on a background thread.
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            self.privateStopped = False
+            self.privateServer = http.server.ThreadingHTTPServer((self.host, self.port), _PreviewRequestHandler)
+            self.privateServer.daemon_threads = True
+            self.privateServer.preview = self
+            self.privateThread = threading.Thread(
+                target=self.privateServer.serve_forever, name="lightberries-preview", daemon=True
+            )
+            self.privateThread.start()
+            LOGGER.info("%s serving on http://%s:%d/", self.__class__.__name__, *self.address)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+    def stop(
+        self,
+    ) -> None:
+        """Disconnect every client and stop serving."""
+        with self.privateCondition:
+            self.privateStopped = True
+            self.privateCondition.notify_all()
+        if self.privateServer is not None:
+            self.privateServer.shutdown()
+            self.privateServer.server_close()
+            self.privateServer = None
+
+    def __enter__(
+        self,
+    ) -> "PreviewServer":
+        """Start serving.
+
+        Returns:
+            this server
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        *args,
+    ) -> None:
+        """Stop serving.
+
+        Args:
+            args: ignored
+        """
+        self.stop()
+
+    def write(
+        self,
+        image: numpy.typing.NDArray[np.uint8],
+    ) -> None:
+        """Offer an image to the connected clients.
+
+        Args:
+            image: the (rows, columns, 3) uint8 image
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            SimulatorException: if something bad happens
+        """
+        try:
+            if not self.privateClientCount:
+                return
+            _now = self.clock()
+            if self.framesPerSecond and _now - self.privateFrameTime < 1.0 / self.framesPerSecond:
+                return
+            _png = encodePNG(image, self.compressionLevel)
+            with self.privateCondition:
+                self.privateFrame = _png
+                self.privateFrameNumber += 1
+                self.privateFrameTime = _now
+                self.privateCondition.notify_all()
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise SimulatorException from ex
+
+    def _addClient(
+        self,
+        count: int,
+    ) -> None:
+        """Count a client connecting (1) or leaving (-1).
+
+        Args:
+            count: the change in the number of clients
+        """
+        with self.privateCondition:
+            self.privateClientCount += count
+
+    def _nextFrame(
+        self,
+        frameNumber: int,
+    ) -> tuple[int, Optional[bytes]]:
+        """Wait for an image newer than the one a client was last sent.
+
+        Args:
+            frameNumber: the number of the last image sent
+
+        Returns:
+            the number and contents of the newest image, or None for the contents if the server stopped
+        """
+        with self.privateCondition:
+            while not self.privateStopped and self.privateFrameNumber <= frameNumber:
+                self.privateCondition.wait(_PREVIEW_POLL_SECONDS)
+            if self.privateStopped:
+                return frameNumber, None
+            return self.privateFrameNumber, self.privateFrame
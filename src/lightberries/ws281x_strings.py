@@ -5,14 +5,17 @@ import os
 import sys
 import atexit
 import logging
-from typing import Any, Sequence, overload
+from typing import TYPE_CHECKING, Any, Optional, Sequence, overload
 import numpy as np
 from numpy.typing import NDArray
-from lightberries.array_patterns import ConvertPixelArrayToNumpyArray
+from lightberries.array_patterns import ConvertPixelArrayToNumpyArray, PackPixelArray
 from lightberries.exceptions import WS281xStringException, LightBerryException
 from lightberries.rpiws281x import rpi_ws281x
 from lightberries.pixel import Pixel, PixelColors
 
+if TYPE_CHECKING:  # pragma: no cover
+    from lightberries.ws281x_simulator import SimulatedPixelStrip
+
 LOGGER = logging.getLogger("lightBerries")
 
 
@@ -49,7 +52,7 @@ class WS281xString(Sequence[np.int_]):
             channelPWM: defaults to 0, see https://github.com/rpi-ws281x/rpi-ws281x-python
             stripTypeLED: see https://github.com/rpi-ws281x/rpi-ws281x-python
             gamma: see https://github.com/rpi-ws281x/rpi-ws281x-python
-            simulate: don't use GPIO
+            simulate: don't use GPIO, render the LEDs with ws281x_simulator.SimulatedPixelStrip instead
 
         Raises:
             SystemExit: if exiting
@@ -58,6 +61,7 @@ class WS281xString(Sequence[np.int_]):
             LightStringException: if something bad happens
         """
         self.ws281xPixelStrip = None
+        self.simulator: Optional[SimulatedPixelStrip] = None
         self.simulate = simulate
         self.testing = testing
         # catch error cases first
@@ -108,8 +112,13 @@ class WS281xString(Sequence[np.int_]):
         testing: bool = False,
     ) -> None:
         try:  # pragma: no cover
+            _pixelStrip = rpi_ws281x.PixelStrip
+            if self.simulate and not self.testing:
+                from lightberries.ws281x_simulator import SimulatedPixelStrip
+
+                _pixelStrip = SimulatedPixelStrip
             # create ws281x pixel strip
-            self.ws281xPixelStrip = rpi_ws281x.PixelStrip(  # pragma: no cover
+            self.ws281xPixelStrip = _pixelStrip(  # pragma: no cover
                 pin=pwmGPIOpin,
                 dma=channelDMA,
                 num=ledCount,
@@ -120,6 +129,8 @@ class WS281xString(Sequence[np.int_]):
                 strip_type=stripTypeLED,
                 brightness=int(255 * ledBrightnessFloat),
             )
+            if _pixelStrip is not rpi_ws281x.PixelStrip:
+                self.simulator = self.ws281xPixelStrip
             # try to force cleanup of underlying c objects when user exits
             atexit.register(self.__del__)
 
@@ -249,6 +260,47 @@ class WS281xString(Sequence[np.int_]):
             p = Pixel(value)
             self.ws281xPixelStrip.setPixelColor(key, p.int_value)
 
+    def setPixelArray(
+        self,
+        ledBuffer: np.ndarray[(3, Any), np.float32],
+        indices: np.ndarray[(Any,), np.int32] | None = None,
+    ) -> None:
+        """Quantize, clip, and pack a whole render buffer and write it to the LEDs.
+
+        Args:
+            ledBuffer: the RGB values to assign, in any numeric dtype
+            indices: the LED index for each row of ledBuffer, defaults to 0..len(ledBuffer)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightStringException: if something bad happens
+        """
+        try:
+            _setPixelColors = getattr(self.ws281xPixelStrip, "setPixelColors", None)
+            if _setPixelColors is not None:
+                # the simulator takes the whole array at once
+                _packed = PackPixelArray(ledBuffer)
+                _setPixelColors(slice(len(_packed)) if indices is None else np.asarray(indices).reshape(-1), _packed)
+                return
+            _packed = PackPixelArray(ledBuffer).tolist()
+            if indices is None:
+                _indices = range(len(_packed))
+            else:
+                _indices = np.asarray(indices).reshape(-1).tolist()
+            _setPixelColor = self.ws281xPixelStrip.setPixelColor
+            for index, value in zip(_indices, _packed):
+                _setPixelColor(index, value)
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:  # pragma: no cover
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise WS281xStringException from ex
+
     def __enter__(
         self,
     ) -> "WS281xString":
@@ -270,6 +322,46 @@ class WS281xString(Sequence[np.int_]):
         """
         self.__del__()
 
+    @property
+    def brightness(
+        self,
+    ) -> float:
+        """The brightness applied by rpi_ws281x to every LED.
+
+        Returns:
+            the brightness between 0.0 (OFF) and 1.0 (ON)
+        """
+        return self.ws281xPixelStrip.getBrightness() / 255.0
+
+    @brightness.setter
+    def brightness(
+        self,
+        brightness: float,
+    ) -> None:
+        """Set the brightness applied by rpi_ws281x to every LED.
+
+        Args:
+            brightness: a value between 0.0 (OFF) and 1.0 (ON)
+
+        Raises:
+            SystemExit: if exiting
+            KeyboardInterrupt: if user quits
+            LightBerryException: if propagating an exception
+            LightStringException: if something bad happens
+        """
+        try:
+            if not 0.0 <= float(brightness) <= 1.0:
+                raise WS281xStringException(f"Brightness {brightness} is not between 0.0 and 1.0")
+            self.ws281xPixelStrip.setBrightness(int(255 * float(brightness)))
+        except SystemExit:  # pragma: no cover
+            raise
+        except KeyboardInterrupt:  # pragma: no cover
+            raise
+        except LightBerryException:
+            raise
+        except Exception as ex:  # pragma: no cover
+            raise WS281xStringException from ex
+
     def refresh(self):
         if self.ws281xPixelStrip:
             self.ws281xPixelStrip.show()
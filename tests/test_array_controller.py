@@ -6,7 +6,11 @@ from lightberries.pixel import PixelColors
 from lightberries.array_patterns import ConvertPixelArrayToNumpyArray
 from lightberries.ws281x_strings import WS281xString
 import mock
-from lightberries.exceptions import WS281xStringException
+from lightberries.exceptions import ControllerException, WS281xStringException
+import pytest
+import asyncio
+import random
+import time
 import lightberries.rpiws281x_patch
 from numpy.typing import NDArray
 
@@ -157,3 +161,179 @@ def test_getRandomBoolean():
     with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
         ac = ArrayController(testing=True)
         assert isinstance(ac.getRandomBoolean(), bool)
+
+
+def test_seeded_controller():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac1 = ArrayController(testing=True, seed=1234)
+        ac2 = ArrayController(testing=True, seed=1234)
+        assert np.array_equal(ac1.getRandomIndices(10), ac2.getRandomIndices(10))
+        assert ac1.getRandomIndex() == ac2.getRandomIndex()
+        assert ac1.getRandomDirection() == ac2.getRandomDirection()
+
+
+def test_render():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useColorSingleRandom()
+        ac.useFunctionMarquee()
+        with mock.patch.object(WS281xString, "setPixelArray") as setPixelArray:
+            frames = ac.render(frames=5, seed=42)
+            setPixelArray.assert_not_called()
+        assert frames.shape == (5, ac.realLEDCount, 3)
+        assert frames.dtype == np.uint8
+
+
+def test_render_seeded_is_reproducible():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        renders = []
+        for _ in range(2):
+            ac = ArrayController(testing=True, seed=7)
+            ac.useColorSequence()
+            ac.useFunctionMeteors()
+            renders.append(ac.render(frames=10, seed=7))
+        assert np.array_equal(renders[0], renders[1])
+
+
+@pytest.mark.parametrize("useColor", ["useColorSinglePseudoRandom", "useColorSequencePseudoRandom"])
+def test_render_pseudo_random_colors_are_reproducible(useColor):
+    functions = [
+        "useFunctionAccelerate",
+        "useFunctionAlive",
+        "useFunctionCylon",
+        "useFunctionMarquee",
+        "useFunctionMerge",
+        "useFunctionMeteors",
+        "useFunctionRaindrops",
+        "useFunctionRandomChange",
+        "useFunctionSolidColorCycle",
+        "useFunctionSprites",
+    ]
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        for useFunction in functions:
+            renders = []
+            for run in range(2):
+                # the global random module must not leak into the frames
+                random.seed(run)
+                ac = ArrayController(testing=True, seed=3)
+                getattr(ac, useColor)()
+                getattr(ac, useFunction)()
+                renders.append(ac.render(frames=10, seed=3))
+            assert np.array_equal(renders[0], renders[1]), useFunction
+
+
+def test_render_lazy():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        frames = ac.render(frames=None, seed=1, lazy=True)
+        for _ in range(3):
+            frame = next(frames)
+            assert frame.shape == (ac.realLEDCount, 3)
+        frames.close()
+        assert ac.privateVirtualClock is None
+        with pytest.raises(ControllerException):
+            ac.render(frames=None)
+
+
+def test_composite_clears_hidden_leds():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.virtualLEDBuffer[:] = PixelColors.RED.array
+        assert np.array_equal(ac.compositeFrame(), np.tile(PixelColors.RED.array, (ac.realLEDCount, 1)))
+        # map fewer LEDs than the string has, the rest must go dark
+        ac.virtualLEDIndexBuffer = ac.virtualLEDIndexBuffer[:-2]
+        frame = ac.compositeFrame()
+        assert np.array_equal(frame[:-2], np.tile(PixelColors.RED.array, (ac.realLEDCount - 2, 1)))
+        assert not frame[-2:].any()
+
+
+def test_play():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        frames = [np.full((ac.virtualLEDCount, 3), i, dtype=np.uint8) for i in range(4)]
+        frames.append((np.array([0, 1]), PixelColors.RED.array))
+        with mock.patch.object(ac, "_showFrame") as showFrame:
+            ac.play(iter(frames))
+            assert showFrame.call_count == len(frames)
+        assert np.array_equal(ac.virtualLEDBuffer[0], PixelColors.RED.array)
+        assert np.array_equal(ac.virtualLEDBuffer[2], [3, 3, 3])
+        assert ac.droppedFrameCount == 0
+
+
+def test_play_bad_frame():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        with pytest.raises(ControllerException):
+            ac.play([np.zeros((ac.virtualLEDCount + 1, 3))])
+
+
+def test_play_async_latest_frame_wins():
+    async def source(count):
+        for i in range(count):
+            yield np.full((ac.virtualLEDCount, 3), i)
+        yield (np.array([0]), PixelColors.BLUE.array)
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        with mock.patch.object(ac, "_showFrame") as showFrame:
+            ac.play(source(20), framesPerSecond=1000)
+            shown = showFrame.call_count
+        # every full frame is either shown or dropped, the trailing delta may be shown on its own
+        assert shown + ac.droppedFrameCount in (20, 21)
+        assert np.array_equal(ac.virtualLEDBuffer[0], PixelColors.BLUE.array)
+        assert np.array_equal(ac.virtualLEDBuffer[1], [19, 19, 19])
+        with mock.patch.object(ac, "_showFrame") as showFrame:
+            ac.play(source(20), framesPerSecond=1000, dropFrames=False)
+            assert showFrame.call_count == 21
+        assert ac.droppedFrameCount == 0
+
+
+def test_run_async():
+    async def main():
+        ac.secondsPerMode = 0.2
+        task = asyncio.ensure_future(ac.runAsync(framesPerSecond=200))
+        await asyncio.sleep(0.02)
+        await ac.switchMode(lambda: (ac.useColorSingle(PixelColors.RED), ac.useFunctionNone()))
+        assert len(ac.functionList) == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        with mock.patch.object(ac, "refreshLEDs") as refreshLEDs:
+            asyncio.run(main())
+            assert refreshLEDs.call_count > 0
+        assert np.array_equal(ac.colorSequence[0], PixelColors.RED.array)
+        # with nothing running, the switch is applied immediately
+        asyncio.run(ac.switchMode(ac.useFunctionCylon))
+        assert "functionCylon" in [f.runFunction.__name__ for f in ac.functionList]
+
+
+def test_run_async_cancel_waits_for_frame():
+    sent = []
+
+    def slowRefresh():
+        time.sleep(0.05)
+        sent.append(True)
+
+    async def main():
+        task = asyncio.ensure_future(ac.runAsync())
+        while ac.privateShowExecutor is None or not refreshLEDs.call_count:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the frame that was being sent when the task was cancelled went all the way out
+        assert len(sent) == refreshLEDs.call_count
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        with mock.patch.object(ac, "refreshLEDs", side_effect=slowRefresh) as refreshLEDs:
+            asyncio.run(main())
+        # the worker thread is stopped when the controller is reset
+        assert ac.privateShowExecutor is not None
+        ac.reset()
+        assert ac.privateShowExecutor is None
@@ -1,5 +1,11 @@
 from __future__ import annotations
-from lightberries.array_patterns import ArrayPattern, ConvertPixelArrayToNumpyArray
+from lightberries.array_patterns import (
+    ArrayPattern,
+    ConvertPixelArrayToNumpyArray,
+    PackPixelArray,
+    PIXEL_BUFFER_DTYPE,
+    QuantizePixelArray,
+)
 import datetime
 
 import numpy as np
@@ -22,6 +28,11 @@ def test_default_color_sequence():
         last_month = month
 
 
+def test_default_color_sequence_is_lazy():
+    # the class attribute resolves to this month's colors when it is first read
+    assert_array_equal(ArrayPattern.DEFAULT_COLOR_SEQUENCE, ArrayPattern.DefaultColorSequenceByMonth())
+
+
 def test_pixel_array_off():
     for i in range(0, 101, 20):
         ary = ArrayPattern.PixelArrayOff(i)
@@ -199,3 +210,29 @@ def test_colorstretch_array():
             assert len(ary.shape) == 2
             assert ary.shape[0] == i
             assert ary.shape[1] == 3
+
+
+def test_pattern_dtype():
+    for ary in [
+        ArrayPattern.PixelArrayOff(10),
+        ArrayPattern.SolidColorArray(10),
+        ArrayPattern.ColorTransitionArray(10),
+        ArrayPattern.RainbowArray(10),
+        ArrayPattern.RepeatingColorSequenceArray(10),
+        ArrayPattern.ReflectArray(10),
+    ]:
+        assert ary.dtype == PIXEL_BUFFER_DTYPE
+        assert ary.flags["C_CONTIGUOUS"]
+
+
+def test_quantize_pixel_array():
+    ary = np.array([[-10.0, 127.4, 300.0], [0.6, 254.5, 255.0]], dtype=PIXEL_BUFFER_DTYPE)
+    quantized = QuantizePixelArray(ary)
+    assert quantized.dtype == np.uint8
+    assert_array_equal(quantized, [[0, 127, 255], [1, 254, 255]])
+
+
+def test_pack_pixel_array():
+    colors = [PixelColors.RED, PixelColors.GREEN, PixelColors.BLUE, PixelColors.RANDOM]
+    ary = ConvertPixelArrayToNumpyArray(colors)
+    assert_array_equal(PackPixelArray(ary.astype(PIXEL_BUFFER_DTYPE)), [Pixel(rgb).int_value for rgb in ary])
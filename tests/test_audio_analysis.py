@@ -0,0 +1,327 @@
+from __future__ import annotations
+import subprocess
+import sys
+import time
+import wave
+import mock
+import numpy as np
+import pytest
+from lightberries.array_controller import ArrayController
+from lightberries.audio_analysis import (
+    FEATURE_BANDS,
+    FEATURE_BEAT,
+    FEATURE_BEAT_COUNT,
+    FEATURE_LEVEL,
+    FEATURE_ONSET,
+    FEATURE_ONSET_COUNT,
+    FEATURE_TIME,
+    AudioAnalyzer,
+    AudioRingBuffer,
+    SharedFeatures,
+    WavSource,
+    analysisWindow,
+    attackDecay,
+    bandBinMap,
+    bandLEDMap,
+)
+from lightberries.exceptions import AudioException
+from tests.test_array_controller import new_instantiate_WS281xString
+
+SAMPLE_RATE = 22050
+
+
+def write_wav(path, samples: np.ndarray, channels: int = 1) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+
+
+def clicks(seconds: float, period: float) -> np.ndarray:
+    # quiet noise with a decaying 80 Hz thump every period seconds
+    rng = np.random.default_rng(3)
+    samples = rng.normal(0, 0.002, int(seconds * SAMPLE_RATE))
+    t = np.arange(int(0.08 * SAMPLE_RATE)) / SAMPLE_RATE
+    thump = np.sin(2 * np.pi * 80 * t) * np.exp(-t * 40)
+    for start in np.arange(period, seconds - 0.1, period):
+        index = int(start * SAMPLE_RATE)
+        samples[index : index + len(thump)] += 0.8 * thump
+    return samples
+
+
+def test_ring_buffer_wraps():
+    ring = AudioRingBuffer(8)
+    history = np.arange(30, dtype=np.float32)
+    for start, stop in [(0, 5), (5, 11), (11, 12), (12, 25), (25, 30)]:
+        ring.write(history[start:stop])
+        count = min(stop, 8)
+        assert ring.latest(count).tolist() == history[stop - count : stop].tolist()
+    assert ring.written == 30
+    out = np.zeros(3, dtype=np.float32)
+    assert ring.latest(3, out=out) is out
+
+
+def test_band_bin_map():
+    starts, widths = bandBinMap(SAMPLE_RATE, 1024, 24, 20.0, 20000.0)
+    assert bandBinMap(SAMPLE_RATE, 1024, 24, 20.0, 20000.0)[0] is starts
+    assert (widths >= 1).all()
+    # contiguous, and inside the rfft bins
+    assert (starts[1:] == starts[:-1] + widths[:-1]).all()
+    assert starts[-1] + widths[-1] <= 513
+    # wider bands higher up
+    assert widths[-1] > widths[len(widths) // 2] >= widths[0]
+    with pytest.raises(AudioException):
+        bandBinMap(SAMPLE_RATE, 64, 40, 20.0, 20000.0)
+    assert not analysisWindow("hann", 64).flags.writeable
+    with pytest.raises(AudioException):
+        analysisWindow("triangle", 64)
+
+
+def test_sine_lands_in_its_band():
+    analyzer = AudioAnalyzer(sampleRate=SAMPLE_RATE, frameSize=1024, bandCount=12)
+    t = np.arange(SAMPLE_RATE // 4) / SAMPLE_RATE
+    starts, widths = bandBinMap(SAMPLE_RATE, 1024, 12, 40.0, 16000.0)
+    for band in [4, 8, 11]:
+        # a tone in the middle bin of the band
+        frequency = (starts[band] + widths[band] // 2) * SAMPLE_RATE / 1024
+        features = analyzer.process(0.5 * np.sin(2 * np.pi * frequency * t))
+        expected = np.searchsorted(analyzer.bandFrequencies, frequency, side="right") - 1
+        assert expected == band
+        assert int(np.argmax(features[FEATURE_BANDS:])) == expected
+        assert features[FEATURE_BANDS + expected] > 0.8
+        assert features[FEATURE_LEVEL] == pytest.approx(0.5 / np.sqrt(2), rel=0.01)
+    assert features[FEATURE_TIME] == pytest.approx(0.75, abs=1e-3)
+
+
+def test_beats_from_wav(tmp_path):
+    path = tmp_path / "clicks.wav"
+    samples = clicks(4.0, 0.5)
+    write_wav(path, np.repeat(samples, 2), channels=2)
+    source = WavSource(str(path), chunkSize=256)
+    assert source.sampleRate == SAMPLE_RATE
+    assert source.duration == pytest.approx(4.0, abs=1e-3)
+    analyzer = AudioAnalyzer(sampleRate=source.sampleRate, frameSize=1024)
+    beats = []
+    onsets = []
+    for chunk in source:
+        features = analyzer.process(chunk)
+        if features[FEATURE_BEAT]:
+            beats.append(features[FEATURE_TIME])
+        if features[FEATURE_ONSET]:
+            onsets.append(features[FEATURE_TIME])
+    expected = np.arange(0.5, 3.9, 0.5)
+    assert len(beats) == len(expected)
+    # each beat is reported within a few chunks of the thump starting
+    assert np.abs(np.array(beats) - expected).max() < 3 * 256 / SAMPLE_RATE
+    assert len(onsets) >= len(expected) - 1
+    assert features[FEATURE_BEAT_COUNT] == len(beats)
+    assert features[FEATURE_ONSET_COUNT] == len(onsets)
+
+
+def test_shared_features(tmp_path):
+    analyzer = AudioAnalyzer(sampleRate=SAMPLE_RATE, frameSize=512, bandCount=8)
+    shared = SharedFeatures.create(len(analyzer.features))
+    reader = SharedFeatures.attach(shared.name)
+    try:
+        out = np.zeros(reader.featureCount)
+        assert reader.read(out) == 0
+        path = tmp_path / "clicks.wav"
+        write_wav(path, clicks(1.0, 0.25))
+        analyzer.run(WavSource(str(path), chunkSize=256), shared=shared)
+        assert reader.read(out) == int(np.ceil(SAMPLE_RATE / 256))
+        assert np.array_equal(out, analyzer.features)
+        # a write in progress leaves readers with the last complete vector
+        shared.privateHeader[0] += 1
+        shared.privateValues[:] = -1
+        assert reader.read(out) == int(np.ceil(SAMPLE_RATE / 256))
+        assert np.array_equal(out, analyzer.features)
+        shared.privateHeader[0] += 1
+        assert reader.read(out) == int(np.ceil(SAMPLE_RATE / 256)) + 1
+        assert (out == -1).all()
+    finally:
+        reader.close()
+        shared.close()
+    with pytest.raises(AudioException):
+        SharedFeatures.attach(shared.name)
+
+
+def test_shared_features_outlive_readers():
+    shared = SharedFeatures.create(4)
+    try:
+        shared.publish(np.arange(4.0))
+        code = f"from lightberries.audio_analysis import SharedFeatures; SharedFeatures.attach({shared.name!r}).close()"
+        subprocess.run([sys.executable, "-c", f"import sys; sys.path[:0] = {sys.path!r}; {code}"], check=True)
+        # a reader process exiting must not free the block (its resource tracker cleans up just after it exits)
+        deadline = time.monotonic() + 0.5
+        while time.monotonic() < deadline:
+            reader = SharedFeatures.attach(shared.name)
+            out = np.zeros(4)
+            assert reader.read(out) == 1
+            assert np.array_equal(out, np.arange(4.0))
+            reader.close()
+            time.sleep(0.05)
+    finally:
+        shared.close()
+
+
+def test_features_threaded(tmp_path):
+    path = tmp_path / "clicks.wav"
+    write_wav(path, clicks(2.0, 0.5))
+    source = WavSource(str(path), chunkSize=512, loop=True)
+    analyzer = AudioAnalyzer(sampleRate=SAMPLE_RATE, frameSize=2048, bandCount=32)
+    shared = SharedFeatures.create(len(analyzer.features))
+    out = np.zeros(shared.featureCount)
+    try:
+        analyzer.start(source, shared, realtime=True)
+        deadline = time.perf_counter() + 5
+        while shared.read(out) < 10 and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        analyzer.stop(timeout=5)
+        count = shared.read(out)
+        assert count >= 10
+        for _, chunk in zip(range(5), source):
+            shared.publish(analyzer.process(chunk))
+        assert shared.read(out) == count + 5
+        assert np.array_equal(out, analyzer.features)
+    finally:
+        shared.close()
+
+
+class FakeFeatures:
+    # a feature source the tests set directly
+    def __init__(self, bandCount: int) -> None:
+        self.features = np.zeros(FEATURE_BANDS + bandCount)
+        self.featureCount = len(self.features)
+
+    def read(self, out: np.ndarray) -> int:
+        out[:] = self.features
+        return 0
+
+
+def new_controller(ledCount: int) -> ArrayController:
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        return ArrayController(ledCount=ledCount, testing=True, seed=1)
+
+
+def run_frame(ac: ArrayController) -> None:
+    for function in ac.privateLightFunctions:
+        function.run()
+
+
+def test_band_led_map_and_smoothing():
+    bands, starts, scales = bandLEDMap(3, 7)
+    assert bands.tolist() == [0, 0, 0, 1, 1, 2, 2]
+    assert starts.tolist() == pytest.approx([0, 1 / 3, 2 / 3, 0, 0.5, 0, 0.5])
+    assert scales.tolist() == [3, 3, 3, 2, 2, 2, 2]
+    assert bandLEDMap(3, 7)[0] is bands
+    # fewer LEDs than bands, one band each
+    assert bandLEDMap(8, 4)[0].tolist() == [0, 2, 4, 6]
+    levels = np.array([0.0, 1.0])
+    attackDecay(levels, np.array([1.0, 0.0]), attack=0.5, decay=0.25)
+    assert levels.tolist() == [0.5, 0.75]
+
+
+def test_spectrum_effect():
+    ac = new_controller(96)
+    ac.colorSequence = np.array([[255, 0, 0], [0, 255, 0]])
+    analyzer = AudioAnalyzer(sampleRate=SAMPLE_RATE, frameSize=1024, bandCount=12)
+    starts, widths = bandBinMap(SAMPLE_RATE, 1024, 12, 40.0, 16000.0)
+    frequency = (starts[4] + widths[4] // 2) * SAMPLE_RATE / 1024
+    analyzer.process(0.5 * np.sin(2 * np.pi * frequency * np.arange(4096) / SAMPLE_RATE))
+    ac.useFunctionAudioSpectrum(analyzer, attack=1.0, decay=0.5)
+    run_frame(ac)
+    segments = ac.virtualLEDBuffer.reshape((12, 8, 3))
+    # the tone's band is a full bar in its own color, the bars far from it are shorter
+    assert (segments[4] == ac.colorSequence[0]).all()
+    assert (segments[11] == 0).any()
+    # the bars fall at the decay rate when the tone stops
+    analyzer.features[FEATURE_BANDS:] = 0
+    run_frame(ac)
+    assert np.count_nonzero(segments[4].any(axis=1)) == 4
+    with pytest.raises(AudioException):
+        ac.useFunctionAudioSpectrum("no-such-features")
+
+
+def test_beat_pulse_effect():
+    ac = new_controller(20)
+    ac.colorSequence = np.array([[0, 0, 255], [255, 0, 0]])
+    source = FakeFeatures(4)
+    source.features[FEATURE_BEAT_COUNT] = 3
+    ac.useFunctionAudioBeatPulse(source, attack=1.0, decay=0.5)
+    # beats counted before the effect started do not flash
+    run_frame(ac)
+    assert not ac.virtualLEDBuffer.any()
+    source.features[FEATURE_BEAT_COUNT] = 5
+    run_frame(ac)
+    color = ac.privateLightFunctions[0].color
+    assert (ac.virtualLEDBuffer[1:-1] == color).all()
+    run_frame(ac)
+    run_frame(ac)
+    # a quarter of the flash is left, lighting the middle
+    lit = ac.virtualLEDBuffer.any(axis=1)
+    assert lit[8:12].all() and not lit[:6].any() and not lit[14:].any()
+    assert ac.virtualLEDBuffer[10].tolist() == pytest.approx((color * 0.25).tolist())
+
+
+def test_audio_meteors_follow_energy():
+    ac = new_controller(100)
+    source = FakeFeatures(8)
+    ac.useFunctionAudioMeteors(source, meteorCount=4, maxSpeed=6, fadeAmount=0.5, attack=1.0, decay=1.0)
+    meteors = ac.privateLightFunctions[-1]
+    assert meteors.bandStarts.tolist() == [0, 2, 4, 6]
+    positions = meteors.positions.copy()
+    run_frame(ac)
+    # silent meteors crawl one LED per refresh
+    assert np.array_equal((meteors.positions - positions) % 100, meteors.directions % 100)
+    source.features[FEATURE_BANDS + 2 : FEATURE_BANDS + 4] = 1.0
+    positions = meteors.positions.copy()
+    directions = meteors.directions.copy()
+    ac.virtualLEDBuffer[:] = 0
+    run_frame(ac)
+    steps = (meteors.positions - positions) * directions % 100
+    assert steps.tolist() == [1, 7, 1, 1]
+    # the loud meteor lights every LED it passed at full brightness
+    trail = (positions[1] + directions[1] * np.arange(8)) % 100
+    assert (ac.virtualLEDBuffer[trail.astype(int)] == meteors.colors[1]).all()
+    source.features[FEATURE_BEAT_COUNT] += 1
+    source.features[FEATURE_ONSET_COUNT] += 1
+    colors = meteors.colors.copy()
+    run_frame(ac)
+    assert np.array_equal(meteors.directions, -directions)
+    assert not np.array_equal(meteors.colors, colors)
+
+
+def test_audio_effects_follow_analyzer():
+    ac = new_controller(1000)
+    analyzer = AudioAnalyzer(sampleRate=SAMPLE_RATE, frameSize=1024, bandCount=32)
+    samples = clicks(1.0, 0.25)
+    for useFunction in [ac.useFunctionAudioSpectrum, ac.useFunctionAudioBeatPulse, ac.useFunctionAudioMeteors]:
+        ac.reset()
+        ac.virtualLEDBuffer[:] = 0
+        useFunction(analyzer)
+        lit = 0
+        for start in range(0, len(samples) - 512, 512):
+            analyzer.process(samples[start : start + 512])
+            run_frame(ac)
+            assert np.isfinite(ac.virtualLEDBuffer).all()
+            assert ac.virtualLEDBuffer.min() >= 0 and ac.virtualLEDBuffer.max() <= 255
+            lit = max(lit, np.count_nonzero(ac.virtualLEDBuffer.any(axis=1)))
+        # every effect reacts to the clicks
+        assert lit > 0
+
+
+def test_audio_effects_detach_on_reset():
+    shared = SharedFeatures.create(FEATURE_BANDS + 4)
+    try:
+        ac = new_controller(20)
+        ac.useFunctionAudioBeatPulse(shared.name)
+        ac.useFunctionAudioSpectrum(shared)
+        attached = ac.privateLightFunctions[0].featureSource
+        assert attached is not shared
+        ac.reset()
+        # the effect attached by name is detached, the one handed in is left to its owner
+        assert attached.memory.buf is None
+        assert shared.memory.buf is not None
+    finally:
+        shared.close()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+import asyncio
+import base64
+import json
+import os
+import struct
+import mock
+import numpy as np
+from lightberries.array_controller import ArrayController
+from lightberries.array_patterns import PIXEL_BUFFER_DTYPE
+from lightberries.control_server import ControlServer, _websocketHeader
+from lightberries.pixel import Pixel, PixelColors
+from tests.test_array_controller import new_instantiate_WS281xString
+
+
+async def request(address, method, path, body=None):
+    reader, writer = await asyncio.open_connection(*address[:2])
+    payload = b"" if body is None else json.dumps(body).encode()
+    writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(content)
+
+
+def test_catalogue_and_settings():
+    async def main():
+        async with ControlServer(ac, port=0) as server:
+            status, catalogue = await request(server.address, "GET", "/catalogue")
+            assert status == 200
+            assert "useFunctionCylon" in catalogue["useFunction"]
+            assert "useColorRainbow" in catalogue["useColor"]
+            status, settings = await request(server.address, "POST", "/settings", {"brightness": 0.5})
+            assert status == 200
+            assert abs(settings["brightness"] - 0.5) < 0.01
+            status, _ = await request(server.address, "POST", "/settings", {"brightness": 2})
+            assert status == 400
+            status, _ = await request(server.address, "POST", "/settings", {"nope": 2})
+            assert status == 400
+            status, settings = await request(server.address, "POST", "/settings", {"colorSequence": [[0, 0, 255]]})
+            assert status == 200
+            assert ac.colorSequence.dtype == PIXEL_BUFFER_DTYPE
+            status, _ = await request(server.address, "GET", "/nope")
+            assert status == 404
+            status, _ = await request(server.address, "GET", "/mode")
+            assert status == 405
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        asyncio.run(main())
+
+
+def test_mode_between_frames():
+    async def main():
+        ac.secondsPerMode = 5
+        task = asyncio.ensure_future(ac.runAsync(framesPerSecond=100))
+        async with ControlServer(ac, port=0) as server:
+            status, response = await request(
+                server.address,
+                "POST",
+                "/mode",
+                [
+                    {"name": "useColorSingle", "arguments": {"foregroundColor": [0, 255, 0]}},
+                    {"name": "useFunctionNone"},
+                ],
+            )
+            assert status == 200
+            assert response["functions"] == ["functionNone"]
+            status, _ = await request(server.address, "POST", "/mode", [{"name": "reset"}])
+            assert status == 400
+            status, _ = await request(
+                server.address, "POST", "/mode", [{"name": "useFunctionNone", "arguments": {"x": 1}}]
+            )
+            assert status == 400
+            # a rejected mode leaves the running one alone
+            assert [function.runFunction.__name__ for function in ac.functionList] == ["functionNone"]
+        ac.running = False
+        await task
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        with mock.patch.object(ac, "refreshLEDs"):
+            asyncio.run(main())
+        assert np.array_equal(ac.colorSequence[0], Pixel([0, 255, 0]).array)
+
+
+def test_frame_stream():
+    async def main():
+        ac.layers.output[:] = PixelColors.RED.array
+        async with ControlServer(ac, port=0, previewFramesPerSecond=50) as server:
+            reader, writer = await asyncio.open_connection(*server.address[:2])
+            key = base64.b64encode(os.urandom(16)).decode()
+            writer.write(
+                (
+                    "GET /frames HTTP/1.1\r\n"
+                    "Upgrade: websocket\r\n"
+                    "Connection: Upgrade\r\n"
+                    f"Sec-WebSocket-Key: {key}\r\n\r\n"
+                ).encode()
+            )
+            await writer.drain()
+            assert b"101" in await reader.readuntil(b"\r\n\r\n")
+            opcode, length = struct.unpack("!BB", await reader.readexactly(2))
+            assert opcode == 0x82
+            if length == 126:
+                (length,) = struct.unpack("!H", await reader.readexactly(2))
+            frame = np.frombuffer(await reader.readexactly(length), dtype=np.uint8).reshape((-1, 3))
+            assert len(frame) == ac.realLEDCount
+            assert np.array_equal(frame[0], PixelColors.RED.array)
+            writer.close()
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        asyncio.run(main())
+
+
+def test_websocket_header():
+    assert _websocketHeader(0x2, 10) == bytes([0x82, 10])
+    assert _websocketHeader(0x2, 300) == bytes([0x82, 126]) + struct.pack("!H", 300)
+    assert _websocketHeader(0x2, 70000) == bytes([0x82, 127]) + struct.pack("!Q", 70000)
@@ -413,9 +413,10 @@ def test_functionOff():
 def test_functionFadeOff():
     control = newController()
     pattern = ConvertPixelArrayToNumpyArray([PixelColors.RED, PixelColors.GREEN, PixelColors.BLUE])
-    half = ConvertPixelArrayToNumpyArray([PixelColors.RED2, PixelColors.GREEN2, PixelColors.BLUE2])
-    quarter = ConvertPixelArrayToNumpyArray([PixelColors.RED3, PixelColors.GREEN3, PixelColors.BLUE3])
-    eighth = ConvertPixelArrayToNumpyArray([PixelColors.RED4, PixelColors.GREEN4, PixelColors.BLUE4])
+    # the render buffer is float, so fades keep their fractional part until output
+    half = pattern * 0.5
+    quarter = pattern * 0.25
+    eighth = pattern * 0.125
     control.setvirtualLEDBuffer(pattern)
     function1 = ArrayFunction(control, ArrayFunction.functionFadeOff, pattern)
     function1.fadeAmount = 0.5
@@ -737,7 +738,7 @@ def test_overlayTwinkle():
     function.random = 0.0
     control.functionList.append(function)
     control._runFunctions()
-    control._copyOverlays()
+    control.copyVirtualLedsToWS281X()
     assert np.sum(np.array(control.ws281xString)) != 0
 
 
@@ -748,5 +749,5 @@ def test_overlayBlink():
     function.random = 0.0
     control.functionList.append(function)
     control._runFunctions()
-    control._copyOverlays()
+    control.copyVirtualLedsToWS281X()
     assert np.sum(np.array(control.ws281xString)) != 0
@@ -0,0 +1,205 @@
+from __future__ import annotations
+import numpy as np
+from lightberries.pixel import Pixel
+import pytest
+from games.game_objects import (
+    GameClock,
+    GameObject,
+    Sprite,
+    SpriteShape,
+    check_for_collisions,
+    collision_boxes,
+    collision_pairs,
+    render_objects,
+    shape_stencil,
+)
+
+
+@pytest.fixture
+def frame():
+    GameObject.objects.clear()
+    GameObject.dead_objects.clear()
+    GameObject.frame_size_x = 48
+    GameObject.frame_size_y = 32
+    yield
+    GameObject.objects.clear()
+    GameObject.dead_objects.clear()
+
+
+def brute_force_collisions(objs: list[GameObject]) -> dict[tuple[int, int], set[tuple[int, int]]]:
+    # the pairwise check the spatial hash replaced
+    found = {}
+    for i, obj1 in enumerate(objs):
+        for obj2 in objs[i + 1 :]:
+            if obj1.animate or obj2.animate:
+                overlap = obj1.collision_surface.intersection(obj2.collision_surface)
+                if overlap:
+                    found[(obj1.id, obj2.id)] = overlap
+    return found
+
+
+def test_collision_pairs_match_brute_force(frame):
+    rng = np.random.default_rng(7)
+    shapes = list(SpriteShape)
+    for _ in range(300):
+        obj = GameObject(
+            x=int(rng.integers(-4, 52)),
+            y=int(rng.integers(-4, 36)),
+            size=int(rng.integers(0, 4)),
+            name="thing",
+            shape=shapes[rng.integers(len(shapes))],
+        )
+        obj.animate = bool(rng.random() < 0.3)
+    objs = list(GameObject.objects.values())
+    expected = brute_force_collisions(objs)
+    boxes = collision_boxes(objs)
+    animate = np.array([obj.animate for obj in objs])
+    pairs = collision_pairs(boxes, animate)
+    assert [(objs[i].id, objs[j].id) for i, j in pairs] == sorted(expected)
+    assert len(collision_pairs(boxes, np.zeros(len(objs), dtype=np.bool_))) == 0
+
+
+def test_check_for_collisions_calls_collide(frame):
+    player = GameObject(x=10, y=10, size=1, name="player")
+    player.animate = True
+    owned = GameObject(x=11, y=10, size=1, name="shot")
+    owned.owner = player
+    owned.damage = 1
+    GameObject(x=40, y=20, size=1, name="far away")
+    wall = GameObject(x=9, y=9, size=1, name="wall")
+    wall.damage = 1
+    expected = brute_force_collisions(list(GameObject.objects.values()))
+    check_for_collisions()
+    # the owner's own shots do not hurt it, the wall does
+    assert player.collided == [wall]
+    assert player.collision_xys == [expected[(player.id, wall.id)]]
+    assert owned.collided == [player]
+    assert wall.collided == [player]
+    assert player.health == 0
+
+
+def reference_xys(obj: GameObject) -> list[tuple[int, int]]:
+    # how xs and ys were listed before the stencils were cached
+    size = obj.size
+    if obj.shape == SpriteShape.CROSS:
+        xs = [round(obj._x + i) for i in range(-size, size + 1)] + [round(obj._x)] * (2 * size + 1)
+        ys = [round(obj._y)] * (2 * size + 1) + [round(obj._y + i) for i in range(-size, size + 1)]
+    elif obj.shape == SpriteShape.CIRCLE:
+        angles = np.linspace(0, 2 * np.pi, 1 + (4 * size))
+        xs = list(np.round(np.sin(angles) * size).astype(np.int32) + obj.x)
+        ys = list(np.round(np.cos(angles) * size).astype(np.int32) + obj.y)
+    elif obj.shape == SpriteShape.SQUARE:
+        line_xs = [round(obj._x + i) for i in range(-size, size + 1)]
+        line_ys = [round(obj._y + i) for i in range(-size, size + 1)]
+        xs = line_xs + [line_xs[0], line_xs[-1]] * (2 * size - 1) + line_xs
+        ys = [line_ys[0]] * (2 * size + 1)
+        for y in line_ys[1:-1]:
+            ys.extend([y, y])
+        ys.extend([line_ys[-1]] * (2 * size + 1))
+    else:
+        xs = [round(obj._x + i) for _ in range(obj.height) for i in range(obj.width)]
+        ys = [round(obj._y - i) for i in range(obj.height) for _ in range(obj.width)]
+    return list(zip(xs, ys))
+
+
+@pytest.mark.parametrize("shape", list(SpriteShape))
+def test_stencils_match_reference(frame, shape):
+    for size in range(1, 6):
+        for x, y in [(0, 0), (5, 7), (2.5, 3.5), (10.25, 4.75), (-1.5, 40)]:
+            obj = GameObject(x=x, y=y, size=size, name="thing", shape=shape)
+            assert [(int(x), int(y)) for x, y in obj.xys] == reference_xys(obj)
+
+
+def test_stencil_cache(frame):
+    obj = GameObject(x=3, y=3, size=2, name="thing", shape=SpriteShape.SQUARE)
+    stencil = obj.stencil
+    assert stencil is shape_stencil(SpriteShape.SQUARE, 2, 2, 2)
+    assert not stencil[0].flags.writeable
+    obj.x = 10
+    assert obj.stencil is stencil
+    assert obj.xs.min() == 8
+    obj.size = 1
+    assert obj.stencil is not stencil
+    assert len(obj.xs) == 8
+    obj.shape = SpriteShape.CROSS
+    assert obj.stencil is shape_stencil(SpriteShape.CROSS, 1, 1, 1)
+    # sprites wrap around the frame without touching the shared stencil
+    sprite = Sprite(x=0, y=0, size=1, name="sprite")
+    assert sorted(sprite.xs.tolist()) == [0, 0, 0, 0, 1, GameObject.frame_size_x - 1]
+    assert shape_stencil(SpriteShape.CROSS, 1, 1, 1)[0].min() == -1
+
+
+def test_render_objects(frame):
+    buffer = np.zeros((GameObject.frame_size_x, GameObject.frame_size_y, 3))
+    corner = GameObject(x=0, y=0, size=2, name="corner", color=np.array([10, 20, 30]))
+    square = GameObject(x=1, y=1, size=1, name="square", shape=SpriteShape.SQUARE, color=np.array([1, 2, 3]))
+    GameObject(x=5, y=-1, size=1, name="above the frame")
+    render_objects(buffer, list(GameObject.objects.values()))
+    expected = np.zeros_like(buffer)
+    # the cross is clipped pixel by pixel instead of being dropped, and the square is drawn over it
+    for obj in (corner, square):
+        for x, y in obj.xys:
+            if 0 <= x < buffer.shape[0] and 0 <= y < buffer.shape[1]:
+                expected[x, y] = Pixel(obj.color).array
+    assert np.array_equal(buffer, expected)
+    assert np.count_nonzero(buffer.any(axis=2)) == 8
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.t = 100.0
+        self.sleeps = []
+
+    def now(self) -> float:
+        return self.t
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.t += seconds
+
+
+def test_game_clock_fixed_steps():
+    fake = FakeTime()
+    clock = GameClock(tick_rate=10, poll_rate=50, max_ticks=3, now=fake.now, sleep=fake.sleep)
+    assert clock.ticks() == 1
+    # fast frames are padded out to the poll rate, and the game steps ten times a second regardless
+    ticks = []
+    for _ in range(50):
+        fake.t += 0.005
+        ticks.append(clock.ticks())
+        clock.wait()
+    assert fake.t == pytest.approx(100.985)
+    assert fake.sleeps[-1] == pytest.approx(0.015)
+    assert sum(ticks) in (9, 10)
+    assert max(ticks) == 1
+    # slow frames catch up, and a long stall only costs max_ticks steps
+    start = clock.accumulator
+    fake.t += 0.25
+    assert clock.ticks() == 2 + int(start + 0.05 >= 0.1)
+    assert 0.0 <= clock.alpha < 1.0
+    fake.t += 10.0
+    assert clock.ticks() == 3
+    assert clock.dropped_ticks > 90
+    assert clock.alpha == 0.0
+
+
+def test_render_objects_interpolates(frame):
+    sprite = Sprite(x=10, y=10, size=0, name="sprite", has_gravity=False, dx=2.0, dy=-1.0)
+    wall = GameObject(x=20, y=20, size=0, name="wall")
+    buffer = np.zeros((GameObject.frame_size_x, GameObject.frame_size_y, 3))
+    render_objects(buffer, [sprite, wall], alpha=0.5)
+    # half way back along the last move, the wall does not move
+    lit = buffer.any(axis=2)
+    assert lit[9, 10] and lit[20, 20] and np.count_nonzero(lit) == 2
+    buffer[:] = 0
+    render_objects(buffer, [sprite, wall], alpha=0.0)
+    assert buffer.any(axis=2)[8, 11]
+
+
+def test_render_objects_interpolates_across_the_wrap(frame):
+    # the sprite just wrapped from the right edge (47) to the left edge (0)
+    sprite = Sprite(x=0, y=10, size=0, name="sprite", has_gravity=False, dx=1.0)
+    buffer = np.zeros((GameObject.frame_size_x, GameObject.frame_size_y, 3))
+    render_objects(buffer, [sprite], alpha=0.0)
+    lit = buffer.any(axis=2)
+    assert lit[47, 10] and np.count_nonzero(lit) == 1
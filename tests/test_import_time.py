@@ -0,0 +1,40 @@
+from __future__ import annotations
+import json
+import subprocess
+import sys
+
+# modules that must only be imported on first use
+LAZY_MODULES = [
+    "asyncio",
+    "cProfile",
+    "lightberries.array_profiler",
+    "lightberries.audio_analysis",
+    "lightberries.control_server",
+    "lightberries.matrix_controller",
+    "lightberries.matrix_font",
+    "lightberries.matrix_functions",
+    "lightberries.matrix_letters",
+    "lightberries.matrix_patterns",
+    "lightberries.matrix_resample",
+    "lightberries.matrix_video",
+    "lightberries.ws281x_simulator",
+]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", f"import sys; sys.path[:0] = {sys.path!r}; {code}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_is_lazy():
+    result = run_python("import json, lightberries; print(json.dumps(sorted(sys.modules)))")
+    modules = json.loads(result.stdout.splitlines()[-1])
+    assert [module for module in LAZY_MODULES if module in modules] == []
+    result = run_python(
+        "import json, lightberries; lightberries.MatrixController; print(json.dumps(sorted(sys.modules)))"
+    )
+    assert "lightberries.matrix_controller" in json.loads(result.stdout.splitlines()[-1])
@@ -0,0 +1,73 @@
+"""Test the layer compositor."""
+from __future__ import annotations
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+from lightberries.array_layers import ArrayLayer, BlendMode, LayerStack
+from lightberries.exceptions import LayerException
+from lightberries.pixel import PixelColors
+
+
+def test_default_layers():
+    stack = LayerStack(10)
+    assert len(stack) == 1
+    assert stack["overlay"].temporary
+    with pytest.raises(LayerException):
+        stack["missing"]
+
+
+def test_add_remove_layer():
+    stack = LayerStack(10)
+    layer = stack.addLayer("test", BlendMode.MAX, position=0)
+    assert stack.layers[0] is layer
+    assert stack.addLayer("test") is layer
+    stack.removeLayer("test")
+    assert stack.getLayer("test") is None
+
+
+def test_empty_composite():
+    stack = LayerStack(10)
+    stack.base[:] = PixelColors.RED.array
+    assert_array_equal(stack.composite(), stack.base)
+
+
+@pytest.mark.parametrize(
+    "blendMode, expected",
+    [
+        (BlendMode.REPLACE, [64, 128, 255]),
+        (BlendMode.ADD, [192, 192, 255]),
+        (BlendMode.MULTIPLY, [128 * 64 / 255, 64 * 128 / 255, 0]),
+        (BlendMode.MAX, [128, 128, 255]),
+        (BlendMode.SCREEN, [255 - (127 * 191 / 255), 255 - (191 * 127 / 255), 255]),
+    ],
+)
+def test_blend_modes(blendMode: BlendMode, expected: list[float]):
+    destination = np.array([[128, 64, 0], [1, 2, 3]], dtype=np.float32)
+    scratch = np.zeros_like(destination)
+    layer = ArrayLayer("test", 2, blendMode=blendMode)
+    layer.set(np.array([True, False]), [64, 128, 255])
+    layer.blend(destination, scratch)
+    assert_array_almost_equal(destination[0], expected, decimal=3)
+    assert_array_equal(destination[1], [1, 2, 3])
+
+
+def test_alpha():
+    destination = np.zeros((3, 3), dtype=np.float32)
+    layer = ArrayLayer("test", 3, alpha=0.5)
+    layer.set(np.s_[:], PixelColors.WHITE.array)
+    layer.blend(destination, np.zeros_like(destination))
+    assert_array_equal(destination, np.full((3, 3), 127.5))
+
+
+def test_temporary_layer():
+    stack = LayerStack(4)
+    stack.addLayer("effect", BlendMode.ADD, position=0)
+    stack["overlay"].set(np.array([0, 2]), PixelColors.BLUE.array)
+    stack["effect"].set(np.array([1]), PixelColors.GREEN.array)
+    output = stack.composite()
+    assert_array_equal(output[0], PixelColors.BLUE.array)
+    assert_array_equal(output[1], PixelColors.GREEN.array)
+    assert not stack["overlay"].mask.any()
+    assert stack["effect"].mask[1]
+    stack.clear()
+    assert_array_equal(stack.composite(), np.zeros((4, 3)))
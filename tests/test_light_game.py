@@ -0,0 +1,109 @@
+from __future__ import annotations
+import importlib
+import os
+import sys
+import types
+import pytest
+from tests.test_matrix_font import new_matrix_controller
+
+GAMES_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "games")
+# the pygame 2 event types the games handle
+EVENT_TYPES = {
+    "QUIT": 256,
+    "JOYAXISMOTION": 1536,
+    "JOYHATMOTION": 1538,
+    "JOYBUTTONDOWN": 1539,
+    "JOYBUTTONUP": 1540,
+    "JOYDEVICEADDED": 1541,
+    "JOYDEVICEREMOVED": 1542,
+    "WINDOWCLOSE": 32787,
+}
+
+
+class FakeJoystick:
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def init(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        pass
+
+    def get_instance_id(self) -> int:
+        return 100 + self.index
+
+
+def pygame_event(name: str, **fields) -> types.SimpleNamespace:
+    return types.SimpleNamespace(type=EVENT_TYPES[name], dict=fields)
+
+
+@pytest.fixture
+def light_game(monkeypatch):
+    # just enough of pygame to drive the event translation without a display or controllers
+    pygame = types.ModuleType("pygame")
+    pygame.__dict__.update(EVENT_TYPES)
+    pygame.pending = []
+    pygame.init = lambda: None
+    pygame.event = types.SimpleNamespace(get=lambda: pygame.pending.pop(0), Event=types.SimpleNamespace)
+    pygame.joystick = types.SimpleNamespace(get_count=lambda: 2, Joystick=FakeJoystick)
+    monkeypatch.setitem(sys.modules, "pygame", pygame)
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.syspath_prepend(GAMES_DIRECTORY)
+    for module in ("light_game", "game_objects"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    module = importlib.import_module("light_game")
+    game = module.LightGame(new_matrix_controller(8, 8))
+    # events in the first second after a splash screen are skipped
+    game.timestamp_ready = 0.0
+    return module, game, pygame
+
+
+def test_get_events(light_game):
+    module, game, pygame = light_game
+    pressed = []
+    game.add_callback(module.LightEventId.ButtonBottom, pressed.append)
+    pygame.pending.append(
+        [
+            pygame_event("JOYDEVICEADDED", device_index=0),
+            pygame_event("JOYBUTTONDOWN", button=module.XboxButton.A, instance_id=100, joy=0),
+            pygame_event("JOYHATMOTION", hat=0, value=(0, 1), instance_id=100, joy=0),
+            pygame_event("JOYAXISMOTION", axis=module.XboxJoystick.JOY_LEFT_X, value=0.5, instance_id=100, joy=0),
+            pygame_event("JOYAXISMOTION", axis=module.XboxJoystick.JOY_LEFT_Y, value=-0.25, instance_id=100, joy=0),
+            pygame_event("JOYAXISMOTION", axis=module.XboxJoystick.JOY_LEFT_X, value=0.1, instance_id=101, joy=1),
+        ]
+    )
+    events = list(game.get_events())
+    assert [type(event) for event in events] == [
+        module.ControllerAdded,
+        module.ButtonBottom,
+        module.ButtonHatUp,
+        module.StickLeft,
+        module.StickLeft,
+    ]
+    assert events[1].state == module.ButtonState.Down and events[1].controller_instance_id == 100
+    assert events[2].id == module.XboxButton.UP
+    # both axes of a stick arrive as one event per controller
+    assert (events[3].x, events[3].y, events[3].controller_instance_id) == (0.5, -0.25, 100)
+    assert (events[4].x, events[4].controller_instance_id) == (0.1, 101)
+    assert pressed == [events[1]]
+    # the same events come back from the pool next frame
+    pygame.pending.append(
+        [
+            pygame_event("JOYBUTTONDOWN", button=module.XboxButton.A, instance_id=100, joy=0),
+            pygame_event("JOYBUTTONUP", button=module.XboxButton.A, instance_id=100, joy=0),
+            pygame_event("JOYAXISMOTION", axis=module.XboxJoystick.JOY_LEFT_Y, value=0.75, instance_id=100, joy=0),
+        ]
+    )
+    again = list(game.get_events())
+    assert again[0] is events[1]
+    assert again[1] is not events[1] and again[1].state == module.ButtonState.Up
+    assert again[2] is events[3] and (again[2].x, again[2].y) == (0.5, 0.75)
+    # removing a controller drops its pooled events, and only its events
+    pygame.pending.append([pygame_event("JOYDEVICEREMOVED", instance_id=100)])
+    removed = list(game.get_events())
+    assert [type(event) for event in removed] == [module.ControllerRemoved]
+    assert {key[0] for key in game._event_pool} == {101}
+    pygame.pending.append([pygame_event("QUIT")])
+    assert list(game.get_events()) == []
+    assert game.exiting
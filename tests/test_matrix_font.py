@@ -0,0 +1,208 @@
+from __future__ import annotations
+import itertools
+import json
+import os
+import mock
+import numpy as np
+import pytest
+from lightberries.exceptions import MatrixFontException
+from lightberries.matrix_controller import MatrixController
+from lightberries.matrix_font import SCROLL_CHUNK_CHARACTERS, FontAtlas, TextScroller, defaultFont, loadFont
+from lightberries.matrix_letters import letters_to_matrices
+from lightberries.matrix_patterns import TextMatrix
+from tests.test_array_controller import new_instantiate_WS281xString
+
+
+def reference_text_matrix(yRange: int, text: str, color: np.ndarray) -> np.ndarray:
+    # what TextMatrix rendered before the atlas (column then row order)
+    letters = letters_to_matrices(text + "     ")
+    matrix = np.concatenate(letters, axis=0).astype(np.float32) * color
+    padded = np.zeros((matrix.shape[0], yRange, 3), dtype=np.float32)
+    padded[:, : matrix.shape[1], :] = matrix
+    return padded
+
+
+@pytest.mark.parametrize("text", ["HELLO, WORLD!", "it's 12=3", "a~b", ""])
+def test_text_matrix_matches_letters(text):
+    color = np.array([255, 128, 0])
+    matrix = TextMatrix(20, text, color)
+    assert matrix.dtype == np.float32
+    assert np.array_equal(matrix, reference_text_matrix(20, text, color))
+
+
+def test_atlas_render_and_cache():
+    font = FontAtlas.fromGlyphs({"a": [[1, 0], [0, 1]], "b": [[1], [1]], "A": [[1, 0], [0, 1]]}, cacheSize=2)
+    # one blank column is kept on the end for spacing
+    assert font.bitmap.shape == (2, 4)
+    assert not font.bitmap[:, font.blankColumn].any()
+    assert font.glyphIndex["a"] == font.glyphIndex["A"]
+    assert font.width("ab?") == 3
+    rendered = font.render("ab?")
+    assert rendered.tolist() == [[True, False, True], [False, True, True]]
+    assert font.render("ab?") is rendered
+    assert not rendered.flags.writeable
+    font.render("b")
+    font.render("bb")
+    assert list(font.privateCache) == ["b", "bb"]
+    out = np.zeros((2, 5), dtype=np.bool_)
+    assert font.render("Aab", out=out) is out
+    assert out.tolist() == [[True, False, True, False, True], [False, True, False, True, True]]
+    with pytest.raises(MatrixFontException):
+        font.render("b", out=out)
+    with pytest.raises(MatrixFontException):
+        FontAtlas.fromGlyphs({"a": [[1]], "b": [[1], [1]]})
+
+
+def test_render_color_uses_cache():
+    font = defaultFont()
+    out = np.zeros((font.height, font.width("12:34:56") + 40, 3), dtype=np.float32)
+    color = np.array([255, 0, 0])
+    for second in range(60):
+        font.render(f"12=34={second:02d}")
+    # text that was rendered before is never laid out again
+    with mock.patch.object(font, "columns", wraps=font.columns) as columns:
+        for second in range(60):
+            text = f"12=34={second:02d}"
+            rendered = font.renderColor(text, color, out=out[:, : font.width(text), :])
+            assert np.array_equal(rendered, font.render(text)[:, :, None] * color)
+        assert columns.call_count == 0
+
+
+def new_matrix_controller(xRange: int, yRange: int) -> MatrixController:
+    with mock.patch.object(MatrixController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        return MatrixController(xRange, yRange, testing=True, seed=1)
+
+
+def test_marquee_text_matches_rolled_text_matrix():
+    mc = new_matrix_controller(16, 24)
+    mc.useFunctionMatrixMarqueeText(delayCount=0, text="Hi, 42!")
+    # the marquee used to roll a buffer holding the whole message and show its first columns
+    rolled = TextMatrix(mc.realLEDYaxisRange, "Hi, 42!", mc.colorSequence[0])
+    window = mc.realLEDXaxisRange
+    assert mc.virtualLEDBuffer.shape == (window, mc.realLEDYaxisRange, 3)
+    assert np.array_equal(mc.virtualLEDBuffer, rolled[:window])
+    for _ in range(2 * len(rolled) + 3):
+        mc._runFunctions()
+        rolled = np.roll(rolled, -1, 0)
+        assert np.array_equal(mc.virtualLEDBuffer, rolled[:window])
+
+
+def test_scroller_streams_messages():
+    font = FontAtlas.fromGlyphs({"a": [[1], [1]], "b": [[1, 1], [0, 0]], " ": [[0], [0]]})
+
+    def feed():
+        for count in itertools.count():
+            yield "ab" * (count % 50)
+
+    scroller = TextScroller(font, window=4, messages=feed(), gap=" ")
+    scroller.feed("ba")
+    # the queued message comes first, then the feed
+    assert scroller.render().tolist() == [[True, True, True, False], [False, False, True, False]]
+    for _ in range(20000):
+        scroller.step(3)
+        scroller.render()
+        assert len(scroller.privateColumns) < 4 + 3 * SCROLL_CHUNK_CHARACTERS
+    assert scroller.offset == 60000
+    finished = TextScroller(font, window=3, messages=["a"], gap="")
+    finished.step()
+    assert not finished.render().any()
+
+
+def test_scroller_clips_rows():
+    scroller = TextScroller(defaultFont(), window=5, text="A")
+    out = np.zeros((5, 8, 3), dtype=np.float32)
+    scroller.renderColor([1, 2, 3], out=out, transpose=True)
+    expected = reference_text_matrix(16, "A", np.array([1, 2, 3]))[:5, :8]
+    assert np.array_equal(out, expected)
+    with pytest.raises(MatrixFontException):
+        TextScroller(defaultFont(), window=0)
+
+
+BDF_FONT = """STARTFONT 2.1
+FONT -test-tiny
+SIZE 4 75 75
+FONTBOUNDINGBOX 4 4 0 -1
+CHARS 3
+STARTCHAR i
+ENCODING 105
+DWIDTH 2 0
+BBX 1 3 0 0
+BITMAP
+80
+00
+80
+ENDCHAR
+STARTCHAR g
+ENCODING 103
+DWIDTH 4 0
+BBX 3 3 0 -1
+BITMAP
+E0
+20
+E0
+ENDCHAR
+STARTCHAR space
+ENCODING 32
+DWIDTH 3 0
+BBX 0 0 0 0
+BITMAP
+ENDCHAR
+ENDFONT
+"""
+
+
+def test_bdf_font(tmp_path):
+    path = tmp_path / "tiny.bdf"
+    path.write_text(BDF_FONT)
+    font = FontAtlas.fromBDF(str(path))
+    assert font.height == 4
+    assert font.width("ig ") == 2 + 4 + 3
+    assert font.render("ig").astype(int).tolist() == [
+        # "i" sits on the baseline and "g" hangs one row below it
+        [1, 0, 0, 0, 0, 0],
+        [0, 0, 1, 1, 1, 0],
+        [1, 0, 0, 0, 1, 0],
+        [0, 0, 1, 1, 1, 0],
+    ]
+
+
+def test_json_font_kerning(tmp_path):
+    path = tmp_path / "tiny.json"
+    path.write_text(json.dumps({"glyphs": {"L": ["#..", "###"], "T": ["###", ".#."]}, "kerning": {"LT": -1, "TT": 1}}))
+    font = FontAtlas.fromJSON(str(path))
+    assert font.render("LTT").astype(int).tolist() == [
+        [1, 0, 1, 1, 1, 0, 1, 1, 1],
+        [1, 1, 0, 1, 0, 0, 0, 1, 0],
+    ]
+    # kerning across a chunk boundary uses the following character
+    assert font.columns("L", following="T").tolist() == font.columns("LT").tolist()[:2]
+    scroller = TextScroller(font, window=9, text="LTT", gap="")
+    assert np.array_equal(scroller.render(), font.render("LTT"))
+
+
+def test_load_font_cache(tmp_path):
+    path = tmp_path / "tiny.bdf"
+    path.write_text(BDF_FONT)
+    cache = tmp_path / "cache"
+    font = loadFont(str(path), cacheDirectory=str(cache))
+    [cached] = os.listdir(cache)
+    assert cached.startswith("tiny.bdf-") and cached.endswith(".npz")
+    with mock.patch.object(FontAtlas, "fromBDF", side_effect=AssertionError("parsed again")):
+        again = loadFont(str(path), cacheDirectory=str(cache))
+    assert np.array_equal(again.bitmap, font.bitmap)
+    assert again.glyphIndex == font.glyphIndex
+    assert np.array_equal(again.render("gig"), font.render("gig"))
+    with pytest.raises(MatrixFontException):
+        loadFont(str(tmp_path / "font.ttf"))
+
+
+def test_marquee_text_font(tmp_path):
+    path = tmp_path / "tiny.bdf"
+    path.write_text(BDF_FONT)
+    font = loadFont(str(path), cacheDirectory=str(tmp_path))
+    mc = new_matrix_controller(8, 4)
+    mc.useFunctionMatrixMarqueeText(delayCount=0, text="gig", font=font)
+    # four columns of the eight row matrix are visible, and the four row font fills the top half
+    assert mc.virtualLEDBuffer.shape == (4, 8, 3)
+    assert np.array_equal(mc.virtualLEDBuffer[:, :4, 0].T > 0, font.render("gig")[:, :4])
+    assert not mc.virtualLEDBuffer[:, 4:].any()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from lightberries.exceptions import MatrixVideoException
+from lightberries.matrix_resample import (
+    ASPECT_FILL,
+    ASPECT_FIT,
+    RESAMPLE_AREA,
+    RESAMPLE_BILINEAR,
+    RESAMPLE_BOX,
+    RESAMPLE_NEAREST,
+    ResampleMap,
+    resampleMap,
+)
+from tests.test_matrix_font import new_matrix_controller
+
+RGB = (0, 1, 2)
+
+
+def test_bilinear_blends_neighbors():
+    frame = np.zeros((1, 2, 3), dtype=np.uint8)
+    frame[0, 1] = 100
+    wide = ResampleMap((1, 2), (1, 4), RESAMPLE_BILINEAR, channelOrder=RGB).apply(frame)
+    assert np.allclose(wide[0, :, 0], [0, 25, 75, 100])
+    # a flat frame stays flat at any size
+    flat = np.full((5, 7, 3), 40, dtype=np.uint8)
+    assert np.allclose(ResampleMap((5, 7), (3, 11), RESAMPLE_BILINEAR).apply(flat), 40)
+    # the same size samples every pixel exactly
+    frame = np.random.default_rng(1).integers(0, 255, (4, 6, 3), dtype=np.uint8)
+    assert np.array_equal(ResampleMap((4, 6), (4, 6), RESAMPLE_BILINEAR, channelOrder=RGB).apply(frame), frame)
+
+
+def test_fit_pads_and_fill_crops():
+    frame = np.arange(2 * 4 * 3, dtype=np.uint8).reshape((2, 4, 3)) + 1
+    for method in (RESAMPLE_NEAREST, RESAMPLE_BILINEAR, RESAMPLE_BOX):
+        fit = ResampleMap((2, 4), (4, 4), method, channelOrder=RGB, aspect=ASPECT_FIT).apply(frame)
+        # black bars above and below the whole frame
+        assert not fit[[0, 3]].any()
+        assert np.allclose(fit[1:3], frame)
+        fill = ResampleMap((2, 4), (4, 4), method, channelOrder=RGB, aspect=ASPECT_FILL).apply(frame)
+        # the middle of the frame, doubled
+        if method != RESAMPLE_BILINEAR:
+            assert np.allclose(fill, frame[:, 1:3].repeat(2, axis=0).repeat(2, axis=1))
+        assert fill.min() >= frame[:, 1:3].min() and fill.max() <= frame[:, 1:3].max()
+    # turning a wide frame onto a tall matrix needs no padding
+    turned = ResampleMap((2, 4), (4, 2), RESAMPLE_AREA, quarterTurns=1, channelOrder=RGB, aspect=ASPECT_FIT)
+    assert np.array_equal(turned.apply(frame), np.rot90(frame))
+    assert resampleMap((2, 4), (4, 4), aspect=ASPECT_FIT) is resampleMap((2, 4), (4, 4), aspect=ASPECT_FIT)
+    with pytest.raises(MatrixVideoException):
+        ResampleMap((2, 4), (4, 4), aspect="zoom")
+
+
+def test_show_image(tmp_path):
+    mc = new_matrix_controller(4, 8)
+    image = np.zeros((30, 30, 3), dtype=np.uint8)
+    image[:, :, 0] = 200
+    path = tmp_path / "red.ppm"
+    path.write_bytes(b"P6 30 30 255\n" + image.tobytes())
+    mc.showImage(str(path), aspect=ASPECT_FIT)
+    # a square image in the middle of a wide matrix, in LED color order
+    assert not mc.virtualLEDBuffer[:, [0, 1, 6, 7]].any()
+    assert np.allclose(mc.virtualLEDBuffer[:, 2:6], [0, 200, 0])
+    mc.showImage(image, method=RESAMPLE_BILINEAR, aspect=ASPECT_FILL)
+    assert np.allclose(mc.virtualLEDBuffer, [0, 200, 0])
+
+
+def test_channels():
+    rgb = np.random.default_rng(2).integers(0, 255, (24, 32, 3), dtype=np.uint8)
+    rgba = np.concatenate([rgb, np.random.default_rng(3).integers(0, 255, (24, 32, 1), dtype=np.uint8)], axis=2)
+    gray = rgb[:, :, 0]
+    for method in (RESAMPLE_NEAREST, RESAMPLE_BILINEAR, RESAMPLE_AREA):
+        _map = resampleMap((24, 32), (8, 8), method, channelOrder=RGB, aspect=ASPECT_FIT)
+        # alpha is dropped, gray is the same in every channel
+        assert np.array_equal(_map.apply(rgba), _map.apply(rgb))
+        assert np.array_equal(_map.apply(gray), _map.apply(np.repeat(gray[:, :, None], 3, axis=2)))
+        with pytest.raises(MatrixVideoException):
+            _map.apply(rgb[:, :, :2])
+    mc = new_matrix_controller(4, 8)
+    mc.showImage(rgba, aspect=ASPECT_FILL)
+    expected = resampleMap((24, 32), (4, 8), aspect=ASPECT_FILL).apply(rgb)
+    assert np.array_equal(mc.virtualLEDBuffer, expected)
@@ -0,0 +1,131 @@
+from __future__ import annotations
+import numpy as np
+import pytest
+from lightberries.matrix_stencils import (
+    circleStencil,
+    joinStencils,
+    lineStencil,
+    pointsStencil,
+    ringStencil,
+    scatterStencil,
+    sweepStencils,
+)
+from tests.test_matrix_font import new_matrix_controller
+
+
+def old_clipped_circle(size: int, row: int, column: int, rows: int, columns: int) -> tuple:
+    # how the fireworks and the eye drew circles before the stencils
+    x = np.round(np.sin(np.linspace(0, 2 * np.pi, 1 + (4 * size))) * (size)).astype(dtype=np.int32) + row
+    y = np.round(np.cos(np.linspace(0, 2 * np.pi, 1 + (4 * size))) * (size)).astype(dtype=np.int32) + column
+    i = np.concatenate((np.where((x >= rows) | (x < 0))[0], np.where((y >= columns) | (y < 0))[0]))
+    return np.delete(x, i), np.delete(y, i)
+
+
+@pytest.mark.parametrize("size,row,column", [(1, 0, 0), (3, 5, 2), (7, 8, 8), (12, 15, 1)])
+def test_circle_matches_old_drawing(size, row, column):
+    old = np.zeros((16, 16, 3))
+    new = np.zeros((16, 16, 3))
+    old[old_clipped_circle(size, row, column, 16, 16)] = 255
+    drawn = scatterStencil(new, circleStencil(size), 255, row, column)
+    assert np.array_equal(old, new)
+    assert [list(axis) for axis in drawn] == [list(axis) for axis in old_clipped_circle(size, row, column, 16, 16)]
+
+
+def test_stencils_are_cached_and_read_only():
+    assert circleStencil(5) is circleStencil(5)
+    assert sweepStencils(8, 200) is sweepStencils(8, 200)
+    rows, _ = circleStencil(5)
+    with pytest.raises(ValueError):
+        rows[0] = 1
+
+
+def test_shapes():
+    rows, columns = ringStencil(1, 2)
+    distances = np.hypot(rows, columns)
+    assert distances.min() >= 1 and distances.max() <= 2
+    assert len(rows) == len(set(zip(rows.tolist(), columns.tolist()))) == 12
+    assert [axis.tolist() for axis in lineStencil(2, -4)] == [[0, 0, 1, 2, 2], [0, -1, -2, -3, -4]]
+    joined = joinStencils(pointsStencil(((0, 1),)), lineStencil(0, 1))
+    assert [axis.tolist() for axis in joined] == [[0, 0, 0], [1, 0, 1]]
+    buffer = np.zeros((4, 4))
+    assert scatterStencil(buffer, lineStencil(0, 9), None, 1, -2)[1].tolist() == [0, 1, 2, 3]
+    assert not buffer.any()
+
+
+def test_sweep_matches_old_radar():
+    radius, steps = 8, 200
+    samples = np.linspace(-radius, radius - 1, steps).astype(np.int32)
+    slopes = np.tan(np.linspace(-np.pi, np.pi, steps))
+    for step, (rows, columns) in enumerate(sweepStencils(radius, steps)):
+        x = samples + radius
+        with np.errstate(invalid="ignore"):
+            y = (slopes[step] * samples + radius).astype(np.int32)
+        onMatrix = (x < 16) & (x >= 0) & (y < 16) & (y >= 0)
+        drawn = scatterStencil(np.zeros((16, 16)), (rows, columns), 1)
+        assert [axis.tolist() for axis in drawn] == [x[onMatrix].tolist(), y[onMatrix].tolist()]
+
+
+@pytest.mark.parametrize("use", ["useFunctionMatrixEye", "useFunctionMatrixFireworks", "useFunctionMatrixRadar"])
+def test_matrix_functions_draw(use):
+    mc = new_matrix_controller(16, 16)
+    getattr(mc, use)(delayCount=0)
+    lit = 0
+    for _ in range(50):
+        mc._runFunctions()
+        lit = max(lit, int(mc.virtualLEDBuffer.any(axis=2).sum()))
+    assert lit > 0
+
+
+def test_fireworks_batch():
+    mc = new_matrix_controller(32, 32)
+    mc.useFunctionMatrixFireworksBatch(delayCount=0, fireworkCount=30, fadeAmount=1.0)
+    fireworks = mc.functionList[-1]
+    for _ in range(40):
+        mc._runFunctions()
+        # the same picture as drawing every firework's circle on its own
+        expected = np.zeros_like(mc.virtualLEDBuffer)
+        for i in range(30):
+            scatterStencil(
+                expected,
+                circleStencil(int(fireworks.sizes[i])),
+                fireworks.colors[i],
+                fireworks.rowIndices[i],
+                fireworks.columnIndices[i],
+            )
+        assert np.array_equal(mc.virtualLEDBuffer.any(axis=2), expected.any(axis=2))
+    assert (fireworks.sizes <= fireworks.sizeMax).all()
+
+
+def test_snake_batch_occupancy():
+    mc = new_matrix_controller(24, 24)
+    mc.useFunctionMatrixSnakeBatch(delayCount=0, snakeLength=12, snakeCount=25)
+    snakes = mc.functionList[-1]
+    for _ in range(300):
+        mc._runFunctions()
+        visible = np.arange(12)[None, :] < snakes.lengths[:, None]
+        rows, columns = snakes.bodyRows[visible], snakes.bodyColumns[visible]
+        assert ((rows >= 0) & (rows < 24) & (columns >= 0) & (columns < 24)).all()
+        # no two segments ever share a cell
+        assert len(np.unique(rows * 24 + columns)) == len(rows)
+        body = np.zeros((24, 24), dtype=bool)
+        body[rows, columns] = True
+        assert not mc.virtualLEDBuffer.any(axis=2)[~body].any()
+    assert snakes.lengths.max() > 1
+
+
+def test_snake_batch_blocked_head_does_not_take_a_cell():
+    mc = new_matrix_controller(4, 4)
+    mc.useFunctionMatrixSnakeBatch(delayCount=0, snakeLength=3, snakeCount=3)
+    snakes = mc.functionList[-1]
+    snakes.sizes[:] = 3
+    snakes.lengths[:] = [1, 1, 2]
+    # snake 0 is stuck in the top right corner heading off the matrix, to (0, 4),
+    # which is flat cell 4, the same as (1, 0) where snake 1 is heading
+    snakes.bodyRows[:] = [[0, 0, 0], [1, 1, 1], [1, 2, 2]]
+    snakes.bodyColumns[:] = [[3, 3, 3], [1, 1, 1], [3, 3, 3]]
+    snakes.rowDirections[:] = [0, 0, -1]
+    snakes.columnDirections[:] = [1, -1, 0]
+    mc._runFunctions()
+    # snake 1 moved and grew instead of starting over
+    assert (snakes.bodyRows[1, 0], snakes.bodyColumns[1, 0]) == (1, 0)
+    assert snakes.lengths[1] == 2
@@ -0,0 +1,165 @@
+from __future__ import annotations
+import io
+import threading
+import numpy as np
+import pytest
+from lightberries.exceptions import MatrixVideoException
+from lightberries.matrix_resample import RESAMPLE_AREA, RESAMPLE_NEAREST, ResampleMap, resampleMap
+from lightberries.matrix_video import ImageSequenceDecoder, VideoPipeline, Y4MDecoder, openVideo, readNetpbm
+from lightberries.pixel import Pixel
+from tests.test_matrix_font import new_matrix_controller
+
+
+def numbered_frames(count: int, shape: tuple[int, int] = (4, 6), duration: float = 1 / 30):
+    # frame n is filled with n, so the tests can tell which frames were shown
+    for index in range(count):
+        yield np.full(shape + (3,), index, dtype=np.uint8), duration
+
+
+class FakeTime:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def y4m_stream(frames: list[np.ndarray], colorSpace: str = "444", extra: str = "") -> io.BytesIO:
+    height, width = frames[0][0].shape
+    data = f"YUV4MPEG2 W{width} H{height} F25:1 Ip A1:1 C{colorSpace}{extra}\n".encode()
+    for planes in frames:
+        data += b"FRAME\n" + b"".join(plane.astype(np.uint8).tobytes() for plane in planes)
+    return io.BytesIO(data)
+
+
+def test_nearest_map_rotates_and_orders_channels():
+    frame = np.arange(4 * 6 * 3, dtype=np.uint8).reshape((4, 6, 3))
+    same = resampleMap((4, 6), (4, 6), RESAMPLE_NEAREST)
+    assert np.array_equal(same.apply(frame), frame[:, :, Pixel.DEFAULT_PIXEL_ORDER])
+    assert resampleMap((4, 6), (4, 6), RESAMPLE_NEAREST) is same
+    turned = ResampleMap((4, 6), (3, 2), RESAMPLE_NEAREST, quarterTurns=1, channelOrder=(0, 1, 2))
+    # every other row and column, then a quarter turn
+    assert np.array_equal(turned.apply(frame), np.rot90(frame[::2, ::2]))
+    with pytest.raises(MatrixVideoException):
+        turned.apply(frame[:2])
+    with pytest.raises(MatrixVideoException):
+        ResampleMap((4, 6), (3, 2), "cubic")
+
+
+def test_area_map_averages():
+    frame = np.arange(4 * 6 * 3, dtype=np.uint8).reshape((4, 6, 3))
+    shrunk = ResampleMap((4, 6), (2, 3), RESAMPLE_AREA, channelOrder=(0, 1, 2)).apply(frame)
+    expected = frame.reshape((2, 2, 3, 2, 3)).mean(axis=(1, 3))
+    assert shrunk.dtype == np.float32
+    assert np.allclose(shrunk, expected)
+    # growing an axis repeats pixels
+    grown = ResampleMap((4, 6), (8, 3), RESAMPLE_AREA, channelOrder=(0, 1, 2)).apply(frame)
+    assert np.allclose(grown, frame.reshape((4, 3, 2, 3)).mean(axis=2).repeat(2, axis=0))
+
+
+def test_y4m_decoder():
+    luma = np.array([[16, 235], [126, 126]])
+    chroma = np.full((2, 2), 128)
+    red = np.array([[81, 81], [81, 81]]), np.full((2, 2), 90), np.full((2, 2), 240)
+    decoder = Y4MDecoder(y4m_stream([(luma, chroma, chroma), red]))
+    frames = list(decoder)
+    assert decoder.framesPerSecond == 25.0
+    assert [duration for _, duration in frames] == [0.04, 0.04]
+    # limited range black, white, and gray, then red
+    assert frames[0][0][:, :, 0].tolist() == [[0, 255], [128, 128]]
+    assert (frames[0][0][:, :, 0:1] == frames[0][0]).all()
+    assert np.abs(frames[1][0].astype(int) - [255, 0, 0]).max() <= 2
+    # quarter size chroma, full range
+    full = Y4MDecoder(y4m_stream([(luma, np.array([[128]]), np.array([[255]]))], "420jpeg", " XCOLORRANGE=FULL"))
+    [(frame, _)] = list(full)
+    assert frame[0, 0].tolist() == [194, 0, 16]
+    with pytest.raises(MatrixVideoException):
+        list(Y4MDecoder(io.BytesIO(b"YUV4MPEG2 W2 H2 C420p10\n")))
+
+
+def test_image_sequence(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"frame{index}.ppm"
+        image = np.full((2, 3, 3), index * 10, dtype=np.uint8)
+        image[0, 0] = (255, 0, 0)
+        path.write_bytes(b"P6\n# made by a test\n3 2\n255\n" + image.tobytes())
+        paths.append(str(path))
+    (tmp_path / "gray.pgm").write_bytes(b"P5 2 1 255\n" + bytes([7, 9]))
+    assert readNetpbm(str(tmp_path / "gray.pgm")).tolist() == [[[7, 7, 7], [9, 9, 9]]]
+    decoder = openVideo(paths, framesPerSecond=10)
+    assert isinstance(decoder, ImageSequenceDecoder)
+    frames = list(decoder)
+    assert [frame[1, 1, 0] for frame, _ in frames] == [0, 10, 20]
+    assert frames[2][0][0, 0].tolist() == [255, 0, 0]
+    assert frames[0][1] == pytest.approx(0.1)
+    assert isinstance(openVideo(str(tmp_path / "clip.y4m")), Y4MDecoder)
+    assert len(openVideo(str(tmp_path)).paths) == 4
+
+
+def test_pipeline_holds_target_rate():
+    fake = FakeTime()
+    pipeline = VideoPipeline(
+        numbered_frames(30), (2, 3), framesPerSecond=10, prefetch=30, clock=fake.clock, sleep=fake.sleep
+    )
+    pipeline.start()
+    # let the decoder fill the queue, so every dropped frame is already decoded
+    while pipeline.privateQueue.qsize() < 30:
+        threading.Event().wait(0.001)
+    shown = [int(frame[0, 0, 0]) for frame in pipeline]
+    # one frame in three at a third of the rate, on time, and the last frame stays up
+    assert shown == list(range(0, 30, 3)) + [29]
+    assert fake.now == pytest.approx(1.0)
+    assert pipeline.droppedFrameCount == 19
+    assert pipeline.shownFrameCount == 11
+
+
+def test_pipeline_drops_late_frames():
+    fake = FakeTime()
+    pipeline = VideoPipeline(numbered_frames(10), (2, 3), prefetch=10, clock=fake.clock, sleep=fake.sleep)
+    pipeline.start()
+    while pipeline.privateQueue.qsize() < 10:
+        threading.Event().wait(0.001)
+    shown = []
+    for frame in pipeline:
+        shown.append(int(frame[0, 0, 0]))
+        if len(shown) == 2:
+            # the display stalls for a tenth of a second
+            fake.now += 0.1
+    assert shown == [0, 1, 4, 5, 6, 7, 8, 9]
+    assert pipeline.droppedFrameCount == 2
+
+
+def test_pipeline_prefetch_is_bounded():
+    pulled = []
+
+    def decoder():
+        for frame in numbered_frames(50):
+            pulled.append(1)
+            yield frame
+
+    pipeline = VideoPipeline(decoder(), (2, 3), prefetch=3)
+    pipeline.start()
+    threading.Event().wait(0.05)
+    # three waiting in the queue, and one waiting to go in
+    assert len(pulled) == 4
+    pipeline.stop()
+
+
+def test_play_video():
+    mc = new_matrix_controller(8, 12)
+    frames = [np.random.default_rng(index).integers(0, 255, (24, 16, 3), dtype=np.uint8) for index in range(3)]
+    mc.playVideo([(frame, 0.001) for frame in frames], method="area")
+    expected = ResampleMap((24, 16), mc.virtualLEDBuffer.shape[:2], RESAMPLE_AREA).apply(frames[-1])
+    assert np.array_equal(mc.virtualLEDBuffer, expected)
+    assert mc.metrics.droppedFramesTotal.value == mc.droppedFrameCount
+
+    def broken():
+        yield frames[0], 0.001
+        raise ValueError("bad frame")
+
+    with pytest.raises(MatrixVideoException):
+        mc.playVideo(broken())
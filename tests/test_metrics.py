@@ -0,0 +1,85 @@
+from __future__ import annotations
+import mock
+import pytest
+from lightberries.array_controller import ArrayController
+from lightberries.exceptions import MetricsException
+from lightberries.metrics import ControllerMetrics, Histogram, MetricsRegistry
+from tests.test_array_controller import new_instantiate_WS281xString
+
+
+def test_counter_and_gauge():
+    registry = MetricsRegistry()
+    counter = registry.counter("things_total", "Things.")
+    gauge = registry.gauge("level", "Level.", ("channel",))
+    counter.inc()
+    counter.inc(2)
+    gauge.labels("red").set(0.5)
+    text = registry.expose()
+    assert "# TYPE things_total counter\n" in text
+    assert "things_total 3.0\n" in text
+    assert 'level{channel="red"} 0.5\n' in text
+    with pytest.raises(MetricsException):
+        gauge.labels("red", "green")
+    with pytest.raises(MetricsException):
+        registry.counter("things_total", "Again.")
+    with pytest.raises(MetricsException):
+        registry.counter("bad name", "Bad.")
+
+
+def test_histogram():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.count == 4
+    text = histogram.expose()
+    assert 'latency_seconds_bucket{le="0.1"} 2\n' in text
+    assert 'latency_seconds_bucket{le="1.0"} 3\n' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 4\n' in text
+    assert "latency_seconds_sum 5.65\n" in text
+    assert "latency_seconds_count 4\n" in text
+    with pytest.raises(MetricsException):
+        Histogram("latency_seconds", "Latency.", buckets=(1.0, 0.1))
+
+
+def test_write_textfile(tmp_path):
+    registry = MetricsRegistry()
+    registry.counter("things_total", "Things.").inc()
+    path = tmp_path / "lightberries.prom"
+    registry.writeTextfile(str(path))
+    assert path.read_text() == registry.expose()
+    assert [p.name for p in tmp_path.iterdir()] == ["lightberries.prom"]
+
+
+def test_controller_metrics():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        for _ in range(5):
+            ac._runFunctions()
+            ac.copyVirtualLedsToWS281X()
+            ac.refreshLEDs()
+        metrics = ac.metrics
+        assert metrics.framesTotal.value == 5
+        # an interval between each pair of frames, and the work on every frame
+        assert metrics.frameSeconds.count == 4
+        assert metrics.workSeconds.count == 5
+        assert metrics.workSeconds.sum > 0
+        assert metrics.outputSeconds.count == 5
+        assert metrics.framesPerSecond.value > 0
+        assert metrics.estimatedAmps.value > 0
+        assert metrics.functionSeconds.labels("functionMarquee").value >= 0
+        assert 'lightberries_function_cpu_seconds_total{function="functionMarquee"}' in metrics.expose()
+
+
+def test_record_frame():
+    metrics = ControllerMetrics()
+    metrics.recordFrame(0.0, 0.001, 0.004)
+    metrics.recordFrame(0.02, 0.021, 0.003)
+    metrics.recordFrame(0.04, 0.041, 0.005)
+    assert metrics.framesTotal.value == 3
+    # frame seconds is the time from one frame going out to the next
+    assert metrics.frameSeconds.count == 2
+    assert abs(metrics.frameSeconds.sum - 0.04) < 1e-9
+    assert abs(metrics.workSeconds.sum - 0.012) < 1e-9
+    assert abs(metrics.outputSeconds.sum - 0.003) < 1e-9
+    assert abs(metrics.framesPerSecond.value - 50.0) < 1e-6
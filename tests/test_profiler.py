@@ -0,0 +1,101 @@
+from __future__ import annotations
+import os
+import pstats
+import signal
+import sys
+import mock
+import pytest
+from lightberries.array_controller import ArrayController
+from lightberries.array_profiler import ArrayProfiler
+from lightberries.exceptions import ControllerException, ProfilerException
+from tests.test_array_controller import new_instantiate_WS281xString
+
+
+def run_frames(ac: ArrayController, frames: int) -> None:
+    for _ in range(frames):
+        ac._runFunctions()
+
+
+def test_profiler_summary():
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        ac.useFunctionMarquee()
+        assert ac.profiler is None
+        profiler = ac.enableProfiling(historyFrames=10)
+        run_frames(ac, 20)
+        summary = profiler.summary()
+        # each useFunction call adds its own instances, so they can be told apart
+        assert set(summary) == {f"{function.funcName}[{i}]" for i, function in enumerate(ac.functionList)}
+        assert summary["functionMarquee[1]"]["frames"] == 10
+        assert summary["functionMarquee[1]"]["max"] >= summary["functionMarquee[1]"]["mean"] > 0
+        ac.disableProfiling()
+        assert ac.profiler is None
+        run_frames(ac, 1)
+
+
+def test_profiler_capture(tmp_path):
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        profiler = ac.enableProfiling(outputDirectory=str(tmp_path))
+        written = []
+        profiler.requestProfile(frames=3, callback=written.append)
+        assert profiler.capturing
+        run_frames(ac, 5)
+        profiler.waitForCapture(10)
+        assert not profiler.capturing
+        assert written == profiler.captures
+        path = written[0]
+        stats = pstats.Stats(path + ".pstats")
+        assert any(name == "functionMarquee" for _, _, name in stats.stats)
+        with open(path + ".folded") as folded:
+            lines = folded.read().splitlines()
+        assert any("functionMarquee" in line for line in lines)
+        for line in lines:
+            stack, count = line.rsplit(" ", 1)
+            assert stack and int(count) > 0
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+def test_profiler_signal(tmp_path):
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        profiler = ac.enableProfiling(outputDirectory=str(tmp_path))
+        previous = signal.getsignal(signal.SIGUSR1)
+        try:
+            profiler.installSignalHandler(signal.SIGUSR1, frames=2)
+            os.kill(os.getpid(), signal.SIGUSR1)
+            run_frames(ac, 2)
+            profiler.waitForCapture(10)
+        finally:
+            signal.signal(signal.SIGUSR1, previous)
+        assert len(profiler.captures) == 1
+
+
+def test_profiler_signal_default(monkeypatch):
+    profiler = ArrayProfiler()
+    monkeypatch.delattr(signal, "SIGUSR1", raising=False)
+    # without SIGUSR1 there is no safe default, in particular not Ctrl-C
+    with pytest.raises(ProfilerException):
+        profiler.installSignalHandler()
+    assert signal.getsignal(signal.SIGINT) is signal.default_int_handler
+
+
+def test_profiler_frame_raises(tmp_path):
+    def broken(function):
+        raise ValueError("broken")
+
+    with mock.patch.object(ArrayController, "_instantiate_WS281xString", new_instantiate_WS281xString):
+        ac = ArrayController(testing=True)
+        ac.useFunctionMarquee()
+        profiler = ac.enableProfiling(outputDirectory=str(tmp_path))
+        profiler.requestProfile(frames=3)
+        run_frames(ac, 1)
+        ac.functionList[0].runFunction = broken
+        with pytest.raises(ControllerException):
+            run_frames(ac, 1)
+        # the frame was closed out, so cProfile is no longer hooked into the interpreter
+        assert len(profiler.frames) == 2
+        assert sys.getprofile() is None
@@ -0,0 +1,69 @@
+"""Test the batched random number source."""
+from __future__ import annotations
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+from lightberries.array_patterns import ArrayPattern
+from lightberries.array_random import ArrayRandom
+from lightberries.exceptions import RandomException
+
+
+def test_seeded_sequences_repeat():
+    random1 = ArrayRandom(seed=42, batchSize=8)
+    random2 = ArrayRandom(seed=42, batchSize=8)
+    # draw past a refill to make sure batches don't change the sequence
+    values1 = [random1.randint(0, 100) for _ in range(20)]
+    values2 = [random2.randint(0, 100) for _ in range(20)]
+    assert values1 == values2
+    assert_array_equal(random1.integers(0, 10, 50), random2.integers(0, 10, 50))
+    random1.seed(7)
+    random2.seed(7)
+    assert random1.uniform(2.0, 3.0) == random2.uniform(2.0, 3.0)
+
+
+def test_scalar_ranges():
+    source = ArrayRandom(seed=1, batchSize=16)
+    ints = [source.randint(3, 5) for _ in range(200)]
+    assert min(ints) == 3
+    assert max(ints) == 5
+    for _ in range(100):
+        assert 2.0 <= source.uniform(2.0, 4.0) < 4.0
+        assert source.direction() in (-1, 1)
+        assert source.boolean() in (True, False)
+        assert source.choice("abc") in "abc"
+    assert source.boolean(chance=0.0) is False
+    assert source.boolean(chance=1.0) is True
+    # an empty range is an error, like random.randint
+    assert source.randint(4, 4) == 4
+    with pytest.raises(RandomException):
+        source.randint(5, 3)
+    with pytest.raises(RandomException):
+        source.choice([])
+
+
+def test_batch_ranges():
+    source = ArrayRandom(seed=2)
+    ints = source.integers(0, 9, 1000)
+    assert ints.dtype == np.int32
+    assert ints.min() == 0
+    assert ints.max() == 9
+    directions = source.directions(1000)
+    assert set(np.unique(directions)) == {-1, 1}
+    assert not source.booleans(100, chance=0.0).any()
+    assert source.booleans(100, chance=1.0).all()
+    uniforms = source.uniforms(100, 5.0, 6.0)
+    assert uniforms.min() >= 5.0
+    assert uniforms.max() < 6.0
+    with pytest.raises(RandomException):
+        source.integers(5, 3, 10)
+
+
+def test_random_patterns_with_generator():
+    ary1 = ArrayPattern.RandomArray(20, generator=ArrayRandom(seed=3).generator)
+    ary2 = ArrayPattern.RandomArray(20, generator=ArrayRandom(seed=3).generator)
+    assert_array_equal(ary1, ary2)
+    # one channel is always excluded
+    assert np.all(np.min(ary1, axis=1) == 0)
+    sequence = np.array([[1, 2, 3], [4, 5, 6]])
+    ary = ArrayPattern.PseudoRandomArray(20, sequence, generator=ArrayRandom(seed=3).generator)
+    assert all(any(np.array_equal(led, color) for color in sequence) for led in ary)
@@ -250,3 +250,16 @@ def test_context_manager():
             ws281x[:] = random_colors
             assigned_colors = ws281x[:]
             assert_array_equal(assigned_colors, random_colors)
+
+
+def test_set_pixel_array():
+    """Test quantized assignment of a float render buffer."""
+    led_count = 10
+    with mock.patch.object(WS281xString, "_instantiate_pixelstrip", new=new_instantiate_pixelstrip):
+        ws281x = WS281xString(ledCount=led_count, simulate=True)
+        random_colors = ConvertPixelArrayToNumpyArray([PixelColors.RANDOM for i in range(led_count)])
+        ws281x.setPixelArray(random_colors.astype(np.float32) + 0.25)
+        assert_array_equal(ws281x[:], random_colors)
+        ws281x.setPixelArray(np.full((2, 3), 1000.0), indices=np.array([3, 7]))
+        assert_array_equal(ws281x[3], PixelColors.WHITE.array)
+        assert_array_equal(ws281x[7], PixelColors.WHITE.array)
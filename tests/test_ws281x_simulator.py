@@ -0,0 +1,124 @@
+import http.client
+import struct
+import time
+import zlib
+import numpy as np
+import pytest
+from lightberries.array_controller import ArrayController
+from lightberries.exceptions import SimulatorException
+from lightberries.matrix_controller import MatrixController
+from lightberries.ws281x_simulator import PNGSequenceWriter, PreviewServer, SimulatedPixelStrip, encodePNG
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    # enough of a PNG reader for the unfiltered truecolor images the simulator writes
+    assert data[:8] == b"\x89PNG\r\n\x1a\n"
+    position, chunks = 8, {}
+    while position < len(data):
+        (length,) = struct.unpack(">I", data[position : position + 4])
+        kind = data[position + 4 : position + 8]
+        body = data[position + 8 : position + 8 + length]
+        assert struct.unpack(">I", data[position + 8 + length : position + 12 + length])[0] == zlib.crc32(kind + body)
+        chunks[kind] = chunks.get(kind, b"") + body
+        position += 12 + length
+    width, height, depth, colorType = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert (depth, colorType) == (8, 2)
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8).reshape((height, 1 + width * 3))
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape((height, width, 3))
+
+
+def test_encode_png():
+    image = np.random.default_rng(1).integers(0, 255, (5, 7, 3), dtype=np.uint8)
+    assert np.array_equal(decode_png(encodePNG(image)), image)
+
+
+def test_strip_renders_layout_and_brightness():
+    strip = SimulatedPixelStrip(num=4, pin=18, dma=10, brightness=255, scale=2)
+    assert strip.numPixels() == 4
+    strip.setPixelColor(0, 0xFF0000)
+    strip.setPixelColors(np.array([1, 3]), np.array([0x00FF00, 0x0000FF]))
+    assert strip.getPixelColor(3) == 0x0000FF
+    strip.show()
+    # one row of LEDs, two pixels square each
+    assert strip.image.shape == (2, 8, 3)
+    assert strip.image[1, ::2].tolist() == [[255, 0, 0], [0, 255, 0], [0, 0, 0], [0, 0, 255]]
+    strip.setLayout(np.array([[3, 0], [-1, 9]]))
+    strip.setBrightness(127)
+    strip.show()
+    # out of range indices are dark, and brightness scales like the ws281x driver
+    assert strip.image[::2, ::2].tolist() == [[[0, 0, 127], [127, 0, 0]], [[0, 0, 0], [0, 0, 0]]]
+    assert strip.frameCount == 2
+    with pytest.raises(SimulatorException):
+        strip.setLayout(np.arange(4))
+
+
+def test_controller_simulation(tmp_path):
+    ac = ArrayController(ledCount=6, ledBrightnessFloat=1.0, simulate=True, seed=1)
+    assert isinstance(ac.simulator, SimulatedPixelStrip)
+    writer = PNGSequenceWriter(str(tmp_path / "frames"), prefix="show")
+    ac.simulator.outputs.append(writer)
+    ac.virtualLEDBuffer[:] = 0
+    ac.virtualLEDBuffer[2] = ac.colorSequence[0]
+    ac.copyVirtualLedsToWS281X()
+    ac.refreshLEDs()
+    image = decode_png((tmp_path / "frames" / "show000000.png").read_bytes())
+    # the LED buffer is in LED color order (GRB), the image is RGB
+    green, red, blue = ac.colorSequence[0]
+    assert image[0, 2 * ac.simulator.scale].tolist() == [red, green, blue]
+    assert writer.frameCount == 1
+    # a matrix is drawn as a matrix, with the serpentine LED order undone
+    mc = MatrixController(4, 3, ledBrightnessFloat=1.0, simulate=True, seed=1)
+    mc.virtualLEDBuffer[:] = 0
+    mc.virtualLEDBuffer[1, 2] = [0, 200, 0]
+    mc.copyVirtualLedsToWS281X()
+    mc.refreshLEDs()
+    scale = mc.simulator.scale
+    lit = np.argwhere(mc.simulator.image.any(axis=2))
+    assert lit.min(axis=0).tolist() == [1 * scale, 2 * scale]
+    assert mc.simulator.image[scale, 2 * scale].tolist() == [200, 0, 0]
+
+
+def test_preview_server_streams_png():
+    strip = SimulatedPixelStrip(num=3, scale=1)
+    with PreviewServer(port=0, framesPerSecond=0) as preview:
+        strip.outputs.append(preview)
+        # nothing is encoded until someone watches
+        strip.show()
+        assert preview.privateFrameNumber == 0
+        connection = http.client.HTTPConnection(*preview.address, timeout=5)
+        connection.request("GET", "/")
+        response = connection.getresponse()
+        assert response.status == 200
+        assert response.getheader("Content-Type").startswith("multipart/x-mixed-replace")
+        strip.setPixelColor(1, 0x102030)
+        while preview.privateFrameNumber == 0:
+            strip.show()
+            time.sleep(0.01)
+        assert response.readline().strip() == b"--lightberries-frame"
+        headers = dict(line.decode().strip().split(": ") for line in iter(response.readline, b"\r\n"))
+        image = decode_png(response.read(int(headers["Content-Length"])))
+        assert image[0].tolist() == [[0, 0, 0], [16, 32, 48], [0, 0, 0]]
+        connection.close()
+        missing = http.client.HTTPConnection(*preview.address, timeout=5)
+        missing.request("GET", "/missing")
+        assert missing.getresponse().status == 404
+        missing.close()
+
+
+def test_simulation_frames():
+    mc = MatrixController(32, 32, ledBrightnessFloat=1.0, simulate=True, seed=1)
+    rng = np.random.default_rng(1)
+    frames = 20
+    start = mc.simulator.frameCount
+    for _ in range(frames):
+        mc.virtualLEDBuffer[:] = rng.integers(0, 255, mc.virtualLEDBuffer.shape, endpoint=True)
+        mc.copyVirtualLedsToWS281X()
+        mc.refreshLEDs()
+        # every LED lands in the image, in its own place
+        scale = mc.simulator.scale
+        image = mc.simulator.image[::scale, ::scale]
+        assert image.shape == (32, 32, 3)
+        # the LED buffer is in LED color order (GRB), the image is RGB
+        assert np.array_equal(image, mc.virtualLEDBuffer[:, :, [1, 0, 2]])
+    assert mc.simulator.frameCount - start == frames